@@ -0,0 +1,113 @@
+"""
+Benchmark client-side cost of one API request.
+
+Requests go through the full `BooksClient` stack (session pool, request
+preparation, `Session.send`, latency recording) into a transport adapter
+that answers instantly, so the measured time is the client overhead alone.
+Compares the `RequestTemplate` fast path with `Session.request`.
+
+Usage:
+    uv run python -m benchmarks.bench_client_overhead [--requests N]
+"""
+
+import argparse
+from functools import partial
+import timeit
+from typing import Any, Callable
+import requests
+from requests.adapters import BaseAdapter
+from src.clients.books_client import BooksClient
+from src.clients.session_pool import PoolConfig, SessionPool
+from src.config.settings import Settings
+
+BOOK = {
+    "id": 1,
+    "title": "Book 1",
+    "description": "Lorem ipsum dolor sit amet.",
+    "pageCount": 100,
+    "excerpt": "Lorem ipsum.",
+    "publishDate": "2025-07-12T13:36:48.000Z",
+}
+
+
+class InstantAdapter(BaseAdapter):
+    """
+    Transport adapter answering every request with a canned 200 response.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = str(request.url)
+        response.request = request
+        response.encoding = "utf-8"
+        # pylint: disable=protected-access
+        response._content = b'{"id": 1}'
+        response._content_consumed = True  # type: ignore[attr-defined]
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def instant_client(fast_path: bool) -> BooksClient:
+    """
+    Create Books client whose requests never leave the process.
+    """
+    pool = SessionPool(PoolConfig())
+    with pool.acquire() as session:
+        session.mount("http://", InstantAdapter())
+    client = BooksClient(
+        pool=pool,
+        settings=Settings(base_url="http://bookstore.invalid", fast_path=fast_path),
+    )
+    return client
+
+
+def per_request_us(call: Callable[[], Any], count: int) -> float:
+    """
+    Return best-of-five cost per request in microseconds.
+    """
+    timer = timeit.Timer(call)
+    return min(timer.repeat(repeat=5, number=count)) / count * 1e6
+
+
+def main() -> None:
+    """
+    Run the benchmark and print a comparison table.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    clients = {
+        "Session.request": instant_client(False),
+        "fast path": instant_client(True),
+    }
+
+    print(f"{'request':<8} {'client':<16} {'us/request':>10} {'speedup':>8}")
+    for name in ("GET", "POST", "PUT"):
+        baseline = 0.0
+        for label, client in clients.items():
+            calls: dict[str, Callable[[], Any]] = {
+                "GET": partial(client.get_book_by_id, 1),
+                "POST": partial(client.create_book, BOOK),
+                "PUT": partial(client.update_book, 1, BOOK),
+            }
+            cost = per_request_us(calls[name], args.requests)
+            baseline = baseline or cost
+            print(f"{name:<8} {label:<16} {cost:>10.1f} {baseline / cost:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
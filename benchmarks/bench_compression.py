@@ -0,0 +1,99 @@
+"""
+Benchmark the bandwidth cost of `get_all_books` at catalog scale.
+
+The local stand-in server is filled with `--books` generated books and
+`BooksClient.get_all_books` is called with each `Accept-Encoding` policy.
+Payload bytes come from `byte_accounting`, as reported at the end of a test
+session. Besides the measured loopback latency, the time to move the wire
+bytes over a `--bandwidth` Mbit/s link shows what compression saves against
+a remote service.
+
+Usage:
+    uv run python -m benchmarks.bench_compression [--books 200,2000,20000]
+        [--repeat 20] [--bandwidth 50]
+"""
+
+import argparse
+import statistics
+import time
+from src.clients.books_client import BooksClient
+from src.clients.compression import CompressionConfig
+from src.config.settings import Settings
+from src.data.data_factory import DataFactory
+from src.server.app import FakeRestApi
+from src.server.http_server import LocalApiServer
+from src.server.store import DataStore
+from src.utils.byte_accounting import byte_accounting
+
+ENCODINGS = ("identity", "gzip", "deflate")
+
+
+def build_catalog(books: int) -> FakeRestApi:
+    """
+    Create a stand-in application holding `books` generated books.
+    """
+    store = DataStore(seed=False)
+    factory = DataFactory(seed=1)
+    for _ in range(books):
+        store.books.put(factory.book())
+    return FakeRestApi(store)
+
+
+def run(server: LocalApiServer, encoding: str, repeat: int) -> dict[str, float]:
+    """
+    Fetch all books `repeat` times accepting one coding.
+
+    Returns:
+        Median latency in ms and wire and decoded bytes per call
+    """
+    client = BooksClient(
+        settings=Settings(base_url=server.base_url),
+        compression=CompressionConfig(accept_encoding=encoding),
+    )
+    client.get_all_books().raise_for_status()
+    byte_accounting.clear()
+
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        client.get_all_books().raise_for_status()
+        latencies.append(time.perf_counter() - started)
+    client.pool.close()
+
+    totals = byte_accounting.totals()
+    return {
+        "p50": statistics.median(latencies) * 1000,
+        "wire": totals.received_wire / repeat,
+        "decoded": totals.received_decoded / repeat,
+    }
+
+
+def main() -> None:
+    """
+    Run the benchmark and print a comparison table.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--books", default="200,2000,20000")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--bandwidth", type=float, default=50.0, help="Mbit/s")
+    args = parser.parse_args()
+
+    print(
+        f"{'books':>6} {'encoding':<9} {'wire kB':>9} {'decoded kB':>10} "
+        f"{'ratio':>6} {'p50 ms':>7} {'link ms':>8}"
+    )
+    for books in (int(count) for count in args.books.split(",")):
+        with LocalApiServer(build_catalog(books)) as server:
+            for encoding in ENCODINGS:
+                result = run(server, encoding, args.repeat)
+                link = result["wire"] * 8 / (args.bandwidth * 1e6) * 1000
+                print(
+                    f"{books:>6} {encoding:<9} {result['wire'] / 1000:>9.1f} "
+                    f"{result['decoded'] / 1000:>10.1f} "
+                    f"{result['decoded'] / result['wire']:>5.1f}x "
+                    f"{result['p50']:>7.2f} {link:>8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark HTTP/1.1 session pooling against HTTP/2 multiplexing.
+
+Concurrent threads send requests through `AuthorsClient` to the local
+stand-in server, which holds every response back for `--delay` seconds to
+emulate the round trip to a remote service. Each concurrency level runs
+with three transports:
+
+- "requests": one pooled HTTP/1.1 connection per thread
+- "requests/N": HTTP/1.1 limited to `--connections` connections, threads
+  wait for a free one
+- "http2/N": HTTP/2 streams multiplexed over `--connections` connections
+
+Reports throughput, latency percentiles and the TCP connections the server
+accepted. `--delay 0` measures the CPU cost of each protocol stack instead.
+
+Usage:
+    uv run python -m benchmarks.bench_http2 [--requests N]
+        [--concurrency 1,8,32,64] [--connections 2] [--delay 0.02]
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import statistics
+import time
+from typing import Callable
+import requests
+from src.clients.authors_client import AuthorsClient
+from src.clients.base_client import BaseClient
+from src.clients.resilience import ResilienceConfig, ResiliencePolicy
+from src.clients.session_pool import PoolConfig
+from src.clients.transport import Http2Transport, SessionTransport, Transport
+from src.config.settings import Settings
+from src.server.http_server import LocalApiServer
+
+TRANSPORTS = ("requests", "requests/N", "http2/N")
+
+# Requests to compare: one small book, and the 47 kB author list
+CALLS: dict[str, Callable[[BaseClient, int], requests.Response]] = {
+    "GET /Books/{id}": lambda client, index: client.get(
+        f"{client.settings.books_endpoint}/{index % 200 + 1}"
+    ),
+    "GET /Authors": lambda client, _: client.get(client.settings.authors_endpoint),
+}
+
+
+def build_transport(name: str, base_url: str, connections: int) -> Transport:
+    """
+    Create a transport of the given kind for one run.
+    """
+    if name == "http2/N":
+        return Http2Transport(base_url, max_connections=connections)
+    if name == "requests/N":
+        config = PoolConfig(mode="checkout", max_sessions=connections)
+    else:
+        config = PoolConfig(mode="thread")
+    return SessionTransport(BaseClient.create_pool(config), base_url)
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def run(
+    transport_name: str,
+    call_name: str,
+    concurrency: int,
+    count: int,
+    connections: int,
+    delay: float,
+) -> dict[str, float]:
+    """
+    Send `count` requests from `concurrency` threads against a fresh server.
+
+    Returns:
+        Requests per second, p50 and p99 latency in ms and accepted
+        connections
+    """
+    with LocalApiServer(delay=delay) as server:
+        transport = build_transport(transport_name, server.base_url, connections)
+        client = AuthorsClient(
+            settings=Settings(base_url=server.base_url),
+            resilience=ResiliencePolicy(ResilienceConfig(max_attempts=1)),
+            transport=transport,
+        )
+        call = CALLS[call_name]
+
+        def timed(index: int) -> float:
+            started = time.perf_counter()
+            call(client, index).raise_for_status()
+            return time.perf_counter() - started
+
+        with ThreadPoolExecutor(concurrency) as executor:
+            # Open connections before timing
+            list(executor.map(timed, range(concurrency * 2)))
+            started = time.perf_counter()
+            latencies = sorted(executor.map(timed, range(count)))
+            elapsed = time.perf_counter() - started
+
+        transport.close()
+        if isinstance(transport, SessionTransport):
+            transport.pool.close()
+
+    return {
+        "rps": count / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)] * 1000,
+        "connections": server.connections,
+    }
+
+
+def main() -> None:
+    """
+    Run the benchmark and print a comparison table.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", default="1,8,32,64")
+    parser.add_argument("--connections", type=int, default=2)
+    parser.add_argument("--delay", type=float, default=0.02, help="Seconds")
+    args = parser.parse_args()
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    print(
+        f"{'request':<16} {'threads':>7} {'transport':<10} {'req/s':>8} "
+        f"{'p50 ms':>7} {'p99 ms':>7} {'conns':>5} {'speedup':>8}"
+    )
+    for call_name in CALLS:
+        for concurrency in levels:
+            baseline = 0.0
+            for transport_name in TRANSPORTS:
+                result = run(
+                    transport_name,
+                    call_name,
+                    concurrency,
+                    args.requests,
+                    args.connections,
+                    args.delay,
+                )
+                baseline = baseline or result["rps"]
+                print(
+                    f"{call_name:<16} {concurrency:>7} {transport_name:<10} "
+                    f"{result['rps']:>8.0f} {result['p50']:>7.2f} "
+                    f"{result['p99']:>7.2f} {result['connections']:>5.0f} "
+                    f"{result['rps'] / baseline:>7.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark per-object cost of JSON schema validation.
+
+Compares `jsonschema.validate`, which rebuilds the validator on every call,
+with validators precompiled by `SchemaRegistry`.
+
+Usage:
+    uv run python -m benchmarks.bench_schema_validation [--objects N]
+"""
+
+import argparse
+from functools import partial
+import importlib.util
+import timeit
+from typing import Any, Callable
+from jsonschema import validate as json_validate
+from src.models.authors_models import AuthorModels
+from src.models.books_models import BookModels
+from src.utils.schema_registry import SchemaRegistry
+
+
+def sample_authors(count: int) -> list[dict[str, Any]]:
+    """
+    Build author objects shaped like GET /api/v1/Authors items.
+    """
+    return [
+        {
+            "id": index,
+            "idBook": index // 3,
+            "firstName": f"First Name {index}",
+            "lastName": f"Last Name {index}",
+        }
+        for index in range(count)
+    ]
+
+
+def sample_books(count: int) -> list[dict[str, Any]]:
+    """
+    Build book objects shaped like GET /api/v1/Books items.
+    """
+    return [
+        {
+            "id": index,
+            "title": f"Book {index}",
+            "description": "Lorem ipsum dolor sit amet.",
+            "pageCount": index * 10,
+            "excerpt": "Lorem ipsum.",
+            "publishDate": "2025-07-12T13:36:48.000Z",
+        }
+        for index in range(count)
+    ]
+
+
+def uncached_validate(instance: dict[str, Any], schema: dict) -> None:
+    """
+    Validate the way `validate_json_schema` did before the registry.
+    """
+    json_validate(instance=instance, schema=schema)
+
+
+def per_object_us(check: Callable[[dict[str, Any]], None], data: list[dict]) -> float:
+    """
+    Return best-of-five validation cost per object in microseconds.
+    """
+
+    def run() -> None:
+        for item in data:
+            check(item)
+
+    timer = timeit.Timer(run)
+    return min(timer.repeat(repeat=5, number=1)) / len(data) * 1e6
+
+
+def main() -> None:
+    """
+    Run the benchmark and print a comparison table.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=2000)
+    args = parser.parse_args()
+
+    backends = ["jsonschema"]
+    if importlib.util.find_spec("fastjsonschema"):
+        backends.append("fastjsonschema")
+
+    cases = [
+        ("author", AuthorModels.author_response_model, sample_authors(args.objects)),
+        ("book", BookModels.book_response_model, sample_books(args.objects)),
+    ]
+
+    print(f"{'schema':<8} {'validator':<28} {'us/object':>10} {'speedup':>8}")
+    for name, schema, data in cases:
+        baseline = per_object_us(partial(uncached_validate, schema=schema), data)
+        print(f"{name:<8} {'jsonschema.validate':<28} {baseline:>10.2f} {1:>7.1f}x")
+
+        for backend in backends:
+            check = SchemaRegistry(backend).get(schema)
+            cost = per_object_us(check, data)
+            label = f"registry ({backend})"
+            print(f"{name:<8} {label:<28} {cost:>10.2f} {baseline / cost:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Timing harness with warmup, calibrated loops and robust statistics.
+"""
+
+from dataclasses import asdict, dataclass
+from datetime import datetime
+import gc
+import os
+import platform
+import statistics
+import subprocess
+import time
+from typing import Any, Callable, Optional
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:  # pylint: disable=too-many-instance-attributes
+    """
+    Per-operation timing statistics of one benchmark in microseconds.
+
+    Attributes:
+        name: Benchmark name
+        median: Median of the samples, the headline figure
+        q1: First quartile
+        q3: Third quartile
+        mean: Mean of the samples
+        stdev: Standard deviation of the samples
+        minimum: Fastest sample
+        samples: Number of samples
+        loops: Calls per sample
+    """
+
+    name: str
+    median: float
+    q1: float
+    q3: float
+    mean: float
+    stdev: float
+    minimum: float
+    samples: int
+    loops: int
+
+    @property
+    def iqr(self) -> float:
+        """
+        Interquartile range, the spread of the middle half of the samples.
+        """
+        return self.q3 - self.q1
+
+    @property
+    def ops_per_second(self) -> float:
+        """
+        Throughput derived from the median.
+        """
+        return 1e6 / self.median if self.median else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize result to a JSON compatible dictionary.
+        """
+        return asdict(self)
+
+
+def _calibrate(func: Callable[[], Any], min_sample_time: float) -> int:
+    """
+    Return the number of calls that takes at least `min_sample_time` seconds.
+    """
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_sample_time:
+            return loops
+        # Aim slightly above the target, at most 10x per step
+        loops *= min(max(int(min_sample_time / max(elapsed, 1e-9) * 1.2), 2), 10)
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    samples: int = 15,
+    warmup: float = 0.1,
+    min_sample_time: float = 0.02,
+) -> BenchmarkResult:
+    """
+    Time a callable.
+
+    The callable first runs for `warmup` seconds (caches, lazy imports,
+    connection pools), then the number of calls per sample is calibrated
+    so timer resolution is irrelevant. Garbage collection is paused while
+    sampling, as in `timeit`, so collections triggered by earlier work do
+    not land in random samples.
+
+    Args:
+        name: Benchmark name
+        func: Operation to time, called without arguments
+        samples: Number of timed samples
+        warmup: Seconds of untimed calls before sampling
+        min_sample_time: Minimum duration of one sample in seconds
+    """
+    deadline = time.perf_counter() + warmup
+    while time.perf_counter() < deadline:
+        func()
+
+    loops = _calibrate(func, min_sample_time)
+    times = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            started = time.perf_counter()
+            for _ in range(loops):
+                func()
+            times.append((time.perf_counter() - started) / loops * 1e6)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    quartiles = statistics.quantiles(times, n=4) if len(times) > 1 else times * 3
+    return BenchmarkResult(
+        name=name,
+        median=statistics.median(times),
+        q1=quartiles[0],
+        q3=quartiles[2],
+        mean=statistics.fmean(times),
+        stdev=statistics.stdev(times) if len(times) > 1 else 0.0,
+        minimum=min(times),
+        samples=samples,
+        loops=loops,
+    )
+
+
+def git_revision() -> Optional[str]:
+    """
+    Return the current git commit, None outside a repository.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def environment() -> dict[str, Any]:
+    """
+    Describe the machine and revision results were measured on.
+    """
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def change(current: BenchmarkResult, previous: dict[str, Any]) -> tuple[float, bool]:
+    """
+    Compare a result with one loaded from an earlier run.
+
+    Returns:
+        Relative change of the median, and whether it exceeds the noise,
+        i.e. the interquartile ranges of both runs do not overlap
+    """
+    relative = current.median / previous["median"] - 1 if previous["median"] else 0.0
+    significant = current.q1 > previous["q3"] or current.q3 < previous["q1"]
+    return relative, significant
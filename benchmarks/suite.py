@@ -0,0 +1,286 @@
+"""
+Micro-benchmark suite of the framework's per-request hot paths.
+
+Runs offline: requests are answered in-process by `InstantAdapter`, log
+files go to a temporary directory. Results can be written as JSON and
+compared with an earlier run to track the framework's cost across commits.
+
+Usage:
+    uv run python -m benchmarks.suite [--filter TEXT] [--quick]
+        [--output reports/benchmarks/HEAD.json] [--compare BASELINE.json]
+"""
+
+import argparse
+from contextlib import ExitStack
+import json
+import logging
+from pathlib import Path
+import shutil
+import tempfile
+from typing import Any, Callable
+from benchmarks.bench_client_overhead import BOOK, instant_client
+from benchmarks.harness import BenchmarkResult, change, environment, measure
+from src.clients.request_template import RequestTemplate
+from src.data.authors_data import AuthorsData
+from src.data.books_data import BooksData
+from src.data.data_factory import DataFactory
+from src.models.authors_models import AuthorModels
+from src.models.books_models import BookModels
+from src.utils.log_pipeline import LogPipeline
+from src.utils.payload_logging import (
+    Payload,
+    PayloadLogConfig,
+    configure_payload_logging,
+    payload_logger,
+)
+from src.utils.validators import (
+    validate_json_data,
+    validate_json_schema,
+    validate_json_schema_items,
+)
+
+# Builds the callable to time; resources to release go on the stack
+CaseFactory = Callable[[ExitStack], Callable[[], Any]]
+
+
+def client_prepare(_: ExitStack) -> Callable[[], Any]:
+    """
+    Build a GET request from the request template.
+    """
+    client = instant_client(fast_path=True)
+    with client.pool.acquire() as session:
+        template = RequestTemplate.for_session(session, str(client.base_url))
+    return lambda: template.prepare(session, "GET", "/api/v1/Books/1")
+
+
+def client_get(_: ExitStack) -> Callable[[], Any]:
+    """
+    Full `BooksClient.get_book_by_id` call without network.
+    """
+    client = instant_client(fast_path=True)
+    return lambda: client.get_book_by_id(1)
+
+
+def client_post(_: ExitStack) -> Callable[[], Any]:
+    """
+    Full `BooksClient.create_book` call without network.
+    """
+    client = instant_client(fast_path=True)
+    return lambda: client.create_book(BOOK)
+
+
+def books_list(count: int = 200) -> list[dict[str, Any]]:
+    """
+    Return a realistic GET /Books response body.
+    """
+    return [record.data for record in DataFactory(seed=0).books(count)]
+
+
+def json_encode_book(_: ExitStack) -> Callable[[], Any]:
+    """
+    Encode one book payload.
+    """
+    return lambda: json.dumps(BooksData.sample_book_data)
+
+
+def json_decode_book(_: ExitStack) -> Callable[[], Any]:
+    """
+    Decode one book response.
+    """
+    body = json.dumps(BooksData.sample_book_data)
+    return lambda: json.loads(body)
+
+
+def json_encode_books(_: ExitStack) -> Callable[[], Any]:
+    """
+    Encode a list of 200 books.
+    """
+    books = books_list()
+    return lambda: json.dumps(books)
+
+
+def json_decode_books(_: ExitStack) -> Callable[[], Any]:
+    """
+    Decode a list of 200 books.
+    """
+    body = json.dumps(books_list())
+    return lambda: json.loads(body)
+
+
+def schema_author(_: ExitStack) -> Callable[[], Any]:
+    """
+    Validate one author against its response model.
+    """
+    author = {**AuthorsData.sample_author_data}
+    schema = AuthorModels.author_response_model
+    return lambda: validate_json_schema(author, schema)
+
+
+def schema_book(_: ExitStack) -> Callable[[], Any]:
+    """
+    Validate one book against its response model.
+    """
+    schema = BookModels.book_response_model
+    return lambda: validate_json_schema(BooksData.sample_book_data, schema)
+
+
+def schema_books(_: ExitStack) -> Callable[[], Any]:
+    """
+    Validate a list of 200 books item by item.
+    """
+    books = books_list()
+    schema = BookModels.book_response_model
+    return lambda: validate_json_schema_items(books, schema)
+
+
+def json_data_book(_: ExitStack) -> Callable[[], Any]:
+    """
+    Compare a book response with the expected data.
+    """
+    received = {**BooksData.sample_book_data}
+    return lambda: validate_json_data(received, BooksData.sample_book_data, True)
+
+
+def _pipeline_logger(stack: ExitStack) -> logging.Logger:
+    """
+    Return a logger writing through a `LogPipeline` into a temporary file.
+    """
+    directory = Path(tempfile.mkdtemp())
+    stack.callback(shutil.rmtree, directory, ignore_errors=True)
+    pipeline = LogPipeline(
+        directory / "benchmark.log",
+        logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"),
+    )
+    pipeline.start()
+    stack.callback(pipeline.stop)
+
+    logger = logging.getLogger("benchmarks.suite")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(pipeline.handler)
+    stack.callback(logger.removeHandler, pipeline.handler)
+    return logger
+
+
+def logging_line(stack: ExitStack) -> Callable[[], Any]:
+    """
+    Log one request line through the session log pipeline.
+    """
+    logger = _pipeline_logger(stack)
+    return lambda: logger.info("[GET REQ] Endpoint: %s", "/api/v1/Books/1")
+
+
+def logging_filtered(_: ExitStack) -> Callable[[], Any]:
+    """
+    Log call below the logger level.
+    """
+    logger = logging.getLogger("benchmarks.filtered")
+    logger.setLevel(logging.WARNING)
+    return lambda: logger.info("[GET REQ] Endpoint: %s", "/api/v1/Books/1")
+
+
+def logging_payload(stack: ExitStack) -> Callable[[], Any]:
+    """
+    Log a payload in "on_failure" mode, i.e. buffered and never rendered.
+    """
+    logger = _pipeline_logger(stack)
+    capture = configure_payload_logging(PayloadLogConfig(), target=logger.handlers[0])
+    stack.callback(configure_payload_logging, PayloadLogConfig(mode="off"))
+
+    def log_payload() -> None:
+        payload_logger.info("[POST REQ] Data: %s", Payload(BooksData.sample_book_data))
+        if capture is not None:
+            capture.discard()
+
+    return log_payload
+
+
+CASES: dict[str, CaseFactory] = {
+    "client.prepare": client_prepare,
+    "client.get": client_get,
+    "client.post": client_post,
+    "json.encode_book": json_encode_book,
+    "json.decode_book": json_decode_book,
+    "json.encode_books_200": json_encode_books,
+    "json.decode_books_200": json_decode_books,
+    "schema.author": schema_author,
+    "schema.book": schema_book,
+    "schema.books_200": schema_books,
+    "validate_json_data.book": json_data_book,
+    "logging.line": logging_line,
+    "logging.filtered": logging_filtered,
+    "logging.payload_on_failure": logging_payload,
+}
+
+
+def run(selected: list[str], samples: int, warmup: float) -> list[BenchmarkResult]:
+    """
+    Run the selected benchmark cases.
+    """
+    results = []
+    for name in selected:
+        with ExitStack() as stack:
+            results.append(
+                measure(name, CASES[name](stack), samples=samples, warmup=warmup)
+            )
+    return results
+
+
+def print_table(
+    results: list[BenchmarkResult], baseline: dict[str, dict[str, Any]]
+) -> None:
+    """
+    Print results, with the change against a baseline run when given.
+    """
+    header = f"{'benchmark':<30} {'median us':>10} {'iqr us':>8} {'ops/s':>10}"
+    print(header + (f" {'change':>9}" if baseline else ""))
+    for result in results:
+        line = (
+            f"{result.name:<30} {result.median:>10.2f} {result.iqr:>8.2f} "
+            f"{result.ops_per_second:>10.0f}"
+        )
+        previous = baseline.get(result.name)
+        if previous:
+            relative, significant = change(result, previous)
+            line += f" {relative:>+8.1%}{'*' if significant else ' '}"
+        print(line)
+    if baseline:
+        print("* change beyond the interquartile ranges of both runs")
+
+
+def main() -> None:
+    """
+    Run the suite, print the results and optionally save them.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--filter", default="", help="Run cases containing TEXT")
+    parser.add_argument("--quick", action="store_true", help="Fewer samples")
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--compare", type=Path, help="JSON results to compare with")
+    args = parser.parse_args()
+
+    selected = [name for name in CASES if args.filter in name]
+    results = run(
+        selected, samples=5 if args.quick else 15, warmup=0.02 if args.quick else 0.1
+    )
+
+    baseline: dict[str, dict[str, Any]] = {}
+    if args.compare:
+        previous = json.loads(args.compare.read_text(encoding="utf-8"))
+        baseline = {item["name"]: item for item in previous["results"]}
+    print_table(results, baseline)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        document = {
+            "environment": environment(),
+            "results": [result.to_dict() for result in results],
+        }
+        args.output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
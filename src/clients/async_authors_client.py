@@ -0,0 +1,147 @@
+"""
+Asyncio Authors API client with specific endpoints.
+"""
+
+from typing import Dict, Any, Iterable, Optional
+import httpx
+from src.clients.async_base_client import AsyncBaseClient
+from src.clients.cassette import Cassette
+from src.clients.compression import CompressionConfig
+from src.config.settings import Settings
+
+
+class AsyncAuthorsClient(AsyncBaseClient):
+    """
+    Async client for Authors API endpoints.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        max_concurrency: int = 100,
+        http_client: Optional[httpx.AsyncClient] = None,
+        settings: Optional[Settings] = None,
+        timeout: int = 30,
+        compression: Optional[CompressionConfig] = None,
+        cassette: Optional[Cassette] = None,
+    ) -> None:
+        """
+        Initialize async Authors API client.
+
+        Args:
+            max_concurrency: Maximum number of in-flight requests
+            http_client: Shared `httpx.AsyncClient` whose connection pool is reused
+            settings: API settings, the process-wide settings when omitted
+            timeout: Request timeout in seconds
+            compression: Response and request body compression
+            cassette: Cassette recording or replaying requests
+        """
+        super().__init__(
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            http_client=http_client,
+            settings=settings,
+            compression=compression,
+            cassette=cassette,
+        )
+        self.authors_endpoint = self.settings.authors_endpoint
+
+    async def get_all_authors(self) -> httpx.Response:
+        """
+        Get all authors.
+
+        GET /api/v1/Authors – Retrieve a list of all authors.
+
+        Returns:
+            HTTP response object
+        """
+        return await self.get(self.authors_endpoint)
+
+    async def get_author_by_id(self, author_id: int | str) -> httpx.Response:
+        """
+        Get author by ID.
+
+        GET /api/v1/Authors/{id} – Retrieve details of a specific author by their ID.
+
+        Args:
+            author_id: Author ID to retrieve
+
+        Returns:
+            HTTP response object
+        """
+        return await self.get(f"{self.authors_endpoint}/{author_id}")
+
+    async def create_author(self, author_data: Dict[str, Any]) -> httpx.Response:
+        """
+        Create a new author.
+
+        POST /api/v1/Authors – Add a new author to the system.
+
+        Args:
+            author_data: Author data dictionary
+
+        Returns:
+            HTTP response object
+        """
+        return await self.post(self.authors_endpoint, data=author_data)
+
+    async def update_author(
+        self, author_id: int | str, author_data: Dict[str, Any]
+    ) -> httpx.Response:
+        """
+        Update existing author.
+
+        PUT /api/v1/Authors/{id} – Update an existing author's details.
+
+        Args:
+            author_id: Author ID to update
+            author_data: Updated author data
+
+        Returns:
+            HTTP response object
+        """
+        return await self.put(f"{self.authors_endpoint}/{author_id}", data=author_data)
+
+    async def delete_author(self, author_id: int) -> httpx.Response:
+        """
+        Delete author by ID.
+
+        DELETE /api/v1/Authors/{id} – Delete an author by their ID.
+
+        Args:
+            author_id: Author ID to delete
+
+        Returns:
+            HTTP response object
+        """
+        return await self.delete(f"{self.authors_endpoint}/{author_id}")
+
+    async def get_authors_by_book_id(self, book_id: int | str) -> httpx.Response:
+        """
+        Get authors by book ID.
+
+        GET /api/v1/Authors/authors/books/{idBook} – Retrieve authors for a specific book.
+
+        Args:
+            book_id: Book ID to get authors for
+
+        Returns:
+            HTTP response object
+        """
+        return await self.get(f"{self.authors_endpoint}/authors/books/{book_id}")
+
+    async def get_authors_by_book_ids(
+        self, book_ids: Iterable[int | str]
+    ) -> list[httpx.Response]:
+        """
+        Get authors for several books concurrently.
+
+        Args:
+            book_ids: Book IDs to get authors for
+
+        Returns:
+            HTTP responses in the same order as `book_ids`
+        """
+        return await self.gather(
+            self.get_authors_by_book_id(book_id) for book_id in book_ids
+        )
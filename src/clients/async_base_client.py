@@ -0,0 +1,380 @@
+"""
+Asyncio HTTP client base abstract class for API testing.
+"""
+
+from abc import ABC
+import asyncio
+from dataclasses import dataclass
+import logging
+from types import TracebackType
+from typing import Any, Awaitable, Dict, Iterable, Optional, Self, Type, TypeVar
+import time
+import weakref
+import httpx
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from src.clients.cassette import Cassette
+from src.clients.compression import CompressionConfig, default_compression, encode_body
+from src.clients.request_timing import RequestTiming, TimedResponse
+from src.clients.transport import TraceTiming
+from src.config.settings import Settings, get_settings
+from src.utils.byte_accounting import ByteCounts, byte_accounting
+from src.utils.latency_metrics import latency_recorder
+from src.utils.payload_logging import Payload, payload_logger
+
+T = TypeVar("T")
+
+
+# Headers describing the wire form of a body, dropped when a replayed body
+# is handed to httpx already decoded
+_WIRE_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+@dataclass(frozen=True)
+class _LoopState:
+    """
+    Per event loop state of an async client.
+    """
+
+    semaphore: asyncio.Semaphore
+    session: httpx.AsyncClient
+
+
+def _recordable(response: httpx.Response) -> Response:
+    """
+    Return a read httpx response in the form a `Cassette` records.
+    """
+    recordable = TimedResponse()
+    recordable.status_code = response.status_code
+    recordable.reason = response.reason_phrase
+    recordable.url = str(response.url)
+    recordable.headers = CaseInsensitiveDict(response.headers)
+    recordable.elapsed = response.elapsed
+    recordable.timing = getattr(response, "timing", RequestTiming())
+    # pylint: disable=protected-access
+    recordable._content = response.content
+    recordable._content_consumed = True  # type: ignore[attr-defined]
+    return recordable
+
+
+def _replayed(recorded: Response, request: httpx.Request) -> httpx.Response:
+    """
+    Return a response replayed by a `Cassette` as an httpx response.
+    """
+    headers = [
+        (name, value)
+        for name, value in recorded.headers.items()
+        if name.lower() not in _WIRE_HEADERS
+    ]
+    response = httpx.Response(
+        recorded.status_code,
+        headers=headers,
+        content=recorded.content,
+        request=request,
+    )
+    response.elapsed = recorded.elapsed
+    response.timing = getattr(recorded, "timing", None)  # type: ignore[attr-defined]
+    return response
+
+
+class AsyncBaseClient(ABC):  # pylint: disable=too-many-instance-attributes
+    """
+    Asyncio HTTP Base Client wrapper for API testing.
+
+    Mirrors the request surface of `BaseClient`, but every call is a coroutine.
+    The number of in-flight requests is bounded by a semaphore and connections
+    are pooled by a single `httpx.AsyncClient`, which can be shared between
+    several clients to reuse the same pool. Both are bound to the event loop
+    they are first used on, so a client used by several loops, e.g. over
+    repeated `asyncio.run` calls, keeps a semaphore and, unless the
+    `httpx.AsyncClient` is shared, a connection pool per loop.
+
+    Like `BaseClient`, requests are timed (`response.timing`), bodies are
+    compressed and payload bytes accounted as the `CompressionConfig` asks,
+    and a cassette records or replays the exchanges.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_concurrency: int = 100,
+        http_client: Optional[httpx.AsyncClient] = None,
+        settings: Optional[Settings] = None,
+        compression: Optional[CompressionConfig] = None,
+        cassette: Optional[Cassette] = None,
+    ):
+        """
+        Initialize async API client.
+
+        Args:
+            timeout: Request timeout in seconds
+            max_concurrency: Maximum number of in-flight requests for this client
+            http_client: Shared `httpx.AsyncClient` whose connection pool is reused
+            settings: API settings, the process-wide settings when omitted
+            compression: Response and request body compression, the
+                process-wide configuration when omitted
+            cassette: Cassette recording or replaying all requests, see
+                `BaseClient.create_cassette`
+        """
+
+        self.settings = settings or get_settings()
+        self.base_url = self.settings.base_url
+
+        if not self.base_url:
+            raise ValueError(
+                "Base URL must be set in environment variables (.env) file in project root."
+            )
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        logging.info("Base URL: %s", self.base_url)
+        logging.info("HTTP Response Timeout: %s seconds", self.timeout)
+        logging.info("Max Concurrent Requests: %s", self.max_concurrency)
+
+        self._http_client = http_client
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopState
+        ] = weakref.WeakKeyDictionary()
+        if http_client is not None:
+            self._setup_session(http_client)
+        self.compression = compression or default_compression()
+        self.cassette = cassette
+        # The shared client accepts the process-wide codings, other ones go
+        # per request
+        accept_encoding = self.compression.accept_encoding_header
+        self._accept_encoding = (
+            {"Accept-Encoding": accept_encoding}
+            if accept_encoding != default_compression().accept_encoding_header
+            else {}
+        )
+
+    @staticmethod
+    def create_http_client(
+        max_connections: int = 100, timeout: int = 30
+    ) -> httpx.AsyncClient:
+        """
+        Create an `httpx.AsyncClient` suitable for sharing between async clients.
+
+        Args:
+            max_connections: Maximum number of pooled connections
+            timeout: Request timeout in seconds
+
+        Returns:
+            Configured `httpx.AsyncClient`
+        """
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+    @staticmethod
+    def _setup_session(session: httpx.AsyncClient) -> None:
+        """
+        Configure the HTTP session.
+        """
+        session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Accept-Encoding": default_compression().accept_encoding_header,
+            }
+        )
+
+    def _loop_state(self) -> _LoopState:
+        """
+        Return the semaphore and HTTP client of the running event loop,
+        creating them on its first request.
+        """
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            session = self._http_client
+            if session is None:
+                session = self.create_http_client(
+                    max_connections=self.max_concurrency, timeout=self.timeout
+                )
+                self._setup_session(session)
+            state = _LoopState(asyncio.Semaphore(self.max_concurrency), session)
+            self._loops[loop] = state
+        return state
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """
+        HTTP client sending the requests of the running event loop.
+        """
+        return self._loop_state().session
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the connection pool of the running event loop if it is owned
+        by this client.
+        """
+        state = self._loops.pop(asyncio.get_running_loop(), None)
+        if state is not None and self._http_client is None:
+            await state.session.aclose()
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[dict[str, Any]] = None,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Make HTTP request within the concurrency limit.
+
+        Latency and payload bytes are recorded in the session-wide
+        `latency_recorder` and `byte_accounting`. A replaying cassette
+        answers without contacting the service and records neither.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint
+            data: Request body data
+            params: Query parameters
+            headers: Additional headers
+
+        Returns:
+            Response object, with its body read
+
+        Raises:
+            CassetteMismatchError: Replayed request was not recorded
+        """
+        body, decoded_size, content_encoding = encode_body(data, self.compression)
+        headers = {
+            **self._accept_encoding,
+            **({"Content-Encoding": content_encoding} if content_encoding else {}),
+            **(headers or {}),
+        }
+        trace = TraceTiming()
+        state = self._loop_state()
+        request = state.session.build_request(
+            method,
+            f"{self.base_url}/{endpoint.lstrip('/')}",
+            content=body,
+            params=params,
+            headers=headers,
+            timeout=self.timeout,
+            extensions={"trace": trace},
+        )
+
+        if self.cassette is not None and self.cassette.replaying:
+            return _replayed(
+                self.cassette.replay(method, endpoint, params, data), request
+            )
+
+        async with state.semaphore:
+            started = time.perf_counter()
+            trace.mark("request")
+            response = await state.session.send(request, stream=True)
+            trace.mark("response.headers")
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            trace.mark("response.body")
+            latency_recorder.record(method, endpoint, time.perf_counter() - started)
+
+        response.timing = trace.timing()  # type: ignore[attr-defined]
+        byte_accounting.record(
+            method,
+            endpoint,
+            ByteCounts(
+                requests=1,
+                sent_wire=len(body) if body is not None else 0,
+                sent_decoded=decoded_size,
+                received_wire=response.num_bytes_downloaded,
+                received_decoded=len(response.content),
+            ),
+        )
+        if self.cassette is not None and self.cassette.recording:
+            self.cassette.record(method, endpoint, params, data, _recordable(response))
+        return response
+
+    async def gather(self, requests: Iterable[Awaitable[T]]) -> list[T]:
+        """
+        Run request coroutines concurrently and return results in input order.
+
+        Concurrency is still bounded by `max_concurrency`.
+        """
+        return list(await asyncio.gather(*requests))
+
+    async def get(
+        self, endpoint: str, params: Optional[dict[str, Any]] = None
+    ) -> httpx.Response:
+        """
+        GET request.
+        """
+        logging.info("[GET REQ] Endpoint: %s, Params: %s", endpoint, params)
+        response = await self._make_request("GET", endpoint, params=params)
+        logging.info("[GET RSP] Code: %s", response.status_code)
+        payload_logger.info("[GET RSP] Data: %s", Payload(response))
+        return response
+
+    async def post(
+        self, endpoint: str, data: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """
+        POST request.
+        """
+        logging.info("[POST REQ] Endpoint: %s", endpoint)
+        payload_logger.info("[POST REQ] Data: %s", Payload(data))
+        response = await self._make_request("POST", endpoint, data=data)
+        logging.info("[POST RSP] Code: %s", response.status_code)
+        payload_logger.info("[POST RSP] Data: %s", Payload(response))
+        return response
+
+    async def put(
+        self, endpoint: str, data: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """
+        PUT request.
+        """
+        logging.info("[PUT REQ] Endpoint: %s", endpoint)
+        payload_logger.info("[PUT REQ] Data: %s", Payload(data))
+        response = await self._make_request("PUT", endpoint, data=data)
+        logging.info("[PUT RSP] Code: %s", response.status_code)
+        payload_logger.info("[PUT RSP] Data: %s", Payload(response))
+        return response
+
+    async def delete(self, endpoint: str) -> httpx.Response:
+        """
+        DELETE request.
+        """
+        logging.info("[DELETE REQ] Endpoint: %s", endpoint)
+        response = await self._make_request("DELETE", endpoint)
+        logging.info("[DELETE RSP] Code: %s", response.status_code)
+        payload_logger.info("[DELETE RSP] Data: %s", Payload(response))
+        return response
+
+    async def patch(
+        self, endpoint: str, data: Optional[Dict[str, Any]] = None
+    ) -> httpx.Response:
+        """
+        PATCH request.
+        """
+        logging.info("[PATCH REQ] Endpoint: %s", endpoint)
+        payload_logger.info("[PATCH REQ] Data: %s", Payload(data))
+        response = await self._make_request("PATCH", endpoint, data=data)
+        logging.info("[PATCH RSP] Code: %s", response.status_code)
+        payload_logger.info("[PATCH RSP] Data: %s", Payload(response))
+        return response
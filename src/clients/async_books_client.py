@@ -0,0 +1,103 @@
+"""
+Asyncio Books API client with specific endpoints.
+"""
+
+from typing import Dict, Any, Iterable, Optional
+import httpx
+from src.clients.async_base_client import AsyncBaseClient
+from src.clients.cassette import Cassette
+from src.clients.compression import CompressionConfig
+from src.config.settings import Settings
+
+
+class AsyncBooksClient(AsyncBaseClient):
+    """
+    Async client for Books API endpoints.
+    """
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        max_concurrency: int = 100,
+        http_client: Optional[httpx.AsyncClient] = None,
+        settings: Optional[Settings] = None,
+        timeout: int = 30,
+        compression: Optional[CompressionConfig] = None,
+        cassette: Optional[Cassette] = None,
+    ) -> None:
+        """
+        Initialize async Books API client.
+
+        Args:
+            max_concurrency: Maximum number of in-flight requests
+            http_client: Shared `httpx.AsyncClient` whose connection pool is reused
+            settings: API settings, the process-wide settings when omitted
+            timeout: Request timeout in seconds
+            compression: Response and request body compression
+            cassette: Cassette recording or replaying requests
+        """
+        super().__init__(
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            http_client=http_client,
+            settings=settings,
+            compression=compression,
+            cassette=cassette,
+        )
+        self.books_endpoint = self.settings.books_endpoint
+
+    async def get_all_books(self) -> httpx.Response:
+        """
+        Get all books.
+
+        """
+        return await self.get(self.books_endpoint)
+
+    async def get_book_by_id(self, book_id: int | str | object) -> httpx.Response:
+        """
+        Get book by ID.
+
+        """
+        return await self.get(f"{self.books_endpoint}/{book_id}")
+
+    async def get_books_by_ids(
+        self, book_ids: Iterable[int | str | object]
+    ) -> list[httpx.Response]:
+        """
+        Get several books concurrently.
+
+        Args:
+            book_ids: Book IDs to retrieve
+
+        Returns:
+            HTTP responses in the same order as `book_ids`
+        """
+        return await self.gather(self.get_book_by_id(book_id) for book_id in book_ids)
+
+    async def create_book(self, book_data: Dict[str, Any]) -> httpx.Response:
+        """
+        Create a new book.
+
+        """
+        return await self.post(self.books_endpoint, data=book_data)
+
+    async def update_book(
+        self, book_id: int | object, book_data: Dict[str, Any]
+    ) -> httpx.Response:
+        """
+        Update existing book.
+
+        Args:
+            book_id: Book ID to update
+            book_data: Updated book data
+        """
+        return await self.put(f"{self.books_endpoint}/{book_id}", data=book_data)
+
+    async def delete_book(self, book_id: int | object) -> httpx.Response:
+        """
+        Delete book by ID.
+
+        Args:
+            book_id: Book ID to delete
+        """
+        return await self.delete(f"{self.books_endpoint}/{book_id}")
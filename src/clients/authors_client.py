@@ -2,10 +2,18 @@
 Authors API client with specific endpoints.
 """
 
-import os
-from typing import Dict, Any
+from typing import Dict, Any, Generator, Iterable, Optional
 import requests
 from src.clients.base_client import BaseClient
+from src.clients.bulk import BulkResult, ProgressCallback, run_bulk
+from src.clients.cassette import Cassette
+from src.clients.compression import CompressionConfig
+from src.clients.resilience import ResiliencePolicy
+from src.clients.response_cache import ResponseCache
+from src.clients.session_pool import SessionPool
+from src.clients.transport import Transport
+from src.clients.validator_cache import ValidatorCache
+from src.config.settings import Settings
 
 
 class AuthorsClient(BaseClient):
@@ -13,14 +21,49 @@ class AuthorsClient(BaseClient):
     Client for Authors API endpoints.
     """
 
-    def __init__(self) -> None:
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        pool: Optional[SessionPool] = None,
+        cache: Optional[ResponseCache] = None,
+        cassette: Optional[Cassette] = None,
+        settings: Optional[Settings] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+        transport: Optional[Transport] = None,
+        compression: Optional[CompressionConfig] = None,
+        validators: Optional[ValidatorCache] = None,
+        cache_enabled: bool = True,
+        conditional_enabled: bool = True,
+    ) -> None:
         """
         Initialize Authors API client.
+
+        Args:
+            pool: Session pool shared with other clients
+            cache: GET response cache shared with other clients
+            cassette: Cassette recording or replaying requests
+            settings: API settings, the process-wide settings when omitted
+            resilience: Retry and circuit breaker policy
+            transport: Transport sending the requests
+            compression: Response and request body compression
+            validators: Validator cache for conditional GETs shared with
+                other clients
+            cache_enabled: False sends every GET to the service
+            conditional_enabled: False sends every GET without validators
         """
-        super().__init__()
-        self.authors_endpoint = (
-            f"/api/{os.getenv('API_VERSION')}/{os.getenv('AUTHORS_API_ENDPOINT')}"
+        super().__init__(
+            pool=pool,
+            cache=cache,
+            cassette=cassette,
+            settings=settings,
+            resilience=resilience,
+            transport=transport,
+            compression=compression,
+            validators=validators,
+            cache_enabled=cache_enabled,
+            conditional_enabled=conditional_enabled,
         )
+        self.authors_endpoint = self.settings.authors_endpoint
 
     def get_all_authors(self) -> requests.Response:
         """
@@ -33,6 +76,17 @@ class AuthorsClient(BaseClient):
         """
         return self.get(self.authors_endpoint)
 
+    def iter_all_authors(self) -> Generator[Dict[str, Any], None, None]:
+        """
+        Get all authors, yielding each author as soon as it is downloaded.
+
+        GET /api/v1/Authors – Retrieve a list of all authors, streamed.
+
+        Returns:
+            Iterator over author objects
+        """
+        return self.stream_items(self.authors_endpoint)
+
     def get_author_by_id(self, author_id: int | str) -> requests.Response:
         """
         Get author by ID.
@@ -105,3 +159,55 @@ class AuthorsClient(BaseClient):
             HTTP response object
         """
         return self.get(f"{self.authors_endpoint}/authors/books/{book_id}")
+
+    def create_authors_bulk(
+        self,
+        authors: Iterable[Dict[str, Any]],
+        concurrency: int = 16,
+        progress: Optional[ProgressCallback] = None,
+    ) -> BulkResult:
+        """
+        Create many authors concurrently.
+
+        Args:
+            authors: Author data, may be a lazy stream
+            concurrency: Maximum number of requests in flight
+            progress: Called with (completed, total) as the operation advances
+
+        Returns:
+            IDs of created authors and failures
+        """
+        return run_bulk(
+            authors,
+            self.create_author,
+            key=lambda author: author.get("id"),
+            concurrency=concurrency,
+            progress=progress,
+            total=len(authors) if isinstance(authors, list) else None,
+        )
+
+    def delete_authors_bulk(
+        self,
+        author_ids: Iterable[int],
+        concurrency: int = 16,
+        progress: Optional[ProgressCallback] = None,
+    ) -> BulkResult:
+        """
+        Delete many authors concurrently.
+
+        Args:
+            author_ids: IDs of authors to delete
+            concurrency: Maximum number of requests in flight
+            progress: Called with (completed, total) as the operation advances
+
+        Returns:
+            IDs of deleted authors and failures
+        """
+        return run_bulk(
+            author_ids,
+            self.delete_author,
+            key=lambda author_id: author_id,
+            concurrency=concurrency,
+            progress=progress,
+            total=len(author_ids) if isinstance(author_ids, list) else None,
+        )
@@ -4,29 +4,81 @@ HTTP client base abstract class for API testing.
 
 from abc import ABC
 import logging
-from typing import Dict, Any, Optional
-import os
+from typing import Dict, Any, Generator, Iterator, Optional
+import time
 import requests
-from dotenv import load_dotenv
+from src.clients.cassette import Cassette, CassetteConfig
+from src.clients.compression import (
+    CompressionConfig,
+    default_compression,
+    encode_body,
+)
+from src.clients.resilience import ResiliencePolicy, default_policy
+from src.clients.response_cache import CacheConfig, ResponseCache
+from src.clients.session_pool import PoolConfig, SessionPool
+from src.clients.transport import Transport, create_transport
+from src.clients.validator_cache import ValidatorCache, ValidatorConfig
+from src.config.settings import Settings, get_settings
+from src.utils.byte_accounting import (
+    ByteCounts,
+    byte_accounting,
+    received_wire_bytes,
+)
+from src.utils.json_stream import DEFAULT_CHUNK_SIZE, iter_json_array
+from src.utils.latency_metrics import latency_recorder
+from src.utils.payload_logging import Payload, payload_logger
 
 
-class BaseClient(ABC):
+class BaseClient(ABC):  # pylint: disable=too-many-instance-attributes
     """
     HTTP Base Client wrapper for API testing.
     """
 
-    def __init__(self, timeout: int = 30):
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        timeout: int = 30,
+        pool: Optional[SessionPool] = None,
+        cache: Optional[ResponseCache] = None,
+        cassette: Optional[Cassette] = None,
+        settings: Optional[Settings] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+        transport: Optional[Transport] = None,
+        compression: Optional[CompressionConfig] = None,
+        validators: Optional[ValidatorCache] = None,
+        cache_enabled: bool = True,
+        conditional_enabled: bool = True,
+    ):
         """
-        Initialize API client and load configuration files.
+        Initialize API client.
 
         Args:
-            base_url: Base URL for the API
-            timeout: Request timeout in seconds
+            timeout: Read timeout in seconds, see `ResilienceConfig` for the
+                connect timeout
+            pool: Session pool shared with other clients, created from the
+                settings when omitted
+            cache: GET response cache shared with other clients, created
+                from the settings when omitted (None while caching is disabled)
+            cassette: Cassette recording or replaying all requests, see
+                `create_cassette`
+            settings: API settings, the process-wide settings when omitted
+            resilience: Retry and circuit breaker policy, the process-wide
+                policy when omitted
+            transport: Transport sending the requests, selected by
+                `Settings.transport` when omitted
+            compression: Response and request body compression, the
+                process-wide configuration when omitted
+            validators: Validator cache for conditional GETs shared with
+                other clients, created from the settings when omitted (None
+                while conditional requests are disabled)
+            cache_enabled: False sends every GET to the service, ignoring
+                `cache` and HTTP_CACHE_ENABLED
+            conditional_enabled: False sends every GET without validators,
+                ignoring `validators` and HTTP_CONDITIONAL_ENABLED
         """
 
-        load_dotenv()
-
-        self.base_url = os.getenv("BOOKS_API_BASE_URL")
+        self.settings = settings or get_settings()
+        self.base_url = self.settings.base_url
 
         if not self.base_url:
             raise ValueError(
@@ -37,15 +89,114 @@ class BaseClient(ABC):
         logging.info("Base URL: %s", self.base_url)
         logging.info("HTTP Response Timeout: %s seconds", self.timeout)
 
-        self.session = requests.Session()
-        self._setup_session()
+        self.pool = pool or self.create_pool(self.settings.section(PoolConfig.from_env))
+        self.cache: Optional[ResponseCache] = None
+        if cache_enabled:
+            self.cache = (
+                cache
+                if cache is not None
+                else self.create_cache(self.settings.section(CacheConfig.from_env))
+            )
+        self.cassette = cassette
+        self.resilience = resilience or default_policy()
+        self.transport = transport or create_transport(self.settings, self.pool)
+        self.compression = compression or default_compression()
+        self.validators: Optional[ValidatorCache] = None
+        if conditional_enabled:
+            self.validators = (
+                validators
+                if validators is not None
+                else self.create_validator_cache(
+                    self.settings.section(ValidatorConfig.from_env)
+                )
+            )
+        # Sessions accept the process-wide codings, other ones go per request
+        accept_encoding = self.compression.accept_encoding_header
+        self._accept_encoding = (
+            {"Accept-Encoding": accept_encoding}
+            if accept_encoding != default_compression().accept_encoding_header
+            else {}
+        )
+
+    @classmethod
+    def create_pool(cls, config: Optional[PoolConfig] = None) -> SessionPool:
+        """
+        Create a session pool suitable for sharing between clients.
+
+        Args:
+            config: Pool configuration, that of the process settings when
+                omitted
+
+        Returns:
+            Session pool configuring sessions the way this client expects
+        """
+        return SessionPool(config=config, session_setup=cls._setup_session)
 
-    def _setup_session(self) -> None:
+    @staticmethod
+    def create_cache(config: Optional[CacheConfig] = None) -> Optional[ResponseCache]:
+        """
+        Create a GET response cache suitable for sharing between clients.
+
+        Args:
+            config: Cache configuration, that of the process settings when
+                omitted
+
+        Returns:
+            Response cache, or None when caching is disabled
+        """
+        config = config or get_settings().section(CacheConfig.from_env)
+        return ResponseCache(config) if config.enabled else None
+
+    @staticmethod
+    def create_validator_cache(
+        config: Optional[ValidatorConfig] = None,
+    ) -> Optional[ValidatorCache]:
+        """
+        Create a validator cache suitable for sharing between clients.
+
+        Args:
+            config: Validator cache configuration, that of the process
+                settings when omitted
+
+        Returns:
+            Validator cache, or None when conditional requests are disabled
+        """
+        config = config or get_settings().section(ValidatorConfig.from_env)
+        return ValidatorCache(config) if config.enabled else None
+
+    @staticmethod
+    def create_cassette(config: Optional[CassetteConfig] = None) -> Optional[Cassette]:
+        """
+        Create a cassette suitable for sharing between clients.
+
+        Args:
+            config: Cassette configuration, that of the process settings
+                when omitted
+
+        Returns:
+            Empty recording cassette, cassette loaded from the cassette files
+            for replay, or None when cassettes are off
+        """
+        config = config or get_settings().section(CassetteConfig.from_env)
+        if config.mode == "replay":
+            return Cassette.load(config.files())
+        return Cassette() if config.mode == "record" else None
+
+    @property
+    def _replaying(self) -> bool:
+        return self.cassette is not None and self.cassette.replaying
+
+    @staticmethod
+    def _setup_session(session: requests.Session) -> None:
         """
         Configure the HTTP session.
         """
-        self.session.headers.update(
-            {"Content-Type": "application/json", "Accept": "application/json"}
+        session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "Accept-Encoding": default_compression().accept_encoding_header,
+            }
         )
 
     # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -56,63 +207,202 @@ class BaseClient(ABC):
         data: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """
         Make HTTP request with logging and error handling.
 
+        Requests are sent by the client's `Transport`: pooled `requests`
+        sessions over HTTP/1.1, or HTTP/2 streams (HTTP_TRANSPORT=http2).
+
+        Attempts are made by the client's `ResiliencePolicy`: idempotent
+        requests are retried with jittered backoff and requests to a host
+        whose circuit breaker is open fail fast.
+
+        Bodies are encoded once and compressed as the client's
+        `CompressionConfig` asks. Latency and payload bytes of every
+        completed attempt are recorded per method and endpoint in the
+        session-wide `latency_recorder` and `byte_accounting`. A recording
+        cassette captures the exchange; a replaying one answers without
+        contacting the service and records neither.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint
             data: Request body data
             params: Query parameters
             headers: Additional headers
+            stream: Return once headers arrive and leave the body unread;
+                latency and bytes are then left to the caller to record
 
         Returns:
             Response object
+
+        Raises:
+            CassetteMismatchError: Replayed request was not recorded
+            CircuitOpenError: The API host's circuit is open
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if self.cassette is not None and self._replaying:
+            return self.cassette.replay(method, endpoint, params, data)
 
-        # Merge headers
-        request_headers = dict(self.session.headers).copy()
+        timeout = self.resilience.timeout(self.timeout)
+        transport = self.transport
+        body, decoded_size, content_encoding = encode_body(data, self.compression)
+        if content_encoding or self._accept_encoding:
+            headers = {
+                **self._accept_encoding,
+                **({"Content-Encoding": content_encoding} if content_encoding else {}),
+                **(headers or {}),
+            }
+        sent = (len(body) if body is not None else 0, decoded_size)
 
-        if headers:
-            request_headers.update(headers)
+        def timed_send() -> requests.Response:
+            started = time.perf_counter()
+            response = transport.send(
+                method, endpoint, body, params, headers, timeout, stream
+            )
+            if not stream:
+                latency_recorder.record(method, endpoint, time.perf_counter() - started)
+                byte_accounting.record_response(method, endpoint, response, sent)
+            return response
 
-        response = self.session.request(
-            method=method,
-            url=url,
-            json=data,
-            params=params,
-            headers=request_headers,
-            timeout=self.timeout,
+        response = self.resilience.execute(
+            method, str(self.base_url), endpoint, timed_send
         )
 
+        if self.cassette is not None and self.cassette.recording:
+            self.cassette.record(method, endpoint, params, data, response)
         return response
 
+    def _invalidate(self, endpoint: str) -> None:
+        """
+        Drop cached GET responses of the resource written to.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+        if self.validators is not None:
+            self.validators.invalidate(endpoint)
+
+    def _write(
+        self, method: str, endpoint: str, data: Optional[dict[str, Any]] = None
+    ) -> requests.Response:
+        """
+        Send a request changing a resource and drop its cached responses.
+
+        They are dropped even when the request raises: a write that timed
+        out or lost its connection may still have been applied.
+        """
+        try:
+            return self._make_request(method, endpoint, data=data)
+        finally:
+            self._invalidate(endpoint)
+
     def get(
         self, endpoint: str, params: Optional[dict[str, Any]] = None
     ) -> requests.Response:
         """
         GET request.
+
+        With a validator cache, a repeated GET is sent with the validators
+        of the earlier response and a 304 Not Modified answer is replaced
+        by that response.
         """
         logging.info("[GET REQ] Endpoint: %s, Params: %s", endpoint, params)
-        response = self._make_request("GET", endpoint, params=params)
-        logging.info(
-            "[GET RSP] Code: %s, Data: %s", response.status_code, response.text
-        )
+        key = ResponseCache.key(endpoint, params)
+        if self.cache is not None:
+            generation = self.cache.generation
+            cached = self.cache.get(key)
+            if cached is not None:
+                logging.info("[GET RSP] Code: %s (cached)", cached.status_code)
+                return cached
+
+        if self.validators is None:
+            response = self._make_request("GET", endpoint, params=params)
+        else:
+            response = self._make_request(
+                "GET",
+                endpoint,
+                params=params,
+                headers=self.validators.conditional_headers(key),
+            )
+            if response.status_code == 304:
+                logging.info("[GET RSP] Code: 304 (not modified)")
+            response = self.validators.resolve(key, response)
+        if self.cache is not None:
+            self.cache.put(key, response, generation)
+        logging.info("[GET RSP] Code: %s", response.status_code)
+        payload_logger.info("[GET RSP] Data: %s", Payload(response))
         return response
 
+    def get_stream(
+        self, endpoint: str, params: Optional[dict[str, Any]] = None
+    ) -> requests.Response:
+        """
+        GET request returning before the body is read.
+
+        `stream_items` uses it to process large JSON arrays while they
+        download. Streamed responses bypass the response cache.
+        """
+        logging.info("[GET REQ] Endpoint: %s, Params: %s (stream)", endpoint, params)
+        response = self._make_request("GET", endpoint, params=params, stream=True)
+        logging.info("[GET RSP] Code: %s", response.status_code)
+        return response
+
+    def stream_items(
+        self, endpoint: str, params: Optional[dict[str, Any]] = None
+    ) -> Generator[Any, None, None]:
+        """
+        GET a JSON array and yield its elements as they arrive.
+
+        The response is closed and its latency and bytes recorded once the
+        array has been consumed, or as soon as the iteration fails or is
+        abandoned.
+
+        Raises:
+            requests.HTTPError: Response status is not successful
+        """
+        started = time.perf_counter()
+        response = self.get_stream(endpoint, params)
+        count = 0
+        decoded = 0
+
+        def chunks() -> Iterator[bytes]:
+            nonlocal decoded
+            for chunk in response.iter_content(DEFAULT_CHUNK_SIZE):
+                decoded += len(chunk)
+                yield chunk
+
+        try:
+            response.raise_for_status()
+            for item in iter_json_array(chunks()):
+                count += 1
+                yield item
+        finally:
+            response.close()
+            if not self._replaying:
+                latency_recorder.record("GET", endpoint, time.perf_counter() - started)
+                byte_accounting.record(
+                    "GET",
+                    endpoint,
+                    ByteCounts(
+                        requests=1,
+                        received_wire=received_wire_bytes(response),
+                        received_decoded=decoded,
+                    ),
+                )
+            logging.info("[GET RSP] Streamed %s items", count)
+
     def post(
         self, endpoint: str, data: Optional[Dict[str, Any]] = None
     ) -> requests.Response:
         """
         POST request.
         """
-        logging.info("[POST REQ] Endpoint: %s, Data: %s", endpoint, data)
-        response = self._make_request("POST", endpoint, data=data)
-        logging.info(
-            "[POST RSP] Code: %s, Data: %s", response.status_code, response.text
-        )
+        logging.info("[POST REQ] Endpoint: %s", endpoint)
+        payload_logger.info("[POST REQ] Data: %s", Payload(data))
+        response = self._write("POST", endpoint, data)
+        logging.info("[POST RSP] Code: %s", response.status_code)
+        payload_logger.info("[POST RSP] Data: %s", Payload(response))
         return response
 
     def put(
@@ -121,11 +411,11 @@ class BaseClient(ABC):
         """
         PUT request.
         """
-        logging.info("[PUT REQ] Endpoint: %s, Data: %s", endpoint, data)
-        response = self._make_request("PUT", endpoint, data=data)
-        logging.info(
-            "[PUT RSP] Code: %s, Data: %s", response.status_code, response.text
-        )
+        logging.info("[PUT REQ] Endpoint: %s", endpoint)
+        payload_logger.info("[PUT REQ] Data: %s", Payload(data))
+        response = self._write("PUT", endpoint, data)
+        logging.info("[PUT RSP] Code: %s", response.status_code)
+        payload_logger.info("[PUT RSP] Data: %s", Payload(response))
         return response
 
     def delete(self, endpoint: str) -> requests.Response:
@@ -133,10 +423,9 @@ class BaseClient(ABC):
         DELETE request.
         """
         logging.info("[DELETE REQ] Endpoint: %s", endpoint)
-        response = self._make_request("DELETE", endpoint)
-        logging.info(
-            "[DELETE RSP] Code: %s, Data: %s", response.status_code, response.text
-        )
+        response = self._write("DELETE", endpoint)
+        logging.info("[DELETE RSP] Code: %s", response.status_code)
+        payload_logger.info("[DELETE RSP] Data: %s", Payload(response))
         return response
 
     def patch(
@@ -145,9 +434,9 @@ class BaseClient(ABC):
         """
         PATCH request.
         """
-        logging.info("[PATCH REQ] Endpoint: %s, Data: %s", endpoint, data)
-        response = self._make_request("PATCH", endpoint, data=data)
-        logging.info(
-            "[PATCH RSP] Code: %s, Data: %s", response.status_code, response.text
-        )
+        logging.info("[PATCH REQ] Endpoint: %s", endpoint)
+        payload_logger.info("[PATCH REQ] Data: %s", Payload(data))
+        response = self._write("PATCH", endpoint, data)
+        logging.info("[PATCH RSP] Code: %s", response.status_code)
+        payload_logger.info("[PATCH RSP] Data: %s", Payload(response))
         return response
@@ -2,10 +2,18 @@
 Books API client with specific endpoints.
 """
 
-import os
-from typing import Dict, Any
+from typing import Dict, Any, Generator, Iterable, Optional
 import requests
 from src.clients.base_client import BaseClient
+from src.clients.bulk import BulkResult, ProgressCallback, run_bulk
+from src.clients.cassette import Cassette
+from src.clients.compression import CompressionConfig
+from src.clients.resilience import ResiliencePolicy
+from src.clients.response_cache import ResponseCache
+from src.clients.session_pool import SessionPool
+from src.clients.transport import Transport
+from src.clients.validator_cache import ValidatorCache
+from src.config.settings import Settings
 
 
 class BooksClient(BaseClient):
@@ -13,14 +21,49 @@ class BooksClient(BaseClient):
     Client for Books API endpoints.
     """
 
-    def __init__(self) -> None:
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        pool: Optional[SessionPool] = None,
+        cache: Optional[ResponseCache] = None,
+        cassette: Optional[Cassette] = None,
+        settings: Optional[Settings] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+        transport: Optional[Transport] = None,
+        compression: Optional[CompressionConfig] = None,
+        validators: Optional[ValidatorCache] = None,
+        cache_enabled: bool = True,
+        conditional_enabled: bool = True,
+    ) -> None:
         """
         Initialize Books API client.
+
+        Args:
+            pool: Session pool shared with other clients
+            cache: GET response cache shared with other clients
+            cassette: Cassette recording or replaying requests
+            settings: API settings, the process-wide settings when omitted
+            resilience: Retry and circuit breaker policy
+            transport: Transport sending the requests
+            compression: Response and request body compression
+            validators: Validator cache for conditional GETs shared with
+                other clients
+            cache_enabled: False sends every GET to the service
+            conditional_enabled: False sends every GET without validators
         """
-        super().__init__()
-        self.books_endpoint = (
-            f"/api/{os.getenv("API_VERSION")}/{os.getenv("BOOKS_API_ENDPOINT")}"
+        super().__init__(
+            pool=pool,
+            cache=cache,
+            cassette=cassette,
+            settings=settings,
+            resilience=resilience,
+            transport=transport,
+            compression=compression,
+            validators=validators,
+            cache_enabled=cache_enabled,
+            conditional_enabled=conditional_enabled,
         )
+        self.books_endpoint = self.settings.books_endpoint
 
     def get_all_books(self) -> requests.Response:
         """
@@ -29,6 +72,13 @@ class BooksClient(BaseClient):
         """
         return self.get(self.books_endpoint)
 
+    def iter_all_books(self) -> Generator[Dict[str, Any], None, None]:
+        """
+        Get all books, yielding each book as soon as it is downloaded.
+
+        """
+        return self.stream_items(self.books_endpoint)
+
     def get_book_by_id(self, book_id: int | str | object) -> requests.Response:
         """
         Get book by ID.
@@ -63,3 +113,55 @@ class BooksClient(BaseClient):
             book_id: Book ID to delete
         """
         return self.delete(f"{self.books_endpoint}/{book_id}")
+
+    def create_books_bulk(
+        self,
+        books: Iterable[Dict[str, Any]],
+        concurrency: int = 16,
+        progress: Optional[ProgressCallback] = None,
+    ) -> BulkResult:
+        """
+        Create many books concurrently.
+
+        Args:
+            books: Book data, may be a lazy stream
+            concurrency: Maximum number of requests in flight
+            progress: Called with (completed, total) as the operation advances
+
+        Returns:
+            IDs of created books and failures
+        """
+        return run_bulk(
+            books,
+            self.create_book,
+            key=lambda book: book.get("id"),
+            concurrency=concurrency,
+            progress=progress,
+            total=len(books) if isinstance(books, list) else None,
+        )
+
+    def delete_books_bulk(
+        self,
+        book_ids: Iterable[int],
+        concurrency: int = 16,
+        progress: Optional[ProgressCallback] = None,
+    ) -> BulkResult:
+        """
+        Delete many books concurrently.
+
+        Args:
+            book_ids: IDs of books to delete
+            concurrency: Maximum number of requests in flight
+            progress: Called with (completed, total) as the operation advances
+
+        Returns:
+            IDs of deleted books and failures
+        """
+        return run_bulk(
+            book_ids,
+            self.delete_book,
+            key=lambda book_id: book_id,
+            concurrency=concurrency,
+            progress=progress,
+            total=len(book_ids) if isinstance(book_ids, list) else None,
+        )
@@ -0,0 +1,136 @@
+"""
+Bounded-concurrency fan-out of many API calls with partial failure reporting.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any, Callable, Iterable, Optional, TypeVar
+import requests
+
+T = TypeVar("T")
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+@dataclass(frozen=True)
+class BulkFailure:
+    """
+    Single failed call of a bulk operation.
+
+    Attributes:
+        key: Identifier of the item, e.g. record ID
+        status_code: Response status, None when no response was received
+        error: Response reason or exception message
+    """
+
+    key: Any
+    status_code: Optional[int]
+    error: str
+
+
+@dataclass
+class BulkResult:
+    """
+    Outcome of a bulk operation.
+
+    Attributes:
+        succeeded: Keys of items processed successfully, in completion order
+        failures: Items that failed
+        elapsed: Wall time in seconds
+    """
+
+    succeeded: list[Any] = field(default_factory=list)
+    failures: list[BulkFailure] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def total(self) -> int:
+        """
+        Number of processed items.
+        """
+        return len(self.succeeded) + len(self.failures)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every item succeeded.
+        """
+        return not self.failures
+
+    def __str__(self) -> str:
+        rate = self.total / self.elapsed if self.elapsed else 0.0
+        return (
+            f"{len(self.succeeded)}/{self.total} succeeded, "
+            f"{len(self.failures)} failed in {self.elapsed:.1f}s ({rate:.0f}/s)"
+        )
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def run_bulk(
+    items: Iterable[T],
+    call: Callable[[T], requests.Response],
+    key: Callable[[T], Any],
+    concurrency: int = 16,
+    expected_status: tuple[int, ...] = (200,),
+    progress: Optional[ProgressCallback] = None,
+    total: Optional[int] = None,
+    progress_every: int = 1000,
+) -> BulkResult:
+    """
+    Apply an API call to every item using a bounded pool of worker threads.
+
+    Items are pulled from the iterable only as workers free up, so a lazy
+    stream (e.g. from `DataFactory`) is never materialized. A failing call
+    is recorded and does not stop the remaining ones.
+
+    Args:
+        items: Payloads or IDs to process
+        call: Client method issuing one request per item
+        key: Function returning an item's identifier for the result
+        concurrency: Maximum number of requests in flight
+        expected_status: Status codes counted as success
+        progress: Called with (completed, total) every `progress_every` items
+            and once at the end
+        total: Number of items when known, passed on to `progress`
+        progress_every: Items between progress reports
+
+    Returns:
+        Successful keys and failures
+    """
+    result = BulkResult()
+    started = time.perf_counter()
+    in_flight: dict[Future[requests.Response], Any] = {}
+
+    def collect(done: Iterable[Future[requests.Response]]) -> None:
+        for future in done:
+            item_key = in_flight.pop(future)
+            try:
+                response = future.result()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                result.failures.append(BulkFailure(item_key, None, repr(exc)))
+            else:
+                if response.status_code in expected_status:
+                    result.succeeded.append(item_key)
+                else:
+                    result.failures.append(
+                        BulkFailure(item_key, response.status_code, response.reason)
+                    )
+
+            if progress is not None and result.total % progress_every == 0:
+                progress(result.total, total)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for item in items:
+            if len(in_flight) >= concurrency * 2:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            in_flight[executor.submit(call, item)] = key(item)
+        collect(wait(in_flight).done)
+
+    result.elapsed = time.perf_counter() - started
+    if progress is not None and result.total % progress_every:
+        progress(result.total, total)
+    logging.info("Bulk operation: %s", result)
+    return result
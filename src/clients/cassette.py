@@ -0,0 +1,253 @@
+"""
+Record and replay of API interactions for offline test runs.
+"""
+
+import base64
+from dataclasses import dataclass
+from datetime import timedelta
+import gzip
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Any, Iterable, Literal, Optional, cast
+import requests
+from requests.structures import CaseInsensitiveDict
+from src.clients.request_timing import RequestTiming, TimedResponse
+
+CassetteMode = Literal["off", "record", "replay"]
+InteractionKey = tuple[str, str, str, str, str]
+
+
+@dataclass(frozen=True)
+class CassetteConfig:
+    """
+    Cassette settings.
+
+    Attributes:
+        mode: "record" saves every request and response, "replay" answers
+            requests from the saved cassettes without contacting the service
+        directory: Directory holding the cassette files
+        name: Cassette name, files are "{name}*.jsonl.gz"
+    """
+
+    mode: CassetteMode = "off"
+    directory: Path = Path("cassettes")
+    name: str = "session"
+
+    @classmethod
+    def from_env(cls) -> "CassetteConfig":
+        """
+        Build cassette configuration from `CASSETTE_*` environment variables.
+        """
+        mode = os.getenv("CASSETTE_MODE", "off").lower()
+        if mode not in ("off", "record", "replay"):
+            raise ValueError(f"Unsupported CASSETTE_MODE: {mode}")
+
+        return cls(
+            mode=cast(CassetteMode, mode),
+            directory=Path(os.getenv("CASSETTE_DIR", "cassettes")),
+            name=os.getenv("CASSETTE_NAME", "session"),
+        )
+
+    def files(self) -> list[Path]:
+        """
+        Return existing cassette files, one per recording test worker.
+        """
+        return sorted(self.directory.glob(f"{self.name}*.jsonl.gz"))
+
+
+class CassetteMismatchError(LookupError):
+    """
+    Request has no matching recording in the cassette.
+    """
+
+
+def body_hash(data: Any) -> str:
+    """
+    Return a short, key order independent digest of a JSON request body.
+    """
+    if data is None:
+        return ""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def interaction_key(
+    scope: str,
+    method: str,
+    endpoint: str,
+    params: Optional[dict[str, Any]] = None,
+    data: Any = None,
+) -> InteractionKey:
+    """
+    Build index key of a request.
+
+    Args:
+        scope: Recording scope, e.g. test node ID
+        method: HTTP method
+        endpoint: Request path
+        params: Query parameters
+        data: JSON request body
+    """
+    query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+    return scope, method.upper(), "/" + endpoint.lstrip("/"), query, body_hash(data)
+
+
+class Cassette:
+    """
+    Thread-safe, in-memory index of recorded API interactions.
+
+    Interactions are keyed on scope, method, path, query parameters and
+    body hash. A key may be recorded several times (e.g. a GET before and
+    after an update); replay hands the recordings out in their original
+    order, and a request beyond the recorded ones is a mismatch just like
+    an unknown key.
+
+    On disk a cassette is gzip compressed JSON lines, one interaction per
+    line, with text bodies stored as is.
+    """
+
+    def __init__(self, mode: CassetteMode = "record") -> None:
+        """
+        Initialize empty cassette.
+
+        Args:
+            mode: "record" or "replay"
+        """
+        self.mode = mode
+        # Set per test, so recordings of different tests never mix
+        self.scope = ""
+        self._lock = threading.Lock()
+        self._recorded: list[dict[str, Any]] = []
+        self._index: dict[InteractionKey, list[dict[str, Any]]] = {}
+        self._cursors: dict[InteractionKey, int] = {}
+
+    @property
+    def recording(self) -> bool:
+        """
+        Whether responses are captured.
+        """
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        """
+        Whether responses are served from the cassette.
+        """
+        return self.mode == "replay"
+
+    @classmethod
+    def load(cls, paths: Iterable[Path]) -> "Cassette":
+        """
+        Create a replaying cassette from cassette files.
+        """
+        cassette = cls("replay")
+        count = 0
+        for path in paths:
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    cassette._add(json.loads(line))
+                    count += 1
+        logging.info("Cassette: loaded %s interactions", count)
+        return cassette
+
+    def _add(self, interaction: dict[str, Any]) -> None:
+        key = cast(InteractionKey, tuple(interaction["key"]))
+        self._index.setdefault(key, []).append(interaction)
+
+    def save(self, path: Path) -> None:
+        """
+        Write recorded interactions to a cassette file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, gzip.open(path, "wt", encoding="utf-8") as file:
+            for interaction in self._recorded:
+                file.write(json.dumps(interaction, separators=(",", ":")) + "\n")
+        logging.info("Cassette: saved %s interactions", len(self._recorded))
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]],
+        data: Any,
+        response: requests.Response,
+    ) -> None:
+        """
+        Capture a request and its response, reading the body if streamed.
+        """
+        content = response.content or b""
+        try:
+            body: dict[str, str] = {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"base64": base64.b64encode(content).decode("ascii")}
+
+        timing = getattr(response, "timing", None)
+        interaction = {
+            "key": interaction_key(self.scope, method, endpoint, params, data),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "elapsed": response.elapsed.total_seconds(),
+            "timing": timing.phases() if isinstance(timing, RequestTiming) else None,
+            **body,
+        }
+        with self._lock:
+            self._recorded.append(interaction)
+            self._add(interaction)
+
+    def replay(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        data: Any = None,
+    ) -> requests.Response:
+        """
+        Return the next recorded response of a request.
+
+        Raises:
+            CassetteMismatchError: Request was not recorded, or not this often
+        """
+        key = interaction_key(self.scope, method, endpoint, params, data)
+        with self._lock:
+            recordings = self._index.get(key, [])
+            position = self._cursors.get(key, 0)
+            if position >= len(recordings):
+                raise CassetteMismatchError(
+                    f"No recording for {key[1]} {key[2]} (params: {key[3] or '-'}, "
+                    f"body: {key[4] or '-'}, occurrence {position + 1}) "
+                    f"in scope '{key[0]}'."
+                )
+            self._cursors[key] = position + 1
+            interaction = recordings[position]
+
+        return self._build_response(interaction, key[2])
+
+    @staticmethod
+    def _build_response(interaction: dict[str, Any], path: str) -> requests.Response:
+        response = TimedResponse()
+        response.status_code = interaction["status"]
+        response.reason = interaction["reason"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response.url = path
+        response.elapsed = timedelta(seconds=interaction["elapsed"])
+        if "base64" in interaction:
+            content = base64.b64decode(interaction["base64"])
+        else:
+            content = interaction["text"].encode("utf-8")
+        # Same state as a response whose body has been read
+        # pylint: disable=protected-access
+        response._content = content
+        response._content_consumed = True  # type: ignore[attr-defined]
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.timing = RequestTiming(**(interaction["timing"] or {}))
+        return response
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(recordings) for recordings in self._index.values())
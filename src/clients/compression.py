@@ -0,0 +1,145 @@
+"""
+Content-Encoding negotiation and compression of request bodies.
+"""
+
+from dataclasses import dataclass
+import gzip
+import json
+import os
+from typing import Any, Optional
+import zlib
+from urllib3.util.request import ACCEPT_ENCODING
+from src.config.settings import get_settings
+
+# Codings the HTTP stack can decode: gzip and deflate, plus br and zstd when
+# their optional packages are installed
+SUPPORTED_ENCODINGS = tuple(ACCEPT_ENCODING.split(","))
+
+# Codings request bodies can be compressed with
+REQUEST_ENCODINGS = ("gzip", "deflate")
+
+
+@dataclass(frozen=True)
+class CompressionConfig:
+    """
+    Compression settings of API requests and responses.
+
+    Attributes:
+        accept_encoding: `Accept-Encoding` header value, "auto" for every
+            supported coding or "identity" for uncompressed responses
+        request_encoding: "gzip" or "deflate" to compress request bodies,
+            "" to send them as they are
+        min_request_bytes: Smallest request body worth compressing
+        level: zlib compression level of request bodies
+    """
+
+    accept_encoding: str = "auto"
+    request_encoding: str = ""
+    min_request_bytes: int = 1024
+    level: int = 6
+
+    def __post_init__(self) -> None:
+        if self.accept_encoding not in ("auto", "identity"):
+            unsupported = set(parse_encodings(self.accept_encoding)) - {
+                *SUPPORTED_ENCODINGS,
+                "identity",
+                "*",
+            }
+            if unsupported:
+                raise ValueError(
+                    f"Unsupported HTTP_ACCEPT_ENCODING: {', '.join(sorted(unsupported))}"
+                    f", supported are {', '.join(SUPPORTED_ENCODINGS)}."
+                )
+        if self.request_encoding not in ("",) + REQUEST_ENCODINGS:
+            raise ValueError(
+                f"Unsupported HTTP_REQUEST_COMPRESSION: {self.request_encoding}"
+            )
+
+    @classmethod
+    def from_env(cls) -> "CompressionConfig":
+        """
+        Build compression configuration from `HTTP_ACCEPT_ENCODING` and
+        `HTTP_REQUEST_COMPRESSION*` environment variables.
+        """
+        request_encoding = os.getenv("HTTP_REQUEST_COMPRESSION", "off").lower()
+        return cls(
+            accept_encoding=os.getenv("HTTP_ACCEPT_ENCODING", "auto").lower(),
+            request_encoding="" if request_encoding == "off" else request_encoding,
+            min_request_bytes=int(
+                os.getenv("HTTP_REQUEST_COMPRESSION_MIN_BYTES", "1024")
+            ),
+            level=int(os.getenv("HTTP_REQUEST_COMPRESSION_LEVEL", "6")),
+        )
+
+    @property
+    def accept_encoding_header(self) -> str:
+        """
+        Value of the `Accept-Encoding` request header.
+        """
+        if self.accept_encoding == "auto":
+            return ", ".join(SUPPORTED_ENCODINGS)
+        return self.accept_encoding
+
+
+def parse_encodings(header: str) -> list[str]:
+    """
+    Return the codings of an `Accept-Encoding` or `Content-Encoding` value,
+    without quality values and in order.
+    """
+    codings = (part.split(";", 1)[0].strip().lower() for part in header.split(","))
+    return [coding for coding in codings if coding]
+
+
+def compress(body: bytes, encoding: str, level: int = 6) -> bytes:
+    """
+    Compress a body with "gzip" or "deflate" (zlib format, as HTTP defines it).
+    """
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=level, mtime=0)
+    if encoding == "deflate":
+        return zlib.compress(body, level)
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+
+def decompress(body: bytes, encoding: str) -> bytes:
+    """
+    Decompress a "gzip" or "deflate" body.
+
+    Raises:
+        ValueError: Unsupported coding or corrupt body
+    """
+    try:
+        if encoding == "gzip":
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            return zlib.decompress(body)
+    except (OSError, EOFError, zlib.error) as error:
+        raise ValueError(f"Corrupt {encoding} body.") from error
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+
+def encode_body(
+    data: Any, config: CompressionConfig
+) -> tuple[Optional[bytes], int, Optional[str]]:
+    """
+    Serialize a JSON request body, compressed if the configuration asks for it.
+
+    Returns:
+        Bytes to send (None without body), size of the uncompressed body and
+        the `Content-Encoding` applied (None if sent as is)
+    """
+    if data is None:
+        return None, 0, None
+    body = json.dumps(data, allow_nan=False).encode("utf-8")
+    if not config.request_encoding or len(body) < config.min_request_bytes:
+        return body, len(body), None
+    encoding = config.request_encoding
+    return compress(body, encoding, config.level), len(body), encoding
+
+
+def default_compression() -> CompressionConfig:
+    """
+    Return the compression configuration of the process settings, read
+    from environment on first use.
+    """
+    return get_settings().section(CompressionConfig.from_env)
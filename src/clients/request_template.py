@@ -0,0 +1,129 @@
+"""
+Request preparation resolved once per client for the low-overhead fast path.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+from urllib.parse import urlencode
+import requests
+from requests.cookies import RequestsCookieJar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_netrc_auth, requote_uri
+
+
+@dataclass(frozen=True)
+class RequestTemplate:
+    """
+    Parts of every request to one base URL that do not change between calls.
+
+    `requests.Session.request` merges session settings and re-reads proxy
+    environment variables and ~/.netrc on every call, which dominates the
+    client-side cost of a request. A template does that work once; each
+    call then only fills in method, path, query and body and hands the
+    prepared request to `Session.send`, which still handles cookies,
+    redirects, hooks and the transport adapter.
+
+    Changes to the environment or to session headers after the template
+    has been built are not picked up.
+
+    Attributes:
+        url_prefix: Normalized base URL without trailing slash
+        headers: Session headers sent with every request
+        auth: Session or ~/.netrc credentials
+        hooks: Session hooks
+        send_kwargs: Proxies, TLS verification and client certificate
+            resolved from session and environment
+    """
+
+    url_prefix: str
+    headers: CaseInsensitiveDict[str]
+    auth: Any
+    hooks: dict[str, list[Any]]
+    send_kwargs: dict[str, Any]
+
+    @classmethod
+    def for_session(cls, session: requests.Session, base_url: str) -> "RequestTemplate":
+        """
+        Resolve the request settings of a session for a base URL.
+        """
+        probe = requests.PreparedRequest()
+        probe.prepare_url(base_url, None)
+        url_prefix = str(probe.url).rstrip("/")
+
+        auth = session.auth
+        if auth is None and session.trust_env:
+            auth = get_netrc_auth(url_prefix)
+
+        settings = session.merge_environment_settings(
+            url_prefix, session.proxies, None, session.verify, session.cert
+        )
+        return cls(
+            url_prefix=url_prefix,
+            headers=CaseInsensitiveDict(
+                {
+                    name: value.decode("latin-1") if isinstance(value, bytes) else value
+                    for name, value in session.headers.items()
+                    if value is not None
+                }
+            ),
+            auth=auth,
+            hooks=session.hooks,
+            send_kwargs={
+                "proxies": settings["proxies"],
+                "verify": settings["verify"],
+                "cert": settings["cert"],
+            },
+        )
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def prepare(
+        self,
+        session: requests.Session,
+        method: str,
+        endpoint: str,
+        data: Optional[Any] = None,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> requests.PreparedRequest:
+        """
+        Build a request equivalent to what `Session.request` would send.
+
+        Args:
+            session: Session the request will be sent with, for its cookies
+            method: HTTP method
+            endpoint: API endpoint
+            data: JSON request body
+            params: Query parameters
+            headers: Additional headers, None values remove a session header
+            content: Encoded request body, sent instead of `data`
+        """
+        url = self.url_prefix + requote_uri("/" + endpoint.lstrip("/"))
+        if params:
+            url = f"{url}?{urlencode(params, doseq=True)}"
+
+        request = requests.PreparedRequest()
+        request.method = method.upper()
+        request.url = url
+        request.hooks = self.hooks
+        # The only per-call copy: body preparation adds Content-Length
+        request.headers = self.headers.copy()
+        if headers:
+            for name, value in headers.items():
+                if value is None:
+                    request.headers.pop(name, None)
+                else:
+                    request.headers[name] = value
+
+        if session.cookies:
+            jar = RequestsCookieJar()
+            jar.update(session.cookies)
+            request.prepare_cookies(jar)
+        else:
+            # Skips building an empty Cookie header; redirects still need a jar
+            # pylint: disable-next=protected-access
+            request._cookies = RequestsCookieJar()  # type: ignore[attr-defined]
+        request.prepare_body(content, None, data)
+        if self.auth:
+            request.prepare_auth(self.auth, url)
+        return request
@@ -0,0 +1,247 @@
+"""
+Per-request timing breakdown captured at the connection level.
+"""
+
+from dataclasses import dataclass, fields
+import socket
+import threading
+import time
+from typing import Any, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.connection import allowed_gai_family
+
+# Timing of the request being sent by the current thread
+_active = threading.local()
+
+
+@dataclass
+class RequestTiming:
+    """
+    Durations of the phases of one request in seconds.
+
+    Connection phases are None when a pooled connection was reused (and
+    `tls` also for plain HTTP); `transfer` is None until the body of a
+    streamed response has been read, and `decode` until `json()` is called.
+
+    Attributes:
+        dns: Host name resolution
+        connect: TCP connection establishment
+        tls: TLS handshake
+        send: Writing the request line, headers and body
+        ttfb: From the request being sent to the response headers arriving
+        transfer: Reading the response body
+        decode: Parsing the JSON body
+    """
+
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    send: Optional[float] = None
+    ttfb: Optional[float] = None
+    transfer: Optional[float] = None
+    decode: Optional[float] = None
+
+    @property
+    def total(self) -> float:
+        """
+        Sum of all measured phases.
+        """
+        return sum(value for value in self.phases().values() if value is not None)
+
+    @property
+    def reused_connection(self) -> bool:
+        """
+        Whether the request went over an already open connection.
+        """
+        return self.connect is None
+
+    def phases(self) -> dict[str, Optional[float]]:
+        """
+        Return phase durations by name, in request order.
+        """
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"{name}={value * 1000:.2f}ms"
+            for name, value in self.phases().items()
+            if value is not None
+        )
+
+
+def _current() -> Optional[RequestTiming]:
+    return getattr(_active, "timing", None)
+
+
+class TimedResponse(requests.Response):
+    """
+    Response carrying the timing breakdown of its request.
+    """
+
+    # Keep the timing in pickles and `copy.copy` (e.g. cached responses)
+    __attrs__ = requests.Response.__attrs__ + ["timing"]
+
+    timing: RequestTiming
+
+    @property
+    def content(self) -> Any:
+        if self._content is False:
+            started = time.perf_counter()
+            content = super().content
+            self.timing.transfer = time.perf_counter() - started
+            return content
+        return super().content
+
+    def json(self, **kwargs: Any) -> Any:
+        # Read a streamed body first, so its download is booked as transfer
+        _ = self.content
+        started = time.perf_counter()
+        try:
+            return super().json(**kwargs)
+        finally:
+            self.timing.decode = time.perf_counter() - started
+
+
+class TimingHTTPConnection(HTTPConnection):
+    """
+    HTTP connection reporting its phases to the active `RequestTiming`.
+    """
+
+    _tcp_connected_at = 0.0
+    _sent_at = 0.0
+
+    def _new_conn(self) -> socket.socket:
+        timing = _current()
+        if timing is None:
+            return super()._new_conn()
+
+        host = self._dns_host
+        started = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(
+                host.strip("[]"), self.port, allowed_gai_family(), socket.SOCK_STREAM
+            )
+        except OSError:
+            # Let urllib3 resolve again and raise its own error
+            return super()._new_conn()
+        resolved = time.perf_counter()
+
+        # Connect to the resolved addresses directly, so the lookup is not
+        # repeated and counted as connect time
+        candidates = list(dict.fromkeys(str(info[4][0]) for info in addresses))
+        try:
+            for index, address in enumerate(candidates, start=1):
+                self.host = address
+                try:
+                    sock = super()._new_conn()
+                    break
+                except ConnectTimeoutError:
+                    if index == len(candidates):
+                        raise
+        finally:
+            self.host = host
+
+        self._tcp_connected_at = time.perf_counter()
+        timing.dns = resolved - started
+        timing.connect = self._tcp_connected_at - resolved
+        return sock
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> None:
+        timing = _current()
+        if timing is None:
+            super().request(method, url, *args, **kwargs)
+            return
+
+        # Connect up front so that connection setup is not booked as send time
+        if self.sock is None:
+            self.connect()
+        started = time.perf_counter()
+        super().request(method, url, *args, **kwargs)
+        self._sent_at = time.perf_counter()
+        timing.send = self._sent_at - started
+
+    def getresponse(self) -> Any:
+        response = super().getresponse()
+        timing = _current()
+        if timing is not None:
+            timing.ttfb = time.perf_counter() - self._sent_at
+        return response
+
+
+class TimingHTTPSConnection(TimingHTTPConnection, HTTPSConnection):
+    """
+    HTTPS connection additionally reporting the TLS handshake.
+    """
+
+    def connect(self) -> None:
+        super().connect()
+        timing = _current()
+        if timing is not None and timing.connect is not None:
+            timing.tls = time.perf_counter() - self._tcp_connected_at
+
+
+class TimingHTTPConnectionPool(HTTPConnectionPool):
+    """
+    HTTP connection pool of timing connections.
+    """
+
+    ConnectionCls = TimingHTTPConnection
+
+
+class TimingHTTPSConnectionPool(HTTPSConnectionPool):
+    """
+    HTTPS connection pool of timing connections.
+    """
+
+    ConnectionCls = TimingHTTPSConnection
+
+
+class TimingAdapter(HTTPAdapter):
+    """
+    Transport adapter attaching a `RequestTiming` to every response.
+
+    All clocks are `time.perf_counter`, which is monotonic and has the
+    highest available resolution. Requests through a proxy only report
+    transfer and decode.
+    """
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimingHTTPConnectionPool,
+            "https": TimingHTTPSConnectionPool,
+        }
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        _active.timing = RequestTiming()
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            _active.timing = None
+
+    def build_response(
+        self, req: requests.PreparedRequest, resp: Any
+    ) -> requests.Response:
+        response = super().build_response(req, resp)
+        response.__class__ = TimedResponse
+        response.timing = _current() or RequestTiming()  # type: ignore[attr-defined]
+        return response
+
+
+def request_timing(response: requests.Response) -> RequestTiming:
+    """
+    Return the timing breakdown of a response received through `TimingAdapter`.
+
+    Raises:
+        ValueError: Response was not received through a timing adapter
+    """
+    timing = getattr(response, "timing", None)
+    if not isinstance(timing, RequestTiming):
+        raise ValueError("Response carries no request timing.")
+    return timing
@@ -0,0 +1,410 @@
+"""
+Retries with jittered backoff and per-host circuit breakers for API requests.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+import functools
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
+import requests
+from urllib3.exceptions import NewConnectionError
+from src.clients.transport import ConnectionNotEstablished
+from src.config.settings import get_settings
+from src.utils.latency_metrics import endpoint_template
+
+# Methods that may be sent twice without changing the outcome (RFC 9110)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+# Statuses of an overloaded or unreachable backend, counted by the breaker
+UNAVAILABLE_STATUSES = frozenset({502, 503, 504})
+
+
+@dataclass(frozen=True)
+class ResilienceConfig:
+    """
+    Retry and circuit breaker settings.
+
+    Attributes:
+        max_attempts: Attempts per request including the first, 1 disables retries
+        backoff: Base delay in seconds, doubled per retry and fully jittered
+        max_backoff: Upper bound of a delay, also for honoured Retry-After
+        connect_timeout: Seconds to establish a connection; the read timeout
+            is the client timeout
+        retry_statuses: Response statuses retried for idempotent methods
+        breaker_threshold: Consecutive failures that open a host's circuit,
+            0 disables the breaker
+        breaker_reset: Seconds an open circuit fails fast before one probe
+            request is let through
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.1
+    max_backoff: float = 2.0
+    connect_timeout: float = 5.0
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset({429, 502, 503, 504})
+    )
+    breaker_threshold: int = 5
+    breaker_reset: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> "ResilienceConfig":
+        """
+        Build resilience configuration from `HTTP_RETRY_*`, `HTTP_BREAKER_*`
+        and `HTTP_CONNECT_TIMEOUT` environment variables.
+        """
+        statuses = os.getenv("HTTP_RETRY_STATUSES", "429,502,503,504")
+        return cls(
+            max_attempts=max(int(os.getenv("HTTP_RETRY_MAX_ATTEMPTS", "3")), 1),
+            backoff=float(os.getenv("HTTP_RETRY_BACKOFF", "0.1")),
+            max_backoff=float(os.getenv("HTTP_RETRY_MAX_BACKOFF", "2.0")),
+            connect_timeout=float(os.getenv("HTTP_CONNECT_TIMEOUT", "5")),
+            retry_statuses=frozenset(
+                int(status) for status in statuses.split(",") if status.strip()
+            ),
+            breaker_threshold=int(os.getenv("HTTP_BREAKER_THRESHOLD", "5")),
+            breaker_reset=float(os.getenv("HTTP_BREAKER_RESET", "30")),
+        )
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Request refused without contacting the host, whose circuit is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Consecutive failure counter failing fast once a host looks down.
+
+    Closed: requests pass, failures are counted. Open: requests are refused
+    for `reset` seconds. Half-open: a single probe request passes; its
+    success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(
+        self, threshold: int, reset: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.threshold = threshold
+        self.reset = reset
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """
+        "closed", "open" or "half_open".
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or self._clock() - self._opened_at >= self.reset:
+                return "half_open"
+            return "open"
+
+    def allow(self) -> bool:
+        """
+        Whether a request may be sent now.
+        """
+        if self.threshold <= 0:
+            return True
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or self._clock() - self._opened_at < self.reset:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        """
+        Close the circuit.
+        """
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """
+        Count a failure.
+
+        Returns:
+            True if the failure opened the circuit
+        """
+        if self.threshold <= 0:
+            return False
+        with self._lock:
+            self._failures += 1
+            if self._probing or (
+                self._opened_at is None and self._failures >= self.threshold
+            ):
+                self._opened_at = self._clock()
+                self._probing = False
+                return True
+            return False
+
+    def abort_probe(self) -> bool:
+        """
+        End a probe that failed for a reason other than the host, e.g. an
+        undecodable body, by opening the circuit again.
+
+        Returns:
+            True if a probe was running
+        """
+        with self._lock:
+            if not self._probing:
+                return False
+            self._opened_at = self._clock()
+            self._probing = False
+            return True
+
+
+class ResilienceMetrics:
+    """
+    Thread-safe counts of retries, short-circuits and opened circuits.
+    """
+
+    EVENTS = ("retry", "exhausted", "short_circuit", "circuit_open")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Counter[tuple[str, str, str]] = Counter()
+
+    def record(self, event: str, method: str, endpoint: str) -> None:
+        """
+        Count an event of a request, IDs in the endpoint collapsed to "{id}".
+        """
+        key = (event, method.upper(), endpoint_template(endpoint))
+        with self._lock:
+            self._counts[key] += 1
+
+    def totals(self) -> dict[str, int]:
+        """
+        Return the number of each event over all endpoints.
+        """
+        totals = dict.fromkeys(self.EVENTS, 0)
+        with self._lock:
+            for (event, _, _), count in self._counts.items():
+                totals[event] = totals.get(event, 0) + count
+        return totals
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize counts, e.g. to hand them to another process.
+        """
+        with self._lock:
+            return {
+                "events": [
+                    {"event": event, "method": method, "endpoint": endpoint, "count": n}
+                    for (event, method, endpoint), n in sorted(self._counts.items())
+                ]
+            }
+
+    def merge(self, data: dict[str, Any]) -> None:
+        """
+        Add counts serialized by `to_dict`.
+        """
+        with self._lock:
+            for entry in data["events"]:
+                key = (entry["event"], entry["method"], entry["endpoint"])
+                self._counts[key] += entry["count"]
+
+    def clear(self) -> None:
+        """
+        Drop all counts.
+        """
+        with self._lock:
+            self._counts.clear()
+
+
+resilience_metrics = ResilienceMetrics()
+
+
+@functools.lru_cache(maxsize=64)
+def _host(url: str) -> str:
+    return urlsplit(url).netloc
+
+
+def _never_sent(error: requests.RequestException) -> bool:
+    """
+    Whether the request failed before reaching the server.
+    """
+    if isinstance(error, (requests.ConnectTimeout, ConnectionNotEstablished)):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class ResiliencePolicy:
+    """
+    Send requests with retries and a circuit breaker per host.
+
+    Idempotent requests are retried on connection errors, timeouts and
+    `retry_statuses`; POST and PATCH only when the connection could not be
+    established, so they never reach the server twice. Delays grow
+    exponentially with full jitter, so parallel workers do not retry in
+    lockstep; a numeric Retry-After header is honoured up to `max_backoff`.
+
+    Connection errors, timeouts and 502/503/504 responses count as
+    failures of the host. Once `breaker_threshold` of them happen in a row,
+    requests to the host raise `CircuitOpenError` immediately instead of
+    waiting for timeouts, until a probe request succeeds.
+    """
+
+    def __init__(
+        self,
+        config: Optional[ResilienceConfig] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+    ) -> None:
+        """
+        Initialize resilience policy.
+
+        Args:
+            config: Resilience configuration, read from environment when omitted
+            sleep: Function waiting between attempts
+            jitter: Source of random factors in [0, 1)
+        """
+        self.config = config or get_settings().section(ResilienceConfig.from_env)
+        self._sleep = sleep
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def timeout(self, read_timeout: float) -> tuple[float, float]:
+        """
+        Return the (connect, read) timeout passed to requests.
+        """
+        return (self.config.connect_timeout, read_timeout)
+
+    def breaker(self, url: str) -> CircuitBreaker:
+        """
+        Return the circuit breaker of the host of a URL.
+        """
+        host = _host(url)
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    host,
+                    CircuitBreaker(
+                        self.config.breaker_threshold, self.config.breaker_reset
+                    ),
+                )
+        return breaker
+
+    def delay(
+        self, attempt: int, response: Optional[requests.Response] = None
+    ) -> float:
+        """
+        Return the wait before retry number `attempt` (1 for the first retry).
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.config.max_backoff)
+        ceiling = min(
+            self.config.backoff * 2.0 ** (attempt - 1), self.config.max_backoff
+        )
+        return self._jitter() * ceiling
+
+    def execute(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        send: Callable[[], requests.Response],
+    ) -> requests.Response:
+        """
+        Send a request, retrying it according to the policy.
+
+        Args:
+            method: HTTP method
+            url: Base URL of the request, selects the circuit breaker
+            endpoint: API endpoint, for metrics
+            send: Sends one attempt
+
+        Returns:
+            Response of the last attempt
+
+        Raises:
+            CircuitOpenError: The host's circuit is open
+            requests.RequestException: Last attempt failed
+        """
+        method = method.upper()
+        breaker = self.breaker(url)
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 1
+        while True:
+            if not breaker.allow():
+                resilience_metrics.record("short_circuit", method, endpoint)
+                raise CircuitOpenError(
+                    f"Circuit open for {_host(url)}, {method} {endpoint} not sent."
+                )
+
+            response: Optional[requests.Response] = None
+            try:
+                response = send()
+            except (requests.ConnectionError, requests.Timeout) as error:
+                self._failure(breaker, method, endpoint)
+                retry = idempotent or _never_sent(error)
+                if not retry or attempt >= self.config.max_attempts:
+                    if retry:
+                        resilience_metrics.record("exhausted", method, endpoint)
+                    raise
+                logging.warning(
+                    "[RETRY] %s %s attempt %s: %s", method, endpoint, attempt, error
+                )
+            except BaseException:
+                # Otherwise a probe failing this way keeps the circuit half-open
+                if breaker.abort_probe():
+                    resilience_metrics.record("circuit_open", method, endpoint)
+                raise
+            else:
+                status = response.status_code
+                if status in UNAVAILABLE_STATUSES:
+                    self._failure(breaker, method, endpoint)
+                else:
+                    breaker.record_success()
+                if status not in self.config.retry_statuses or not idempotent:
+                    return response
+                if attempt >= self.config.max_attempts:
+                    resilience_metrics.record("exhausted", method, endpoint)
+                    return response
+                logging.warning(
+                    "[RETRY] %s %s attempt %s: status %s",
+                    method,
+                    endpoint,
+                    attempt,
+                    status,
+                )
+                response.close()
+
+            resilience_metrics.record("retry", method, endpoint)
+            self._sleep(self.delay(attempt, response))
+            attempt += 1
+
+    @staticmethod
+    def _failure(breaker: CircuitBreaker, method: str, endpoint: str) -> None:
+        if breaker.record_failure():
+            resilience_metrics.record("circuit_open", method, endpoint)
+            logging.warning("[CIRCUIT OPEN] after %s %s", method, endpoint)
+
+
+@functools.cache
+def default_policy() -> ResiliencePolicy:
+    """
+    Return the policy shared by all clients of the process, so that clients
+    of one host share its circuit breaker.
+    """
+    return ResiliencePolicy()
@@ -0,0 +1,157 @@
+"""
+TTL and LRU bounded cache of GET responses for API clients.
+"""
+
+from collections import OrderedDict
+import copy
+from dataclasses import dataclass
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+import requests
+from src.config.settings import get_settings
+
+CacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    """
+    Response cache settings.
+
+    Attributes:
+        enabled: Serve repeated GETs from the cache
+        ttl: Seconds a cached response stays fresh
+        max_entries: Maximum number of cached responses, least recently used
+            entries are evicted first
+    """
+
+    enabled: bool = False
+    ttl: float = 30.0
+    max_entries: int = 256
+
+    @classmethod
+    def from_env(cls) -> "CacheConfig":
+        """
+        Build cache configuration from `HTTP_CACHE_*` environment variables.
+        """
+        return cls(
+            enabled=os.getenv("HTTP_CACHE_ENABLED", "false").lower() == "true",
+            ttl=float(os.getenv("HTTP_CACHE_TTL", "30")),
+            max_entries=int(os.getenv("HTTP_CACHE_MAX_ENTRIES", "256")),
+        )
+
+
+def resource_path(endpoint: str) -> str:
+    """
+    Return the collection path (/api/{version}/{resource}) of a request.
+
+    Example:
+        "/api/v1/Authors/authors/books/5" -> "/api/v1/authors"
+    """
+    segments = [segment for segment in endpoint.split("?", 1)[0].split("/") if segment]
+    return "/" + "/".join(segments[:3]).lower()
+
+
+class ResponseCache:
+    """
+    Thread-safe cache of successful GET responses.
+
+    Entries expire after `ttl` seconds and the least recently used entry is
+    evicted once `max_entries` is reached. A write to a resource drops every
+    cached response under the same collection path, so reads that follow a
+    POST, PUT or DELETE always go to the service.
+    """
+
+    def __init__(
+        self,
+        config: Optional[CacheConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize response cache.
+
+        Args:
+            config: Cache configuration, read from environment when omitted
+            clock: Monotonic time source, replaceable for tests
+        """
+        self.config = config or get_settings().section(CacheConfig.from_env)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, tuple[float, requests.Response]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        # Bumped by every invalidation, see `put`
+        self.generation = 0
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[dict[str, Any]] = None) -> CacheKey:
+        """
+        Build cache key of a GET request.
+        """
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return endpoint.lower(), items
+
+    def get(self, key: CacheKey) -> Optional[requests.Response]:
+        """
+        Return a copy of a fresh cached response or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.copy(entry[1])
+
+    def put(self, key: CacheKey, response: requests.Response, generation: int) -> None:
+        """
+        Cache a successful response.
+
+        Args:
+            key: Cache key of the request
+            response: Response to cache, only 200 responses are kept
+            generation: Value of `generation` read before the request was
+                sent; the response is dropped when a write happened since,
+                as it may already be stale
+        """
+        if response.status_code != 200:
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (self._clock() + self.config.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str) -> None:
+        """
+        Drop cached responses of the collection the endpoint belongs to.
+        """
+        root = resource_path(endpoint)
+        with self._lock:
+            self.generation += 1
+            stale = [key for key in self._entries if resource_path(key[0]) == root]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            logging.info("Response cache: invalidated %s entries", len(stale))
+
+    def clear(self) -> None:
+        """
+        Drop all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
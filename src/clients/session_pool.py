@@ -0,0 +1,247 @@
+"""
+Thread-safe HTTP session pooling for API clients.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from typing import Callable, Iterator, Literal, Optional, cast
+import requests
+from src.clients.request_timing import TimingAdapter
+from src.config.settings import get_settings
+
+PoolMode = Literal["thread", "checkout"]
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """
+    Connection pool settings shared by all sessions of a `SessionPool`.
+
+    Attributes:
+        mode: "thread" gives every thread its own session, "checkout" lends
+            sessions from a bounded pool for the duration of one request
+        max_sessions: Maximum number of sessions in "checkout" mode
+        pool_connections: Number of per-host connection pools kept per session
+        pool_maxsize: Maximum number of connections kept per host
+        pool_block: Block instead of opening extra connections when a host
+            pool is exhausted
+        keep_alive: Reuse connections between requests
+        idle_timeout: Drop pooled connections of a session that has been idle
+            for longer than this many seconds (None keeps them forever)
+    """
+
+    mode: PoolMode = "thread"
+    max_sessions: int = 10
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+    idle_timeout: Optional[float] = None
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        """
+        Build pool configuration from `HTTP_POOL_*` environment variables.
+        """
+        mode = os.getenv("HTTP_POOL_MODE", cls.mode)
+        if mode not in ("thread", "checkout"):
+            raise ValueError(f"Unsupported HTTP_POOL_MODE: {mode}")
+
+        idle_timeout = os.getenv("HTTP_POOL_IDLE_TIMEOUT")
+
+        return cls(
+            mode=cast(PoolMode, mode),
+            max_sessions=int(os.getenv("HTTP_POOL_MAX_SESSIONS", "10")),
+            pool_connections=int(os.getenv("HTTP_POOL_CONNECTIONS", "10")),
+            pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", "10")),
+            pool_block=os.getenv("HTTP_POOL_BLOCK", "false").lower() == "true",
+            keep_alive=os.getenv("HTTP_POOL_KEEP_ALIVE", "true").lower() == "true",
+            idle_timeout=float(idle_timeout) if idle_timeout else None,
+        )
+
+
+class SessionPool:  # pylint: disable=too-many-instance-attributes
+    """
+    Pool of `requests.Session` objects safe to use from many threads.
+
+    A single `requests.Session` must not be shared between threads, so the
+    pool either binds one session to each thread or lends sessions out for
+    the duration of a request. Either way connections stay warm and are
+    reused instead of being re-established for every request.
+    """
+
+    def __init__(
+        self,
+        config: Optional[PoolConfig] = None,
+        session_setup: Optional[Callable[[requests.Session], None]] = None,
+    ) -> None:
+        """
+        Initialize session pool.
+
+        Args:
+            config: Pool configuration, read from environment when omitted
+            session_setup: Callback applied to every newly created session
+        """
+        self.config = config or get_settings().section(PoolConfig.from_env)
+        self._session_setup = session_setup
+        self._lock = threading.Lock()
+        self._sessions: list[requests.Session] = []
+        self._thread_sessions: weakref.WeakKeyDictionary[
+            threading.Thread, requests.Session
+        ] = weakref.WeakKeyDictionary()
+        self._last_used: weakref.WeakKeyDictionary[requests.Session, float] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._local = threading.local()
+        self._idle: queue.LifoQueue[requests.Session] = queue.LifoQueue()
+
+        logging.info(
+            "HTTP session pool: mode=%s, max_sessions=%s, pool_maxsize=%s",
+            self.config.mode,
+            self.config.max_sessions,
+            self.config.pool_maxsize,
+        )
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a session with adapters sized according to the pool config.
+        """
+        session = requests.Session()
+        adapter = TimingAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        if not self.config.keep_alive:
+            session.headers["Connection"] = "close"
+
+        if self._session_setup:
+            self._session_setup(session)
+
+        return session
+
+    def _expire_idle_connections(self, session: requests.Session) -> None:
+        """
+        Close pooled connections of a session idle for longer than allowed.
+        """
+        now = time.monotonic()
+        last_used = self._last_used.get(session, now)
+        self._last_used[session] = now
+
+        if (
+            self.config.idle_timeout is not None
+            and now - last_used > self.config.idle_timeout
+        ):
+            for adapter in session.adapters.values():
+                adapter.close()
+
+    def _thread_session(self) -> requests.Session:
+        """
+        Return the session bound to the calling thread, creating it on first use.
+
+        The session is released with its thread: once a finished thread is
+        collected, e.g. after its `ThreadPoolExecutor` shut down, the pool
+        forgets the session and closes its connections.
+        """
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            thread = threading.current_thread()
+            with self._lock:
+                session = self._create_session()
+                self._thread_sessions[thread] = session
+            weakref.finalize(thread, session.close)
+            self._local.session = session
+        return session
+
+    def _checkout_session(self) -> requests.Session:
+        """
+        Take an idle session, create a new one, or wait for one to be returned.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._sessions) < self.config.max_sessions:
+                session = self._create_session()
+                self._sessions.append(session)
+                return session
+
+        return self._idle.get()
+
+    def lend(self) -> tuple[requests.Session, Callable[[], None]]:
+        """
+        Acquire a session until the returned callback releases it.
+
+        Unlike `acquire`, the session can outlive the calling block, e.g.
+        for a streamed response whose body is read later. Releasing twice
+        is harmless. In "thread" mode the callback does nothing.
+
+        Returns:
+            Session with warm pooled connections and its release callback
+        """
+        if self.config.mode == "thread":
+            session = self._thread_session()
+            self._expire_idle_connections(session)
+            return session, lambda: None
+
+        session = self._checkout_session()
+        # Never released again, so only the first call returns the session
+        once = threading.Lock()
+
+        def release() -> None:
+            if once.acquire(blocking=False):  # pylint: disable=consider-using-with
+                self._idle.put(session)
+
+        try:
+            self._expire_idle_connections(session)
+        except BaseException:
+            release()
+            raise
+        return session, release
+
+    @contextmanager
+    def acquire(self) -> Iterator[requests.Session]:
+        """
+        Acquire a session for exclusive use by the calling thread.
+
+        Yields:
+            Session with warm pooled connections
+        """
+        session, release = self.lend()
+        try:
+            yield session
+        finally:
+            release()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of sessions held by the pool, in "thread" mode those of
+        threads still alive.
+        """
+        with self._lock:
+            return len(self._sessions) + len(self._thread_sessions)
+
+    def close(self) -> None:
+        """
+        Close all sessions and their pooled connections.
+        """
+        with self._lock:
+            for session in [*self._sessions, *self._thread_sessions.values()]:
+                session.close()
+            self._sessions.clear()
+            self._thread_sessions.clear()
+            self._last_used.clear()
+            self._local = threading.local()
+            self._idle = queue.LifoQueue()
@@ -0,0 +1,487 @@
+"""
+Transports sending the requests of `BaseClient` over HTTP/1.1 or HTTP/2.
+"""
+
+from abc import ABC, abstractmethod
+import asyncio
+import atexit
+from datetime import timedelta
+import functools
+import threading
+import time
+import weakref
+from typing import Any, AsyncIterator, Callable, Coroutine, Iterator, Optional, TypeVar
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from src.clients.compression import default_compression
+from src.clients.request_template import RequestTemplate
+from src.clients.request_timing import RequestTiming, TimedResponse
+from src.clients.session_pool import SessionPool
+from src.config.settings import Settings
+
+T = TypeVar("T")
+
+TRANSPORTS = ("requests", "http2")
+
+# Headers every request carries, as set on pooled sessions
+DEFAULT_HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+
+
+class ConnectionNotEstablished(requests.ConnectionError):
+    """
+    Connection to the host failed, so the request was never sent.
+    """
+
+
+class Transport(ABC):
+    """
+    Sends one attempt of a request and returns a `requests.Response`.
+
+    Retries, latency recording and cassettes stay in `BaseClient`, so every
+    transport gets them alike. Responses carry a `RequestTiming`.
+    """
+
+    name = ""
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    @abstractmethod
+    def send(
+        self,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes],
+        params: Optional[dict[str, Any]],
+        headers: Optional[dict[str, str]],
+        timeout: tuple[float, float],
+        stream: bool,
+    ) -> requests.Response:
+        """
+        Send a request.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint, relative to the base URL
+            body: Encoded request body, see `encode_body`
+            params: Query parameters
+            headers: Additional headers
+            timeout: (connect, read) timeout in seconds
+            stream: Return once headers arrive and leave the body unread
+
+        Raises:
+            requests.RequestException: Request failed
+        """
+
+    def close(self) -> None:
+        """
+        Close connections owned by the transport.
+        """
+
+
+class SessionTransport(Transport):
+    """
+    HTTP/1.1 through a `SessionPool` of `requests` sessions.
+
+    Every in-flight request needs a connection of its own. Requests are
+    built from a `RequestTemplate` resolved on first use, unless the fast
+    path is disabled.
+    """
+
+    name = "requests"
+
+    def __init__(self, pool: SessionPool, base_url: str, fast_path: bool = True):
+        """
+        Initialize session transport.
+
+        Args:
+            pool: Session pool to send with, closed by its owner
+            base_url: Base URL of the API
+            fast_path: Build requests from a `RequestTemplate` instead of
+                `Session.request`
+        """
+        self.pool = pool
+        self.base_url = base_url
+        self.fast_path = fast_path
+        self._template: Optional[RequestTemplate] = None
+
+    def _request_template(self, session: requests.Session) -> RequestTemplate:
+        """
+        Return the request template, built from the first session used.
+
+        All sessions of a pool are configured alike, so one template serves
+        every session.
+        """
+        if self._template is None:
+            self._template = RequestTemplate.for_session(session, self.base_url)
+        return self._template
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def send(
+        self,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes],
+        params: Optional[dict[str, Any]],
+        headers: Optional[dict[str, str]],
+        timeout: tuple[float, float],
+        stream: bool,
+    ) -> requests.Response:
+        if not stream:
+            with self.pool.acquire() as session:
+                return self._send(
+                    session, method, endpoint, body, params, headers, timeout, stream
+                )
+
+        # The body of a streamed response is read after this returns, so its
+        # session stays lent until the connection is released
+        session, release = self.pool.lend()
+        try:
+            response = self._send(
+                session, method, endpoint, body, params, headers, timeout, stream
+            )
+        except BaseException:
+            release()
+            raise
+        _release_with_connection(response, release)
+        return response
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def _send(
+        self,
+        session: requests.Session,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes],
+        params: Optional[dict[str, Any]],
+        headers: Optional[dict[str, str]],
+        timeout: tuple[float, float],
+        stream: bool,
+    ) -> requests.Response:
+        if not self.fast_path:
+            return session.request(
+                method=method,
+                url=f"{self.base_url}/{endpoint.lstrip('/')}",
+                data=body,
+                params=params,
+                headers=headers,
+                timeout=timeout,
+                stream=stream,
+            )
+
+        template = self._request_template(session)
+        request = template.prepare(
+            session, method, endpoint, params=params, headers=headers, content=body
+        )
+        return session.send(
+            request,
+            timeout=timeout,
+            stream=stream,
+            allow_redirects=True,
+            **template.send_kwargs,
+        )
+
+
+def _release_with_connection(
+    response: requests.Response, release: Callable[[], None]
+) -> None:
+    """
+    Call `release` once a streamed response gives up its connection: when
+    it is closed, its body has been read to the end, or it is collected
+    without either.
+    """
+    raw = response.raw
+    release_conn = getattr(raw, "release_conn", None)
+
+    def release_connection() -> None:
+        try:
+            if release_conn is not None:
+                release_conn()
+        finally:
+            release()
+
+    if raw is not None:
+        raw.release_conn = release_connection  # type: ignore[method-assign]
+    weakref.finalize(response, release)
+
+
+def _requests_error(error: httpx.TransportError) -> requests.RequestException:
+    """
+    Translate an httpx error into the `requests` exception clients expect.
+    """
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.ConnectTimeout(str(error))
+    if isinstance(error, httpx.ConnectError):
+        return ConnectionNotEstablished(str(error))
+    if isinstance(error, httpx.ReadTimeout):
+        return requests.ReadTimeout(str(error))
+    if isinstance(error, httpx.TimeoutException):
+        return requests.Timeout(str(error))
+    return requests.ConnectionError(str(error))
+
+
+async def _next_chunk(chunks: AsyncIterator[bytes]) -> Optional[bytes]:
+    return await anext(chunks, None)
+
+
+class _StreamedBody:
+    """
+    `Response.raw` stand-in reading the body of an httpx response on the
+    event loop of its `Http2Transport`, and counting its wire bytes.
+    """
+
+    def __init__(
+        self, response: httpx.Response, run: Callable[[Coroutine[Any, Any, Any]], Any]
+    ) -> None:
+        self._response = response
+        self._run = run
+
+    def stream(
+        self, chunk_size: Optional[int] = None, decode_content: bool = True
+    ) -> Iterator[bytes]:
+        """
+        Yield the decoded body, as `requests.Response.iter_content` expects.
+        """
+        chunks = (
+            self._response.aiter_bytes(chunk_size)
+            if decode_content
+            else self._response.aiter_raw(chunk_size)
+        )
+        while True:
+            try:
+                chunk = self._run(_next_chunk(chunks))
+            except httpx.TransportError as error:
+                raise _requests_error(error) from error
+            if chunk is None:
+                return
+            yield chunk
+
+    def tell(self) -> int:
+        """
+        Return the body bytes read so far, before decompression.
+        """
+        return self._response.num_bytes_downloaded
+
+    def close(self) -> None:
+        """
+        Release the stream without reading the rest of the body.
+        """
+        self._run(self._response.aclose())
+
+
+class TraceTiming:
+    """
+    httpcore trace callback turning connection events into a `RequestTiming`.
+    """
+
+    def __init__(self) -> None:
+        self.marks: dict[str, float] = {}
+
+    async def __call__(self, event: str, _info: dict[str, Any]) -> None:
+        self.mark(event)
+
+    def mark(self, event: str) -> None:
+        """
+        Note the time of an event.
+        """
+        self.marks[event] = time.perf_counter()
+
+    def span(self, start: str, end: str) -> Optional[float]:
+        """
+        Return seconds between two events, None unless both happened.
+        """
+        if start in self.marks and end in self.marks:
+            return self.marks[end] - self.marks[start]
+        return None
+
+    def timing(self) -> RequestTiming:
+        """
+        Return the phases of the request traced so far.
+
+        Name resolution happens inside the TCP connect and is booked there.
+        """
+        protocol = "http11"
+        if "http2.send_request_headers.started" in self.marks:
+            protocol = "http2"
+        return RequestTiming(
+            connect=self.span(
+                "connection.connect_tcp.started", "connection.connect_tcp.complete"
+            ),
+            tls=self.span(
+                "connection.start_tls.started", "connection.start_tls.complete"
+            ),
+            send=self.span(
+                f"{protocol}.send_request_headers.started",
+                f"{protocol}.send_request_body.complete",
+            ),
+            ttfb=self.span(
+                f"{protocol}.send_request_body.complete",
+                f"{protocol}.receive_response_headers.complete",
+            ),
+            transfer=self.span("response.headers", "response.body"),
+        )
+
+
+class Http2Transport(Transport):
+    """
+    HTTP/2 through one `httpx.AsyncClient`, multiplexing concurrent requests
+    as streams over a few connections.
+
+    The client runs on an event loop thread of its own: calling threads hand
+    their requests over and wait for the response, while the loop
+    interleaves all streams on the shared connections. Plain `http://` URLs
+    use HTTP/2 with prior knowledge (h2c), `https://` URLs negotiate it with
+    ALPN. Meant to be shared by all clients of a process, see
+    `http2_transport`. Requires the `h2` package (`http2` extra).
+    """
+
+    name = "http2"
+
+    def __init__(self, base_url: str, max_connections: int = 2):
+        """
+        Initialize HTTP/2 transport and start its event loop thread.
+
+        Args:
+            base_url: Base URL of the API
+            max_connections: Connections opened to the host at most; one
+                carries as many concurrent streams as the server allows
+        """
+        self.base_url = base_url
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            headers={
+                **DEFAULT_HEADERS,
+                "Accept-Encoding": default_compression().accept_encoding_header,
+            },
+            http1=False,
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="http2-transport", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the transport's event loop and wait for its result.
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _exchange(
+        self, request: httpx.Request, trace: TraceTiming, stream: bool
+    ) -> httpx.Response:
+        reply = await self.client.send(request, stream=True)
+        trace.mark("response.headers")
+        if not stream:
+            try:
+                await reply.aread()
+            finally:
+                await reply.aclose()
+            trace.mark("response.body")
+        return reply
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def send(
+        self,
+        method: str,
+        endpoint: str,
+        body: Optional[bytes],
+        params: Optional[dict[str, Any]],
+        headers: Optional[dict[str, str]],
+        timeout: tuple[float, float],
+        stream: bool,
+    ) -> requests.Response:
+        trace = TraceTiming()
+        request = self.client.build_request(
+            method,
+            endpoint,
+            content=body,
+            params=params,
+            headers=headers,
+            timeout=httpx.Timeout(timeout[1], connect=timeout[0]),
+            extensions={"trace": trace},
+        )
+        trace.mark("request")
+        try:
+            reply = self._run(self._exchange(request, trace, stream))
+        except httpx.TransportError as error:
+            raise _requests_error(error) from error
+
+        response = TimedResponse()
+        response.timing = trace.timing()
+        response.status_code = reply.status_code
+        response.reason = reply.reason_phrase
+        response.url = str(reply.url)
+        response.headers = CaseInsensitiveDict(reply.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(
+            seconds=trace.span("request", "response.headers") or 0.0
+        )
+        response.raw = _StreamedBody(reply, self._run)
+        if not stream:
+            # pylint: disable=protected-access
+            response._content = reply.content
+            response._content_consumed = True  # type: ignore[attr-defined]
+        return response
+
+    def close(self) -> None:
+        """
+        Close the connections and stop the event loop thread.
+        """
+        if self._loop.is_closed():
+            return
+        self._run(self.client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+
+
+# Transports handed out by `http2_transport`, until closed
+_SHARED_HTTP2: list[Http2Transport] = []
+
+
+@functools.cache
+def http2_transport(base_url: str, max_connections: int) -> Http2Transport:
+    """
+    Return the HTTP/2 transport shared by all clients of a process, so that
+    they multiplex over the same connections.
+
+    Shared transports are closed by `close_http2_transports`, at the latest
+    when the interpreter exits.
+    """
+    transport = Http2Transport(base_url, max_connections)
+    _SHARED_HTTP2.append(transport)
+    return transport
+
+
+@atexit.register
+def close_http2_transports() -> None:
+    """
+    Close the shared HTTP/2 transports; `http2_transport` opens new ones.
+    """
+    http2_transport.cache_clear()
+    while _SHARED_HTTP2:
+        _SHARED_HTTP2.pop().close()
+
+
+def create_transport(settings: Settings, pool: SessionPool) -> Transport:
+    """
+    Create the transport selected by `Settings.transport`.
+
+    Args:
+        settings: API settings
+        pool: Session pool of the "requests" transport
+
+    Raises:
+        ValueError: Unknown transport name
+    """
+    if settings.transport == "requests":
+        return SessionTransport(pool, settings.base_url, settings.fast_path)
+    if settings.transport == "http2":
+        return http2_transport(settings.base_url, settings.http2_connections)
+    raise ValueError(
+        f"Unsupported HTTP_TRANSPORT: {settings.transport}, "
+        f"expected one of {', '.join(TRANSPORTS)}."
+    )
@@ -0,0 +1,184 @@
+"""
+Validator cache turning repeated GETs into conditional requests.
+"""
+
+from collections import OrderedDict
+import copy
+from dataclasses import dataclass
+import logging
+import os
+import threading
+from typing import Optional
+import requests
+from requests.structures import CaseInsensitiveDict
+from src.clients.response_cache import CacheKey, resource_path
+from src.config.settings import get_settings
+
+# Headers of a 304 response that update the stored response, RFC 9111 4.3.4
+REFRESHED_HEADERS = ("Cache-Control", "Date", "ETag", "Expires", "Last-Modified")
+
+
+@dataclass(frozen=True)
+class ValidatorConfig:
+    """
+    Conditional request settings.
+
+    Attributes:
+        enabled: Revalidate repeated GETs with `If-None-Match` and
+            `If-Modified-Since` instead of downloading them again
+        max_entries: Maximum number of stored responses, least recently used
+            entries are evicted first
+    """
+
+    enabled: bool = False
+    max_entries: int = 1024
+
+    @classmethod
+    def from_env(cls) -> "ValidatorConfig":
+        """
+        Build validator cache configuration from `HTTP_CONDITIONAL_*`
+        environment variables.
+        """
+        return cls(
+            enabled=os.getenv("HTTP_CONDITIONAL_ENABLED", "false").lower() == "true",
+            max_entries=int(os.getenv("HTTP_CONDITIONAL_MAX_ENTRIES", "1024")),
+        )
+
+
+@dataclass(frozen=True)
+class _Entry:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    response: requests.Response
+
+
+class ValidatorCache:
+    """
+    Thread-safe store of GET responses and their validators, by URL.
+
+    Unlike `ResponseCache`, every read still goes to the service: a stored
+    response is only served once the service confirms it is unchanged with
+    304 Not Modified, which saves the body download but not the round
+    trip. A write through the clients drops stored responses of the same
+    collection, like `ResponseCache.invalidate`.
+
+    `hits` counts 304 responses answered from the store, `misses` GETs that
+    downloaded a body.
+    """
+
+    def __init__(self, config: Optional[ValidatorConfig] = None) -> None:
+        """
+        Initialize validator cache.
+
+        Args:
+            config: Validator cache configuration, read from environment
+                when omitted
+        """
+        self.config = config or get_settings().section(ValidatorConfig.from_env)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def conditional_headers(self, key: CacheKey) -> Optional[dict[str, str]]:
+        """
+        Return the conditional headers of a request, None without validators.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        headers = {}
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def resolve(self, key: CacheKey, response: requests.Response) -> requests.Response:
+        """
+        Process the response to a GET sent with `conditional_headers`.
+
+        Returns:
+            A copy of the stored response on 304 Not Modified, with headers,
+            elapsed time and timing refreshed from the 304; otherwise
+            `response`, stored when it is a 200 carrying validators
+        """
+        if response.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+            if entry is None:
+                logging.warning("Validator cache: 304 for %s without entry", key[0])
+                return response
+            return self._refreshed(key, entry, response)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            self.misses += 1
+            if response.status_code != 200 or (etag is None and last_modified is None):
+                self._entries.pop(key, None)
+                return response
+            self._entries[key] = _Entry(etag, last_modified, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.config.max_entries:
+                self._entries.popitem(last=False)
+        return response
+
+    def _refreshed(
+        self, key: CacheKey, entry: _Entry, not_modified: requests.Response
+    ) -> requests.Response:
+        """
+        Return a copy of a stored response updated from a 304 response.
+        """
+        response = copy.copy(entry.response)
+        response.headers = CaseInsensitiveDict(entry.response.headers)
+        for name in REFRESHED_HEADERS:
+            if name in not_modified.headers:
+                response.headers[name] = not_modified.headers[name]
+        response.elapsed = not_modified.elapsed
+        if hasattr(not_modified, "timing"):
+            response.timing = not_modified.timing  # type: ignore[attr-defined]
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if (etag, last_modified) != (entry.etag, entry.last_modified):
+            with self._lock:
+                if key in self._entries:
+                    self._entries[key] = _Entry(etag, last_modified, entry.response)
+        return response
+
+    def invalidate(self, endpoint: str) -> None:
+        """
+        Drop stored responses of the collection the endpoint belongs to.
+        """
+        root = resource_path(endpoint)
+        with self._lock:
+            stale = [key for key in self._entries if resource_path(key[0]) == root]
+            for key in stale:
+                del self._entries[key]
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return hit and miss counts and the number of stored responses.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """
+        Drop all stored responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
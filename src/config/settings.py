@@ -0,0 +1,167 @@
+"""
+API settings read once per process from the environment and .env files.
+"""
+
+from dataclasses import dataclass, field
+import functools
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar, cast
+from dotenv import dotenv_values
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+T = TypeVar("T")
+
+# Variables this process took from .env files, replaced when they are reloaded
+_DOTENV_VALUES: dict[str, str] = {}
+
+
+def _load_dotenv(path: Path) -> None:
+    """
+    Set variables of a .env file that the environment does not define yet.
+    """
+    for name, value in dotenv_values(path).items():
+        if value is not None and name not in os.environ:
+            os.environ[name] = value
+            _DOTENV_VALUES[name] = value
+
+
+def load_environment(
+    profile: Optional[str] = None, directory: Path = PROJECT_ROOT
+) -> str:
+    """
+    Load .env files of an environment profile into the environment.
+
+    Variables already set in the environment win over `.env.{profile}`,
+    which wins over `.env`. Variables an earlier call took from the files
+    are read from them again, so edited .env files take effect on reload.
+
+    Args:
+        profile: Profile name such as "staging", read from `TEST_PROFILE`
+            (environment or .env) when omitted; "" loads `.env` only
+        directory: Directory containing the .env files
+
+    Returns:
+        Name of the loaded profile
+
+    Raises:
+        ValueError: If the profile has no `.env.{profile}` file
+    """
+    for name, value in _DOTENV_VALUES.items():
+        if os.environ.get(name) == value:
+            del os.environ[name]
+    _DOTENV_VALUES.clear()
+
+    base = directory / ".env"
+    if profile is None:
+        profile = os.getenv("TEST_PROFILE") or dotenv_values(base).get("TEST_PROFILE")
+        profile = profile or ""
+
+    if profile:
+        path = directory / f".env.{profile}"
+        if not path.is_file():
+            raise ValueError(f"Environment profile file {path} not found.")
+        # Loaded first: values already set take precedence
+        _load_dotenv(path)
+    _load_dotenv(base)
+    return profile
+
+
+@dataclass(frozen=True)
+class Settings:  # pylint: disable=too-many-instance-attributes
+    """
+    Books and Authors API connection settings.
+
+    Attributes:
+        profile: Environment profile the settings were loaded from
+        base_url: Base URL of the API ("" when not configured)
+        api_version: API version segment of the endpoint paths
+        books_resource: Name of the Books resource
+        authors_resource: Name of the Authors resource
+        fast_path: Build requests from a `RequestTemplate` instead of
+            `Session.request`
+        transport: "requests" for HTTP/1.1 through pooled sessions, or
+            "http2" to multiplex requests over a few HTTP/2 connections
+        http2_connections: Connections the "http2" transport opens at most
+
+    Configuration of the other client components (session pool,
+    resilience, caches, cassettes, compression) is read from the
+    environment once per settings object, see `section`.
+    """
+
+    profile: str = ""
+    base_url: str = ""
+    api_version: str = "v1"
+    books_resource: str = "Books"
+    authors_resource: str = "Authors"
+    fast_path: bool = True
+    transport: str = "requests"
+    http2_connections: int = 2
+    _sections: dict[Callable[[], Any], Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_env(cls, profile: str = "") -> "Settings":
+        """
+        Build settings from environment variables.
+        """
+        return cls(
+            profile=profile,
+            base_url=os.getenv("BOOKS_API_BASE_URL", ""),
+            api_version=os.getenv("API_VERSION", "v1"),
+            books_resource=os.getenv("BOOKS_API_ENDPOINT", "Books"),
+            authors_resource=os.getenv("AUTHORS_API_ENDPOINT", "Authors"),
+            fast_path=os.getenv("HTTP_FAST_PATH", "true").lower() == "true",
+            transport=os.getenv("HTTP_TRANSPORT", "requests").lower(),
+            http2_connections=int(os.getenv("HTTP2_MAX_CONNECTIONS", "2")),
+        )
+
+    def section(self, from_env: Callable[[], T]) -> T:
+        """
+        Return a component configuration, built by `from_env` on first use.
+
+        Components keep their configuration dataclass and its `from_env`
+        next to their code, so importing the settings stays cheap; reloading
+        the settings reads every section again.
+
+        Args:
+            from_env: Configuration factory, e.g. `PoolConfig.from_env`
+        """
+        if from_env not in self._sections:
+            self._sections.setdefault(from_env, from_env())
+        return cast(T, self._sections[from_env])
+
+    @property
+    def books_endpoint(self) -> str:
+        """
+        Path of the Books collection endpoint.
+        """
+        return f"/api/{self.api_version}/{self.books_resource}"
+
+    @property
+    def authors_endpoint(self) -> str:
+        """
+        Path of the Authors collection endpoint.
+        """
+        return f"/api/{self.api_version}/{self.authors_resource}"
+
+
+@functools.cache
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings, loading .env files on first use.
+
+    Environment changes made afterwards are only picked up by
+    `reload_settings`.
+    """
+    return Settings.from_env(load_environment())
+
+
+def reload_settings() -> Settings:
+    """
+    Discard the process-wide settings and load them again.
+    """
+    get_settings.cache_clear()
+    return get_settings()
@@ -0,0 +1,244 @@
+"""
+Deterministic, streaming generator of synthetic book and author payloads.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import itertools
+import math
+import random
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua enim ad minim veniam "
+    "quis nostrud exercitation ullamco laboris nisi aliquip ex ea commodo "
+    "consequat duis aute irure in reprehenderit voluptate velit esse cillum "
+    "fugiat nulla pariatur excepteur sint occaecat cupidatat non proident sunt "
+    "culpa qui officia deserunt mollit anim id est laborum"
+).split()
+
+FIRST_NAMES = (
+    "Ada Alan Barbara Claude Donald Edsger Frances Grace Guido Ken Linus "
+    "Margaret Niklaus Radia Tim Sophie John Katherine Dennis Shafi"
+).split()
+
+LAST_NAMES = (
+    "Lovelace Turing Liskov Shannon Knuth Dijkstra Allen Hopper Rossum "
+    "Thompson Torvalds Hamilton Wirth Perlman Berners-Lee McCarthy Johnson "
+    "Ritchie Goldwasser"
+).split()
+
+CORPUS_WORDS = 20_000
+EPOCH = datetime(1900, 1, 1, tzinfo=timezone.utc)
+DATE_RANGE_DAYS = 365 * 130
+
+
+@dataclass(frozen=True)
+class SizeDistribution:
+    """
+    Log-normal length distribution of a generated text field.
+
+    Attributes:
+        median: Median length in characters
+        sigma: Spread of the distribution, 0 gives a fixed length
+        minimum: Shortest allowed length
+        maximum: Longest allowed length
+    """
+
+    median: int
+    sigma: float = 0.0
+    minimum: int = 1
+    maximum: int = 10_000
+
+    def sample(self, rng: random.Random) -> int:
+        """
+        Draw a length.
+        """
+        if self.sigma <= 0:
+            length = self.median
+        else:
+            length = round(rng.lognormvariate(math.log(self.median), self.sigma))
+        return min(max(length, self.minimum), self.maximum)
+
+
+@dataclass(frozen=True)
+class FieldSizes:
+    """
+    Length distributions of all generated text fields.
+    """
+
+    title: SizeDistribution = SizeDistribution(24, 0.4, 3, 200)
+    description: SizeDistribution = SizeDistribution(200, 0.6, 10, 4000)
+    excerpt: SizeDistribution = SizeDistribution(400, 0.6, 10, 8000)
+    page_count: tuple[int, int] = (20, 2000)
+
+
+@dataclass(frozen=True)
+class GeneratedRecord:
+    """
+    Generated payload with a note on whether the API should accept it.
+
+    Attributes:
+        data: Request body
+        valid: Payload follows the API model
+        defect: Name of the injected defect of an invalid payload
+    """
+
+    data: dict[str, Any]
+    valid: bool = True
+    defect: Optional[str] = None
+
+
+BOOK_DEFECTS: dict[str, Callable[[dict[str, Any]], None]] = {
+    "id_not_integer": lambda book: book.update(id=str(book["id"])),
+    "page_count_not_integer": lambda book: book.update(pageCount="many"),
+    "publish_date_malformed": lambda book: book.update(publishDate="yesterday"),
+    "title_not_string": lambda book: book.update(title=12345),
+}
+
+AUTHOR_DEFECTS: dict[str, Callable[[dict[str, Any]], None]] = {
+    "id_not_integer": lambda author: author.update(id=1.5),
+    "book_id_not_integer": lambda author: author.update(idBook="book"),
+    "first_name_not_string": lambda author: author.update(firstName=42),
+}
+
+
+class DataFactory:
+    """
+    Seedable source of realistic book and author payloads.
+
+    Records are produced one at a time, so arbitrarily large datasets can be
+    streamed without keeping them in memory. The same seed always produces
+    the same sequence of records.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        sizes: Optional[FieldSizes] = None,
+        next_id: Optional[Callable[[], int]] = None,
+    ) -> None:
+        """
+        Initialize data factory.
+
+        Args:
+            seed: Seed of the random generator
+            sizes: Field length distributions
+            next_id: Source of record IDs, sequential from 1 when omitted,
+                e.g. `IdAllocator.next_id` for tests running in parallel
+        """
+        self.rng = random.Random(seed)
+        self.sizes = sizes or FieldSizes()
+        self.next_id = next_id or itertools.count(1).__next__
+        # Text fields are slices of one pre-built corpus, which costs two
+        # random draws per field instead of one per word
+        self._corpus = " ".join(self.rng.choices(WORDS, k=CORPUS_WORDS))
+
+    def _text(self, size: SizeDistribution) -> str:
+        """
+        Return text of a sampled length cut from the corpus.
+
+        The text is exactly the sampled length; a cut ending on a space
+        ends with a full stop instead, so it never falls below the minimum.
+        """
+        length = size.sample(self.rng)
+        start = self._corpus.find(" ", self.rng.randrange(len(self._corpus) // 2)) + 1
+        text = self._corpus[start : start + length]
+        while len(text) < length:
+            text = f"{text} {self._corpus[: length - len(text) - 1]}"
+        if text.endswith(" "):
+            text = f"{text[:-1]}."
+        return text.capitalize()
+
+    def book(self) -> dict[str, Any]:
+        """
+        Generate a valid book payload.
+        """
+        sizes = self.sizes
+        publish_date = EPOCH + timedelta(
+            days=self.rng.randrange(DATE_RANGE_DAYS),
+            seconds=self.rng.randrange(86_400),
+        )
+        return {
+            "id": self.next_id(),
+            "title": self._text(sizes.title),
+            "description": self._text(sizes.description),
+            "pageCount": self.rng.randint(*sizes.page_count),
+            "excerpt": self._text(sizes.excerpt),
+            "publishDate": publish_date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+
+    def author(self, book_id: int) -> dict[str, Any]:
+        """
+        Generate a valid author payload linked to a book.
+        """
+        return {
+            "id": self.next_id(),
+            "idBook": book_id,
+            "firstName": self.rng.choice(FIRST_NAMES),
+            "lastName": self.rng.choice(LAST_NAMES),
+        }
+
+    def _record(
+        self,
+        data: dict[str, Any],
+        defects: dict[str, Callable[[dict[str, Any]], None]],
+        invalid_rate: float,
+    ) -> GeneratedRecord:
+        """
+        Wrap payload, injecting a random defect at the given rate.
+        """
+        if invalid_rate <= 0 or self.rng.random() >= invalid_rate:
+            return GeneratedRecord(data)
+        defect = self.rng.choice(sorted(defects))
+        defects[defect](data)
+        return GeneratedRecord(data, valid=False, defect=defect)
+
+    def books(
+        self, count: Optional[int] = None, invalid_rate: float = 0.0
+    ) -> Iterator[GeneratedRecord]:
+        """
+        Stream book payloads.
+
+        Args:
+            count: Number of records, endless when omitted
+            invalid_rate: Fraction of payloads with an injected defect
+        """
+        for _ in itertools.repeat(None) if count is None else range(count):
+            yield self._record(self.book(), BOOK_DEFECTS, invalid_rate)
+
+    def authors(
+        self,
+        book_ids: Iterable[int],
+        per_book: tuple[int, int] = (1, 3),
+        invalid_rate: float = 0.0,
+    ) -> Iterator[GeneratedRecord]:
+        """
+        Stream author payloads for the given books.
+
+        Args:
+            book_ids: IDs of books the authors belong to
+            per_book: Inclusive range of authors generated per book
+            invalid_rate: Fraction of payloads with an injected defect
+        """
+        for book_id in book_ids:
+            for _ in range(self.rng.randint(*per_book)):
+                yield self._record(self.author(book_id), AUTHOR_DEFECTS, invalid_rate)
+
+    def catalog(
+        self, count: Optional[int] = None, per_book: tuple[int, int] = (1, 3)
+    ) -> Iterator[tuple[dict[str, Any], list[dict[str, Any]]]]:
+        """
+        Stream valid books together with their authors.
+
+        Args:
+            count: Number of books, endless when omitted
+            per_book: Inclusive range of authors generated per book
+        """
+        for record in self.books(count):
+            book = record.data
+            authors = [
+                self.author(book["id"]) for _ in range(self.rng.randint(*per_book))
+            ]
+            yield book, authors
@@ -0,0 +1,71 @@
+"""
+Record ID allocation for tests running in parallel.
+"""
+
+import os
+import re
+import threading
+
+# Largest ID accepted by the API (Int32 route and body values)
+MAX_ID = 2**31 - 1
+
+
+class IdAllocator:
+    """
+    Hands out record IDs that no other test worker will use.
+
+    Every worker owns a contiguous block of IDs derived from its index, so
+    no coordination between processes is needed. The first block starts at
+    `base`, well above the IDs tests address explicitly, and `base` can be
+    moved (TEST_ID_BASE) to keep concurrent runs against one service apart.
+    """
+
+    def __init__(
+        self,
+        worker_index: int = 0,
+        base: int = 100_000_000,
+        block_size: int = 10_000_000,
+    ) -> None:
+        """
+        Initialize ID allocator.
+
+        Args:
+            worker_index: Index of the test worker, 0 when not running in parallel
+            base: First ID of worker 0
+            block_size: Number of IDs owned by each worker
+        """
+        self.start = base + worker_index * block_size
+        self.stop = self.start + block_size
+        if worker_index < 0 or self.stop - 1 > MAX_ID:
+            raise ValueError(f"No ID block available for worker {worker_index}.")
+
+        self._next = self.start
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_worker(cls, worker_id: str) -> "IdAllocator":
+        """
+        Create allocator for a pytest-xdist worker.
+
+        Args:
+            worker_id: Worker name such as "gw3", or "master" without xdist
+        """
+        match = re.fullmatch(r"gw(\d+)", worker_id)
+        worker_index = int(match.group(1)) if match else 0
+        return cls(worker_index, base=int(os.getenv("TEST_ID_BASE", "100000000")))
+
+    def next_id(self) -> int:
+        """
+        Return an ID not handed out before.
+        """
+        with self._lock:
+            if self._next >= self.stop:
+                raise RuntimeError(
+                    f"ID block {self.start}-{self.stop - 1} is exhausted."
+                )
+            record_id = self._next
+            self._next += 1
+        return record_id
+
+    def __contains__(self, record_id: object) -> bool:
+        return isinstance(record_id, int) and self.start <= record_id < self.stop
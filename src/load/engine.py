@@ -0,0 +1,300 @@
+"""
+Open-loop load generation engine built on the API clients.
+"""
+
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import itertools
+import logging
+import random
+import threading
+import time
+from typing import Any, Callable, Iterator, Literal, Optional, Sequence
+import requests
+from src.utils.histogram import LatencyHistogram
+
+ArrivalProcess = Literal["constant", "poisson"]
+
+# Submitted requests kept before completed ones are pruned
+PRUNE_MIN_FUTURES = 1024
+
+
+@dataclass(frozen=True)
+class Operation:
+    """
+    Single request type issued by the load engine.
+
+    Attributes:
+        name: Endpoint label used in the report, e.g. "GET /Books/{id}"
+        call: Function issuing the request through an API client
+        weight: Relative share of this operation in the request mix
+        expected_status: Status codes counted as success
+    """
+
+    name: str
+    call: Callable[[], requests.Response]
+    weight: float = 1.0
+    expected_status: tuple[int, ...] = (200,)
+
+
+@dataclass
+class OperationStats:
+    """
+    Results collected for one operation.
+
+    Attributes:
+        latency: Time from the intended start to completion; includes any
+            time the request waited because the system was falling behind
+        service_time: Time from the actual start to completion
+        errors: Failed requests by status code or exception name
+    """
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    service_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def requests(self) -> int:
+        """
+        Number of completed requests.
+        """
+        return self.latency.count
+
+    @property
+    def error_rate(self) -> float:
+        """
+        Fraction of failed requests.
+        """
+        return sum(self.errors.values()) / self.requests if self.requests else 0.0
+
+
+@dataclass
+class LoadReport:
+    """
+    Outcome of a load run.
+
+    Attributes:
+        rate: Target arrival rate in requests per second
+        duration: Measured wall time, including the drain of late requests
+        stats: Results by operation name
+        max_dispatch_lag: Largest delay of the scheduler behind the timeline
+    """
+
+    rate: float
+    duration: float
+    stats: dict[str, OperationStats]
+    max_dispatch_lag: float = 0.0
+
+    @property
+    def total(self) -> OperationStats:
+        """
+        Results of all operations combined.
+        """
+        combined = OperationStats()
+        for stats in self.stats.values():
+            combined.latency.merge(stats.latency)
+            combined.service_time.merge(stats.service_time)
+            combined.errors.update(stats.errors)
+        return combined
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize report to a JSON compatible dictionary.
+        """
+        endpoints = dict(self.stats)
+        endpoints["TOTAL"] = self.total
+        return {
+            "rate": self.rate,
+            "duration": self.duration,
+            "max_dispatch_lag": self.max_dispatch_lag,
+            "endpoints": {
+                name: {
+                    "requests": stats.requests,
+                    "throughput": stats.requests / self.duration,
+                    "error_rate": stats.error_rate,
+                    "errors": dict(stats.errors),
+                    "latency": stats.latency.summary(),
+                    "service_time": stats.service_time.summary(),
+                    "histogram": stats.latency.to_dict(),
+                }
+                for name, stats in endpoints.items()
+            },
+        }
+
+    def format_table(self) -> str:
+        """
+        Render per-endpoint results as a text table (latencies in ms).
+        """
+        columns = ["p50", "p90", "p99", "p99.9", "max"]
+        lines = [
+            f"{'endpoint':<40} {'reqs':>7} {'rps':>8} {'err%':>6} "
+            + " ".join(f"{column:>8}" for column in columns)
+        ]
+        endpoints = dict(self.stats)
+        endpoints["TOTAL"] = self.total
+        for name, stats in endpoints.items():
+            summary = stats.latency.summary()
+            lines.append(
+                f"{name:<40} {stats.requests:>7} "
+                f"{stats.requests / self.duration:>8.1f} "
+                f"{stats.error_rate * 100:>6.2f} "
+                + " ".join(f"{summary[column] * 1000:>8.2f}" for column in columns)
+            )
+        return "\n".join(lines)
+
+
+class LoadEngine:  # pylint: disable=too-many-instance-attributes
+    """
+    Drive operations at a fixed arrival rate, independent of response times.
+
+    Requests are scheduled on a timeline computed up front and handed to a
+    worker pool when their time comes, whether or not earlier requests have
+    completed. Latency is measured from the scheduled start, so time spent
+    waiting for a free worker while the service is slow is part of the
+    result instead of silently lowering the offered load (coordinated
+    omission).
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        operations: Sequence[Operation],
+        rate: float,
+        duration: float,
+        workers: int = 32,
+        warmup: float = 0.0,
+        arrival: ArrivalProcess = "constant",
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize load engine.
+
+        Args:
+            operations: Request mix
+            rate: Target arrival rate in requests per second
+            duration: Measured run length in seconds
+            workers: Maximum number of concurrent requests
+            warmup: Seconds run before measuring, excluded from the report
+            arrival: "constant" spacing or "poisson" (exponential gaps)
+            seed: Seed for operation selection and Poisson gaps
+        """
+        if not operations:
+            raise ValueError("At least one operation is required.")
+        if rate <= 0 or duration <= 0:
+            raise ValueError("Rate and duration must be positive.")
+
+        self.operations = list(operations)
+        self.rate = rate
+        self.duration = duration
+        self.workers = workers
+        self.warmup = warmup
+        self.arrival = arrival
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats: dict[str, OperationStats] = {}
+
+    def _arrivals(self) -> Iterator[float]:
+        """
+        Yield intended start times in seconds from the start of the run.
+
+        Constant arrivals are computed from their index rather than summed,
+        so rounding never adds a request at the end of the run.
+        """
+        if self.arrival == "poisson":
+            offset = 0.0
+            while True:
+                yield offset
+                offset += self._random.expovariate(self.rate)
+        for index in itertools.count():
+            yield index / self.rate
+
+    @staticmethod
+    def _pending(futures: list[Future[None]]) -> list[Future[None]]:
+        """
+        Drop completed futures, re-raising an error of any of them.
+        """
+        pending = []
+        for future in futures:
+            if future.done():
+                future.result()
+            else:
+                pending.append(future)
+        return pending
+
+    def _execute(self, operation: Operation, intended: float, measured: bool) -> None:
+        started = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            response = operation.call()
+            if response.status_code not in operation.expected_status:
+                error = str(response.status_code)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            error = type(exc).__name__
+        finished = time.perf_counter()
+
+        if not measured:
+            return
+
+        with self._lock:
+            stats = self._stats.setdefault(operation.name, OperationStats())
+            stats.latency.record(finished - intended)
+            stats.service_time.record(finished - started)
+            if error is not None:
+                stats.errors[error] += 1
+
+    def run(self) -> LoadReport:
+        """
+        Run the load and return per-endpoint results.
+        """
+        weights = [operation.weight for operation in self.operations]
+        futures: list[Future[None]] = []
+        prune_at = PRUNE_MIN_FUTURES
+        max_lag = 0.0
+
+        logging.info(
+            "Load run: %s req/s for %ss (+%ss warmup), %s workers, %s arrivals",
+            self.rate,
+            self.duration,
+            self.warmup,
+            self.workers,
+            self.arrival,
+        )
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            start = time.perf_counter()
+            measure_from = start + self.warmup
+
+            for offset in self._arrivals():
+                if offset >= self.warmup + self.duration:
+                    break
+                intended = start + offset
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    max_lag = max(max_lag, -delay)
+
+                operation = self._random.choices(self.operations, weights)[0]
+                futures.append(
+                    executor.submit(
+                        self._execute, operation, intended, offset >= self.warmup
+                    )
+                )
+                # Keep only requests in flight; the bound doubles with them so
+                # pruning stays amortized O(1) even when the service falls behind
+                if len(futures) >= prune_at:
+                    futures = self._pending(futures)
+                    prune_at = max(PRUNE_MIN_FUTURES, 2 * len(futures))
+
+            for future in futures:
+                future.result()
+
+            elapsed = time.perf_counter() - measure_from
+
+        return LoadReport(
+            rate=self.rate,
+            duration=max(elapsed, self.duration),
+            stats=dict(sorted(self._stats.items())),
+            max_dispatch_lag=max_lag,
+        )
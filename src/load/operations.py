@@ -0,0 +1,95 @@
+"""
+Request mixes for the load engine built from the API client methods.
+"""
+
+import itertools
+import random
+from typing import Optional
+import requests
+from src.clients.authors_client import AuthorsClient
+from src.clients.books_client import BooksClient
+from src.data.authors_data import AuthorsData
+from src.data.books_data import BooksData
+from src.load.engine import Operation
+
+# IDs of records created under load start here to stay clear of seed data
+LOAD_ID_OFFSET = 1_000_000
+
+
+def read_operations(
+    books_client: BooksClient,
+    authors_client: AuthorsClient,
+    max_id: int = 200,
+    rng: Optional[random.Random] = None,
+) -> list[Operation]:
+    """
+    Build a read-only request mix.
+
+    Args:
+        books_client: Books API client
+        authors_client: Authors API client
+        max_id: Highest book ID expected to exist
+        rng: Source of the requested IDs, unseeded when omitted
+    """
+    rng = rng or random.Random()
+    return [
+        Operation("GET /Books", books_client.get_all_books, weight=1),
+        Operation(
+            "GET /Books/{id}",
+            lambda: books_client.get_book_by_id(rng.randint(1, max_id)),
+            weight=4,
+        ),
+        Operation("GET /Authors", authors_client.get_all_authors, weight=1),
+        Operation(
+            "GET /Authors/{id}",
+            lambda: authors_client.get_author_by_id(rng.randint(1, max_id)),
+            weight=4,
+        ),
+        Operation(
+            "GET /Authors/authors/books/{idBook}",
+            lambda: authors_client.get_authors_by_book_id(rng.randint(1, max_id)),
+            weight=2,
+        ),
+    ]
+
+
+def crud_operations(
+    books_client: BooksClient,
+    authors_client: AuthorsClient,
+    max_id: int = 200,
+    rng: Optional[random.Random] = None,
+) -> list[Operation]:
+    """
+    Build a mixed read/write request mix.
+
+    Writes use IDs above `LOAD_ID_OFFSET` so they do not touch seed data.
+
+    Args:
+        books_client: Books API client
+        authors_client: Authors API client
+        max_id: Highest book ID expected to exist
+        rng: Source of the requested IDs, unseeded when omitted
+    """
+    rng = rng or random.Random()
+    book_ids = itertools.count(LOAD_ID_OFFSET)
+    author_ids = itertools.count(LOAD_ID_OFFSET)
+
+    def create_book() -> requests.Response:
+        book_data = {**BooksData.sample_book_data, "id": next(book_ids)}
+        return books_client.create_book(book_data)
+
+    def update_book() -> requests.Response:
+        book_id = rng.randint(1, max_id)
+        return books_client.update_book(
+            book_id, {**BooksData.updated_book_data, "id": book_id}
+        )
+
+    def create_author() -> requests.Response:
+        author_data = {**AuthorsData.sample_author_data, "id": next(author_ids)}
+        return authors_client.create_author(author_data)
+
+    return read_operations(books_client, authors_client, max_id, rng) + [
+        Operation("POST /Books", create_book, weight=1),
+        Operation("PUT /Books/{id}", update_book, weight=1, expected_status=(200, 404)),
+        Operation("POST /Authors", create_author, weight=1),
+    ]
@@ -0,0 +1,662 @@
+"""
+Soak test: cycle the Books and Authors CRUD flows for hours and flag drift.
+
+Usage:
+    uv run python -m src.load.soak --duration 3600 --window 60 [--workers N]
+        [--warmup-windows N] [--alpha P] [--local-api]
+        [--output reports/soak/result.json]
+"""
+
+import argparse
+from dataclasses import dataclass, field, replace
+import gc
+import itertools
+import json
+import logging
+import math
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import Any, Callable, Optional, Sequence
+from src.clients.authors_client import AuthorsClient
+from src.clients.base_client import BaseClient
+from src.clients.books_client import BooksClient
+from src.clients.resilience import ResilienceConfig, ResiliencePolicy
+from src.config.settings import get_settings
+from src.data.authors_data import AuthorsData
+from src.data.books_data import BooksData
+from src.load.engine import LoadReport, Operation, OperationStats
+from src.server.http_server import LocalApiServer
+from src.utils.histogram import LatencyHistogram
+from src.utils.trend import TrendTest, mann_kendall
+
+# IDs of records created by soak flows, clear of seed data and load runs
+SOAK_ID_OFFSET = 2_000_000
+
+# Fewer windows than this after warmup leave drift undecided
+MIN_WINDOWS = 4
+
+# Steps of one flow cycle, built fresh for every cycle
+Flow = Callable[[], Sequence[Operation]]
+
+# The public service acknowledges writes without storing them, so reads and
+# writes of a record created in the same flow may answer 404 there
+FOLLOW_UP_STATUS = (200, 404)
+
+
+def book_lifecycle(books_client: BooksClient) -> Flow:
+    """
+    Create, read, update, read and delete a book, as in `tests/api/books`.
+    """
+    book_ids = itertools.count(SOAK_ID_OFFSET)
+
+    def cycle() -> Sequence[Operation]:
+        book_id = next(book_ids)
+        updated = {**BooksData.updated_book_data, "id": book_id}
+        return [
+            Operation(
+                "POST /Books",
+                lambda: books_client.create_book(
+                    {**BooksData.sample_book_data, "id": book_id}
+                ),
+            ),
+            Operation(
+                "GET /Books/{id}",
+                lambda: books_client.get_book_by_id(book_id),
+                expected_status=FOLLOW_UP_STATUS,
+            ),
+            Operation(
+                "PUT /Books/{id}",
+                lambda: books_client.update_book(book_id, updated),
+                expected_status=FOLLOW_UP_STATUS,
+            ),
+            Operation("GET /Books", books_client.get_all_books),
+            Operation(
+                "DELETE /Books/{id}",
+                lambda: books_client.delete_book(book_id),
+                expected_status=FOLLOW_UP_STATUS,
+            ),
+        ]
+
+    return cycle
+
+
+def author_lifecycle(authors_client: AuthorsClient) -> Flow:
+    """
+    Create, read, update, read and delete an author, as in `tests/api/authors`.
+    """
+    author_ids = itertools.count(SOAK_ID_OFFSET)
+
+    def cycle() -> Sequence[Operation]:
+        author_id = next(author_ids)
+        author = {**AuthorsData.sample_author_data, "id": author_id}
+        updated = {**AuthorsData.updated_author_data, "id": author_id}
+        book_id = str(updated["idBook"])
+        return [
+            Operation("POST /Authors", lambda: authors_client.create_author(author)),
+            Operation(
+                "GET /Authors/{id}",
+                lambda: authors_client.get_author_by_id(author_id),
+                expected_status=FOLLOW_UP_STATUS,
+            ),
+            Operation(
+                "PUT /Authors/{id}",
+                lambda: authors_client.update_author(author_id, updated),
+                expected_status=FOLLOW_UP_STATUS,
+            ),
+            Operation(
+                "GET /Authors/authors/books/{idBook}",
+                lambda: authors_client.get_authors_by_book_id(book_id),
+            ),
+            Operation(
+                "DELETE /Authors/{id}",
+                lambda: authors_client.delete_author(author_id),
+                expected_status=FOLLOW_UP_STATUS,
+            ),
+        ]
+
+    return cycle
+
+
+def crud_flows(books_client: BooksClient, authors_client: AuthorsClient) -> list[Flow]:
+    """
+    Build the flows cycled by a soak run.
+    """
+    return [book_lifecycle(books_client), author_lifecycle(authors_client)]
+
+
+def resident_memory() -> int:
+    """
+    Return the resident set size of this process in bytes.
+
+    Read from `/proc` on Linux; elsewhere the peak RSS reported by
+    `getrusage` is the closest portable figure, and 0 without either.
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def live_objects() -> int:
+    """
+    Return the number of objects tracked by the garbage collector.
+    """
+    return len(gc.get_objects())
+
+
+@dataclass(frozen=True)
+class WindowSample:  # pylint: disable=too-many-instance-attributes
+    """
+    Measurements of one soak window.
+
+    Attributes:
+        index: Window number, from 0
+        elapsed: Seconds from the start of the run to the end of the window
+        requests: Requests completed in the window
+        errors: Failed requests in the window
+        p50: Median latency in seconds
+        p99: 99th percentile latency in seconds
+        rss: Resident set size in bytes at the end of the window
+        objects: Objects tracked by the garbage collector at the end of the
+            window
+    """
+
+    index: int
+    elapsed: float
+    requests: int
+    errors: int
+    p50: float
+    p99: float
+    rss: int
+    objects: int
+
+    @property
+    def error_rate(self) -> float:
+        """
+        Fraction of failed requests.
+        """
+        return self.errors / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize sample to a JSON compatible dictionary.
+        """
+        return {
+            "index": self.index,
+            "elapsed": self.elapsed,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "p50": self.p50,
+            "p99": self.p99,
+            "rss": self.rss,
+            "objects": self.objects,
+        }
+
+    def format_line(self) -> str:
+        """
+        Render sample as one progress line (latencies in ms, RSS in MiB).
+        """
+        return (
+            f"window {self.index:>4} {self.elapsed:>8.0f}s {self.requests:>7} reqs "
+            f"{self.error_rate * 100:>6.2f} err% p50 {self.p50 * 1000:>8.2f} "
+            f"p99 {self.p99 * 1000:>8.2f} rss {self.rss / 2**20:>8.1f} "
+            f"objects {self.objects:>9}"
+        )
+
+
+@dataclass(frozen=True)
+class SoakConfig:  # pylint: disable=too-many-instance-attributes
+    """
+    Soak run settings.
+
+    Attributes:
+        duration: Run length in seconds
+        window: Sampling window in seconds
+        workers: Flows run concurrently, each one request at a time
+        warmup_windows: Leading windows left out of drift detection, while
+            pools, caches and the allocator fill up
+        alpha: Significance level of the trend test
+        latency_tolerance: Relative rise of p50/p99 over the run that counts
+            as drift
+        memory_tolerance: Relative rise of RSS or object count over the run
+            that counts as drift
+        error_tolerance: Absolute rise of the error rate over the run that
+            counts as drift
+        throughput_tolerance: Relative fall of requests per window over the
+            run that counts as drift
+    """
+
+    duration: float = 3600.0
+    window: float = 60.0
+    workers: int = 4
+    warmup_windows: int = 1
+    alpha: float = 0.01
+    latency_tolerance: float = 0.2
+    memory_tolerance: float = 0.1
+    error_tolerance: float = 0.01
+    throughput_tolerance: float = 0.2
+
+    def __post_init__(self) -> None:
+        if self.duration <= 0 or self.window <= 0 or self.workers <= 0:
+            raise ValueError("Duration, window and workers must be positive.")
+        if not 0 < self.alpha < 1:
+            raise ValueError("Alpha must be between 0 and 1.")
+
+
+@dataclass(frozen=True)
+class Metric:
+    """
+    Window measurement watched for drift.
+
+    Attributes:
+        name: Metric name used in the report
+        value: Reads the measurement from a window sample
+        tolerance: Smallest change over the run that counts as drift
+        relative: Compare the change to the fitted start value instead of
+            in absolute terms
+        decreasing: A fall rather than a rise is the degradation
+    """
+
+    name: str
+    value: Callable[[WindowSample], float]
+    tolerance: float
+    relative: bool = True
+    decreasing: bool = False
+
+
+def drift_metrics(config: SoakConfig) -> list[Metric]:
+    """
+    Build the metrics watched for drift with the tolerances of a run.
+    """
+    return [
+        Metric("p50", lambda sample: sample.p50, config.latency_tolerance),
+        Metric("p99", lambda sample: sample.p99, config.latency_tolerance),
+        Metric(
+            "error_rate",
+            lambda sample: sample.error_rate,
+            config.error_tolerance,
+            relative=False,
+        ),
+        Metric(
+            "throughput",
+            lambda sample: sample.requests,
+            config.throughput_tolerance,
+            decreasing=True,
+        ),
+        Metric("rss", lambda sample: sample.rss, config.memory_tolerance),
+        Metric("objects", lambda sample: sample.objects, config.memory_tolerance),
+    ]
+
+
+@dataclass(frozen=True)
+class Drift:
+    """
+    Trend of one metric over a soak run.
+
+    Attributes:
+        metric: Metric name
+        trend: Mann-Kendall test towards degradation; for decreasing metrics
+            run on the negated series
+        change: Degradation over the run, relative to the fitted start
+            value or absolute, as configured for the metric
+        tolerance: Smallest change that counts as drift
+        alpha: Significance level the p-value is compared with
+    """
+
+    metric: str
+    trend: TrendTest
+    change: float
+    tolerance: float
+    alpha: float
+
+    @property
+    def drifting(self) -> bool:
+        """
+        Whether the metric degrades both significantly and noticeably.
+        """
+        return self.trend.p_value < self.alpha and self.change > self.tolerance
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize drift to a JSON compatible dictionary.
+        """
+        return {
+            "metric": self.metric,
+            "drifting": self.drifting,
+            "change": self.change if math.isfinite(self.change) else None,
+            "tolerance": self.tolerance,
+            "p_value": self.trend.p_value,
+            "z": self.trend.z,
+            "slope": self.trend.slope,
+            "start": self.trend.intercept,
+        }
+
+
+def detect_drift(samples: Sequence[WindowSample], config: SoakConfig) -> list[Drift]:
+    """
+    Test every watched metric for a degrading trend across windows.
+
+    A metric drifts when the Mann-Kendall test finds a monotonic trend at
+    significance `alpha` and Sen's slope extrapolated over the run exceeds
+    the metric's tolerance. The test alone flags changes too small to
+    matter over long runs (RSS rarely shrinks), the tolerance alone
+    flags noise; both together flag slow, steady degradation.
+
+    Returns:
+        One result per metric, empty with fewer than `MIN_WINDOWS` windows
+        after warmup
+    """
+    measured = samples[config.warmup_windows :]
+    if len(measured) < MIN_WINDOWS:
+        logging.warning(
+            "Soak run: %s windows after warmup, at least %s needed to detect drift",
+            len(measured),
+            MIN_WINDOWS,
+        )
+        return []
+
+    results = []
+    for metric in drift_metrics(config):
+        sign = -1 if metric.decreasing else 1
+        trend = mann_kendall([sign * metric.value(sample) for sample in measured])
+        change = trend.change
+        if metric.relative:
+            start = sign * trend.intercept
+            if start > 0:
+                change /= start
+            elif change > 0:
+                change = math.inf
+        results.append(
+            Drift(metric.name, trend, change, metric.tolerance, config.alpha)
+        )
+    return results
+
+
+@dataclass
+class SoakReport:
+    """
+    Outcome of a soak run.
+
+    Attributes:
+        config: Settings of the run
+        duration: Measured wall time
+        samples: Measurements by window
+        stats: Results by operation over the whole run
+        drift: Trend of every watched metric
+    """
+
+    config: SoakConfig
+    duration: float
+    samples: list[WindowSample]
+    stats: dict[str, OperationStats]
+    drift: list[Drift] = field(default_factory=list)
+
+    @property
+    def drifting(self) -> list[Drift]:
+        """
+        Metrics found drifting.
+        """
+        return [drift for drift in self.drift if drift.drifting]
+
+    @property
+    def summary(self) -> LoadReport:
+        """
+        Per-operation results of the whole run.
+        """
+        requests = sum(stats.requests for stats in self.stats.values())
+        return LoadReport(
+            rate=requests / self.duration if self.duration else 0.0,
+            duration=self.duration,
+            stats=self.stats,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize report to a JSON compatible dictionary.
+        """
+        return {
+            "duration": self.duration,
+            "window": self.config.window,
+            "workers": self.config.workers,
+            "warmup_windows": self.config.warmup_windows,
+            "alpha": self.config.alpha,
+            "windows": [sample.to_dict() for sample in self.samples],
+            "drift": [drift.to_dict() for drift in self.drift],
+            "endpoints": self.summary.to_dict()["endpoints"],
+        }
+
+    def format_table(self) -> str:
+        """
+        Render per-endpoint results and drift verdicts as text tables.
+        """
+        lines = [self.summary.format_table(), ""]
+        lines.append(
+            f"{'metric':<12} {'start':>12} {'change':>9} {'limit':>8} "
+            f"{'p-value':>9}  verdict"
+        )
+        for drift in self.drift:
+            change = (
+                f"{drift.change * 100:>8.1f}%"
+                if math.isfinite(drift.change)
+                else f"{'inf':>9}"
+            )
+            lines.append(
+                f"{drift.metric:<12} {abs(drift.trend.intercept):>12.6g} {change} "
+                f"{drift.tolerance * 100:>7.1f}% {drift.trend.p_value:>9.2g}  "
+                f"{'DRIFT' if drift.drifting else 'stable'}"
+            )
+        if not self.drift:
+            lines.append("too few windows to detect drift")
+        return "\n".join(lines)
+
+
+class SoakRunner:  # pylint: disable=too-many-instance-attributes
+    """
+    Cycle flows with a fixed number of workers and sample every window.
+
+    Unlike `LoadEngine`, the load is closed loop: each worker runs one flow
+    step after the other, so the workload stays the same for hours and a
+    slower service shows up as rising latency and falling throughput
+    instead of a growing queue. Runs happen in this process, so RSS and
+    object counts cover the clients and, with `--local-api`, the server.
+    """
+
+    def __init__(
+        self,
+        flows: Sequence[Flow],
+        config: SoakConfig,
+        on_window: Optional[Callable[[WindowSample], None]] = None,
+    ) -> None:
+        """
+        Initialize soak runner.
+
+        Args:
+            flows: Flows cycled by every worker in turn
+            config: Soak run settings
+            on_window: Called with each sample as its window closes
+        """
+        if not flows:
+            raise ValueError("At least one flow is required.")
+        self.flows = list(flows)
+        self.config = config
+        self.on_window = on_window
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._stats: dict[str, OperationStats] = {}
+        self._window = LatencyHistogram()
+        self._window_errors = 0
+
+    def _execute(self, operation: Operation) -> None:
+        started = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            response = operation.call()
+            if response.status_code not in operation.expected_status:
+                error = str(response.status_code)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            error = type(exc).__name__
+        latency = time.perf_counter() - started
+
+        with self._lock:
+            stats = self._stats.setdefault(operation.name, OperationStats())
+            stats.latency.record(latency)
+            stats.service_time.record(latency)
+            self._window.record(latency)
+            if error is not None:
+                stats.errors[error] += 1
+                self._window_errors += 1
+
+    def _work(self, offset: int) -> None:
+        for cycle in itertools.count(offset):
+            for operation in self.flows[cycle % len(self.flows)]():
+                if self._stop.is_set():
+                    return
+                self._execute(operation)
+
+    def _sample(self, index: int, elapsed: float) -> WindowSample:
+        with self._lock:
+            window, errors = self._window, self._window_errors
+            self._window, self._window_errors = LatencyHistogram(), 0
+        return WindowSample(
+            index=index,
+            elapsed=elapsed,
+            requests=window.count,
+            errors=errors,
+            p50=window.percentile(50),
+            p99=window.percentile(99),
+            rss=resident_memory(),
+            objects=live_objects(),
+        )
+
+    def run(self) -> SoakReport:
+        """
+        Run the flows for the configured duration and report drift.
+        """
+        windows = max(math.ceil(self.config.duration / self.config.window), 1)
+        logging.info(
+            "Soak run: %s flows for %ss in %s windows of %ss, %s workers",
+            len(self.flows),
+            self.config.duration,
+            windows,
+            self.config.window,
+            self.config.workers,
+        )
+
+        self._stop.clear()
+        workers = [
+            threading.Thread(target=self._work, args=(offset,), daemon=True)
+            for offset in range(self.config.workers)
+        ]
+        samples = []
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        try:
+            for index in range(windows):
+                close = start + (index + 1) * self.config.window
+                time.sleep(max(close - time.perf_counter(), 0))
+                sample = self._sample(index, time.perf_counter() - start)
+                samples.append(sample)
+                if self.on_window is not None:
+                    self.on_window(sample)
+        finally:
+            self._stop.set()
+            for worker in workers:
+                worker.join()
+
+        return SoakReport(
+            config=self.config,
+            duration=samples[-1].elapsed if samples else 0.0,
+            samples=samples,
+            stats=dict(sorted(self._stats.items())),
+            drift=detect_drift(samples, self.config),
+        )
+
+
+def main() -> None:
+    """
+    Parse command line, run the soak and report drift.
+
+    Exits with status 1 when any metric drifts.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=3600.0, help="Seconds")
+    parser.add_argument("--window", type=float, default=60.0, help="Seconds")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--warmup-windows", type=int, default=1)
+    parser.add_argument("--alpha", type=float, default=0.01)
+    parser.add_argument("--local-api", action="store_true")
+    parser.add_argument("--output", type=Path, default=None, help="JSON report")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(message)s")
+    settings = get_settings()
+    config = SoakConfig(
+        duration=args.duration,
+        window=args.window,
+        workers=args.workers,
+        warmup_windows=args.warmup_windows,
+        alpha=args.alpha,
+    )
+
+    server = None
+    if args.local_api:
+        server = LocalApiServer()
+        settings = replace(settings, base_url=server.start())
+
+    pool = BaseClient.create_pool()
+    # Retries would hide the errors whose rate is watched
+    resilience = ResiliencePolicy(
+        replace(settings.section(ResilienceConfig.from_env), max_attempts=1)
+    )
+    # GETs answered from memory or with 304 would hide drift of the service
+    runner = SoakRunner(
+        crud_flows(
+            BooksClient(
+                pool,
+                settings=settings,
+                resilience=resilience,
+                cache_enabled=False,
+                conditional_enabled=False,
+            ),
+            AuthorsClient(
+                pool,
+                settings=settings,
+                resilience=resilience,
+                cache_enabled=False,
+                conditional_enabled=False,
+            ),
+        ),
+        config,
+        on_window=lambda sample: print(sample.format_line(), flush=True),
+    )
+
+    try:
+        report = runner.run()
+    finally:
+        pool.close()
+        if server is not None:
+            server.stop()
+
+    print(report.format_table())
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+
+    sys.exit(1 if report.drifting else 0)
+
+
+if __name__ == "__main__":
+    main()
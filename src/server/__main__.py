@@ -0,0 +1,37 @@
+"""
+Run the local FakeRestAPI stand-in server.
+
+Usage:
+    uv run python -m src.server [--host HOST] [--port PORT] [--delay SECONDS]
+"""
+
+import argparse
+import asyncio
+import logging
+from src.server.http_server import LocalApiServer, new_event_loop
+
+
+def main() -> None:
+    """
+    Parse command line and serve until interrupted.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument(
+        "--delay", type=float, default=0.0, help="Seconds to hold back responses"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    server = LocalApiServer(host=args.host, port=args.port, delay=args.delay)
+
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        try:
+            runner.run(server.serve_forever())
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Request routing and endpoint logic of the local FakeRestAPI stand-in.
+
+The application is transport agnostic: it maps a method, path and body to
+an `ApiResponse`, so it can be served over any HTTP implementation.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+import itertools
+import json
+from typing import Any, Optional
+from src.server.store import Collection, DataStore, dumps
+
+JSON = "application/json; charset=utf-8; v=1.0"
+PROBLEM_JSON = "application/problem+json; charset=utf-8"
+
+BOOK_FIELDS: dict[str, str] = {
+    "id": "int",
+    "title": "string",
+    "description": "string",
+    "pageCount": "int",
+    "excerpt": "string",
+    "publishDate": "date-time",
+}
+
+AUTHOR_FIELDS: dict[str, str] = {
+    "id": "int",
+    "idBook": "int",
+    "firstName": "string",
+    "lastName": "string",
+}
+
+DEFAULTS: dict[str, Any] = {
+    "int": 0,
+    "string": None,
+    "date-time": "0001-01-01T00:00:00",
+}
+
+
+@dataclass(frozen=True)
+class ApiResponse:
+    """
+    Response produced by the stand-in application.
+
+    `last_modified` is a POSIX timestamp.
+    """
+
+    status: int
+    body: bytes = b""
+    content_type: Optional[str] = JSON
+    content_encoding: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[float] = None
+
+
+class FakeRestApi:
+    """
+    Stateful implementation of the Books and Authors endpoints.
+
+    Routes, status codes and problem+json bodies follow the public
+    FakeRestAPI service, but created, updated and deleted records are
+    persisted in memory for the lifetime of the application.
+    """
+
+    def __init__(
+        self, store: Optional[DataStore] = None, api_version: str = "v1"
+    ) -> None:
+        """
+        Initialize stand-in application.
+
+        Args:
+            store: Data store, a freshly seeded one when omitted
+            api_version: API version segment served under /api/
+        """
+        self.store = store or DataStore()
+        self.api_version = api_version.lower()
+        self._trace_ids = itertools.count(1)
+
+    def handle(self, method: str, path: str, body: bytes = b"") -> ApiResponse:
+        """
+        Handle a single request.
+
+        Args:
+            method: HTTP method
+            path: Request target, query string is ignored
+            body: Raw request body
+
+        Returns:
+            Response to send back
+        """
+        segments = [segment for segment in path.split("?", 1)[0].split("/") if segment]
+        lowered = [segment.lower() for segment in segments]
+
+        if len(lowered) < 3 or lowered[:2] != ["api", self.api_version]:
+            return ApiResponse(404, content_type=None)
+
+        resource = lowered[2]
+        if resource == "books":
+            return self._route(
+                method, segments[3:], body, self.store.books, BOOK_FIELDS
+            )
+        if resource == "authors":
+            if len(lowered) == 6 and lowered[3:5] == ["authors", "books"]:
+                if method != "GET":
+                    return ApiResponse(405, content_type=None)
+                return self._list_by_book(segments[5])
+            return self._route(
+                method, segments[3:], body, self.store.authors, AUTHOR_FIELDS
+            )
+
+        return ApiResponse(404, content_type=None)
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    # pylint: disable=too-many-return-statements
+    def _route(
+        self,
+        method: str,
+        rest: list[str],
+        body: bytes,
+        collection: Collection,
+        fields: dict[str, str],
+    ) -> ApiResponse:
+        """
+        Dispatch collection (/Resource) and item (/Resource/{id}) requests.
+        """
+        if not rest:
+            if method == "GET":
+                return ApiResponse(
+                    200,
+                    collection.list_body(None),
+                    last_modified=collection.modified,
+                )
+            if method == "POST":
+                return self._save(collection, fields, body, None)
+            return ApiResponse(405, content_type=None)
+
+        if len(rest) != 1:
+            return ApiResponse(404, content_type=None)
+
+        record_id = _parse_int(rest[0])
+        if record_id is None:
+            return self._bad_request("id", f"The value '{rest[0]}' is not valid.")
+
+        if method == "GET":
+            item_body = collection.item_body(record_id)
+            if item_body is None:
+                return self._not_found()
+            return ApiResponse(200, item_body, last_modified=collection.modified)
+        if method == "PUT":
+            if collection.get(record_id) is None:
+                return self._not_found()
+            return self._save(collection, fields, body, record_id)
+        if method == "DELETE":
+            collection.delete(record_id)
+            return ApiResponse(200, content_type=None)
+
+        return ApiResponse(405, content_type=None)
+
+    def _list_by_book(self, raw_book_id: str) -> ApiResponse:
+        """
+        Return authors of a book.
+        """
+        book_id = _parse_int(raw_book_id)
+        if book_id is None:
+            return self._bad_request(
+                "idBook", f"The value '{raw_book_id}' is not valid."
+            )
+        return ApiResponse(
+            200,
+            self.store.authors.list_body(book_id, "idBook"),
+            last_modified=self.store.authors.modified,
+        )
+
+    def _save(
+        self,
+        collection: Collection,
+        fields: dict[str, str],
+        body: bytes,
+        record_id: Optional[int],
+    ) -> ApiResponse:
+        """
+        Validate request body and insert or replace the record.
+        """
+        if not body:
+            return self._bad_request("", "A non-empty request body is required.")
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return self._bad_request("$", "The JSON value could not be parsed.")
+
+        if not isinstance(payload, dict):
+            return self._bad_request("$", "The JSON value must be an object.")
+
+        record: dict[str, Any] = {}
+        for name, kind in fields.items():
+            if name not in payload:
+                record[name] = None if name == "id" else DEFAULTS[kind]
+                continue
+            value = payload[name]
+            if not _is_valid(value, kind):
+                return self._bad_request(
+                    f"$.{name}", f"The JSON value could not be converted ({kind})."
+                )
+            record[name] = value
+
+        if record_id is not None:
+            record["id"] = record_id
+
+        return ApiResponse(200, dumps(collection.put(record)))
+
+    def _trace_id(self) -> str:
+        return f"00-{next(self._trace_ids):032x}-{0:016x}-00"
+
+    def _not_found(self) -> ApiResponse:
+        return ApiResponse(
+            404,
+            dumps(
+                {
+                    "type": "https://tools.ietf.org/html/rfc7231#section-6.5.4",
+                    "title": "Not Found",
+                    "status": 404,
+                    "traceId": self._trace_id(),
+                }
+            ),
+            PROBLEM_JSON,
+        )
+
+    def _bad_request(self, field: str, message: str) -> ApiResponse:
+        return ApiResponse(
+            400,
+            dumps(
+                {
+                    "type": "https://tools.ietf.org/html/rfc7231#section-6.5.1",
+                    "title": "One or more validation errors occurred.",
+                    "status": 400,
+                    "traceId": self._trace_id(),
+                    "errors": {field: [message]},
+                }
+            ),
+            PROBLEM_JSON,
+        )
+
+
+def _parse_int(raw: str) -> Optional[int]:
+    """
+    Parse a route value the way ASP.NET binds an int, None when invalid.
+    """
+    try:
+        value = int(raw)
+    except ValueError:
+        return None
+    return value if -(2**31) <= value < 2**31 else None
+
+
+def _is_valid(value: Any, kind: str) -> bool:
+    """
+    Check JSON value against a model field type.
+    """
+    if kind == "int":
+        return isinstance(value, int) and not isinstance(value, bool)
+    if kind == "date-time":
+        if not isinstance(value, str):
+            return False
+        try:
+            datetime.fromisoformat(value)
+        except ValueError:
+            return False
+        return True
+    return value is None or isinstance(value, str)
@@ -0,0 +1,79 @@
+"""
+Conditional GET handling of the local FakeRestAPI stand-in.
+
+Successful GET responses carry a weak `ETag` derived from their body and
+the `Last-Modified` time of their collection. Requests whose validators
+still match are answered with 304 Not Modified and no body.
+"""
+
+from dataclasses import replace
+from email.utils import formatdate, parsedate_to_datetime
+import functools
+import hashlib
+from src.server.app import ApiResponse
+
+
+@functools.lru_cache(maxsize=1024)
+def entity_tag(body: bytes) -> str:
+    """
+    Return the weak entity tag of a response body.
+
+    Weak, as the body may be sent compressed. Stored bodies are reused until
+    their record changes, so each one is hashed once.
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+
+def http_date(timestamp: float) -> str:
+    """
+    Format a POSIX timestamp as an HTTP date.
+    """
+    return formatdate(timestamp, usegmt=True)
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _not_modified(
+    response: ApiResponse, if_none_match: str, if_modified_since: str
+) -> bool:
+    """
+    Evaluate the preconditions of a GET, RFC 9110 13.2.2.
+
+    `If-Modified-Since` is ignored when `If-None-Match` is present.
+    """
+    if if_none_match:
+        if if_none_match.strip() == "*":
+            return True
+        current = _opaque_tag(response.etag or "")
+        return any(_opaque_tag(tag) == current for tag in if_none_match.split(","))
+
+    if if_modified_since and response.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(response.last_modified) <= since
+    return False
+
+
+def evaluate(
+    method: str, response: ApiResponse, if_none_match: str, if_modified_since: str
+) -> ApiResponse:
+    """
+    Add validators to a successful GET response and answer 304 Not Modified
+    when the request's validators match.
+    """
+    if method not in ("GET", "HEAD") or response.status != 200:
+        return response
+    response = replace(response, etag=entity_tag(response.body))
+    if _not_modified(response, if_none_match, if_modified_since):
+        return ApiResponse(
+            304,
+            content_type=None,
+            etag=response.etag,
+            last_modified=response.last_modified,
+        )
+    return response
@@ -0,0 +1,98 @@
+"""
+Content-Encoding negotiation of the local FakeRestAPI stand-in.
+
+Response bodies are compressed with gzip or deflate when the client accepts
+them, request bodies sent with either coding are decompressed before they
+reach the application, so clients can measure what compression saves.
+"""
+
+from dataclasses import replace
+import functools
+import gzip
+from typing import Optional
+import zlib
+from src.server.app import ApiResponse
+
+# Codings the server produces, in order of preference
+CODINGS = ("gzip", "deflate")
+
+# Smaller bodies are sent as they are; compression would hardly pay off
+MIN_COMPRESS_BYTES = 1024
+
+# Fast compression, as the stand-in answers every request in process
+COMPRESS_LEVEL = 1
+
+
+def preferred_coding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the response coding for an `Accept-Encoding` header.
+
+    Returns:
+        Accepted coding with the highest quality, ties resolved in the
+        order of `CODINGS`, or None to send the body as is
+    """
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding.strip()] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in CODINGS:
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+@functools.lru_cache(maxsize=16)
+def _compress(body: bytes, coding: str) -> bytes:
+    """
+    Compress a response body.
+
+    Collection list bodies are cached until the collection changes, so the
+    same bytes object is compressed only once (bytes cache their hash).
+    """
+    if coding == "gzip":
+        return gzip.compress(body, compresslevel=COMPRESS_LEVEL, mtime=0)
+    return zlib.compress(body, COMPRESS_LEVEL)
+
+
+def encode_response(response: ApiResponse, accept_encoding: str) -> ApiResponse:
+    """
+    Compress a response body if the client accepts it and it is large enough.
+    """
+    if len(response.body) < MIN_COMPRESS_BYTES or not accept_encoding:
+        return response
+    coding = preferred_coding(accept_encoding)
+    if coding is None:
+        return response
+    return replace(
+        response, body=_compress(response.body, coding), content_encoding=coding
+    )
+
+
+def decode_body(body: bytes, content_encoding: str) -> Optional[bytes]:
+    """
+    Decompress a request body.
+
+    Returns:
+        Decoded body, None for an unsupported coding or corrupt data
+    """
+    coding = content_encoding.strip().lower()
+    try:
+        if coding in ("", "identity"):
+            return body
+        if coding == "gzip":
+            return gzip.decompress(body)
+        if coding == "deflate":
+            return zlib.decompress(body)
+    except (OSError, EOFError, zlib.error):
+        return None
+    return None
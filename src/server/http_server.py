@@ -0,0 +1,560 @@
+"""
+Minimal asyncio HTTP/1.1 and HTTP/2 (h2c) server for the local FakeRestAPI
+stand-in.
+"""
+
+import asyncio
+from email.utils import formatdate
+from http import HTTPStatus
+import importlib
+import logging
+import threading
+import time
+from types import TracebackType
+from typing import Any, Mapping, Optional, Type
+from src.server import conditional, content_coding
+from src.server.app import ApiResponse, FakeRestApi
+
+MAX_HEADER_BYTES = 64 * 1024
+
+# First bytes of an HTTP/2 connection started with prior knowledge
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+STATUS_LINES = {
+    status.value: f"HTTP/1.1 {status.value} {status.phrase}".encode("ascii")
+    for status in HTTPStatus
+}
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create an event loop, using uvloop when it is installed.
+    """
+    try:
+        uvloop = importlib.import_module("uvloop")
+    except ImportError:
+        return asyncio.new_event_loop()
+    loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+    return loop
+
+
+def _import_h2() -> Optional[Any]:
+    """
+    Return the `h2` package with its submodules loaded, None if not installed.
+    """
+    try:
+        for module in ("h2.config", "h2.connection", "h2.events", "h2.exceptions"):
+            importlib.import_module(module)
+    except ImportError:
+        return None
+    return importlib.import_module("h2")
+
+
+class _DateHeader:
+    """
+    `Date` header value rendered at most once per second.
+    """
+
+    def __init__(self) -> None:
+        self._second = 0
+        self._value = b""
+
+    def get(self) -> bytes:
+        """
+        Return current `Date` header value.
+        """
+        now = int(time.time())
+        if now != self._second:
+            self._second = now
+            self._value = formatdate(now, usegmt=True).encode("ascii")
+        return self._value
+
+
+class HttpProtocol(asyncio.Protocol):
+    """
+    HTTP/1.1 connection with keep-alive and pipelining support.
+
+    Only what API clients need is implemented: requests with a
+    Content-Length body (or none), persistent connections and
+    `Connection: close`. A connection opening with the HTTP/2 preface is
+    handed to `Http2Connection` when the `h2` package is installed.
+    Requests are answered by `handle_request`.
+    Responses are held back for `delay` seconds, e.g. to emulate the round
+    trip to a remote service.
+    """
+
+    def __init__(
+        self, app: FakeRestApi, date_header: _DateHeader, delay: float = 0.0
+    ) -> None:
+        self.app = app
+        self.date_header = date_header
+        self.delay = delay
+        self.transport: Optional[asyncio.Transport] = None
+        self._buffer = bytearray()
+        self._h2: Optional[Http2Connection] = None
+        self._sniffing = True
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        if self._h2 is not None:
+            self._h2.data_received(data)
+            return
+
+        self._buffer += data
+        if not self._sniffing or self._sniff_http2():
+            self._process_requests()
+
+    def _process_requests(self) -> None:
+        """
+        Answer the complete HTTP/1.1 requests in the buffer.
+        """
+        while self.transport is not None and not self.transport.is_closing():
+            header_end = self._buffer.find(b"\r\n\r\n")
+            if header_end < 0:
+                if len(self._buffer) > MAX_HEADER_BYTES:
+                    self._reply(ApiResponse(431, content_type=None), keep_alive=False)
+                return
+
+            request = _parse_head(bytes(self._buffer[:header_end]))
+            if request is None:
+                self._reply(ApiResponse(400, content_type=None), keep_alive=False)
+                return
+            method, target, version, headers = request
+
+            if "chunked" in headers.get("transfer-encoding", "").lower():
+                self._reply(ApiResponse(501, content_type=None), keep_alive=False)
+                return
+
+            raw_length = headers.get("content-length") or "0"
+            if not (raw_length.isascii() and raw_length.isdigit()):
+                self._reply(ApiResponse(400, content_type=None), keep_alive=False)
+                return
+            content_length = int(raw_length)
+
+            body_start = header_end + 4
+            body_end = body_start + content_length
+            if len(self._buffer) < body_end:
+                return
+
+            body = bytes(self._buffer[body_start:body_end])
+            del self._buffer[:body_end]
+
+            connection = headers.get("connection", "").lower()
+            keep_alive = (
+                connection != "close"
+                if version == "HTTP/1.1"
+                else connection == "keep-alive"
+            )
+            response = handle_request(self.app, method, target, body, headers)
+            if self.delay > 0:
+                asyncio.get_running_loop().call_later(
+                    self.delay, self._reply, response, keep_alive
+                )
+            else:
+                self._reply(response, keep_alive)
+
+    def _sniff_http2(self) -> bool:
+        """
+        Switch to HTTP/2 if the connection starts with its preface.
+
+        Returns:
+            True to go on parsing the buffer as HTTP/1.1
+        """
+        received = bytes(self._buffer[: len(H2_PREFACE)])
+        if not H2_PREFACE.startswith(received):
+            self._sniffing = False
+            return True
+        if len(received) < len(H2_PREFACE):
+            return False
+
+        self._sniffing = False
+        h2 = _import_h2()
+        if h2 is None or self.transport is None:
+            return True
+        self._h2 = Http2Connection(h2, self)
+        self._h2.data_received(bytes(self._buffer))
+        self._buffer.clear()
+        return False
+
+    def _reply(self, response: ApiResponse, keep_alive: bool) -> None:
+        """
+        Serialize response and write it to the connection.
+        """
+        if self.transport is None or self.transport.is_closing():
+            return
+        head = [
+            STATUS_LINES[response.status],
+            b"Date: " + self.date_header.get(),
+            b"Server: fake-rest-api",
+        ]
+        head.extend(
+            name.encode("ascii") + b": " + value.encode("latin-1")
+            for name, value in _entity_headers(response)
+        )
+        if not keep_alive:
+            head.append(b"Connection: close")
+
+        self.transport.write(b"\r\n".join(head) + b"\r\n\r\n" + response.body)
+        if not keep_alive:
+            self.transport.close()
+
+
+class Http2Connection:
+    """
+    Server side of an HTTP/2 connection with prior knowledge (h2c).
+
+    Streams are answered as soon as their request is complete, so responses
+    to concurrent requests interleave on the connection. Response bodies
+    are sent as flow control windows allow.
+    """
+
+    def __init__(self, h2: Any, protocol: HttpProtocol) -> None:
+        """
+        Initialize HTTP/2 connection and send the server preface.
+
+        Args:
+            h2: The `h2` package
+            protocol: Connection taken over, providing application, `Date`
+                header, response delay and transport
+        """
+        assert protocol.transport is not None
+        self.h2 = h2
+        self.protocol = protocol
+        self.transport = protocol.transport
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding=None)
+        )
+        self._requests: dict[int, tuple[dict[bytes, bytes], bytearray]] = {}
+        self._pending: dict[int, bytes] = {}
+        self.conn.initiate_connection()
+        self._flush()
+
+    def data_received(self, data: bytes) -> None:
+        """
+        Process received frames and answer completed requests.
+        """
+        events = self.h2.events
+        try:
+            received = self.conn.receive_data(data)
+        except self.h2.exceptions.ProtocolError:
+            self._flush()
+            self.transport.close()
+            return
+
+        for event in received:
+            if isinstance(event, events.RequestReceived):
+                self._requests[event.stream_id] = (dict(event.headers), bytearray())
+            elif isinstance(event, events.DataReceived):
+                if event.stream_id in self._requests:
+                    self._requests[event.stream_id][1].extend(event.data)
+                self.conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, events.StreamEnded):
+                self._respond(event.stream_id)
+            elif isinstance(event, events.WindowUpdated):
+                streams = (
+                    list(self._pending) if event.stream_id == 0 else [event.stream_id]
+                )
+                for stream_id in streams:
+                    self._send_body(stream_id)
+            elif isinstance(event, events.StreamReset):
+                self._requests.pop(event.stream_id, None)
+                self._pending.pop(event.stream_id, None)
+            elif isinstance(event, events.ConnectionTerminated):
+                self._flush()
+                self.transport.close()
+                return
+        self._flush()
+
+    def _respond(self, stream_id: int) -> None:
+        """
+        Handle the completed request of a stream and schedule its response.
+        """
+        headers, body = self._requests.pop(stream_id)
+        response = handle_request(
+            self.protocol.app,
+            headers.get(b":method", b"GET").decode("ascii"),
+            headers.get(b":path", b"/").decode("latin-1"),
+            bytes(body),
+            {
+                name.decode("latin-1"): value.decode("latin-1")
+                for name, value in headers.items()
+            },
+        )
+        if self.protocol.delay > 0:
+            asyncio.get_running_loop().call_later(
+                self.protocol.delay, self._send_response, stream_id, response
+            )
+        else:
+            self._send_response(stream_id, response)
+
+    def _send_response(self, stream_id: int, response: ApiResponse) -> None:
+        """
+        Start sending the response of a stream.
+        """
+        if self.transport.is_closing():
+            return
+        head = [
+            (b":status", str(response.status).encode("ascii")),
+            (b"date", self.protocol.date_header.get()),
+            (b"server", b"fake-rest-api"),
+        ]
+        head.extend(
+            (name.lower().encode("ascii"), value.encode("latin-1"))
+            for name, value in _entity_headers(response)
+        )
+        try:
+            self.conn.send_headers(stream_id, head, end_stream=not response.body)
+        except self.h2.exceptions.StreamClosedError:
+            return
+        if response.body:
+            self._pending[stream_id] = response.body
+            self._send_body(stream_id)
+        self._flush()
+
+    def _send_body(self, stream_id: int) -> None:
+        """
+        Send as much of a pending response body as flow control allows.
+        """
+        body = self._pending.get(stream_id)
+        if body is None:
+            return
+        while body:
+            size = min(
+                self.conn.local_flow_control_window(stream_id),
+                self.conn.max_outbound_frame_size,
+            )
+            if size <= 0:
+                break
+            chunk, body = body[:size], body[size:]
+            self.conn.send_data(stream_id, chunk, end_stream=not body)
+        if body:
+            self._pending[stream_id] = body
+        else:
+            del self._pending[stream_id]
+
+    def _flush(self) -> None:
+        data = self.conn.data_to_send()
+        if data:
+            self.transport.write(data)
+
+
+def handle_request(
+    app: FakeRestApi,
+    method: str,
+    target: str,
+    body: bytes,
+    headers: Mapping[str, str],
+) -> ApiResponse:
+    """
+    Answer a request the way both protocols do.
+
+    The request body is decompressed, the application handles the request,
+    validators are checked (`conditional`) and the response is compressed
+    (`content_coding`). Undecodable request bodies are answered with 415
+    Unsupported Media Type.
+
+    Args:
+        app: Application handling the request
+        method: HTTP method
+        target: Request target
+        body: Request body as received
+        headers: Request headers with lowercase names
+    """
+    content_encoding = headers.get("content-encoding", "")
+    decoded = (
+        content_coding.decode_body(body, content_encoding) if content_encoding else body
+    )
+    if decoded is None:
+        response = ApiResponse(415, content_type=None)
+    else:
+        response = conditional.evaluate(
+            method,
+            app.handle(method, target, decoded),
+            headers.get("if-none-match", ""),
+            headers.get("if-modified-since", ""),
+        )
+    return content_coding.encode_response(response, headers.get("accept-encoding", ""))
+
+
+def _entity_headers(response: ApiResponse) -> list[tuple[str, str]]:
+    """
+    Return the headers describing a response body.
+
+    304 responses have no body and carry no Content-Length.
+    """
+    headers = []
+    if response.status != 304:
+        headers.append(("Content-Length", str(len(response.body))))
+    if response.content_type:
+        headers.append(("Content-Type", response.content_type))
+    if response.content_encoding:
+        headers.append(("Content-Encoding", response.content_encoding))
+    if response.etag:
+        headers.append(("ETag", response.etag))
+    if response.last_modified is not None:
+        headers.append(("Last-Modified", conditional.http_date(response.last_modified)))
+    return headers
+
+
+def _parse_head(
+    head: bytes,
+) -> Optional[tuple[str, str, str, dict[str, str]]]:
+    """
+    Parse request line and headers, None when the request line is malformed.
+    """
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = request_line.split(" ", 2)
+    except ValueError:
+        return None
+
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    return method, target, version, headers
+
+
+class LocalApiServer:  # pylint: disable=too-many-instance-attributes
+    """
+    Local, hermetic stand-in for the remote Books and Authors API.
+
+    Can run in the foreground (`serve_forever`) or on a background thread
+    (`start`/`stop`, or as a context manager) next to the test session.
+    `connections` counts the TCP connections accepted so far.
+    """
+
+    def __init__(
+        self,
+        app: Optional[FakeRestApi] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        delay: float = 0.0,
+    ) -> None:
+        """
+        Initialize local API server.
+
+        Args:
+            app: Stand-in application, a freshly seeded one when omitted
+            host: Interface to bind
+            port: Port to bind, 0 picks a free port
+            delay: Seconds every response is held back, to emulate the
+                round trip to a remote service
+        """
+        self.app = app or FakeRestApi()
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.connections = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        Base URL to use as `BOOKS_API_BASE_URL`.
+        """
+        return f"http://{self.host}:{self.port}"
+
+    async def _listen(self) -> asyncio.Server:
+        loop = asyncio.get_running_loop()
+        date_header = _DateHeader()
+
+        def protocol() -> HttpProtocol:
+            self.connections += 1
+            return HttpProtocol(self.app, date_header, self.delay)
+
+        server = await loop.create_server(
+            protocol,
+            self.host,
+            self.port,
+            backlog=1024,
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        self._server = server
+        logging.info("Local API server listening on %s", self.base_url)
+        return server
+
+    async def serve_forever(self) -> None:
+        """
+        Serve requests until cancelled.
+        """
+        server = await self._listen()
+        async with server:
+            await server.serve_forever()
+
+    def start(self) -> str:
+        """
+        Start serving on a background thread.
+
+        Returns:
+            Base URL of the running server
+
+        Raises:
+            OSError: The server could not listen, e.g. the port is in use
+        """
+        loop = new_event_loop()
+        ready = threading.Event()
+        failure: list[BaseException] = []
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self._listen())
+            except BaseException as exc:  # pylint: disable=broad-exception-caught
+                failure.append(exc)
+                return
+            finally:
+                ready.set()
+            loop.run_forever()
+
+        thread = threading.Thread(target=run, name="local-api", daemon=True)
+        thread.start()
+        ready.wait()
+        if failure:
+            thread.join()
+            loop.close()
+            raise failure[0]
+
+        self._loop = loop
+        self._thread = thread
+        return self.base_url
+
+    def stop(self) -> None:
+        """
+        Stop the background server and release its port.
+        """
+        if self._loop is None or self._thread is None:
+            return
+
+        async def shutdown() -> None:
+            if self._server is not None:
+                self._server.close()
+                self._server.close_clients()
+                await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    def __enter__(self) -> "LocalApiServer":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
@@ -0,0 +1,149 @@
+"""
+In-memory, thread-safe data store backing the local FakeRestAPI stand-in.
+"""
+
+from datetime import datetime, timedelta, timezone
+import json
+import threading
+import time
+from typing import Any, Optional
+
+SEED_BOOKS = 200
+SEED_AUTHORS_PER_BOOK = 3
+
+
+class Collection:
+    """
+    Records of one resource keyed by integer ID.
+
+    Serialized list bodies are cached and only rebuilt after a write, so
+    repeated GETs of a whole collection cost a dictionary lookup.
+    `modified` is the POSIX time of the last write.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._records: dict[int, dict[str, Any]] = {}
+        self._bodies: dict[Optional[int], bytes] = {}
+        self._item_bodies: dict[int, bytes] = {}
+        self._next_id = 1
+        self.modified = time.time()
+
+    def all(self) -> list[dict[str, Any]]:
+        """
+        Return all records ordered by ID.
+        """
+        with self._lock:
+            return [self._records[key] for key in sorted(self._records)]
+
+    def get(self, record_id: int) -> Optional[dict[str, Any]]:
+        """
+        Return record by ID or None.
+        """
+        return self._records.get(record_id)
+
+    def put(self, record: dict[str, Any]) -> dict[str, Any]:
+        """
+        Insert or replace record, allocating an ID when it has none.
+        """
+        with self._lock:
+            if record.get("id") is None:
+                record["id"] = self._next_id
+            self._next_id = max(self._next_id, record["id"] + 1)
+            self._records[record["id"]] = record
+            self._bodies.clear()
+            self._item_bodies.pop(record["id"], None)
+            self.modified = time.time()
+        return record
+
+    def delete(self, record_id: int) -> bool:
+        """
+        Delete record by ID, returning whether it existed.
+        """
+        with self._lock:
+            existed = self._records.pop(record_id, None) is not None
+            if existed:
+                self._bodies.clear()
+                self._item_bodies.pop(record_id, None)
+                self.modified = time.time()
+        return existed
+
+    def item_body(self, record_id: int) -> Optional[bytes]:
+        """
+        Return serialized record by ID or None.
+        """
+        body = self._item_bodies.get(record_id)
+        if body is None:
+            with self._lock:
+                record = self._records.get(record_id)
+                if record is None:
+                    return None
+                body = dumps(record)
+                self._item_bodies[record_id] = body
+        return body
+
+    def list_body(self, key: Optional[int], field: Optional[str] = None) -> bytes:
+        """
+        Return serialized list of records, optionally filtered by a field.
+
+        Args:
+            key: Value the field must equal, None for the whole collection
+            field: Name of the field to filter on
+        """
+        body = self._bodies.get(key)
+        if body is None:
+            with self._lock:
+                records = self.all()
+                if field is not None:
+                    records = [record for record in records if record[field] == key]
+                body = dumps(records)
+                self._bodies[key] = body
+        return body
+
+
+class DataStore:
+    """
+    Books and authors shared by all connections of the stand-in server.
+    """
+
+    def __init__(self, seed: bool = True) -> None:
+        self.books = Collection()
+        self.authors = Collection()
+        if seed:
+            self.seed()
+
+    def seed(self) -> None:
+        """
+        Populate the store with data shaped like the public FakeRestAPI.
+        """
+        start = datetime(2025, 7, 12, tzinfo=timezone.utc)
+        author_id = 0
+        for book_id in range(1, SEED_BOOKS + 1):
+            publish_date = start - timedelta(days=book_id)
+            self.books.put(
+                {
+                    "id": book_id,
+                    "title": f"Book {book_id}",
+                    "description": "Lorem lorem lorem. Lorem lorem lorem.",
+                    "pageCount": book_id * 100,
+                    "excerpt": "Lorem lorem lorem. Lorem lorem lorem.",
+                    "publishDate": publish_date.isoformat().replace("+00:00", "Z"),
+                }
+            )
+            for _ in range(SEED_AUTHORS_PER_BOOK):
+                author_id += 1
+                self.authors.put(
+                    {
+                        "id": author_id,
+                        "idBook": book_id,
+                        "firstName": f"First Name {author_id}",
+                        "lastName": f"Last Name {author_id}",
+                    }
+                )
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serialize JSON the compact way ASP.NET does.
+    """
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,253 @@
+"""
+Session-wide accounting of request and response payload bytes by endpoint.
+"""
+
+from dataclasses import asdict, dataclass, fields
+from html import escape
+import threading
+from typing import Any, Optional
+import requests
+from src.utils.latency_metrics import endpoint_template
+
+
+@dataclass
+class ByteCounts:
+    """
+    Payload bytes moved by the requests of one endpoint.
+
+    "Wire" bytes are bodies as transferred, possibly compressed; "decoded"
+    bytes are the same bodies after decompression. Headers are not counted.
+
+    Attributes:
+        requests: Requests with a response
+        sent_wire: Request body bytes sent
+        sent_decoded: Request body bytes before compression
+        received_wire: Response body bytes received
+        received_decoded: Response body bytes after decompression
+    """
+
+    requests: int = 0
+    sent_wire: int = 0
+    sent_decoded: int = 0
+    received_wire: int = 0
+    received_decoded: int = 0
+
+    def add(self, other: "ByteCounts") -> None:
+        """
+        Add the counts of another endpoint or process.
+        """
+        for field in fields(self):
+            setattr(
+                self, field.name, getattr(self, field.name) + getattr(other, field.name)
+            )
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """
+        Decoded over wire bytes of responses, None before any were received.
+        """
+        if not self.received_wire:
+            return None
+        return self.received_decoded / self.received_wire
+
+
+def format_bytes(count: float) -> str:
+    """
+    Format a byte count with a binary unit, e.g. "1.5 MiB".
+    """
+    for unit in ("B", "KiB", "MiB"):
+        if abs(count) < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GiB"
+
+
+def received_wire_bytes(response: requests.Response) -> int:
+    """
+    Return the response body bytes read from the connection.
+
+    urllib3 and the HTTP/2 transport count the bytes they read before
+    decoding; responses without such a count, e.g. replayed ones, are
+    assumed uncompressed.
+    """
+    tell = getattr(response.raw, "tell", None)
+    if callable(tell):
+        try:
+            size = tell()
+        except (OSError, ValueError):
+            size = None
+        if isinstance(size, int):
+            return size
+    return len(response.content)
+
+
+class ByteAccounting:
+    """
+    Thread-safe byte counts keyed by method and route.
+    """
+
+    COLUMNS = (
+        "method",
+        "endpoint",
+        "requests",
+        "sent wire",
+        "sent decoded",
+        "received wire",
+        "received decoded",
+        "ratio",
+    )
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[tuple[str, str], ByteCounts] = {}
+
+    def record(self, method: str, endpoint: str, counts: ByteCounts) -> None:
+        """
+        Add the bytes of a request.
+
+        Args:
+            method: HTTP method
+            endpoint: Request path, IDs are collapsed to "{id}"
+            counts: Bytes sent and received
+        """
+        key = (method.upper(), endpoint_template(endpoint))
+        with self._lock:
+            total = self._counts.get(key)
+            if total is None:
+                total = self._counts[key] = ByteCounts()
+            total.add(counts)
+
+    def record_response(
+        self,
+        method: str,
+        endpoint: str,
+        response: requests.Response,
+        sent: tuple[int, int] = (0, 0),
+    ) -> None:
+        """
+        Add the bytes of a request whose response body has been read.
+
+        Args:
+            method: HTTP method
+            endpoint: Request path
+            response: Response with its body consumed
+            sent: Request body bytes on the wire and before compression
+        """
+        self.record(
+            method,
+            endpoint,
+            ByteCounts(
+                requests=1,
+                sent_wire=sent[0],
+                sent_decoded=sent[1],
+                received_wire=received_wire_bytes(response),
+                received_decoded=len(response.content),
+            ),
+        )
+
+    def snapshot(self) -> dict[tuple[str, str], ByteCounts]:
+        """
+        Return a copy of all counts ordered by route and method.
+        """
+        with self._lock:
+            return {
+                key: ByteCounts(**asdict(self._counts[key]))
+                for key in sorted(self._counts, key=lambda key: (key[1], key[0]))
+            }
+
+    def totals(self) -> ByteCounts:
+        """
+        Return the counts summed over all endpoints.
+        """
+        total = ByteCounts()
+        for counts in self.snapshot().values():
+            total.add(counts)
+        return total
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize all counts to a JSON compatible dictionary.
+        """
+        return {
+            "endpoints": [
+                {"method": method, "endpoint": endpoint, **asdict(counts)}
+                for (method, endpoint), counts in self.snapshot().items()
+            ]
+        }
+
+    def merge(self, data: dict[str, Any]) -> None:
+        """
+        Add counts serialized by `to_dict`, e.g. from another process.
+        """
+        for entry in data["endpoints"]:
+            counts = {key: value for key, value in entry.items() if key != "endpoint"}
+            method = counts.pop("method")
+            self.record(method, entry["endpoint"], ByteCounts(**counts))
+
+    def clear(self) -> None:
+        """
+        Drop all counts.
+        """
+        with self._lock:
+            self._counts.clear()
+
+    def _rows(self) -> list[list[str]]:
+        snapshot = self.snapshot()
+        if not snapshot:
+            return []
+        snapshot[("ALL", "")] = self.totals()
+        rows = []
+        for (method, endpoint), counts in snapshot.items():
+            ratio = counts.ratio
+            rows.append(
+                [
+                    method,
+                    endpoint,
+                    str(counts.requests),
+                    format_bytes(counts.sent_wire),
+                    format_bytes(counts.sent_decoded),
+                    format_bytes(counts.received_wire),
+                    format_bytes(counts.received_decoded),
+                    "-" if ratio is None else f"{ratio:.1f}x",
+                ]
+            )
+        return rows
+
+    def format_lines(self) -> list[str]:
+        """
+        Render the counts as aligned text lines for the terminal summary.
+        """
+        rows = self._rows()
+        if not rows:
+            return []
+        table = [list(self.COLUMNS)] + rows
+        widths = [max(len(cell) for cell in column) for column in zip(*table)]
+        return [
+            "  ".join(
+                cell.ljust(width) if index < 2 else cell.rjust(width)
+                for index, (cell, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in table
+        ]
+
+    def format_html(self) -> str:
+        """
+        Render a payload bytes table for the pytest-html report.
+        """
+        rows = self._rows()
+        if not rows:
+            return ""
+        header = "".join(f"<th>{column}</th>" for column in self.COLUMNS)
+        body = "".join(
+            "<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row) + "</tr>"
+            for row in rows
+        )
+        return (
+            "<h2>HTTP Payload Bytes</h2>"
+            '<table id="payload-bytes">'
+            f"<thead><tr>{header}</tr></thead>"
+            f"<tbody>{body}</tbody></table>"
+        )
+
+
+byte_accounting = ByteAccounting()
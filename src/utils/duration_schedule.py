@@ -0,0 +1,225 @@
+"""
+Test ordering and sharding based on durations of earlier runs.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+import heapq
+import json
+import os
+from pathlib import Path
+import statistics
+from typing import Collection, Literal, Mapping, Optional, Sequence, cast
+
+# Weight of the latest run in the smoothed duration of a test
+SMOOTHING = 0.5
+
+ScheduleMode = Literal["off", "record", "duration"]
+
+
+@dataclass(frozen=True)
+class ScheduleConfig:
+    """
+    Duration based scheduling settings.
+
+    Attributes:
+        mode: "off", "record" to only store test durations, or "duration"
+            to also run the longest tests first on pytest-xdist workers
+        path: File holding the smoothed duration of every test seen
+    """
+
+    mode: ScheduleMode = "off"
+    path: Path = Path("reports/durations/test_durations.json")
+
+    @classmethod
+    def from_env(cls) -> "ScheduleConfig":
+        """
+        Build scheduling configuration from `TEST_SCHEDULE_*` environment variables.
+
+        Durations are recorded by default only on CI (`CI` set to a
+        non-empty value other than "false"), so local runs leave the shared
+        durations file alone.
+        """
+        on_ci = os.getenv("CI", "").lower() not in ("", "false", "0")
+        default = "record" if on_ci else "off"
+        mode = (os.getenv("TEST_SCHEDULE_MODE") or default).lower()
+        if mode not in ("off", "record", "duration"):
+            raise ValueError(f"Unsupported TEST_SCHEDULE_MODE: {mode}")
+
+        return cls(
+            mode=cast(ScheduleMode, mode),
+            path=Path(
+                os.getenv(
+                    "TEST_SCHEDULE_DURATIONS", "reports/durations/test_durations.json"
+                )
+            ),
+        )
+
+
+@dataclass
+class WorkUnit:
+    """
+    Tests that run together on one worker, in collection order.
+
+    Attributes:
+        name: Node ID of a single test, or "@" and the xdist group name
+        indices: Positions of the tests in the collected items
+        weight: Expected duration in seconds
+    """
+
+    name: str
+    indices: list[int] = field(default_factory=list)
+    weight: float = 0.0
+
+
+def base_nodeid(nodeid: str) -> str:
+    """
+    Strip the "@group" suffix pytest-xdist adds under `--dist loadgroup`.
+    """
+    if nodeid.rfind("@") > nodeid.rfind("]"):
+        return nodeid.rsplit("@", 1)[0]
+    return nodeid
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    Parse a shard selection such as "2/3" into (2, 3).
+
+    Raises:
+        ValueError: If the value is not INDEX/COUNT with 1 <= INDEX <= COUNT
+    """
+    index, _, count = value.partition("/")
+    shard = (int(index), int(count))
+    if not 1 <= shard[0] <= shard[1]:
+        raise ValueError(f"Invalid shard {value}, expected INDEX/COUNT.")
+    return shard
+
+
+def load_durations(path: Path) -> dict[str, float]:
+    """
+    Read test durations saved by `save_durations`, empty if there are none.
+    """
+    if not path.is_file():
+        return {}
+    return dict(json.loads(path.read_text(encoding="utf-8"))["durations"])
+
+
+def save_durations(durations: Mapping[str, float], path: Path) -> Path:
+    """
+    Write test durations in seconds by node ID to a file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "durations": dict(sorted(durations.items())),
+    }
+    path.write_text(json.dumps(document, indent=1), encoding="utf-8")
+    return path
+
+
+def module_of(nodeid: str) -> str:
+    """
+    Return the test file part of a node ID.
+    """
+    return nodeid.split("::", 1)[0]
+
+
+def merge_durations(
+    previous: Mapping[str, float],
+    current: Mapping[str, float],
+    collected: Optional[Collection[str]] = None,
+    root: Optional[Path] = None,
+) -> dict[str, float]:
+    """
+    Smooth durations of this run into the stored ones.
+
+    Tests not run this time, e.g. deselected by a marker, keep their
+    stored duration unless they are stale: a stored test of a module
+    collected this run that was not collected itself has been removed or
+    renamed, and a stored test whose module no longer exists is gone.
+
+    Args:
+        previous: Stored durations by node ID
+        current: Durations of this run by node ID
+        collected: Node IDs of every test collected this run, before
+            deselection; None if only part of a module may have been
+            collected, e.g. tests selected by node ID
+        root: Directory node IDs are relative to, for dropping tests of
+            deleted modules
+    """
+    merged = dict(previous)
+    if collected is not None:
+        modules = {module_of(nodeid) for nodeid in collected}
+        merged = {
+            nodeid: seconds
+            for nodeid, seconds in merged.items()
+            if nodeid in collected or module_of(nodeid) not in modules
+        }
+    if root is not None:
+        merged = {
+            nodeid: seconds
+            for nodeid, seconds in merged.items()
+            if (root / module_of(nodeid)).is_file()
+        }
+    for nodeid, seconds in current.items():
+        old = merged.get(nodeid)
+        merged[nodeid] = (
+            seconds if old is None else SMOOTHING * seconds + (1 - SMOOTHING) * old
+        )
+    return merged
+
+
+def work_units(
+    tests: Sequence[tuple[str, Optional[str]]], durations: Mapping[str, float]
+) -> list[WorkUnit]:
+    """
+    Group tests into work units weighted by their expected duration.
+
+    Tests of one xdist group form a single unit, as pytest-xdist runs them
+    on the same worker. Tests without a recorded duration are expected to
+    take the median duration.
+
+    Args:
+        tests: Node ID and xdist group name (None if ungrouped) of each test
+        durations: Recorded durations by node ID
+
+    Returns:
+        Units in order of their first test
+    """
+    estimate = statistics.median(durations.values()) if durations else 1.0
+    units: dict[str, WorkUnit] = {}
+    for index, (nodeid, group) in enumerate(tests):
+        name = nodeid if group is None else f"@{group}"
+        unit = units.setdefault(name, WorkUnit(name))
+        unit.indices.append(index)
+        unit.weight += durations.get(base_nodeid(nodeid), estimate)
+    return list(units.values())
+
+
+def longest_first(units: Sequence[WorkUnit]) -> list[WorkUnit]:
+    """
+    Order units by decreasing weight, keeping collection order on ties.
+
+    Workers taking the next unit as soon as they are free then approximate
+    longest-processing-time scheduling: long tests start early and short
+    ones fill the gaps at the end, instead of one worker finishing last on
+    a slow test.
+    """
+    return sorted(units, key=lambda unit: -unit.weight)
+
+
+def lpt_partition(units: Sequence[WorkUnit], count: int) -> list[list[WorkUnit]]:
+    """
+    Split units into `count` shards of similar total weight.
+
+    Each unit, longest first, goes to the currently lightest shard (LPT),
+    which keeps the longest shard within 4/3 of the optimum. Units keep
+    their collection order within a shard.
+    """
+    shards: list[list[WorkUnit]] = [[] for _ in range(count)]
+    loads = [(0.0, shard) for shard in range(count)]
+    for unit in longest_first(units):
+        load, shard = heapq.heappop(loads)
+        shards[shard].append(unit)
+        heapq.heappush(loads, (load + unit.weight, shard))
+    return [sorted(shard, key=lambda unit: unit.indices[0]) for shard in shards]
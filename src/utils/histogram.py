@@ -0,0 +1,182 @@
+"""
+Mergeable log-linear latency histogram.
+"""
+
+import math
+from typing import Any, Iterable, Optional
+
+# Values below 2**SUB_BUCKET_BITS microseconds are stored exactly; above that
+# every power-of-two range is split into 2**(SUB_BUCKET_BITS - 1) buckets,
+# which bounds the relative error of any reported value to under 1.6%.
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+
+
+def _bucket_index(value: int) -> int:
+    if value < SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return shift * SUB_BUCKET_HALF + (value >> shift)
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    if index < SUB_BUCKET_COUNT:
+        return index, index
+    shift = index // SUB_BUCKET_HALF - 1
+    lower = (index % SUB_BUCKET_HALF + SUB_BUCKET_HALF) << shift
+    return lower, lower + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Latency distribution with bounded memory and constant-time recording.
+
+    Latencies are recorded in seconds and stored as microsecond counts in
+    sparse log-linear buckets, in the spirit of HdrHistogram. Histograms of
+    different threads, workers or runs can be merged without losing
+    precision, and serialized to JSON with `to_dict`/`from_dict`.
+    """
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        """
+        Record a latency.
+
+        Args:
+            seconds: Latency in seconds
+            count: Number of occurrences of this latency
+        """
+        value = max(int(seconds * 1_000_000), 0)
+        index = _bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.max_us = max(self.max_us, value)
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """
+        Add all values recorded by another histogram to this one.
+        """
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = (
+                other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+            )
+        return self
+
+    @classmethod
+    def merged(cls, histograms: Iterable["LatencyHistogram"]) -> "LatencyHistogram":
+        """
+        Return a new histogram combining all given histograms.
+        """
+        result = cls()
+        for histogram in histograms:
+            result.merge(histogram)
+        return result
+
+    def percentile(self, percent: float) -> float:
+        """
+        Return latency at the given percentile in seconds.
+
+        Args:
+            percent: Percentile between 0 and 100
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(math.ceil(percent / 100 * self.count), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                lower, upper = _bucket_bounds(index)
+                value = min(max((lower + upper) / 2, self.min_us or 0), self.max_us)
+                return value / 1_000_000
+
+        return self.max
+
+    def count_above(self, seconds: float) -> int:
+        """
+        Return number of recorded latencies certainly greater than a value.
+
+        Values sharing a bucket with `seconds` are not counted, so the result
+        may be low by at most one bucket.
+        """
+        value = int(seconds * 1_000_000)
+        return sum(
+            count
+            for index, count in self.counts.items()
+            if _bucket_bounds(index)[0] > value
+        )
+
+    @property
+    def mean(self) -> float:
+        """
+        Mean latency in seconds.
+        """
+        return self.total / self.count / 1_000_000 if self.count else 0.0
+
+    @property
+    def max(self) -> float:
+        """
+        Maximum latency in seconds.
+        """
+        return self.max_us / 1_000_000
+
+    @property
+    def min(self) -> float:
+        """
+        Minimum latency in seconds.
+        """
+        return (self.min_us or 0) / 1_000_000
+
+    def summary(
+        self, percentiles: Iterable[float] = (50, 90, 99, 99.9)
+    ) -> dict[str, float]:
+        """
+        Return count, mean, selected percentiles and max (latencies in seconds).
+        """
+        result = {"count": float(self.count), "mean": self.mean}
+        for percent in percentiles:
+            result[f"p{percent:g}"] = self.percentile(percent)
+        result["max"] = self.max
+        return result
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize histogram to a JSON compatible dictionary.
+        """
+        return {
+            "counts": {str(index): count for index, count in self.counts.items()},
+            "count": self.count,
+            "total_us": self.total,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyHistogram":
+        """
+        Deserialize histogram produced by `to_dict`.
+        """
+        histogram = cls()
+        histogram.counts = {
+            int(index): count for index, count in data["counts"].items()
+        }
+        histogram.count = data["count"]
+        histogram.total = data["total_us"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        return histogram
@@ -0,0 +1,107 @@
+"""
+Incremental parsing of top-level JSON arrays from a byte stream.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class _TextBuffer:
+    """
+    Decoded, not yet parsed tail of a chunked UTF-8 body.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.position = 0
+        self.finished = False
+
+    def read_more(self) -> bool:
+        """
+        Append the next chunk, dropping consumed text; False at end of body.
+        """
+        if self.finished:
+            return False
+        chunk = next(self._chunks, None)
+        self.finished = chunk is None
+        decoded = self._decoder.decode(chunk or b"", final=self.finished)
+        self.text = self.text[self.position :] + decoded
+        self.position = 0
+        return True
+
+    def next_char(self) -> str:
+        """
+        Skip whitespace and return the next character, "" at end of body.
+        """
+        while True:
+            while (
+                self.position < len(self.text)
+                and self.text[self.position] in _WHITESPACE
+            ):
+                self.position += 1
+            if self.position < len(self.text):
+                return self.text[self.position]
+            if not self.read_more():
+                return ""
+
+    def decode_value(self) -> Any:
+        """
+        Parse the next JSON value, reading as needed.
+        """
+        self.next_char()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.position)
+            except json.JSONDecodeError:
+                if self.read_more():
+                    continue
+                raise
+            # A value is only complete once the next separator is in the
+            # buffer; "12" or "2." may continue as "1234" or "2.5e3"
+            following = self.text[end : end + 64].lstrip(_WHITESPACE)[:1]
+            if following not in (",", "]") and self.read_more():
+                continue
+            self.position = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield elements of a JSON array as soon as each one is complete.
+
+    Only the unparsed tail of the body is buffered, so memory stays bounded
+    by the chunk and element size however long the array is.
+
+    Args:
+        chunks: Raw body chunks, e.g. from `Response.iter_content`
+
+    Raises:
+        ValueError: Body is not a well-formed JSON array
+    """
+    buffer = _TextBuffer(chunks)
+    if buffer.next_char() != "[":
+        raise ValueError("Response body is not a JSON array.")
+    buffer.position += 1
+
+    if buffer.next_char() == "]":
+        buffer.position += 1
+    else:
+        while True:
+            yield buffer.decode_value()
+            char = buffer.next_char()
+            buffer.position += 1
+            if char == "]":
+                break
+            if char != ",":
+                raise ValueError("Malformed JSON array.")
+
+    if buffer.next_char():
+        raise ValueError("Unexpected data after JSON array.")
@@ -0,0 +1,246 @@
+"""
+Persisted per-endpoint latency baselines and regression detection.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from html import escape
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any, Literal, Optional, cast
+from src.utils.histogram import LatencyHistogram
+
+EndpointKey = tuple[str, str]
+BaselineMode = Literal["off", "update", "compare"]
+
+
+@dataclass(frozen=True)
+class BaselineConfig:  # pylint: disable=too-many-instance-attributes
+    """
+    Latency baseline settings.
+
+    Attributes:
+        mode: "off", "update" to store this run as the new baseline, or
+            "compare" to check this run against the stored baseline
+        path: Baseline file
+        history_dir: Directory receiving the latency distributions of every
+            run
+        history_limit: Number of runs kept in the history directory
+        percentile: Compared latency percentile
+        tolerance: Allowed relative increase of the percentile, 0.2 is +20%
+        alpha: Significance level of the regression test
+        min_samples: Requests an endpoint needs in both runs to be compared
+    """
+
+    mode: BaselineMode = "off"
+    path: Path = Path("reports/baselines/latency_baseline.json")
+    history_dir: Path = Path("reports/latency")
+    history_limit: int = 30
+    percentile: float = 95.0
+    tolerance: float = 0.2
+    alpha: float = 0.01
+    min_samples: int = 30
+
+    @classmethod
+    def from_env(cls) -> "BaselineConfig":
+        """
+        Build baseline configuration from `LATENCY_BASELINE_*` environment variables.
+        """
+        mode = os.getenv("LATENCY_BASELINE_MODE", "off").lower()
+        if mode not in ("off", "update", "compare"):
+            raise ValueError(f"Unsupported LATENCY_BASELINE_MODE: {mode}")
+
+        return cls(
+            mode=cast(BaselineMode, mode),
+            path=Path(
+                os.getenv(
+                    "LATENCY_BASELINE_PATH", "reports/baselines/latency_baseline.json"
+                )
+            ),
+            history_dir=Path(
+                os.getenv("LATENCY_BASELINE_HISTORY_DIR", "reports/latency")
+            ),
+            history_limit=int(os.getenv("LATENCY_BASELINE_HISTORY_LIMIT", "30")),
+            percentile=float(os.getenv("LATENCY_BASELINE_PERCENTILE", "95")),
+            tolerance=float(os.getenv("LATENCY_BASELINE_TOLERANCE", "0.2")),
+            alpha=float(os.getenv("LATENCY_BASELINE_ALPHA", "0.01")),
+            min_samples=int(os.getenv("LATENCY_BASELINE_MIN_SAMPLES", "30")),
+        )
+
+
+@dataclass(frozen=True)
+class LatencyComparison:
+    """
+    Percentile latency of one endpoint in the baseline and the current run.
+
+    Attributes:
+        method: HTTP method
+        endpoint: Endpoint route
+        baseline: Baseline percentile latency in seconds
+        current: Current percentile latency in seconds
+        samples: Requests of the endpoint in the current run
+        p_value: Probability of observing this many slow requests if the
+            latency distribution had not changed
+        regressed: Increase exceeds the tolerance and is significant
+    """
+
+    method: str
+    endpoint: str
+    baseline: float
+    current: float
+    samples: int
+    p_value: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        """
+        Current latency relative to the baseline.
+        """
+        return self.current / self.baseline if self.baseline else math.inf
+
+    def __str__(self) -> str:
+        return (
+            f"{self.method} {self.endpoint}: {self.baseline * 1000:.2f} ms -> "
+            f"{self.current * 1000:.2f} ms ({self.ratio - 1:+.0%}, "
+            f"n={self.samples}, p={self.p_value:.2g})"
+        )
+
+
+def histograms_from_dict(data: dict[str, Any]) -> dict[EndpointKey, LatencyHistogram]:
+    """
+    Deserialize histograms written by `LatencyRecorder.to_dict`.
+    """
+    return {
+        (entry["method"], entry["endpoint"]): LatencyHistogram.from_dict(
+            entry["histogram"]
+        )
+        for entry in data["endpoints"]
+    }
+
+
+def save_latencies(data: dict[str, Any], path: Path) -> Path:
+    """
+    Write latency histograms serialized by `LatencyRecorder.to_dict` to a file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {"created": datetime.now().isoformat(timespec="seconds"), **data}
+    path.write_text(json.dumps(document), encoding="utf-8")
+    return path
+
+
+def save_history(data: dict[str, Any], config: BaselineConfig) -> Path:
+    """
+    Save the latencies of this run to the history directory, dropping the
+    oldest runs beyond `history_limit`.
+    """
+    run_date = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = save_latencies(data, config.history_dir / f"{run_date}_latency.json")
+    runs = sorted(config.history_dir.glob("*_latency.json"))
+    for stale in runs[: max(len(runs) - config.history_limit, 0)]:
+        stale.unlink()
+    return path
+
+
+def load_latencies(path: Path) -> Optional[dict[EndpointKey, LatencyHistogram]]:
+    """
+    Read latency histograms saved by `save_latencies`, None if there are none.
+    """
+    if not path.is_file():
+        return None
+    return histograms_from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def binomial_tail(successes: int, trials: int, probability: float) -> float:
+    """
+    Return P(X >= successes) for X ~ Binomial(trials, probability).
+    """
+    if successes <= 0:
+        return 1.0
+    if successes > trials:
+        return 0.0
+    log_p, log_q = math.log(probability), math.log1p(-probability)
+    log_n = math.lgamma(trials + 1)
+    return min(
+        sum(
+            math.exp(
+                log_n
+                - math.lgamma(k + 1)
+                - math.lgamma(trials - k + 1)
+                + k * log_p
+                + (trials - k) * log_q
+            )
+            for k in range(successes, trials + 1)
+        ),
+        1.0,
+    )
+
+
+def compare_latencies(
+    baseline: dict[EndpointKey, LatencyHistogram],
+    current: dict[EndpointKey, LatencyHistogram],
+    config: BaselineConfig,
+) -> list[LatencyComparison]:
+    """
+    Compare endpoint latency percentiles of the current run to the baseline.
+
+    An endpoint regresses when its percentile grew by more than the
+    tolerance and the growth is statistically significant. Significance is
+    judged by how many current requests were slower than the baseline
+    percentile: without a change, each request exceeds the p95 with
+    probability 0.05, so the count follows a binomial distribution, and a
+    count that is less likely than `alpha` under it is not noise.
+
+    Endpoints with fewer than `min_samples` requests in either run are
+    skipped.
+    """
+    exceed_probability = 1 - config.percentile / 100
+    comparisons = []
+    for key, histogram in current.items():
+        reference = baseline.get(key)
+        if reference is None or min(reference.count, histogram.count) < (
+            config.min_samples
+        ):
+            continue
+
+        before = reference.percentile(config.percentile)
+        after = histogram.percentile(config.percentile)
+        p_value = binomial_tail(
+            histogram.count_above(before), histogram.count, exceed_probability
+        )
+        regressed = after > before * (1 + config.tolerance) and p_value < config.alpha
+        comparisons.append(
+            LatencyComparison(
+                key[0], key[1], before, after, histogram.count, p_value, regressed
+            )
+        )
+    return comparisons
+
+
+def format_comparison_html(
+    comparisons: list[LatencyComparison], config: BaselineConfig
+) -> str:
+    """
+    Render the baseline comparison table for the pytest-html report.
+    """
+    if not comparisons:
+        return ""
+
+    percentile = f"p{config.percentile:g}"
+    rows = "".join(
+        f"<tr><td>{escape(item.method)}</td><td>{escape(item.endpoint)}</td>"
+        f"<td>{item.baseline * 1000:.2f}</td><td>{item.current * 1000:.2f}</td>"
+        f"<td>{item.ratio - 1:+.0%}</td><td>{item.p_value:.2g}</td>"
+        f"<td>{'REGRESSED' if item.regressed else 'ok'}</td></tr>"
+        for item in comparisons
+    )
+    return (
+        f"<h2>Latency Baseline ({percentile}, tolerance "
+        f"{config.tolerance:+.0%})</h2>"
+        '<table id="latency-baseline">'
+        "<thead><tr><th>method</th><th>endpoint</th><th>baseline (ms)</th>"
+        "<th>current (ms)</th><th>change</th><th>p-value</th><th>result</th>"
+        f"</tr></thead><tbody>{rows}</tbody></table>"
+    )
@@ -0,0 +1,131 @@
+"""
+Session-wide request latency metrics grouped by endpoint.
+"""
+
+import functools
+from html import escape
+import re
+import threading
+from typing import Any
+from src.utils.histogram import LatencyHistogram
+
+# Route segments are names; anything else (numbers, "1.5", "-1") is an ID
+_NAME_SEGMENT = re.compile(r"[A-Za-z][\w-]*")
+
+# Percentiles shown in reports
+REPORT_PERCENTILES = (50, 90, 99, 99.9)
+
+
+@functools.lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """
+    Collapse record IDs in a path so requests group by route.
+
+    Results are cached, as the same paths are requested over and over.
+
+    Example:
+        "/api/v1/Authors/authors/books/12" -> "/api/v1/Authors/authors/books/{id}"
+    """
+    path = endpoint.split("?", 1)[0].strip("/")
+    segments = [
+        segment if _NAME_SEGMENT.fullmatch(segment) else "{id}"
+        for segment in path.split("/")
+    ]
+    return "/" + "/".join(segments)
+
+
+class LatencyRecorder:
+    """
+    Thread-safe collection of latency histograms keyed by method and route.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str], LatencyHistogram] = {}
+
+    def record(self, method: str, endpoint: str, seconds: float) -> None:
+        """
+        Record latency of a completed request.
+
+        Args:
+            method: HTTP method
+            endpoint: Request path, IDs are collapsed to "{id}"
+            seconds: Time from sending the request to receiving the body
+        """
+        key = (method.upper(), endpoint_template(endpoint))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def snapshot(self) -> dict[tuple[str, str], LatencyHistogram]:
+        """
+        Return a copy of all histograms ordered by route and method.
+        """
+        with self._lock:
+            return {
+                key: LatencyHistogram.merged([self._histograms[key]])
+                for key in sorted(self._histograms, key=lambda key: (key[1], key[0]))
+            }
+
+    def merge(self, data: dict[str, Any]) -> None:
+        """
+        Merge histograms serialized by `to_dict`, e.g. from another process.
+        """
+        with self._lock:
+            for entry in data["endpoints"]:
+                key = (entry["method"], entry["endpoint"])
+                histogram = self._histograms.setdefault(key, LatencyHistogram())
+                histogram.merge(LatencyHistogram.from_dict(entry["histogram"]))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize all histograms to a JSON compatible dictionary.
+        """
+        return {
+            "endpoints": [
+                {"method": method, "endpoint": endpoint, "histogram": hist.to_dict()}
+                for (method, endpoint), hist in self.snapshot().items()
+            ]
+        }
+
+    def clear(self) -> None:
+        """
+        Drop all recorded latencies.
+        """
+        with self._lock:
+            self._histograms.clear()
+
+    def format_html(self) -> str:
+        """
+        Render a latency summary table for the pytest-html report.
+        """
+        snapshot = self.snapshot()
+        if not snapshot:
+            return ""
+
+        snapshot[("ALL", "")] = LatencyHistogram.merged(snapshot.values())
+        columns = ["count", "mean"] + [f"p{p:g}" for p in REPORT_PERCENTILES] + ["max"]
+        header = "".join(f"<th>{column}</th>" for column in columns)
+        rows = []
+        for (method, endpoint), histogram in snapshot.items():
+            summary = histogram.summary(REPORT_PERCENTILES)
+            cells = [f"{summary['count']:.0f}"] + [
+                f"{summary[column] * 1000:.2f}" for column in columns[1:]
+            ]
+            rows.append(
+                f"<tr><td>{escape(method)}</td><td>{escape(endpoint)}</td>"
+                + "".join(f"<td>{cell}</td>" for cell in cells)
+                + "</tr>"
+            )
+
+        return (
+            "<h2>Request Latency (ms)</h2>"
+            '<table id="latency-summary">'
+            f"<thead><tr><th>method</th><th>endpoint</th>{header}</tr></thead>"
+            f"<tbody>{''.join(rows)}</tbody></table>"
+        )
+
+
+latency_recorder = LatencyRecorder()
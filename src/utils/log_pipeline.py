@@ -0,0 +1,175 @@
+"""
+Non-blocking, queue based log pipeline for the test session.
+"""
+
+from dataclasses import dataclass
+import gzip
+import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import os
+from pathlib import Path
+import queue
+import shutil
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class LogPipelineConfig:
+    """
+    Session log pipeline settings.
+
+    Attributes:
+        batch_size: Maximum number of records written between two flushes
+        max_bytes: Rotate the log file when it reaches this size (0 = never)
+        backup_count: Number of rotated files to keep
+        compress: Gzip rotated log files
+    """
+
+    batch_size: int = 512
+    max_bytes: int = 0
+    backup_count: int = 5
+    compress: bool = False
+
+    @classmethod
+    def from_env(cls) -> "LogPipelineConfig":
+        """
+        Build log pipeline configuration from `LOG_*` environment variables.
+        """
+        return cls(
+            batch_size=int(os.getenv("LOG_BATCH_SIZE", "512")),
+            max_bytes=int(os.getenv("LOG_MAX_BYTES", "0")),
+            backup_count=int(os.getenv("LOG_BACKUP_COUNT", "5")),
+            compress=os.getenv("LOG_COMPRESS", "false").lower() == "true",
+        )
+
+
+class BatchedFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that leaves flushing to its owner.
+
+    `StreamHandler` flushes after every record; here records accumulate in
+    the file buffer until `commit` is called.
+    """
+
+    def __init__(self, filename: Path, config: LogPipelineConfig) -> None:
+        super().__init__(
+            filename,
+            mode="a",
+            maxBytes=config.max_bytes,
+            backupCount=config.backup_count,
+            delay=True,
+        )
+        if config.compress:
+            self.namer = lambda name: f"{name}.gz"
+            self.rotator = _gzip_rotator
+
+    def flush(self) -> None:
+        """
+        Defer flushing until the batch is committed.
+        """
+
+    def commit(self) -> None:
+        """
+        Flush buffered records to disk.
+        """
+        super().flush()
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """
+    Compress rotated log file.
+    """
+    with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    Queue listener flushing its file handler once per batch of records.
+
+    The file is flushed whenever the queue runs dry or `batch_size` records
+    have been written, so bursts of log lines cost a single write call.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[logging.LogRecord]",
+        handler: BatchedFileHandler,
+        batch_size: int,
+    ) -> None:
+        super().__init__(log_queue, handler, respect_handler_level=True)
+        self.log_queue = log_queue
+        self.file_handler = handler
+        self.batch_size = batch_size
+        self._pending = 0
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """
+        Dequeue next record, flushing the batch before waiting for more.
+        """
+        try:
+            record = self.log_queue.get_nowait()
+        except queue.Empty:
+            self._commit()
+            return self.log_queue.get(block)
+
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self._commit()
+        return record
+
+    def _commit(self) -> None:
+        if self._pending:
+            self.file_handler.commit()
+            self._pending = 0
+
+
+class LogPipeline:
+    """
+    Background writer for the session log file.
+
+    Loggers only put records on an in-memory queue through the `handler`.
+    The message is interpolated on the calling thread, so later changes to
+    logged objects do not leak into the log; laying out the line and writing
+    it to disk happen on a listener thread.
+    """
+
+    def __init__(
+        self,
+        log_file: Path,
+        formatter: logging.Formatter,
+        config: Optional[LogPipelineConfig] = None,
+    ) -> None:
+        """
+        Initialize log pipeline.
+
+        Args:
+            log_file: Destination log file
+            formatter: Formatter applied by the background writer
+            config: Pipeline configuration, read from environment when omitted
+        """
+        self.config = config or LogPipelineConfig.from_env()
+        self._queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+
+        self.file_handler = BatchedFileHandler(log_file, self.config)
+        self.file_handler.setFormatter(formatter)
+
+        self.handler = QueueHandler(self._queue)
+        self._listener = BatchingQueueListener(
+            self._queue, self.file_handler, self.config.batch_size
+        )
+
+    def start(self) -> None:
+        """
+        Start the background writer.
+        """
+        self._listener.start()
+
+    def stop(self) -> None:
+        """
+        Write all queued records and close the log file.
+        """
+        self._listener.stop()
+        self.file_handler.commit()
+        self.file_handler.close()
@@ -0,0 +1,205 @@
+"""
+Bounded, lazily rendered logging of request and response payloads.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+import logging
+import os
+import random
+import reprlib
+from typing import Any, Literal, Optional, cast
+
+PayloadLogMode = Literal["on_failure", "verbose", "off"]
+
+payload_logger = logging.getLogger("payload")
+
+
+@dataclass(frozen=True)
+class PayloadLogConfig:
+    """
+    Payload logging settings.
+
+    Attributes:
+        mode: "on_failure" keeps payloads in memory and writes them only for
+            failed tests, "verbose" always writes them, "off" drops them
+        max_chars: Maximum rendered length of a single payload (0 = unlimited)
+        sample_rate: Fraction of payload records written in "verbose" mode
+        capacity: Maximum number of payload records buffered per test
+    """
+
+    mode: PayloadLogMode = "on_failure"
+    max_chars: int = 2000
+    sample_rate: float = 1.0
+    capacity: int = 1000
+
+    @classmethod
+    def from_env(cls) -> "PayloadLogConfig":
+        """
+        Build payload logging configuration from `PAYLOAD_LOG_*` variables.
+        """
+        mode = os.getenv("PAYLOAD_LOG_MODE", "on_failure")
+        if mode not in ("on_failure", "verbose", "off"):
+            raise ValueError(f"Unsupported PAYLOAD_LOG_MODE: {mode}")
+
+        return cls(
+            mode=cast(PayloadLogMode, mode),
+            max_chars=int(os.getenv("PAYLOAD_LOG_MAX_CHARS", "2000")),
+            sample_rate=float(os.getenv("PAYLOAD_LOG_SAMPLE_RATE", "1.0")),
+            capacity=int(os.getenv("PAYLOAD_LOG_CAPACITY", "1000")),
+        )
+
+
+_config = PayloadLogConfig()
+
+
+class Payload:
+    """
+    Log argument rendering a payload only when the record is formatted.
+
+    Response bodies are decoded only up to the size cap and nested data is
+    rendered with `reprlib` limits, so huge payloads never get fully
+    converted to text just to be logged.
+    """
+
+    __slots__ = ("_source",)
+
+    def __init__(self, source: Any) -> None:
+        self._source = source
+
+    def freeze(self) -> Any:
+        """
+        Return a log argument that renders the payload as it is now.
+
+        Containers, e.g. request data a test goes on to mutate, are rendered
+        right away, within the size cap. Strings and response bodies cannot
+        change, so they stay unrendered.
+        """
+        if isinstance(self._source, (dict, list, tuple, set)):
+            return str(self)
+        return self
+
+    def __str__(self) -> str:
+        max_chars = _config.max_chars
+        content = getattr(self._source, "content", None)
+
+        if isinstance(content, bytes):
+            limit = len(content) if max_chars <= 0 else max_chars * 4
+            text = content[:limit].decode("utf-8", errors="replace")
+            total = len(content)
+            unit = "bytes"
+        elif isinstance(self._source, str):
+            text = self._source
+            total = len(text)
+            unit = "chars"
+        else:
+            text = _repr(max_chars).repr(self._source)
+            total = 0
+            unit = "chars"
+
+        if 0 < max_chars < len(text):
+            total = total or len(text)
+            return f"{text[:max_chars]}... [truncated, {total} {unit} total]"
+
+        return text
+
+
+def _repr(max_chars: int) -> reprlib.Repr:
+    """
+    Return a `reprlib.Repr` whose limits roughly match the size cap.
+    """
+    limits = reprlib.Repr()
+    if max_chars <= 0:
+        limits.maxlevel = limits.maxdict = limits.maxlist = 1_000_000
+        limits.maxstring = limits.maxother = limits.maxlong = 1_000_000
+        return limits
+
+    limits.maxlevel = 6
+    limits.maxdict = limits.maxlist = max(max_chars // 20, 6)
+    limits.maxstring = limits.maxother = max(max_chars // 2, 30)
+    return limits
+
+
+class _SampleFilter(logging.Filter):
+    """
+    Keep a random fraction of payload records.
+    """
+
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return self.rate >= 1.0 or random.random() < self.rate
+
+
+class FailureCaptureHandler(logging.Handler):
+    """
+    Buffer payload records of the running test and release them on failure.
+
+    Records are kept unformatted, so response bodies of passing tests are
+    never rendered at all; mutable payloads are rendered when buffered, see
+    `Payload.freeze`. The buffer is bounded; the oldest records are dropped.
+    """
+
+    def __init__(self, target: logging.Handler, capacity: int = 1000) -> None:
+        super().__init__()
+        self.target = target
+        self.buffer: deque[logging.LogRecord] = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if isinstance(record.args, tuple):
+            record.args = tuple(
+                arg.freeze() if isinstance(arg, Payload) else arg for arg in record.args
+            )
+        self.buffer.append(record)
+
+    def release(self) -> None:
+        """
+        Write buffered records to the target handler.
+        """
+        while self.buffer:
+            record = self.buffer.popleft()
+            if record.levelno >= self.target.level:
+                self.target.handle(record)
+
+    def discard(self) -> None:
+        """
+        Drop buffered records without rendering them.
+        """
+        self.buffer.clear()
+
+
+def configure_payload_logging(
+    config: PayloadLogConfig, target: Optional[logging.Handler] = None
+) -> Optional[FailureCaptureHandler]:
+    """
+    Configure the payload logger according to the selected mode.
+
+    Args:
+        config: Payload logging configuration
+        target: Handler receiving payloads of failed tests ("on_failure" mode)
+
+    Returns:
+        Capture handler to release or discard per test, None in other modes
+    """
+    global _config  # pylint: disable=global-statement
+    _config = config
+
+    for handler in list(payload_logger.handlers):
+        payload_logger.removeHandler(handler)
+    for log_filter in list(payload_logger.filters):
+        payload_logger.removeFilter(log_filter)
+
+    payload_logger.disabled = config.mode == "off"
+    payload_logger.propagate = config.mode == "verbose" or target is None
+
+    if config.mode == "verbose" and config.sample_rate < 1.0:
+        payload_logger.addFilter(_SampleFilter(config.sample_rate))
+
+    if config.mode != "on_failure" or target is None:
+        return None
+
+    capture = FailureCaptureHandler(target, config.capacity)
+    payload_logger.addHandler(capture)
+    return capture
@@ -0,0 +1,127 @@
+"""
+Registry of precompiled JSON schema validators.
+"""
+
+import logging
+import os
+import threading
+from typing import Any, Callable, Optional
+
+SchemaCheck = Callable[[Any], None]
+
+
+class SchemaRegistry:
+    """
+    Compile each JSON schema once and reuse the compiled validator.
+
+    `jsonschema.validate` checks the schema and builds a new validator on
+    every call. The registry does that work once per schema object and keeps
+    the result for the whole session. With the "fastjsonschema" backend
+    schemas are compiled to specialized Python code, which is considerably
+    faster for the small flat objects returned by the API.
+    """
+
+    def __init__(self, backend: Optional[str] = None) -> None:
+        """
+        Initialize schema registry.
+
+        Args:
+            backend: "jsonschema" (default) or "fastjsonschema", read from
+                `JSON_SCHEMA_BACKEND` environment variable when omitted
+        """
+        self.backend = backend or os.getenv("JSON_SCHEMA_BACKEND", "jsonschema")
+        if self.backend not in ("jsonschema", "fastjsonschema"):
+            raise ValueError(f"Unsupported JSON schema backend: {self.backend}")
+
+        self._lock = threading.Lock()
+        # Keyed by id() of the schema; the schema itself is kept alive
+        # alongside its validator so the id cannot be reused.
+        self._validators: dict[int, tuple[dict, SchemaCheck]] = {}
+
+    def _compile(self, schema: dict) -> SchemaCheck:
+        """
+        Compile schema using the configured backend.
+
+        Validation libraries are imported here, so that importing the
+        registry does not slow down test collection.
+        """
+        # pylint: disable=import-outside-toplevel
+        from jsonschema import ValidationError
+        from jsonschema.exceptions import best_match
+        from jsonschema.validators import validator_for
+
+        if self.backend == "fastjsonschema":
+            import fastjsonschema  # type: ignore[import-untyped]
+
+            # Formats are not asserted by `jsonschema.validate` either
+            compiled = fastjsonschema.compile(schema, use_formats=False)
+
+            def check(instance: Any) -> None:
+                try:
+                    compiled(instance)
+                except fastjsonschema.JsonSchemaValueException as error:
+                    raise ValidationError(error.message) from error
+
+            return check
+
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+
+        def validate(instance: Any) -> None:
+            error = best_match(validator.iter_errors(instance))
+            if error is not None:
+                raise error
+
+        return validate
+
+    def get(self, schema: dict) -> SchemaCheck:
+        """
+        Return compiled validator for schema, compiling it on first use.
+
+        Args:
+            schema: JSON schema dictionary
+
+        Returns:
+            Callable raising `jsonschema.ValidationError` for invalid instances
+        """
+        entry = self._validators.get(id(schema))
+        if entry is not None:
+            return entry[1]
+
+        with self._lock:
+            entry = self._validators.get(id(schema))
+            if entry is None:
+                logging.info("Compiling JSON schema (%s backend)", self.backend)
+                entry = (schema, self._compile(schema))
+                self._validators[id(schema)] = entry
+
+        return entry[1]
+
+    def register_models(self, *models: type) -> int:
+        """
+        Precompile every schema defined as a class attribute of the models.
+
+        Args:
+            models: Model classes such as `AuthorModels` or `BookModels`
+
+        Returns:
+            Number of schemas compiled
+        """
+        count = 0
+        for model in models:
+            for name, value in vars(model).items():
+                if not name.startswith("_") and isinstance(value, dict):
+                    self.get(value)
+                    count += 1
+        return count
+
+    def clear(self) -> None:
+        """
+        Drop all compiled validators.
+        """
+        with self._lock:
+            self._validators.clear()
+
+
+schema_registry = SchemaRegistry()
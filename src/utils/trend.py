@@ -0,0 +1,92 @@
+"""
+Non-parametric trend test for series sampled over time.
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+import math
+import statistics
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class TrendTest:
+    """
+    Result of a Mann-Kendall test with Sen's slope estimate.
+
+    Attributes:
+        samples: Length of the series
+        statistic: Mann-Kendall S, positive for mostly increasing pairs
+        z: Normal approximation of S, continuity and tie corrected
+        p_value: One-sided probability of an increase at least this
+            consistent in a series without trend
+        slope: Sen's slope, the median change per sample
+        intercept: Value of the fitted line at the first sample
+    """
+
+    samples: int
+    statistic: int
+    z: float
+    p_value: float
+    slope: float
+    intercept: float
+
+    @property
+    def change(self) -> float:
+        """
+        Change of the fitted line from the first to the last sample.
+        """
+        return self.slope * max(self.samples - 1, 0)
+
+
+def mann_kendall(values: Sequence[float]) -> TrendTest:
+    """
+    Test a series for a monotonic upward trend.
+
+    Mann-Kendall counts how many later samples exceed earlier ones, so it
+    needs no assumption about the distribution and tolerates outliers and
+    noise; Sen's slope estimates the rate of change just as robustly.
+    Comparing all pairs costs O(n^2), fine for the few thousand windows of
+    a day-long soak.
+
+    Args:
+        values: Samples in time order, at least two
+
+    Raises:
+        ValueError: Fewer than two samples
+    """
+    count = len(values)
+    if count < 2:
+        raise ValueError("A trend needs at least two samples.")
+
+    statistic = 0
+    slopes = []
+    for i in range(count - 1):
+        first = values[i]
+        for j in range(i + 1, count):
+            difference = values[j] - first
+            statistic += (difference > 0) - (difference < 0)
+            slopes.append(difference / (j - i))
+
+    ties = Counter(values).values()
+    variance = (
+        count * (count - 1) * (2 * count + 5)
+        - sum(size * (size - 1) * (2 * size + 5) for size in ties)
+    ) / 18
+    if variance <= 0 or statistic == 0:
+        z = 0.0
+    else:
+        z = (statistic - math.copysign(1, statistic)) / math.sqrt(variance)
+
+    slope = statistics.median(slopes)
+    intercept = statistics.median(
+        value - slope * index for index, value in enumerate(values)
+    )
+    return TrendTest(
+        samples=count,
+        statistic=statistic,
+        z=z,
+        p_value=0.5 * math.erfc(z / math.sqrt(2)),
+        slope=slope,
+        intercept=intercept,
+    )
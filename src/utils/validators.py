@@ -3,8 +3,11 @@ Utility functions for validating API responses and JSON data.
 """
 
 import logging
-from jsonschema import validate as json_validate
+from typing import Any, Iterable
 from requests.models import Response
+from src.clients.request_timing import request_timing
+from src.utils.payload_logging import Payload, payload_logger
+from src.utils.schema_registry import schema_registry
 
 
 def validate_status_code(
@@ -42,17 +45,41 @@ def validate_content_type(response: Response, expected_content_type: str) -> Non
 def validate_json_schema(json_data: dict, schema: dict) -> None:
     """
     Validate JSON data against a given schema or Data.
+
+    The compiled validator is cached, so repeated calls with the same schema
+    do not re-check the schema or rebuild the validator.
     """
 
     logging.info("Validating JSON against schema")
-    logging.info("  JSON data: %s", json_data)
-    logging.info("  Schema: %s", schema)
+    payload_logger.info("  JSON data: %s", Payload(json_data))
+    payload_logger.info("  Schema: %s", Payload(schema))
 
-    json_validate(instance=json_data, schema=schema)
+    schema_registry.get(schema)(json_data)
 
     logging.info("JSON validation successful")
 
 
+def validate_json_schema_items(items: Iterable[Any], schema: dict) -> int:
+    """
+    Validate every element of a (streamed) JSON array against a schema.
+
+    Elements are checked as they are produced, so a streamed list is never
+    held in memory as a whole and validation overlaps the download.
+
+    Returns:
+        Number of validated elements
+    """
+    logging.info("Validating JSON items against schema")
+    validate = schema_registry.get(schema)
+
+    count = 0
+    for count, item in enumerate(items, start=1):
+        validate(item)
+
+    logging.info("JSON validation successful for %s items", count)
+    return count
+
+
 def validate_json_data(
     json_data: dict, expected_data: dict, exact_key_match: bool = False
 ) -> None:
@@ -62,8 +89,8 @@ def validate_json_data(
     If `exact_match` is True, the number of keys must match exactly.
     """
     logging.info("Validating JSON data against expected data")
-    logging.info("  JSON data: %s", json_data)
-    logging.info("  Expected data: %s", expected_data)
+    payload_logger.info("  JSON data: %s", Payload(json_data))
+    payload_logger.info("  Expected data: %s", Payload(expected_data))
 
     if exact_key_match:
         assert len(json_data) == len(
@@ -92,6 +119,44 @@ def validate_elapsed_time(response: Response, max_seconds: float) -> None:
     assert elapsed_time < max_seconds, f"Response took too long: {elapsed_time} seconds"
 
 
+def validate_timing_phase(response: Response, phase: str, max_seconds: float) -> None:
+    """
+    Validate that a phase of the request timing breakdown is within the limit.
+
+    Phases are "dns", "connect", "tls", "send", "ttfb", "transfer", "decode"
+    and "total"; a phase that did not happen (e.g. connect on a reused
+    connection) passes.
+    """
+    timing = request_timing(response)
+    logging.info("Request timing: %s", timing)
+    duration = timing.total if phase == "total" else timing.phases()[phase]
+    logging.info(
+        "Validating %s time: %s seconds, max allowed: %s seconds",
+        phase,
+        duration,
+        max_seconds,
+    )
+
+    assert (
+        duration is None or duration < max_seconds
+    ), f"Request {phase} took too long: {duration} seconds"
+
+
+def validate_ttfb(response: Response, max_seconds: float) -> None:
+    """
+    Validate the time from sending the request to receiving response headers.
+    """
+    validate_timing_phase(response, "ttfb", max_seconds)
+
+
+def validate_total_time(response: Response, max_seconds: float) -> None:
+    """
+    Validate the full request time including connection setup, body
+    download and JSON decoding, unlike `validate_elapsed_time`.
+    """
+    validate_timing_phase(response, "total", max_seconds)
+
+
 def validate_response_reason(response: Response, expected_reason: str) -> None:
     """
     Validate that the response reason matches the expected value.
@@ -105,3 +170,14 @@ def validate_response_reason(response: Response, expected_reason: str) -> None:
     assert (
         response.reason == expected_reason
     ), f"Expected reason '{expected_reason}', but got '{response.reason}'"
+
+
+def has_cache_validators(response: Response) -> bool:
+    """
+    Return whether the response carries an `ETag` or `Last-Modified`
+    validator, which conditional requests depend on.
+    """
+    etag = response.headers.get("etag")
+    last_modified = response.headers.get("last-modified")
+    logging.info("Cache validators: ETag %s, Last-Modified %s", etag, last_modified)
+    return bool(etag or last_modified)
@@ -2,9 +2,10 @@
 Tests for Authors API - DELETE endpoints.
 """
 
+from typing import Any
 import pytest
 from src.clients.authors_client import AuthorsClient
-from src.data.authors_data import AuthorsData
+from src.data.id_allocator import IdAllocator
 from src.models.authors_models import AuthorModels
 from src.utils.validators import (
     validate_elapsed_time,
@@ -22,7 +23,7 @@ class TestDeleteAuthors:
 
     @pytest.mark.smoke
     def test_delete_existing_author_success(
-        self, authors_api_client: AuthorsClient
+        self, authors_api_client: AuthorsClient, new_author_data: dict[str, Any]
     ) -> None:
         """
         Test successful deletion of existing author.
@@ -31,7 +32,7 @@ class TestDeleteAuthors:
         """
 
         # Arrange
-        test_author_data = AuthorsData.sample_author_data
+        test_author_data = new_author_data
         post_response = authors_api_client.create_author(test_author_data)
         validate_status_code(post_response, 200)
         author_id = post_response.json()["id"]
@@ -53,7 +54,11 @@ class TestDeleteAuthors:
             get_author_response_json, AuthorModels.author_not_found_response_model
         )
 
-    @pytest.mark.parametrize("author_id", [-222, -1])
+    @pytest.mark.parametrize(
+        "author_id",
+        # Created by the POST tests on fixed IDs
+        [-222, pytest.param(-1, marks=pytest.mark.xdist_group("fixed_ids"))],
+    )
     def test_delete_nonexistent_author(
         self, authors_api_client: AuthorsClient, author_id: int
     ) -> None:
@@ -80,7 +85,11 @@ class TestDeleteAuthors:
         elif delete_response.status_code == 404:
             validate_response_reason(delete_response, "Not Found")
 
-    @pytest.mark.parametrize("invalid_id", [0, -1, -100])
+    @pytest.mark.parametrize(
+        "invalid_id",
+        # Created by the POST tests on fixed IDs
+        [0, pytest.param(-1, marks=pytest.mark.xdist_group("fixed_ids")), -100],
+    )
     def test_delete_author_invalid_negative_ids(
         self, authors_api_client: AuthorsClient, invalid_id: int
     ) -> None:
@@ -96,7 +105,9 @@ class TestDeleteAuthors:
         # Assert
         validate_status_code(delete_response, [200, 400, 404])
 
-    def test_delete_author_twice(self, authors_api_client: AuthorsClient) -> None:
+    def test_delete_author_twice(
+        self, authors_api_client: AuthorsClient, new_author_data: dict[str, Any]
+    ) -> None:
         """
         Test deleting the same author twice.
 
@@ -104,7 +115,7 @@ class TestDeleteAuthors:
         """
 
         # Arrange
-        test_author_data = AuthorsData.sample_author_data
+        test_author_data = new_author_data
         post_response = authors_api_client.create_author(test_author_data)
         validate_status_code(post_response, 200)
         author_id = post_response.json()["id"]
@@ -127,7 +138,10 @@ class TestDeleteAuthors:
             validate_response_reason(second_delete_response, "Not Found")
 
     def test_delete_author_and_verify_book_association(
-        self, authors_api_client: AuthorsClient
+        self,
+        authors_api_client: AuthorsClient,
+        id_allocator: IdAllocator,
+        new_author_data: dict[str, Any],
     ) -> None:
         """
         Test that deleting an author doesn't affect other authors of the same book.
@@ -136,14 +150,14 @@ class TestDeleteAuthors:
         """
 
         # Arrange - Create two authors for the same book
-        author_data_1 = AuthorsData.sample_author_data
         author_data_2 = {
-            "idBook": author_data_1["idBook"],
+            "id": id_allocator.next_id(),
+            "idBook": new_author_data["idBook"],
             "firstName": "Second Author",
             "lastName": "Second Last Name",
         }
 
-        post_response_1 = authors_api_client.create_author(author_data_1)
+        post_response_1 = authors_api_client.create_author(new_author_data)
         post_response_2 = authors_api_client.create_author(author_data_2)
 
         validate_status_code(post_response_1, 200)
@@ -151,7 +165,7 @@ class TestDeleteAuthors:
 
         author_id_1 = post_response_1.json()["id"]
         author_id_2 = post_response_2.json()["id"]
-        book_id = author_data_1["idBook"]
+        book_id = new_author_data["idBook"]
 
         # Act - Delete first author
         delete_response = authors_api_client.delete_author(author_id_1)
@@ -161,8 +175,7 @@ class TestDeleteAuthors:
         get_author_2_response = authors_api_client.get_author_by_id(author_id_2)
         validate_status_code(get_author_2_response, 200)
 
-        author_2_data = get_author_2_response.json()
-        assert author_2_data["idBook"] == book_id
+        assert get_author_2_response.json()["idBook"] == book_id
 
         # Verify book still has authors (at least author 2)
         book_authors_response = authors_api_client.get_authors_by_book_id(str(book_id))
@@ -177,7 +190,7 @@ class TestDeleteAuthors:
         assert author_id_2 in author_ids_for_book
 
     def test_delete_author_response_time(
-        self, authors_api_client: AuthorsClient
+        self, authors_api_client: AuthorsClient, new_author_data: dict[str, Any]
     ) -> None:
         """
         Test response time for deleting author is reasonable.
@@ -186,7 +199,7 @@ class TestDeleteAuthors:
         """
 
         # Arrange
-        test_author_data = AuthorsData.sample_author_data
+        test_author_data = new_author_data
         post_response = authors_api_client.create_author(test_author_data)
         validate_status_code(post_response, 200)
         author_id = post_response.json()["id"]
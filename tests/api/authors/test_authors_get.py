@@ -6,11 +6,15 @@ import pytest
 from src.clients.authors_client import AuthorsClient
 from src.models.authors_models import AuthorModels
 from src.utils.validators import (
+    has_cache_validators,
     validate_content_type,
     validate_elapsed_time,
     validate_json_schema,
+    validate_json_schema_items,
     validate_response_reason,
     validate_status_code,
+    validate_total_time,
+    validate_ttfb,
 )
 
 
@@ -20,6 +24,8 @@ class TestGetAuthors:
     Test suite for GET /api/v1/Authors endpoints.
     """
 
+    # Runs before the tests leaving authors without names
+    @pytest.mark.xdist_group("unnamed_authors")
     @pytest.mark.smoke
     def test_get_all_authors_success(self, authors_api_client: AuthorsClient) -> None:
         """
@@ -41,6 +47,22 @@ class TestGetAuthors:
         for author in authors_data:
             validate_json_schema(author, AuthorModels.author_response_model)
 
+    # Runs before the tests leaving authors without names
+    @pytest.mark.xdist_group("unnamed_authors")
+    def test_get_all_authors_streamed(self, authors_api_client: AuthorsClient) -> None:
+        """
+        Test retrieval of all authors with incremental parsing.
+
+        Sunny day scenario: every streamed author matches the author schema.
+        """
+
+        # Act
+        authors = authors_api_client.iter_all_authors()
+
+        # Assert
+        count = validate_json_schema_items(authors, AuthorModels.author_response_model)
+        assert count > 0
+
     def test_get_all_authors_response_time(
         self, authors_api_client: AuthorsClient
     ) -> None:
@@ -56,6 +78,8 @@ class TestGetAuthors:
         # Assert
         validate_status_code(get_response, 200)
         validate_elapsed_time(get_response, 3.0)
+        validate_ttfb(get_response, 3.0)
+        validate_total_time(get_response, 3.0)
 
 
 class TestGetAuthorsById:
@@ -63,7 +87,21 @@ class TestGetAuthorsById:
     Test suite for GET /api/v1/Authors/{id} endpoint.
     """
 
-    @pytest.mark.parametrize("author_id", [1, 2, 500, 597, 598, 999, 1000, 10000])
+    @pytest.mark.parametrize(
+        "author_id",
+        [1, 2, 500, 597, 598]
+        + [
+            # Created by the POST tests on fixed IDs
+            pytest.param(
+                author_id,
+                marks=[
+                    pytest.mark.service_defect("Authors above 600 do not exist"),
+                    pytest.mark.xdist_group("fixed_ids"),
+                ],
+            )
+            for author_id in (999, 1000, 10000)
+        ],
+    )
     def test_get_author_by_valid_id(
         self, authors_api_client: AuthorsClient, author_id: int
     ) -> None:
@@ -86,7 +124,17 @@ class TestGetAuthorsById:
         # Verify the returned author has the requested ID
         assert get_response_data["id"] == author_id
 
-    @pytest.mark.parametrize("invalid_id", [0, -1, 999999, "abc", 1.5])
+    @pytest.mark.parametrize(
+        "invalid_id",
+        [
+            0,
+            # Created by the POST tests on fixed IDs
+            pytest.param(-1, marks=pytest.mark.xdist_group("fixed_ids")),
+            999999,
+            "abc",
+            1.5,
+        ],
+    )
     def test_get_author_by_invalid_id(
         self, authors_api_client: AuthorsClient, invalid_id: int | str
     ) -> None:
@@ -136,6 +184,8 @@ class TestGetAuthorsByBookId:
             validate_json_schema(author, AuthorModels.author_response_model)
             assert author["idBook"] == book_id
 
+    # Authors of these books are created by the POST tests on fixed IDs
+    @pytest.mark.xdist_group("fixed_ids")
     @pytest.mark.parametrize("invalid_book_id", [0, -1])
     def test_get_authors_by_book_id_out_of_range(
         self, authors_api_client: AuthorsClient, invalid_book_id: int
@@ -195,3 +245,69 @@ class TestGetAuthorsByBookId:
         # Assert
         validate_status_code(get_response, 200)
         validate_elapsed_time(get_response, 3.0)
+
+
+@pytest.mark.api
+class TestConditionalGetAuthors:
+    """
+    Test suite for conditional GET (ETag / Last-Modified) of Authors
+    endpoints.
+    """
+
+    def test_get_author_by_id_not_modified(
+        self, conditional_authors_client: AuthorsClient
+    ) -> None:
+        """
+        Test that an unchanged author is revalidated instead of downloaded.
+
+        Sunny day scenario: the second GET is answered with 304 and the
+        client serves the stored author.
+        """
+
+        # Arrange
+        first_response = conditional_authors_client.get_author_by_id(1)
+        validate_status_code(first_response, 200)
+        if not has_cache_validators(first_response):
+            pytest.skip("Service sends neither ETag nor Last-Modified")
+
+        # Act
+        response = conditional_authors_client.get_author_by_id(1)
+
+        # Assert
+        validate_status_code(response, 200)
+        validate_json_schema(response.json(), AuthorModels.author_response_model)
+        assert conditional_authors_client.validators is not None
+        if not conditional_authors_client.validators.hits:
+            # Tests on fixed IDs may replace the author in between
+            if response.json() != first_response.json():
+                pytest.skip("Author changed between the two requests")
+            pytest.xfail("Service sent the unchanged author again")
+        assert response.json() == first_response.json()
+
+    def test_get_authors_by_book_id_not_modified(
+        self, conditional_authors_client: AuthorsClient
+    ) -> None:
+        """
+        Test that an unchanged author list of a book is revalidated.
+
+        Sunny day scenario: the second GET is answered with 304.
+        """
+
+        # Arrange
+        first_response = conditional_authors_client.get_authors_by_book_id(2)
+        validate_status_code(first_response, 200)
+        if not has_cache_validators(first_response):
+            pytest.skip("Service sends neither ETag nor Last-Modified")
+
+        # Act
+        response = conditional_authors_client.get_authors_by_book_id(2)
+
+        # Assert
+        validate_status_code(response, 200)
+        assert conditional_authors_client.validators is not None
+        if not conditional_authors_client.validators.hits:
+            # Authors created by tests on other workers change the list
+            if response.json() != first_response.json():
+                pytest.skip("Author list changed between the two requests")
+            pytest.xfail("Service sent the unchanged author list again")
+        assert response.json() == first_response.json()
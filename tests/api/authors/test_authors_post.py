@@ -2,9 +2,11 @@
 Tests for Authors API - POST endpoints.
 """
 
+from typing import Any
 import pytest
 from src.clients.authors_client import AuthorsClient
 from src.data.authors_data import AuthorsData
+from src.data.id_allocator import IdAllocator
 from src.models.authors_models import AuthorModels
 from src.utils.validators import (
     validate_content_type,
@@ -23,7 +25,9 @@ class TestPostAuthors:
     """
 
     @pytest.mark.smoke
-    def test_post_author_success(self, authors_api_client: AuthorsClient) -> None:
+    def test_post_author_success(
+        self, authors_api_client: AuthorsClient, new_author_data: dict[str, Any]
+    ) -> None:
         """
         Test successful creation of author.
 
@@ -31,7 +35,7 @@ class TestPostAuthors:
         """
 
         # Arrange
-        test_author_data = AuthorsData.sample_author_data
+        test_author_data = new_author_data
 
         # Act
         response = authors_api_client.create_author(test_author_data)
@@ -47,7 +51,15 @@ class TestPostAuthors:
         # Verify the created author data
         validate_json_data(author_response, test_author_data)
 
-    @pytest.mark.parametrize("author_id", [-1, 1, 2, 500, 597, 598, 999, 1000, 10000])
+    @pytest.mark.parametrize(
+        "author_id",
+        # Also deleted or expected missing by other tests
+        [
+            pytest.param(author_id, marks=pytest.mark.xdist_group("fixed_ids"))
+            for author_id in (-1, 999, 1000, 10000)
+        ]
+        + [1, 2, 500, 597, 598],
+    )
     def test_post_author_wihth_parametrized_id(
         self, authors_api_client: AuthorsClient, author_id: int
     ) -> None:
@@ -80,14 +92,22 @@ class TestPostAuthors:
         validate_json_schema(get_response_json, AuthorModels.author_response_model)
         validate_json_data(get_response_json, test_author_data)
 
-    def test_post_author_invalid_data(self, authors_api_client: AuthorsClient) -> None:
+    # Leaves an author without names, which fails the schema of author lists
+    @pytest.mark.xdist_group("unnamed_authors")
+    @pytest.mark.service_defect("Authors without names are accepted")
+    def test_post_author_invalid_data(
+        self, authors_api_client: AuthorsClient, id_allocator: IdAllocator
+    ) -> None:
         """
         Test creation of author with invalid data.
 
         Edge case: API should handle invalid input appropriately.
         """
 
-        invalid_author_data = AuthorsData.invalid_author_data
+        invalid_author_data = {
+            **AuthorsData.invalid_author_data,
+            "id": id_allocator.next_id(),
+        }
 
         # Act
         post_response = authors_api_client.create_author(invalid_author_data)
@@ -97,7 +117,7 @@ class TestPostAuthors:
         validate_response_reason(post_response, "Bad Request")
 
     def test_post_author_with_extra_fields(
-        self, authors_api_client: AuthorsClient
+        self, authors_api_client: AuthorsClient, new_author_data: dict[str, Any]
     ) -> None:
         """
         Test creation of author with extra fields not defined in schema.
@@ -107,7 +127,7 @@ class TestPostAuthors:
 
         # Arrange
         author_data_with_extra_fields = {
-            **AuthorsData.sample_author_data,
+            **new_author_data,
             "extraField": "This should be ignored",
             "anotherExtraField": 12345,
         }
@@ -126,9 +146,20 @@ class TestPostAuthors:
         # Verify valid fields are present
         validate_json_schema(author_response, AuthorModels.author_response_model)
 
-    @pytest.mark.parametrize("book_id", [-1, 0, 1, 2, 5, 10, 50])
+    @pytest.mark.parametrize(
+        "book_id",
+        # Books expected to have no authors by other tests
+        [
+            pytest.param(book_id, marks=pytest.mark.xdist_group("fixed_ids"))
+            for book_id in (-1, 0)
+        ]
+        + [1, 2, 5, 10, 50],
+    )
     def test_post_author_with_different_book_ids(
-        self, authors_api_client: AuthorsClient, book_id: int
+        self,
+        authors_api_client: AuthorsClient,
+        id_allocator: IdAllocator,
+        book_id: int,
     ) -> None:
         """
         Test creation of authors for different book IDs.
@@ -138,6 +169,7 @@ class TestPostAuthors:
 
         # Arrange
         author_data = {
+            "id": id_allocator.next_id(),
             "idBook": book_id,
             "firstName": f"Author for Book {book_id}",
             "lastName": f"LastName {book_id}",
@@ -153,7 +185,9 @@ class TestPostAuthors:
         validate_json_schema(author_response, AuthorModels.author_response_model)
         assert author_response["idBook"] == book_id
 
-    def test_post_author_response_time(self, authors_api_client: AuthorsClient) -> None:
+    def test_post_author_response_time(
+        self, authors_api_client: AuthorsClient, new_author_data: dict[str, Any]
+    ) -> None:
         """
         Test response time for creating author is reasonable.
 
@@ -161,7 +195,7 @@ class TestPostAuthors:
         """
 
         # Arrange
-        test_author_data = AuthorsData.sample_author_data
+        test_author_data = new_author_data
 
         # Act
         response = authors_api_client.create_author(test_author_data)
@@ -2,6 +2,7 @@
 Tests for Authors API - PUT endpoints.
 """
 
+from typing import Any
 import pytest
 from src.clients.authors_client import AuthorsClient
 from src.data.authors_data import AuthorsData
@@ -24,7 +25,7 @@ class TestPutAuthors:
 
     @pytest.mark.smoke
     def test_put_existing_author_success(
-        self, authors_api_client: AuthorsClient
+        self, authors_api_client: AuthorsClient, new_author_data: dict[str, Any]
     ) -> None:
         """
         Test successful update of existing author.
@@ -33,7 +34,7 @@ class TestPutAuthors:
         """
 
         # Arrange
-        test_author_data = AuthorsData.sample_author_data
+        test_author_data = new_author_data
         post_response = authors_api_client.create_author(test_author_data)
         validate_status_code(post_response, 200)
         post_response_json = post_response.json()
@@ -81,8 +82,10 @@ class TestPutAuthors:
             put_response_json, AuthorModels.author_not_found_response_model
         )
 
+    # Leaves an author without names, which fails the schema of author lists
+    @pytest.mark.xdist_group("unnamed_authors")
     def test_put_author_with_invalid_data(
-        self, authors_api_client: AuthorsClient
+        self, authors_api_client: AuthorsClient, new_author_data: dict[str, Any]
     ) -> None:
         """
         Test updating author with invalid data.
@@ -91,7 +94,7 @@ class TestPutAuthors:
         """
 
         # Arrange - First create a valid author
-        test_author_data = AuthorsData.sample_author_data.copy()
+        test_author_data = new_author_data
         post_response = authors_api_client.create_author(test_author_data)
         validate_status_code(post_response, 200)
         post_response_data = post_response.json()
@@ -117,7 +120,23 @@ class TestPutAuthors:
             test_author_data["id"] == put_response_data["id"]
         ), "Author ID mismatch after update with invalid data"
 
-    @pytest.mark.parametrize("invalid_id", [-1, -100, "abc", 1.5])
+    @pytest.mark.parametrize(
+        "invalid_id",
+        [
+            pytest.param(
+                -1,
+                marks=[
+                    pytest.mark.service_defect(
+                        "Negative IDs are accepted, -1 is created by POST tests"
+                    ),
+                    pytest.mark.xdist_group("fixed_ids"),
+                ],
+            ),
+            -100,
+            "abc",
+            1.5,
+        ],
+    )
     def test_put_author_invalid_id_types(
         self, authors_api_client: AuthorsClient, invalid_id: int | str
     ) -> None:
@@ -137,7 +156,7 @@ class TestPutAuthors:
         validate_status_code(put_response, [400, 404])
 
     def test_put_author_different_book_association(
-        self, authors_api_client: AuthorsClient
+        self, authors_api_client: AuthorsClient, new_author_data: dict[str, Any]
     ) -> None:
         """
         Test updating author to be associated with a different book.
@@ -146,7 +165,7 @@ class TestPutAuthors:
         """
 
         # Arrange - Create initial author
-        test_author_data = AuthorsData.sample_author_data
+        test_author_data = new_author_data
         post_response = authors_api_client.create_author(test_author_data)
         validate_status_code(post_response, 200)
         author_id = post_response.json()["id"]
@@ -166,7 +185,9 @@ class TestPutAuthors:
         )
         assert updated_author_response["idBook"] == different_book_data["idBook"]
 
-    def test_put_author_response_time(self, authors_api_client: AuthorsClient) -> None:
+    def test_put_author_response_time(
+        self, authors_api_client: AuthorsClient, new_author_data: dict[str, Any]
+    ) -> None:
         """
         Test response time for updating author is reasonable.
 
@@ -174,7 +195,7 @@ class TestPutAuthors:
         """
 
         # Arrange - Create author first
-        test_author_data = AuthorsData.sample_author_data
+        test_author_data = new_author_data
         post_response = authors_api_client.create_author(test_author_data)
         validate_status_code(post_response, 200)
         author_id = post_response.json()["id"]
@@ -2,10 +2,10 @@
 Tests for Books API - DELETE endpoints.
 """
 
+from typing import Any
 import pytest
 
 from src.clients.books_client import BooksClient
-from src.data.books_data import BooksData
 from src.models.books_models import BookModels
 from src.utils.validators import (
     validate_json_schema,
@@ -20,7 +20,9 @@ class TestDeleteBooks:
     Test suite for DELETE /api/v1/Books/{id} endpoint.
     """
 
-    def test_delete_existing_book_success(self, books_api_client: BooksClient) -> None:
+    def test_delete_existing_book_success(
+        self, books_api_client: BooksClient, new_book_data: dict[str, Any]
+    ) -> None:
         """
         Test successful deletion of book which exists.
 
@@ -28,7 +30,7 @@ class TestDeleteBooks:
         """
 
         # Arrange
-        test_book_data = BooksData.sample_book_data
+        test_book_data = new_book_data
         post_response = books_api_client.create_book(test_book_data)
         validate_status_code(post_response, 200)
         book_id = test_book_data["id"]
@@ -50,7 +52,15 @@ class TestDeleteBooks:
             get_book_response_json, BookModels.book_not_found_response_model
         )
 
-    @pytest.mark.parametrize("book_id", [-1, 0, 666, 500, 1762])
+    @pytest.mark.parametrize(
+        "book_id",
+        # Created by the PUT tests on fixed IDs
+        [
+            pytest.param(book_id, marks=pytest.mark.xdist_group("fixed_ids"))
+            for book_id in (-1, 0, 500, 1762)
+        ]
+        + [666],
+    )
     def test_delete_non_existing_book(
         self, books_api_client: BooksClient, book_id: int
     ) -> None:
@@ -2,14 +2,19 @@
 Tests for Books API - GET endpoints.
 """
 
+from typing import Any
 import pytest
 from src.clients.books_client import BooksClient
 from src.models.books_models import BookModels
 from src.utils.validators import (
+    has_cache_validators,
     validate_content_type,
     validate_elapsed_time,
     validate_json_schema,
+    validate_json_schema_items,
     validate_status_code,
+    validate_total_time,
+    validate_ttfb,
 )
 
 
@@ -39,6 +44,20 @@ class TestGetBooks:
         for book in books_data:
             validate_json_schema(book, BookModels.book_response_model)
 
+    def test_get_all_books_streamed(self, books_api_client: BooksClient) -> None:
+        """
+        Test retrieval of all books with incremental parsing.
+
+        Sunny day scenario: every streamed book matches the book schema.
+        """
+
+        # Act
+        books = books_api_client.iter_all_books()
+
+        # Assert
+        count = validate_json_schema_items(books, BookModels.book_response_model)
+        assert count > 0
+
     def test_get_all_books_response_time(self, books_api_client: BooksClient) -> None:
         """
         Test response time for getting all books is reasonable.
@@ -52,6 +71,8 @@ class TestGetBooks:
         # Assert
         validate_status_code(response, 200)
         validate_elapsed_time(response, 5.0)
+        validate_ttfb(response, 5.0)
+        validate_total_time(response, 5.0)
 
 
 @pytest.mark.api
@@ -79,7 +100,17 @@ class TestGetBookById:
         book = response.json()
         validate_json_schema(book, BookModels.book_response_model)
 
-    @pytest.mark.parametrize("invalid_id", [0, -1, -100, 999999, 1000000])
+    @pytest.mark.parametrize(
+        "invalid_id",
+        [
+            # Created by the PUT tests on fixed IDs
+            pytest.param(0, marks=pytest.mark.xdist_group("fixed_ids")),
+            pytest.param(-1, marks=pytest.mark.xdist_group("fixed_ids")),
+            -100,
+            999999,
+            1000000,
+        ],
+    )
     def test_get_book_by_invalid_id(
         self, books_api_client: BooksClient, invalid_id: int
     ) -> None:
@@ -132,3 +163,104 @@ class TestGetBookById:
         # Assert
         validate_status_code(get_response, 200)
         validate_elapsed_time(get_response, 5.0)
+
+
+@pytest.mark.api
+class TestConditionalGetBooks:
+    """
+    Test suite for conditional GET (ETag / Last-Modified) of Books endpoints.
+
+    Whether the service answers unchanged resources with 304 Not Modified
+    decides if repeated reads cost a round trip or a full download.
+    """
+
+    def test_get_all_books_not_modified(
+        self, conditional_books_client: BooksClient
+    ) -> None:
+        """
+        Test that an unchanged book list is revalidated instead of downloaded.
+
+        Sunny day scenario: the second GET is answered with 304 and the
+        client serves the stored list.
+        """
+
+        # Arrange
+        first_response = conditional_books_client.get_all_books()
+        validate_status_code(first_response, 200)
+        if not has_cache_validators(first_response):
+            pytest.skip("Service sends neither ETag nor Last-Modified")
+
+        # Act
+        response = conditional_books_client.get_all_books()
+
+        # Assert
+        validate_status_code(response, 200)
+        assert conditional_books_client.validators is not None
+        if not conditional_books_client.validators.hits:
+            # Books created by tests on other workers change the list
+            if response.json() != first_response.json():
+                pytest.skip("Book list changed between the two requests")
+            pytest.xfail("Service sent the unchanged book list again")
+        assert response.json() == first_response.json()
+
+    def test_get_book_by_id_not_modified(
+        self, conditional_books_client: BooksClient
+    ) -> None:
+        """
+        Test that an unchanged book is revalidated instead of downloaded.
+
+        Sunny day scenario: the second GET is answered with 304.
+        """
+
+        # Arrange
+        first_response = conditional_books_client.get_book_by_id(1)
+        validate_status_code(first_response, 200)
+        if not has_cache_validators(first_response):
+            pytest.skip("Service sends neither ETag nor Last-Modified")
+
+        # Act
+        response = conditional_books_client.get_book_by_id(1)
+
+        # Assert
+        validate_status_code(response, 200)
+        validate_json_schema(response.json(), BookModels.book_response_model)
+        assert conditional_books_client.validators is not None
+        if not conditional_books_client.validators.hits:
+            # Tests on fixed IDs may replace the book in between
+            if response.json() != first_response.json():
+                pytest.skip("Book changed between the two requests")
+            pytest.xfail("Service sent the unchanged book again")
+        assert response.json() == first_response.json()
+
+    def test_get_book_modified_elsewhere(
+        self,
+        conditional_books_client: BooksClient,
+        books_api_client: BooksClient,
+        new_book_data: dict[str, Any],
+    ) -> None:
+        """
+        Test that a book changed by another client is downloaded again.
+
+        Edge case: validators of the old representation must not match.
+        """
+
+        # Arrange
+        book_id = new_book_data["id"]
+        validate_status_code(books_api_client.create_book(new_book_data), 200)
+        first_response = conditional_books_client.get_book_by_id(book_id)
+        if first_response.status_code == 404:
+            pytest.skip("Service does not store created books")
+        validate_status_code(first_response, 200)
+        updated_book_data = {**new_book_data, "title": "Revised Edition"}
+        validate_status_code(
+            books_api_client.update_book(book_id, updated_book_data), 200
+        )
+
+        # Act
+        response = conditional_books_client.get_book_by_id(book_id)
+
+        # Assert
+        validate_status_code(response, 200)
+        assert conditional_books_client.validators is not None
+        assert conditional_books_client.validators.hits == 0
+        assert response.json()["title"] == "Revised Edition"
@@ -2,6 +2,7 @@
 Tests for Books API - POST endpoints.
 """
 
+from typing import Any
 import pytest
 from jsonschema import validate
 from src.clients.books_client import BooksClient
@@ -21,23 +22,18 @@ class TestPostBooks:
     Test suite for POST /api/v1/Books endpoint.
     """
 
-    @pytest.mark.parametrize(
-        # "book_id", [-1, 0, 1, 99, 100, 199, 200, 201, 500, 1762, 99999]
-        "book_id",
-        [10900],
-    )
     def test_parametrized_post_book(
-        self, books_api_client: BooksClient, book_id: int
+        self, books_api_client: BooksClient, new_book_data: dict[str, Any]
     ) -> None:
         """
-        Test successful creation of book with parametrized book ID.
+        Test successful creation of book with an unused book ID.
 
         Sunny day scenario: API returns 200 status with created book data.
         """
 
         # Arrange
-        test_book_data = BooksData.sample_book_data.copy()
-        test_book_data["id"] = book_id
+        test_book_data = new_book_data
+        book_id = test_book_data["id"]
 
         # Act
         post_response = books_api_client.create_book(test_book_data)
@@ -63,7 +59,9 @@ class TestPostBooks:
         validate_json_schema(get_reponse_json, BookModels.book_response_model)
         validate_json_data(get_reponse_json, test_book_data)
 
-    def test_post_book_nullable_data(self, books_api_client: BooksClient) -> None:
+    def test_post_book_nullable_data(
+        self, books_api_client: BooksClient, new_book_data: dict[str, Any]
+    ) -> None:
         """
         Test creation of book with nullable fields.
         Validates handling of null values with GET request.
@@ -72,8 +70,7 @@ class TestPostBooks:
         """
 
         # Arrange
-        test_book_data = BooksData.sample_book_data.copy()
-        test_book_data["id"] = 99999  # Use a unique ID for this test
+        test_book_data = new_book_data
         test_book_data["title"] = None
         test_book_data["description"] = None
         test_book_data["excerpt"] = None
@@ -100,6 +97,8 @@ class TestPostBooks:
         validate_json_schema(get_reponse_json, BookModels.book_response_model)
         validate_json_data(get_reponse_json, test_book_data)
 
+    @pytest.mark.xdist_group("fixed_ids")
+    @pytest.mark.service_defect("A book with an existing ID replaces it")
     def test_post_conflict_book_id(self, books_api_client: BooksClient) -> None:
         """
         Test creation of book with existing ID.
@@ -117,7 +116,7 @@ class TestPostBooks:
         assert existing_book_data["pageCount"] is not None
         assert existing_book_data["publishDate"] is not None
 
-        test_book_data = BooksData.sample_book_data
+        test_book_data = BooksData.sample_book_data.copy()
         test_book_data["id"] = 1
 
         # Act
@@ -149,7 +148,10 @@ class TestPostBooks:
         post_reponse_json = post_response.json()
         validate(post_reponse_json, BookModels.book_not_found_response_model)
 
-    def test_post_out_of_range_page_count(self, books_api_client: BooksClient) -> None:
+    @pytest.mark.service_defect("Negative page counts are accepted")
+    def test_post_out_of_range_page_count(
+        self, books_api_client: BooksClient, new_book_data: dict[str, Any]
+    ) -> None:
         """
         Test creation of book with out-of-range page count.
 
@@ -157,7 +159,7 @@ class TestPostBooks:
         """
 
         # Arrange
-        test_book_data = BooksData.sample_book_data
+        test_book_data = new_book_data
         test_book_data["pageCount"] = -1020
 
         # Act
@@ -2,6 +2,7 @@
 Tests for Books API - PUT endpoints.
 """
 
+from typing import Any
 import pytest
 from src.clients.books_client import BooksClient
 from src.data.books_data import BooksData
@@ -21,7 +22,9 @@ class TestPutBooks:
     Test suite for PUT /api/v1/Books/{id} endpoint.
     """
 
-    def test_put_existing_book_success(self, books_api_client: BooksClient) -> None:
+    def test_put_existing_book_success(
+        self, books_api_client: BooksClient, new_book_data: dict[str, Any]
+    ) -> None:
         """
         Test successful update of existing book.
 
@@ -29,7 +32,7 @@ class TestPutBooks:
         """
 
         # Arrange
-        test_book_data = BooksData.sample_book_data
+        test_book_data = new_book_data
         post_response = books_api_client.create_book(test_book_data)
         validate_status_code(post_response, 200)
 
@@ -51,7 +54,12 @@ class TestPutBooks:
 
     @pytest.mark.parametrize(
         "book_id",
-        [-1, 0, 1, 2, 3, 99, 100, 199, 200, 201, 500, 1762, 99999, 10900],
+        # Also written, deleted or expected missing by other tests
+        [
+            pytest.param(book_id, marks=pytest.mark.xdist_group("fixed_ids"))
+            for book_id in (-1, 0, 1, 500, 1762)
+        ]
+        + [2, 3, 99, 100, 199, 200, 201, 99999, 10900],
     )
     def test_put_book_with_parametrized_id(
         self, books_api_client: BooksClient, book_id: int
@@ -89,7 +97,9 @@ class TestPutBooks:
         validate_json_schema(get_book_response_json, BookModels.book_response_model)
         validate_json_data(get_book_response_json, updated_book_data)
 
-    def test_put_book_with_invalid_data(self, books_api_client: BooksClient) -> None:
+    def test_put_book_with_invalid_data(
+        self, books_api_client: BooksClient, new_book_data: dict[str, Any]
+    ) -> None:
         """
         Test updating book with invalid data.
         Asumption: API should return 400 Bad Request for invalid data.
@@ -98,7 +108,7 @@ class TestPutBooks:
         """
 
         # Arrange
-        test_book_data = BooksData.sample_book_data.copy()
+        test_book_data = new_book_data
         post_response = books_api_client.create_book(test_book_data)
         validate_status_code(post_response, 200)
 
@@ -2,18 +2,446 @@
 Global pytest configuration and fixtures.
 """
 
-from typing import Generator
+from collections import Counter
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Generator, Optional
 from pathlib import Path
 from datetime import datetime
 import logging
+import os
 import pytest
-from src.clients.books_client import BooksClient
-from src.clients.authors_client import AuthorsClient
+from src.config.settings import reload_settings
+from src.data.authors_data import AuthorsData
+from src.data.books_data import BooksData
+from src.data.data_factory import DataFactory
+from src.data.id_allocator import IdAllocator
+from src.utils.byte_accounting import byte_accounting
+from src.utils.duration_schedule import (
+    ScheduleConfig,
+    base_nodeid,
+    load_durations,
+    longest_first,
+    lpt_partition,
+    merge_durations,
+    parse_shard,
+    save_durations,
+    work_units,
+)
+from src.utils.latency_baseline import (
+    BaselineConfig,
+    LatencyComparison,
+    compare_latencies,
+    format_comparison_html,
+    histograms_from_dict,
+    load_latencies,
+    save_history,
+    save_latencies,
+)
+from src.utils.latency_metrics import latency_recorder
+from src.utils.log_pipeline import LogPipeline
+from src.utils.payload_logging import (
+    FailureCaptureHandler,
+    PayloadLogConfig,
+    configure_payload_logging,
+)
 
+# Clients, the local server and the schema libraries are imported on first
+# use, so collecting and starting a worker does not pay for them up front
+# pylint: disable=import-outside-toplevel
+if TYPE_CHECKING:
+    from src.clients.authors_client import AuthorsClient
+    from src.clients.books_client import BooksClient
+    from src.clients.cassette import Cassette, CassetteConfig
+    from src.clients.response_cache import ResponseCache
+    from src.clients.session_pool import SessionPool
+    from src.clients.validator_cache import ValidatorCache
+    from src.server.http_server import LocalApiServer
 
 LOG_DIR = Path("reports/logs")
 LOG_DIR.mkdir(exist_ok=True)
 
+PAYLOAD_CAPTURE = pytest.StashKey[Optional[FailureCaptureHandler]]()
+LOCAL_API_SERVER = pytest.StashKey["LocalApiServer"]()
+LOCAL_API = pytest.StashKey[bool]()
+LATENCY_BASELINE = pytest.StashKey[BaselineConfig]()
+CASSETTE_CONFIG = pytest.StashKey["CassetteConfig"]()
+LATENCY_COMPARISON = pytest.StashKey[list[LatencyComparison]]()
+TEST_SCHEDULE = pytest.StashKey[ScheduleConfig]()
+
+# pytest-xdist worker name ("gw0", "gw1", ...), "master" in a serial run
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "master")
+
+# Seconds spent in setup, call and teardown of each test of this run
+RUN_DURATIONS: dict[str, float] = {}
+
+# Node IDs of every test collected this run, before deselection
+COLLECTED: set[str] = set()
+
+# Hits and misses of the validator caches used by this run
+CONDITIONAL_STATS: Counter[str] = Counter()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """
+    Register framework command line options.
+    """
+    parser.addoption(
+        "--payload-log",
+        choices=["on_failure", "verbose", "off"],
+        default=None,
+        help="Payload logging mode (default: PAYLOAD_LOG_MODE or on_failure)",
+    )
+    parser.addoption(
+        "--env-profile",
+        default=None,
+        help="Load .env.PROFILE on top of .env (default: TEST_PROFILE)",
+    )
+    parser.addoption(
+        "--local-api",
+        action="store_true",
+        help="Run API tests against the local FakeRestAPI stand-in server",
+    )
+    parser.addoption(
+        "--cassette",
+        choices=["record", "replay", "off"],
+        default=None,
+        help="Record API interactions to cassettes, or replay them without "
+        "contacting the service (default: CASSETTE_MODE or off)",
+    )
+    parser.addoption(
+        "--schedule",
+        choices=["duration", "record", "off"],
+        default=None,
+        help="Record test durations, and with 'duration' run the longest tests "
+        "first on pytest-xdist workers (default: TEST_SCHEDULE_MODE, or record "
+        "on CI and off elsewhere)",
+    )
+    parser.addoption(
+        "--shard",
+        type=parse_shard,
+        default=None,
+        metavar="INDEX/COUNT",
+        help="Run one of COUNT shards of similar recorded duration, e.g. 1/3",
+    )
+    parser.addoption(
+        "--latency-baseline",
+        choices=["update", "compare", "off"],
+        default=None,
+        help="Store request latencies as the baseline, or fail on regressions "
+        "against it (default: LATENCY_BASELINE_MODE or off)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Start the local stand-in server and point the API clients at it.
+
+    Under pytest-xdist the server is started once by the controller; workers
+    inherit its address through the environment and share its state.
+    Cassettes of a previous recording are removed before a new one starts.
+    """
+    from src.clients.cassette import CassetteConfig
+
+    profile = config.getoption("env_profile")
+    if profile:
+        os.environ["TEST_PROFILE"] = profile
+    settings = reload_settings()
+
+    cassette = settings.section(CassetteConfig.from_env)
+    cassette_mode = config.getoption("cassette")
+    if cassette_mode:
+        cassette = replace(cassette, mode=cassette_mode)
+    config.stash[CASSETTE_CONFIG] = cassette
+
+    schedule = ScheduleConfig.from_env()
+    schedule_mode = config.getoption("schedule")
+    if schedule_mode:
+        schedule = replace(schedule, mode=schedule_mode)
+    config.stash[TEST_SCHEDULE] = schedule
+
+    local_api = config.getoption("local_api") or (
+        os.getenv("BOOKS_API_LOCAL", "false").lower() == "true"
+    )
+    config.stash[LOCAL_API] = local_api
+
+    if hasattr(config, "workerinput"):
+        return
+
+    # Workers each save their own file; drop those of an earlier recording
+    if cassette.mode == "record":
+        for path in cassette.files():
+            path.unlink()
+
+    baseline = BaselineConfig.from_env()
+    baseline_mode = config.getoption("latency_baseline")
+    if baseline_mode:
+        baseline = replace(baseline, mode=baseline_mode)
+    config.stash[LATENCY_BASELINE] = baseline
+
+    if not local_api:
+        return
+
+    from src.server.http_server import LocalApiServer
+
+    server = LocalApiServer()
+    os.environ["BOOKS_API_BASE_URL"] = server.start()
+    os.environ.setdefault("API_VERSION", "v1")
+    os.environ.setdefault("BOOKS_API_ENDPOINT", "Books")
+    os.environ.setdefault("AUTHORS_API_ENDPOINT", "Authors")
+    config.stash[LOCAL_API_SERVER] = server
+    reload_settings()
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """
+    Close the shared HTTP/2 connections and stop the local stand-in server.
+    """
+    from src.clients.transport import close_http2_transports
+
+    close_http2_transports()
+    server = config.stash.get(LOCAL_API_SERVER, None)
+    if server is not None:
+        server.stop()
+
+
+def _xdist_group(item: pytest.Item) -> Optional[str]:
+    """
+    Return the name pytest-xdist groups a test by, None if ungrouped.
+    """
+    names = {
+        str(mark.args[0] if mark.args else mark.kwargs.get("name", "default"))
+        for mark in item.iter_markers("xdist_group")
+    }
+    return "_".join(sorted(names)) if names else None
+
+
+def _expect_service_defects(items: list[pytest.Item]) -> None:
+    """
+    Mark tests checking a known defect of the public service as xfail.
+
+    The stand-in reproduces those defects, which makes the tests fail
+    there. Whether they fail can also depend on records created by tests
+    run earlier, so an unexpected pass is not an error.
+    """
+    for item in items:
+        marker = item.get_closest_marker("service_defect")
+        if marker is not None:
+            reason = marker.args[0] if marker.args else marker.kwargs.get("reason", "")
+            item.add_marker(pytest.mark.xfail(reason=f"Service defect: {reason}"))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """
+    Select a shard of the tests and order them by recorded duration.
+
+    Runs after marker deselection. A shard holds a share of the tests of
+    similar total duration; tests of one xdist group stay in one shard.
+    Under pytest-xdist in "duration" mode the longest tests are sent to
+    the workers first. Every worker computes the same order from the same
+    durations file, as pytest-xdist requires.
+
+    Against the local stand-in, tests marked `service_defect` are expected
+    to fail.
+    """
+    if config.stash[LOCAL_API]:
+        _expect_service_defects(items)
+
+    schedule = config.stash[TEST_SCHEDULE]
+    shard = config.getoption("shard")
+    reorder = schedule.mode == "duration" and hasattr(config, "workerinput")
+    if shard is None and not reorder:
+        return
+
+    units = work_units(
+        [(item.nodeid, _xdist_group(item)) for item in items],
+        load_durations(schedule.path),
+    )
+    if shard is not None:
+        index, count = shard
+        selected = {id(unit) for unit in lpt_partition(units, count)[index - 1]}
+        deselected = [
+            items[position]
+            for unit in units
+            if id(unit) not in selected
+            for position in unit.indices
+        ]
+        units = [unit for unit in units if id(unit) in selected]
+        config.hook.pytest_deselected(items=deselected)
+    if reorder:
+        units = longest_first(units)
+
+    items[:] = [items[position] for unit in units for position in unit.indices]
+
+
+def pytest_itemcollected(item: pytest.Item) -> None:
+    """
+    Remember every collected test, for pruning durations of removed tests.
+
+    pytest-xdist workers collect the tests and hand them to the controller.
+    """
+    COLLECTED.add(base_nodeid(item.nodeid))
+
+
+def pytest_runtest_logreport(report: pytest.TestReport) -> None:
+    """
+    Add up setup, call and teardown time of each test.
+
+    Reports of pytest-xdist workers are replayed on the controller, so the
+    controller sees the durations of all tests.
+    """
+    nodeid = base_nodeid(report.nodeid)
+    RUN_DURATIONS[nodeid] = RUN_DURATIONS.get(nodeid, 0.0) + report.duration
+
+
+def pytest_html_results_summary(prefix: list[str], session: pytest.Session) -> None:
+    """
+    Add per-endpoint request latency and payload bytes summaries to the
+    HTML report.
+    """
+    for table in (latency_recorder.format_html(), byte_accounting.format_html()):
+        if table:
+            prefix.append(table)
+
+    comparisons = session.config.stash.get(LATENCY_COMPARISON, [])
+    if comparisons:
+        prefix.append(
+            format_comparison_html(comparisons, session.config.stash[LATENCY_BASELINE])
+        )
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """
+    Persist test durations and request latencies of the session and check
+    latencies for regressions.
+
+    A pytest-xdist worker hands its latencies over to the controller instead,
+    which merges them before this hook runs there. Every run with
+    latencies is saved under the baseline history directory; in "update"
+    mode it also becomes the new baseline, in "compare" mode a significant
+    regression fails the session.
+    """
+    from src.clients.resilience import resilience_metrics
+
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["latency"] = latency_recorder.to_dict()
+        workeroutput["resilience"] = resilience_metrics.to_dict()
+        workeroutput["bytes"] = byte_accounting.to_dict()
+        workeroutput["conditional"] = dict(CONDITIONAL_STATS)
+        workeroutput["collected"] = sorted(COLLECTED)
+        return
+
+    schedule = session.config.stash[TEST_SCHEDULE]
+    if schedule.mode != "off" and RUN_DURATIONS:
+        # Tests selected by node ID leave the rest of their module uncollected
+        partial = any("::" in arg for arg in session.config.args)
+        save_durations(
+            merge_durations(
+                load_durations(schedule.path),
+                RUN_DURATIONS,
+                collected=None if partial else COLLECTED,
+                root=session.config.rootpath,
+            ),
+            schedule.path,
+        )
+
+    config = session.config.stash.get(LATENCY_BASELINE, None)
+    latencies = latency_recorder.to_dict()
+    if config is None or not latencies["endpoints"]:
+        return
+
+    save_history(latencies, config)
+
+    if config.mode == "update":
+        save_latencies(latencies, config.path)
+    elif config.mode == "compare":
+        baseline = load_latencies(config.path)
+        if baseline is None:
+            logging.warning("Latency baseline %s not found.", config.path)
+            return
+        comparisons = compare_latencies(
+            baseline, histograms_from_dict(latencies), config
+        )
+        session.config.stash[LATENCY_COMPARISON] = comparisons
+        if session.exitstatus == pytest.ExitCode.OK and any(
+            item.regressed for item in comparisons
+        ):
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    """
+    Report payload bytes per endpoint, conditional GETs answered with 304,
+    retried and short-circuited requests and endpoints whose latency
+    regressed against the baseline.
+    """
+    from src.clients.resilience import resilience_metrics
+
+    lines = byte_accounting.format_lines()
+    if lines:
+        terminalreporter.section("http payload bytes")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    revalidated = CONDITIONAL_STATS["hits"] + CONDITIONAL_STATS["misses"]
+    if revalidated:
+        terminalreporter.section("conditional requests")
+        terminalreporter.write_line(
+            f"hits: {CONDITIONAL_STATS['hits']}, "
+            f"misses: {CONDITIONAL_STATS['misses']} "
+            f"({CONDITIONAL_STATS['hits'] / revalidated:.0%} not modified)"
+        )
+
+    totals = resilience_metrics.totals()
+    if any(totals.values()):
+        terminalreporter.section("http resilience")
+        terminalreporter.write_line(
+            ", ".join(f"{event}: {count}" for event, count in totals.items()),
+            yellow=True,
+        )
+
+    comparisons = config.stash.get(LATENCY_COMPARISON, [])
+    if not comparisons:
+        return
+
+    baseline = config.stash[LATENCY_BASELINE]
+    regressions = [item for item in comparisons if item.regressed]
+    terminalreporter.section("latency baseline")
+    terminalreporter.write_line(
+        f"{len(comparisons)} endpoint(s) compared at p{baseline.percentile:g} "
+        f"against {baseline.path} (tolerance {baseline.tolerance:+.0%})"
+    )
+    for item in regressions:
+        terminalreporter.write_line(f"REGRESSED {item}", red=True)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node: Any) -> None:
+    """
+    Merge request latencies, resilience metrics, payload bytes,
+    conditional request counts and collected tests of a finished
+    pytest-xdist worker.
+    """
+    from src.clients.resilience import resilience_metrics
+
+    workeroutput = getattr(node, "workeroutput", {})
+    latency = workeroutput.get("latency")
+    if latency:
+        latency_recorder.merge(latency)
+    resilience = workeroutput.get("resilience")
+    if resilience:
+        resilience_metrics.merge(resilience)
+    payload_bytes = workeroutput.get("bytes")
+    if payload_bytes:
+        byte_accounting.merge(payload_bytes)
+    CONDITIONAL_STATS.update(workeroutput.get("conditional", {}))
+    COLLECTED.update(workeroutput.get("collected", []))
+
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_call(item: pytest.Function) -> Generator[None, None, None]:
@@ -26,49 +454,312 @@ def pytest_runtest_call(item: pytest.Function) -> Generator[None, None, None]:
     logger.info(">>>>>> Test End: %s <<<<<<\n\n\n", item.nodeid)
 
 
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(
+    item: pytest.Item,
+) -> Generator[None, pytest.TestReport, pytest.TestReport]:
+    """
+    Write buffered payloads of failed tests to the session log.
+    """
+    report = yield
+    capture = item.config.stash.get(PAYLOAD_CAPTURE, None)
+
+    if capture is not None:
+        if report.failed:
+            capture.release()
+        elif report.when == "teardown":
+            capture.discard()
+
+    return report
+
+
 @pytest.fixture(scope="session", autouse=True)
-def logging_session() -> Generator[None, None, None]:
+def logging_session(pytestconfig: pytest.Config) -> Generator[None, None, None]:
     """
     Setup and teardown logging for the entire test session.
-    All test logs are combined into a single file.
+    All test logs are combined into a single file, written by a background
+    thread so that logging does not block the tests.
+
+    Request and response payloads are only written for failed tests unless
+    verbose payload logging is selected.
     """
     session_date = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = LOG_DIR / f"{session_date}_test_session.log"
+    worker_suffix = "" if WORKER_ID == "master" else f"_{WORKER_ID}"
+    log_file = LOG_DIR / f"{session_date}_test_session{worker_suffix}.log"
 
     logger = logging.getLogger()
     logger.handlers.clear()  # Clear existing handlers
 
-    file_handler = logging.FileHandler(log_file, mode="a")
     formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
-    file_handler.setFormatter(formatter)
+    log_pipeline = LogPipeline(log_file, formatter)
+    log_pipeline.start()
 
     logger.setLevel(logging.INFO)
-    logger.addHandler(file_handler)
+    logger.addHandler(log_pipeline.handler)
+
+    payload_config = PayloadLogConfig.from_env()
+    payload_mode = pytestconfig.getoption("payload_log")
+    if payload_mode:
+        payload_config = replace(payload_config, mode=payload_mode)
+
+    pytestconfig.stash[PAYLOAD_CAPTURE] = configure_payload_logging(
+        payload_config, target=log_pipeline.handler
+    )
 
     yield
 
+    pytestconfig.stash[PAYLOAD_CAPTURE] = None
     logger.handlers.clear()
+    log_pipeline.stop()
+
+
+@pytest.fixture(scope="session", name="compiled_schemas")
+def fixture_compiled_schemas() -> None:
+    """
+    Compile all response model schemas once for the entire test session.
+    """
+    from src.models.authors_models import AuthorModels
+    from src.models.books_models import BookModels
+    from src.utils.schema_registry import schema_registry
+
+    schema_registry.register_models(AuthorModels, BookModels)
+
+
+@pytest.fixture(scope="session", name="http_session_pool")
+def fixture_http_session_pool() -> Generator["SessionPool", None, None]:
+    """
+    Create HTTP session pool shared by all API clients.
+
+    Yields:
+        SessionPool instance
+    """
+    from src.clients.base_client import BaseClient
+
+    pool = BaseClient.create_pool()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session", name="http_response_cache")
+def fixture_http_response_cache() -> Optional["ResponseCache"]:
+    """
+    Create GET response cache shared by all API clients.
+
+    Returns:
+        ResponseCache instance, or None unless HTTP_CACHE_ENABLED is true
+    """
+    from src.clients.base_client import BaseClient
+
+    return BaseClient.create_cache()
+
+
+def _count_validator_stats(validators: Optional["ValidatorCache"]) -> None:
+    """
+    Add the hits and misses of a validator cache to the run's counts.
+    """
+    if validators is not None:
+        CONDITIONAL_STATS.update(hits=validators.hits, misses=validators.misses)
+
+
+@pytest.fixture(scope="session", name="http_validator_cache")
+def fixture_http_validator_cache() -> Generator[Optional["ValidatorCache"], None, None]:
+    """
+    Create validator cache for conditional GETs shared by all API clients.
+
+    Yields:
+        ValidatorCache instance, or None unless HTTP_CONDITIONAL_ENABLED is
+        true
+    """
+    from src.clients.base_client import BaseClient
+
+    validators = BaseClient.create_validator_cache()
+    yield validators
+    _count_validator_stats(validators)
+
+
+@pytest.fixture(scope="session", name="http_cassette")
+def fixture_http_cassette(
+    pytestconfig: pytest.Config,
+) -> Generator[Optional["Cassette"], None, None]:
+    """
+    Create cassette shared by all API clients.
+
+    A recording cassette is saved at the end of the session, one file per
+    pytest-xdist worker.
+
+    Yields:
+        Cassette instance, or None unless --cassette (CASSETTE_MODE) is set
+    """
+    from src.clients.base_client import BaseClient
+
+    config = pytestconfig.stash[CASSETTE_CONFIG]
+    cassette = BaseClient.create_cassette(config)
+    yield cassette
+
+    if cassette is not None and cassette.recording:
+        worker_suffix = "" if WORKER_ID == "master" else f"_{WORKER_ID}"
+        cassette.save(config.directory / f"{config.name}{worker_suffix}.jsonl.gz")
+
+
+@pytest.fixture(autouse=True)
+def cassette_scope(request: pytest.FixtureRequest) -> None:
+    """
+    Scope cassette recordings to the running test.
+    """
+    if request.config.stash[CASSETTE_CONFIG].mode == "off":
+        return
+    cassette: Optional["Cassette"] = request.getfixturevalue("http_cassette")
+    if cassette is not None:
+        cassette.scope = request.node.nodeid
 
 
 @pytest.fixture(scope="session")
-def books_api_client() -> Generator[BooksClient, None, None]:
+def books_api_client(
+    http_session_pool: "SessionPool",
+    http_response_cache: Optional["ResponseCache"],
+    http_validator_cache: Optional["ValidatorCache"],
+    http_cassette: Optional["Cassette"],
+    compiled_schemas: None,  # pylint: disable=unused-argument
+) -> Generator["BooksClient", None, None]:
     """
     Create Books API client for testing.
 
     Yields:
         BooksAPIClient instance
     """
-    client = BooksClient()
+    from src.clients.books_client import BooksClient
+
+    client = BooksClient(
+        pool=http_session_pool,
+        cache=http_response_cache,
+        cassette=http_cassette,
+        validators=http_validator_cache,
+    )
+    yield client
+
+
+@pytest.fixture
+def conditional_books_client(
+    http_session_pool: "SessionPool",
+    http_cassette: Optional["Cassette"],
+    compiled_schemas: None,  # pylint: disable=unused-argument
+) -> Generator["BooksClient", None, None]:
+    """
+    Create Books API client sending conditional GETs, with an empty
+    validator cache of its own and no response cache.
+
+    Yields:
+        BooksClient instance
+    """
+    from src.clients.books_client import BooksClient
+    from src.clients.validator_cache import ValidatorCache, ValidatorConfig
+
+    validators = ValidatorCache(ValidatorConfig(enabled=True))
+    # Every GET has to reach the service, even with HTTP_CACHE_ENABLED
+    client = BooksClient(
+        pool=http_session_pool,
+        cassette=http_cassette,
+        validators=validators,
+        cache_enabled=False,
+    )
     yield client
+    _count_validator_stats(validators)
 
 
 @pytest.fixture(scope="session")
-def authors_api_client() -> Generator[AuthorsClient, None, None]:
+def authors_api_client(
+    http_session_pool: "SessionPool",
+    http_response_cache: Optional["ResponseCache"],
+    http_validator_cache: Optional["ValidatorCache"],
+    http_cassette: Optional["Cassette"],
+    compiled_schemas: None,  # pylint: disable=unused-argument
+) -> Generator["AuthorsClient", None, None]:
     """
     Create Authors API client for testing.
 
     Yields:
         AuthorsClient instance
     """
-    client = AuthorsClient()
+    from src.clients.authors_client import AuthorsClient
+
+    client = AuthorsClient(
+        pool=http_session_pool,
+        cache=http_response_cache,
+        cassette=http_cassette,
+        validators=http_validator_cache,
+    )
+    yield client
+
+
+@pytest.fixture
+def conditional_authors_client(
+    http_session_pool: "SessionPool",
+    http_cassette: Optional["Cassette"],
+    compiled_schemas: None,  # pylint: disable=unused-argument
+) -> Generator["AuthorsClient", None, None]:
+    """
+    Create Authors API client sending conditional GETs, with an empty
+    validator cache of its own and no response cache.
+
+    Yields:
+        AuthorsClient instance
+    """
+    from src.clients.authors_client import AuthorsClient
+    from src.clients.validator_cache import ValidatorCache, ValidatorConfig
+
+    validators = ValidatorCache(ValidatorConfig(enabled=True))
+    # Every GET has to reach the service, even with HTTP_CACHE_ENABLED
+    client = AuthorsClient(
+        pool=http_session_pool,
+        cassette=http_cassette,
+        validators=validators,
+        cache_enabled=False,
+    )
     yield client
+    _count_validator_stats(validators)
+
+
+@pytest.fixture(scope="session", name="id_allocator")
+def fixture_id_allocator() -> IdAllocator:
+    """
+    Create allocator of record IDs owned by this test worker.
+
+    Returns:
+        IdAllocator instance
+    """
+    return IdAllocator.for_worker(WORKER_ID)
+
+
+@pytest.fixture
+def new_book_data(id_allocator: IdAllocator) -> dict[str, Any]:
+    """
+    Sample book data with an ID no other test or worker uses.
+
+    Returns:
+        Fresh copy of BooksData.sample_book_data
+    """
+    return {**BooksData.sample_book_data, "id": id_allocator.next_id()}
+
+
+@pytest.fixture
+def new_author_data(id_allocator: IdAllocator) -> dict[str, Any]:
+    """
+    Sample author data with an ID no other test or worker uses.
+
+    Returns:
+        Fresh copy of AuthorsData.sample_author_data
+    """
+    return {**AuthorsData.sample_author_data, "id": id_allocator.next_id()}
+
+
+@pytest.fixture(scope="session")
+def data_factory(id_allocator: IdAllocator) -> DataFactory:
+    """
+    Create synthetic data factory drawing IDs from this worker's block.
+
+    Returns:
+        DataFactory seeded with TEST_DATA_SEED (default 0)
+    """
+    return DataFactory(
+        seed=int(os.getenv("TEST_DATA_SEED", "0")), next_id=id_allocator.next_id
+    )
@@ -0,0 +1,188 @@
+"""
+Tests for the asyncio Books and Authors clients.
+"""
+
+import asyncio
+from typing import Generator
+import httpx
+import pytest
+from src.clients.async_authors_client import AsyncAuthorsClient
+from src.clients.async_base_client import AsyncBaseClient
+from src.clients.async_books_client import AsyncBooksClient
+from src.clients.cassette import Cassette, CassetteMismatchError
+from src.clients.compression import CompressionConfig
+from src.config.settings import Settings
+from src.server.http_server import LocalApiServer
+from src.utils.byte_accounting import byte_accounting
+
+
+@pytest.fixture(name="server")
+def fixture_server() -> Generator[LocalApiServer, None, None]:
+    """
+    Running local API server holding every response back briefly.
+    """
+    with LocalApiServer(delay=0.05) as server:
+        yield server
+
+
+@pytest.mark.unit
+class TestAsyncClients:
+    """
+    Test suite for AsyncBaseClient, AsyncBooksClient and AsyncAuthorsClient.
+    """
+
+    def test_concurrency_is_bounded(self, server: LocalApiServer) -> None:
+        """
+        Test that no more than max_concurrency requests are in flight, even
+        on a connection pool allowing more.
+        """
+
+        # Arrange
+        async def fetch() -> list[httpx.Response]:
+            http_client = AsyncBaseClient.create_http_client(max_connections=10)
+            client = AsyncBooksClient(
+                max_concurrency=2,
+                http_client=http_client,
+                settings=Settings(base_url=server.base_url),
+            )
+            try:
+                return await client.get_books_by_ids(range(1, 7))
+            finally:
+                await http_client.aclose()
+
+        # Act
+        responses = asyncio.run(fetch())
+
+        # Assert
+        assert [response.status_code for response in responses] == [200] * 6
+        assert server.connections == 2
+
+    def test_client_is_reused_across_event_loops(self, server: LocalApiServer) -> None:
+        """
+        Test that a client serves several `asyncio.run` calls, each with
+        requests waiting for the concurrency limit.
+        """
+
+        # Arrange
+        client = AsyncBooksClient(
+            max_concurrency=1, settings=Settings(base_url=server.base_url)
+        )
+
+        async def fetch() -> list[int]:
+            async with client:
+                responses = await client.get_books_by_ids([1, 2, 3])
+            return [response.status_code for response in responses]
+
+        # Act
+        statuses = [asyncio.run(fetch()) for _ in range(2)]
+
+        # Assert
+        assert statuses == [[200, 200, 200]] * 2
+        assert server.connections == 2
+
+    def test_gather_keeps_input_order(self, server: LocalApiServer) -> None:
+        """
+        Test that fan-out results line up with their inputs, failed
+        statuses included.
+        """
+
+        # Arrange
+        async def fetch() -> tuple[list[httpx.Response], list[httpx.Response]]:
+            settings = Settings(base_url=server.base_url)
+            async with AsyncBooksClient(settings=settings) as books_client:
+                books = await books_client.get_books_by_ids([5, 999_999, 1, 3])
+            async with AsyncAuthorsClient(settings=settings) as authors_client:
+                authors = await authors_client.get_authors_by_book_ids([2, 1])
+            return books, authors
+
+        # Act
+        books, authors = asyncio.run(fetch())
+
+        # Assert
+        assert [response.status_code for response in books] == [200, 404, 200, 200]
+        assert [books[index].json()["id"] for index in (0, 2, 3)] == [5, 1, 3]
+        assert [
+            {author["idBook"] for author in response.json()} for response in authors
+        ] == [{2}, {1}]
+
+    def test_connection_errors_propagate(self) -> None:
+        """
+        Test that a request failing to connect raises out of gather.
+        """
+
+        # Arrange
+        with LocalApiServer() as stopped:
+            base_url = stopped.base_url
+
+        async def fetch() -> list[httpx.Response]:
+            settings = Settings(base_url=base_url)
+            async with AsyncBooksClient(settings=settings, timeout=5) as client:
+                return await client.get_books_by_ids([1, 2])
+
+        # Act / Assert
+        with pytest.raises(httpx.ConnectError):
+            asyncio.run(fetch())
+
+    def test_requests_are_timed_compressed_and_accounted(
+        self, server: LocalApiServer
+    ) -> None:
+        """
+        Test that responses carry their timing, request bodies are
+        compressed and payload bytes are recorded.
+        """
+
+        # Arrange
+        byte_accounting.clear()
+        compression = CompressionConfig(request_encoding="gzip", min_request_bytes=1)
+
+        async def exchange() -> tuple[httpx.Response, httpx.Response]:
+            settings = Settings(base_url=server.base_url)
+            async with AsyncBooksClient(
+                settings=settings, compression=compression
+            ) as client:
+                created = await client.create_book({"id": 3_000_000, "title": title})
+                return created, await client.get_all_books()
+
+        title = "Asynchronous " * 20
+
+        # Act
+        created, listed = asyncio.run(exchange())
+
+        # Assert
+        assert created.json()["title"] == title
+        assert listed.headers["Content-Encoding"] == "gzip"
+        assert listed.timing.ttfb is not None  # type: ignore[attr-defined]
+        counts = byte_accounting.snapshot()
+        post = counts[("POST", "/api/v1/Books")]
+        get = counts[("GET", "/api/v1/Books")]
+        assert post.sent_wire < post.sent_decoded
+        assert get.received_wire < get.received_decoded == len(listed.content)
+        byte_accounting.clear()
+
+    def test_cassette_records_and_replays(self, server: LocalApiServer) -> None:
+        """
+        Test that recorded exchanges are replayed without the service,
+        with decoded bodies and their timing.
+        """
+
+        # Arrange
+        cassette = Cassette()
+
+        async def get_twice(base_url: str) -> tuple[httpx.Response, httpx.Response]:
+            settings = Settings(base_url=base_url)
+            async with AsyncBooksClient(settings=settings, cassette=cassette) as client:
+                return await client.get_book_by_id(1), await client.get_all_books()
+
+        recorded = asyncio.run(get_twice(server.base_url))
+        cassette.mode = "replay"
+
+        # Act
+        replayed = asyncio.run(get_twice("http://bookstore.invalid"))
+
+        # Assert
+        assert [response.json() for response in replayed] == [
+            response.json() for response in recorded
+        ]
+        assert replayed[1].timing.ttfb is not None  # type: ignore[attr-defined]
+        with pytest.raises(CassetteMismatchError):
+            asyncio.run(get_twice("http://bookstore.invalid"))
@@ -0,0 +1,92 @@
+"""
+Tests for bulk API operations.
+"""
+
+import threading
+import time
+import pytest
+import requests
+from src.clients.bulk import run_bulk
+
+
+def _response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = "OK" if status_code == 200 else "Bad Request"
+    return response
+
+
+@pytest.mark.unit
+class TestRunBulk:
+    """
+    Test suite for run_bulk.
+    """
+
+    def test_reports_partial_failures(self) -> None:
+        """
+        Test that failing items are reported without stopping the others.
+        """
+
+        # Arrange
+        def call(item: int) -> requests.Response:
+            if item == 3:
+                raise requests.ConnectionError("connection reset")
+            return _response(400 if item % 5 == 0 else 200)
+
+        # Act
+        result = run_bulk(range(20), call, key=lambda item: item, concurrency=4)
+
+        # Assert
+        assert sorted(result.succeeded) == [
+            item for item in range(20) if item % 5 and item != 3
+        ]
+        assert {failure.key for failure in result.failures} == {0, 3, 5, 10, 15}
+        assert not result.ok
+        assert result.total == 20
+
+    def test_concurrency_is_bounded(self) -> None:
+        """
+        Test that no more than `concurrency` calls run at the same time.
+        """
+
+        # Arrange
+        lock = threading.Lock()
+        running, peak = 0, 0
+
+        def call(_: int) -> requests.Response:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return _response(200)
+
+        # Act
+        result = run_bulk(range(40), call, key=lambda item: item, concurrency=4)
+
+        # Assert
+        assert result.ok
+        assert peak == 4
+
+    def test_progress_is_reported(self) -> None:
+        """
+        Test that progress is reported periodically and at the end.
+        """
+
+        # Arrange
+        reports: list[tuple[int, int | None]] = []
+
+        # Act
+        run_bulk(
+            list(range(25)),
+            lambda _: _response(200),
+            key=lambda item: item,
+            progress=lambda done, total: reports.append((done, total)),
+            total=25,
+            progress_every=10,
+        )
+
+        # Assert
+        assert reports == [(10, 25), (20, 25), (25, 25)]
@@ -0,0 +1,75 @@
+"""
+Tests for per-endpoint payload byte accounting.
+"""
+
+import pytest
+from src.utils.byte_accounting import ByteAccounting, ByteCounts, format_bytes
+
+
+@pytest.mark.unit
+class TestByteAccounting:
+    """
+    Test suite for ByteAccounting.
+    """
+
+    def test_records_group_by_method_and_route(self) -> None:
+        """
+        Test that requests to the same route add up.
+        """
+
+        # Arrange
+        accounting = ByteAccounting()
+
+        # Act
+        accounting.record("get", "/api/v1/Books/1", ByteCounts(1, 0, 0, 100, 400))
+        accounting.record("GET", "/api/v1/Books/2", ByteCounts(1, 0, 0, 100, 400))
+        accounting.record("PUT", "/api/v1/Books/2", ByteCounts(1, 50, 200, 10, 10))
+
+        # Assert
+        snapshot = accounting.snapshot()
+        assert snapshot[("GET", "/api/v1/Books/{id}")] == ByteCounts(2, 0, 0, 200, 800)
+        assert snapshot[("GET", "/api/v1/Books/{id}")].ratio == 4.0
+        assert accounting.totals() == ByteCounts(3, 50, 200, 210, 810)
+
+    def test_merge_combines_serialized_accounting(self) -> None:
+        """
+        Test that counts from other processes can be merged.
+        """
+
+        # Arrange
+        worker = ByteAccounting()
+        worker.record("GET", "/api/v1/Authors", ByteCounts(1, 0, 0, 1000, 5000))
+        controller = ByteAccounting()
+        controller.record("GET", "/api/v1/Authors", ByteCounts(1, 0, 0, 1000, 5000))
+
+        # Act
+        controller.merge(worker.to_dict())
+
+        # Assert
+        assert controller.snapshot() == {
+            ("GET", "/api/v1/Authors"): ByteCounts(2, 0, 0, 2000, 10000)
+        }
+
+    def test_formats_summary(self) -> None:
+        """
+        Test that the terminal and HTML summaries list every endpoint and
+        the totals.
+        """
+
+        # Arrange
+        accounting = ByteAccounting()
+        accounting.record("GET", "/api/v1/Books", ByteCounts(1, 0, 0, 2048, 8192))
+        accounting.record("DELETE", "/api/v1/Books/1", ByteCounts(1, 0, 0, 0, 0))
+
+        # Act
+        lines = accounting.format_lines()
+        html = accounting.format_html()
+
+        # Assert
+        assert lines[0].startswith("method")
+        assert lines[1].split()[:3] == ["GET", "/api/v1/Books", "1"]
+        assert lines[2].split()[-1] == "-"
+        assert lines[-1].startswith("ALL") and lines[-1].endswith("4.0x")
+        assert '<table id="payload-bytes">' in html and "8.0 KiB" in html
+        assert ByteAccounting().format_lines() == []
+        assert format_bytes(1536) == "1.5 KiB"
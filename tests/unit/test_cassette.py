@@ -0,0 +1,127 @@
+"""
+Tests for cassette record and replay.
+"""
+
+from dataclasses import replace
+from pathlib import Path
+import pytest
+from src.clients.books_client import BooksClient
+from src.clients.cassette import (
+    Cassette,
+    CassetteMismatchError,
+    body_hash,
+)
+from src.clients.request_timing import request_timing
+from src.clients.session_pool import PoolConfig, SessionPool
+from src.config.settings import Settings
+from src.server.http_server import LocalApiServer
+
+# Replay never contacts the service
+SETTINGS = Settings(base_url="http://bookstore.invalid")
+
+
+@pytest.fixture(name="recorded_cassette")
+def fixture_recorded_cassette(tmp_path: Path) -> Path:
+    """
+    Record a short session against the local server and save it.
+
+    Returns:
+        Path of the cassette file
+    """
+    cassette = Cassette()
+    cassette.scope = "test_scope"
+    with LocalApiServer() as server:
+        client = BooksClient(
+            pool=SessionPool(PoolConfig()),
+            cassette=cassette,
+            settings=replace(SETTINGS, base_url=server.base_url),
+        )
+
+        client.get_book_by_id(1)
+        client.update_book(1, {"id": 1, "title": "Recorded", "pageCount": 1})
+        client.get_book_by_id(1)
+        list(client.iter_all_books())
+
+    path = tmp_path / "cassettes" / "session.jsonl.gz"
+    cassette.save(path)
+    return path
+
+
+@pytest.mark.unit
+class TestCassette:
+    """
+    Test suite for Cassette.
+    """
+
+    def test_replays_recordings_in_order(self, recorded_cassette: Path) -> None:
+        """
+        Test that repeated requests are answered with their recordings in order.
+        """
+
+        # Arrange
+        cassette = Cassette.load([recorded_cassette])
+        cassette.scope = "test_scope"
+        client = BooksClient(cassette=cassette, settings=SETTINGS)
+
+        # Act
+        before = client.get_book_by_id(1)
+        updated = client.update_book(1, {"pageCount": 1, "title": "Recorded", "id": 1})
+        after = client.get_book_by_id(1)
+
+        # Assert
+        assert before.status_code == updated.status_code == after.status_code == 200
+        assert before.json()["title"] != "Recorded"
+        assert after.json()["title"] == "Recorded"
+        assert request_timing(after).ttfb is not None
+        with pytest.raises(CassetteMismatchError, match="occurrence 3"):
+            client.get_book_by_id(1)
+
+    def test_replays_streamed_response(self, recorded_cassette: Path) -> None:
+        """
+        Test that a recorded array can be streamed from the cassette.
+        """
+
+        # Arrange
+        cassette = Cassette.load([recorded_cassette])
+        cassette.scope = "test_scope"
+        client = BooksClient(cassette=cassette, settings=SETTINGS)
+
+        # Act
+        books = list(client.iter_all_books())
+
+        # Assert
+        assert len(books) == 200
+        assert books[0]["id"] == 1
+
+    @pytest.mark.parametrize(
+        "scope, body",
+        [
+            ("test_scope", {"id": 1, "title": "Changed", "pageCount": 1}),
+            ("other_scope", {"id": 1, "title": "Recorded", "pageCount": 1}),
+        ],
+    )
+    def test_detects_request_mismatch(
+        self, recorded_cassette: Path, scope: str, body: dict
+    ) -> None:
+        """
+        Test that a changed body or a different test does not match.
+        """
+
+        # Arrange
+        cassette = Cassette.load([recorded_cassette])
+        cassette.scope = scope
+        client = BooksClient(cassette=cassette, settings=SETTINGS)
+
+        # Act / Assert
+        with pytest.raises(CassetteMismatchError, match="PUT"):
+            client.update_book(1, body)
+
+    def test_body_hash_ignores_key_order(self) -> None:
+        """
+        Test that equal JSON bodies hash equally.
+        """
+
+        # Assert
+        assert body_hash({"a": 1, "b": [1, 2]}) == body_hash({"b": [1, 2], "a": 1})
+        assert body_hash({"a": 1}) != body_hash({"a": 2})
+        assert body_hash(None) == ""
@@ -0,0 +1,187 @@
+"""
+Tests for compression negotiation between the API clients and the local
+server.
+"""
+
+import gzip
+from typing import Generator
+import pytest
+from src.clients import base_client
+from src.clients.books_client import BooksClient
+from src.clients.compression import CompressionConfig, decompress, encode_body
+from src.config.settings import Settings
+from src.server import content_coding
+from src.server.app import FakeRestApi
+from src.server.http_server import LocalApiServer, handle_request
+from src.utils.byte_accounting import ByteAccounting
+
+
+@pytest.fixture(name="server")
+def fixture_server() -> Generator[LocalApiServer, None, None]:
+    """
+    Running local API server.
+    """
+    with LocalApiServer() as server:
+        yield server
+
+
+@pytest.fixture(name="accounting")
+def fixture_accounting(monkeypatch: pytest.MonkeyPatch) -> ByteAccounting:
+    """
+    Byte accounting of the clients, isolated from the session-wide one.
+    """
+    accounting = ByteAccounting()
+    monkeypatch.setattr(base_client, "byte_accounting", accounting)
+    return accounting
+
+
+@pytest.mark.unit
+class TestCompression:
+    """
+    Test suite for request and response compression.
+    """
+
+    def test_config_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that compression is configured from environment and validated.
+        """
+
+        # Arrange
+        monkeypatch.setenv("HTTP_ACCEPT_ENCODING", "gzip;q=1.0, identity;q=0.5")
+        monkeypatch.setenv("HTTP_REQUEST_COMPRESSION", "GZIP")
+
+        # Act
+        config = CompressionConfig.from_env()
+
+        # Assert
+        assert config.accept_encoding_header == "gzip;q=1.0, identity;q=0.5"
+        assert config.request_encoding == "gzip"
+        assert "gzip" in CompressionConfig().accept_encoding_header
+        with pytest.raises(ValueError, match="compress"):
+            CompressionConfig(accept_encoding="gzip, compress")
+        with pytest.raises(ValueError, match="HTTP_REQUEST_COMPRESSION"):
+            CompressionConfig(request_encoding="br")
+
+    def test_request_bodies_compressed_above_threshold(self) -> None:
+        """
+        Test that only request bodies reaching the threshold are compressed.
+        """
+
+        # Arrange
+        config = CompressionConfig(request_encoding="deflate", min_request_bytes=100)
+
+        # Act
+        small = encode_body({"id": 1}, config)
+        large = encode_body({"title": "x" * 1000}, config)
+
+        # Assert
+        assert small == (b'{"id": 1}', 9, None)
+        assert large[2] == "deflate" and len(large[0] or b"") < large[1]
+        assert (
+            decompress(large[0] or b"", "deflate")
+            == b'{"title": "' + (b"x" * 1000) + b'"}'
+        )
+        with pytest.raises(ValueError):
+            encode_body({"value": float("nan")}, config)
+
+    @pytest.mark.parametrize(
+        "accept_encoding, expected",
+        [
+            ("gzip, deflate", "gzip"),
+            ("deflate, gzip;q=0.5", "deflate"),
+            ("br, *;q=0.1", "gzip"),
+            ("gzip;q=0, deflate;q=0", None),
+            ("identity", None),
+        ],
+    )
+    def test_server_negotiates_coding(
+        self, accept_encoding: str, expected: str
+    ) -> None:
+        """
+        Test that the server picks the accepted coding of highest quality.
+        """
+
+        # Act
+        coding = content_coding.preferred_coding(accept_encoding)
+
+        # Assert
+        assert coding == expected
+
+    def test_server_rejects_undecodable_bodies(self) -> None:
+        """
+        Test that request bodies the server cannot decode get a 415.
+        """
+
+        # Arrange
+        app = FakeRestApi()
+        body = gzip.compress(b'{"id": 500, "title": "Gzipped"}')
+        gzipped = {"content-encoding": "gzip"}
+
+        # Act
+        created = handle_request(app, "POST", "/api/v1/Books", body, gzipped)
+        corrupt = handle_request(app, "POST", "/api/v1/Books", b"{}", gzipped)
+        unknown = handle_request(
+            app, "POST", "/api/v1/Books", body, {"content-encoding": "br"}
+        )
+
+        # Assert
+        assert created.status == 200
+        assert (corrupt.status, unknown.status) == (415, 415)
+
+    @pytest.mark.parametrize("accept_encoding", ["gzip", "deflate", "identity"])
+    def test_client_accounts_wire_and_decoded_bytes(
+        self,
+        server: LocalApiServer,
+        accounting: ByteAccounting,
+        accept_encoding: str,
+    ) -> None:
+        """
+        Test that responses are negotiated per client and their wire and
+        decoded sizes are recorded.
+        """
+
+        # Arrange
+        client = BooksClient(
+            settings=Settings(base_url=server.base_url),
+            compression=CompressionConfig(accept_encoding=accept_encoding),
+        )
+
+        # Act
+        response = client.get_all_books()
+        streamed = list(client.iter_all_books())
+
+        # Assert
+        counts = accounting.snapshot()[("GET", "/api/v1/Books")]
+        assert streamed == response.json()
+        assert counts.requests == 2
+        assert counts.received_decoded == 2 * len(response.content)
+        if accept_encoding == "identity":
+            assert "content-encoding" not in response.headers
+            assert counts.received_wire == counts.received_decoded
+        else:
+            assert response.headers["content-encoding"] == accept_encoding
+            assert counts.received_wire * 4 < counts.received_decoded
+
+    def test_client_compresses_request_bodies(
+        self, server: LocalApiServer, accounting: ByteAccounting
+    ) -> None:
+        """
+        Test that compressed request bodies are accepted by the server and
+        accounted before and after compression.
+        """
+
+        # Arrange
+        client = BooksClient(
+            settings=Settings(base_url=server.base_url),
+            compression=CompressionConfig(request_encoding="gzip"),
+        )
+        book = {"id": 700, "title": "Compressed", "description": "lorem " * 500}
+
+        # Act
+        created = client.create_book(book)
+
+        # Assert
+        counts = accounting.snapshot()[("POST", "/api/v1/Books")]
+        assert created.status_code == 200
+        assert client.get_book_by_id(700).json()["description"] == book["description"]
+        assert counts.sent_wire * 10 < counts.sent_decoded
@@ -0,0 +1,91 @@
+"""
+Tests for the synthetic data factory.
+"""
+
+import itertools
+import pytest
+from src.data.data_factory import DataFactory, FieldSizes, SizeDistribution
+from src.server.app import FakeRestApi
+from src.server.store import DataStore, dumps
+
+
+@pytest.mark.unit
+class TestDataFactory:
+    """
+    Test suite for DataFactory.
+    """
+
+    def test_same_seed_streams_same_records(self) -> None:
+        """
+        Test that generation is deterministic for a seed.
+        """
+
+        # Act
+        first = [record.data for record in DataFactory(seed=7).books(100)]
+        second = [record.data for record in DataFactory(seed=7).books(100)]
+        other = [record.data for record in DataFactory(seed=8).books(100)]
+
+        # Assert
+        assert first == second
+        assert first != other
+
+    def test_streams_lazily(self) -> None:
+        """
+        Test that an endless stream yields records on demand.
+        """
+
+        # Act
+        records = list(itertools.islice(DataFactory().books(), 5))
+
+        # Assert
+        assert [record.data["id"] for record in records] == [1, 2, 3, 4, 5]
+
+    def test_field_sizes_follow_distribution(self) -> None:
+        """
+        Test that text fields respect the configured length bounds.
+        """
+
+        # Arrange
+        sizes = FieldSizes(title=SizeDistribution(50, 0.5, 10, 60))
+        factory = DataFactory(sizes=sizes)
+
+        # Act
+        lengths = [len(record.data["title"]) for record in factory.books(500)]
+
+        # Assert
+        assert all(10 <= length <= 60 for length in lengths)
+        assert 40 <= sorted(lengths)[250] <= 60
+
+    def test_payloads_are_accepted_or_rejected_by_the_api(self) -> None:
+        """
+        Test that valid payloads are stored and defective ones rejected.
+        """
+
+        # Arrange
+        api = FakeRestApi(DataStore(seed=False))
+        factory = DataFactory(seed=1)
+
+        # Act
+        records = list(factory.books(200, invalid_rate=0.3))
+        statuses = [
+            api.handle("POST", "/api/v1/Books", dumps(record.data)).status
+            for record in records
+        ]
+
+        # Assert
+        assert any(not record.valid for record in records)
+        for record, status in zip(records, statuses):
+            assert status == (200 if record.valid else 400), record.defect
+
+    def test_authors_reference_generated_books(self) -> None:
+        """
+        Test that authors of the catalog link to their book.
+        """
+
+        # Act
+        catalog = list(DataFactory(seed=2).catalog(20, per_book=(1, 3)))
+
+        # Assert
+        for book, authors in catalog:
+            assert 1 <= len(authors) <= 3
+            assert all(author["idBook"] == book["id"] for author in authors)
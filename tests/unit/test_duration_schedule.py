@@ -0,0 +1,208 @@
+"""
+Tests for duration based test ordering and sharding.
+"""
+
+from pathlib import Path
+from typing import Optional
+import pytest
+from src.utils.duration_schedule import (
+    ScheduleConfig,
+    WorkUnit,
+    base_nodeid,
+    load_durations,
+    longest_first,
+    lpt_partition,
+    merge_durations,
+    parse_shard,
+    save_durations,
+    work_units,
+)
+
+
+@pytest.mark.unit
+class TestDurationSchedule:
+    """
+    Test suite for duration based scheduling.
+    """
+
+    @pytest.mark.parametrize(
+        "nodeid, expected",
+        [
+            ("tests/test_a.py::test_x", "tests/test_a.py::test_x"),
+            ("tests/test_a.py::test_x[1]@fixed_ids", "tests/test_a.py::test_x[1]"),
+            ("tests/test_a.py::test_x[a@b]", "tests/test_a.py::test_x[a@b]"),
+        ],
+    )
+    def test_base_nodeid(self, nodeid: str, expected: str) -> None:
+        """
+        Test that only the xdist group suffix is stripped.
+        """
+
+        # Assert
+        assert base_nodeid(nodeid) == expected
+
+    @pytest.mark.parametrize("value", ["0/3", "4/3", "3", "a/b"])
+    def test_parse_shard_rejects_invalid(self, value: str) -> None:
+        """
+        Test that shard selections outside 1..COUNT are rejected.
+        """
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+    def test_durations_round_trip_and_merge(self, tmp_path: Path) -> None:
+        """
+        Test that durations are smoothed and tests not run are kept.
+        """
+
+        # Arrange
+        path = save_durations({"a": 1.0, "b": 2.0}, tmp_path / "durations.json")
+
+        # Act
+        merged = merge_durations(load_durations(path), {"a": 3.0, "c": 0.5})
+
+        # Assert
+        assert merged == {"a": 2.0, "b": 2.0, "c": 0.5}
+        assert not load_durations(tmp_path / "missing.json")
+
+    def test_merge_drops_stale_tests(self, tmp_path: Path) -> None:
+        """
+        Test that removed tests and tests of deleted modules are dropped,
+        while uncollected modules keep theirs.
+        """
+
+        # Arrange
+        for module in ("test_a.py", "test_b.py"):
+            (tmp_path / module).touch()
+        previous = {
+            "test_a.py::kept": 1.0,
+            "test_a.py::renamed": 1.0,
+            "test_b.py::not_collected": 1.0,
+            "test_gone.py::deleted": 1.0,
+        }
+        collected = {"test_a.py::kept", "test_a.py::deselected"}
+
+        # Act
+        merged = merge_durations(previous, {"test_a.py::kept": 3.0}, collected)
+        pruned = merge_durations(previous, {}, collected, root=tmp_path)
+        partial = merge_durations(previous, {}, None, root=tmp_path)
+
+        # Assert
+        assert merged == {
+            "test_a.py::kept": 2.0,
+            "test_b.py::not_collected": 1.0,
+            "test_gone.py::deleted": 1.0,
+        }
+        assert set(pruned) == {"test_a.py::kept", "test_b.py::not_collected"}
+        assert (
+            "test_a.py::renamed" in partial and "test_gone.py::deleted" not in partial
+        )
+
+    @pytest.mark.parametrize(
+        "ci, mode, expected",
+        [
+            ("", None, "off"),
+            ("true", None, "record"),
+            ("false", "", "off"),
+            ("true", "Duration", "duration"),
+            ("", "off", "off"),
+        ],
+    )
+    def test_config_mode_from_env(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        ci: str,
+        mode: Optional[str],
+        expected: str,
+    ) -> None:
+        """
+        Test that durations are recorded by default on CI only.
+        """
+
+        # Arrange
+        monkeypatch.setenv("CI", ci)
+        if mode is None:
+            monkeypatch.delenv("TEST_SCHEDULE_MODE", raising=False)
+        else:
+            monkeypatch.setenv("TEST_SCHEDULE_MODE", mode)
+
+        # Act
+        config = ScheduleConfig.from_env()
+
+        # Assert
+        assert config.mode == expected
+
+    def test_config_rejects_unknown_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that a misspelled mode fails instead of being ignored.
+        """
+
+        # Arrange
+        monkeypatch.setenv("TEST_SCHEDULE_MODE", "durations")
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="TEST_SCHEDULE_MODE"):
+            ScheduleConfig.from_env()
+
+    def test_work_units_group_tests(self) -> None:
+        """
+        Test that grouped tests form one unit and unknown tests get the median.
+        """
+
+        # Arrange
+        tests = [("a", None), ("b", "fixed"), ("c", None), ("d@fixed", "fixed")]
+        durations = {"a": 1.0, "b": 2.0, "d": 4.0}
+
+        # Act
+        units = work_units(tests, durations)
+
+        # Assert
+        assert [(unit.name, unit.indices) for unit in units] == [
+            ("a", [0]),
+            ("@fixed", [1, 3]),
+            ("c", [2]),
+        ]
+        assert [unit.weight for unit in units] == [1.0, 6.0, 2.0]
+
+    def test_longest_first_keeps_ties_in_order(self) -> None:
+        """
+        Test that units are ordered by decreasing weight, stable on ties.
+        """
+
+        # Arrange
+        units = [
+            WorkUnit("a", [0], 1.0),
+            WorkUnit("b", [1], 3.0),
+            WorkUnit("c", [2], 1.0),
+        ]
+
+        # Act
+        ordered = longest_first(units)
+
+        # Assert
+        assert [unit.name for unit in ordered] == ["b", "a", "c"]
+
+    def test_lpt_partition_balances_shards(self) -> None:
+        """
+        Test that shards cover every unit once with balanced weights.
+        """
+
+        # Arrange
+        weights = [8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 2.0, 1.0]
+        units = [
+            WorkUnit(str(index), [index], weight)
+            for index, weight in enumerate(weights)
+        ]
+
+        # Act
+        shards = lpt_partition(units, 3)
+
+        # Assert
+        loads = [sum(unit.weight for unit in shard) for shard in shards]
+        positions = [unit.indices[0] for shard in shards for unit in shard]
+        assert sorted(positions) == list(range(len(weights)))
+        assert max(loads) - min(loads) <= 2.0
+        assert all(
+            shard == sorted(shard, key=lambda unit: unit.indices[0]) for shard in shards
+        )
@@ -0,0 +1,146 @@
+"""
+Tests for the local FakeRestAPI stand-in.
+"""
+
+import json
+import socket
+import pytest
+import requests
+from src.server.app import FakeRestApi
+from src.server.http_server import LocalApiServer
+
+
+@pytest.mark.unit
+class TestFakeRestApi:
+    """
+    Test suite for FakeRestApi request handling.
+    """
+
+    def test_get_seeded_book(self) -> None:
+        """
+        Test that seeded books are served by ID.
+        """
+
+        # Act
+        response = FakeRestApi().handle("GET", "/api/v1/Books/5")
+
+        # Assert
+        assert response.status == 200
+        assert json.loads(response.body)["pageCount"] == 500
+
+    @pytest.mark.parametrize(
+        "path, status",
+        [("/api/v1/Books/999999", 404), ("/api/v1/Books/abc", 400)],
+    )
+    def test_problem_details(self, path: str, status: int) -> None:
+        """
+        Test that errors are reported as problem+json bodies.
+        """
+
+        # Act
+        response = FakeRestApi().handle("GET", path)
+
+        # Assert
+        assert response.status == status
+        assert response.content_type is not None
+        assert response.content_type.startswith("application/problem+json")
+        assert json.loads(response.body)["status"] == status
+
+    def test_created_author_is_persisted(self) -> None:
+        """
+        Test that POST, GET by book and DELETE share the same state.
+        """
+
+        # Arrange
+        app = FakeRestApi()
+        author = {"idBook": 7, "firstName": "First", "lastName": "Last"}
+
+        # Act
+        created = json.loads(app.handle("POST", "/api/v1/Authors", _body(author)).body)
+        by_book = json.loads(app.handle("GET", "/api/v1/Authors/authors/books/7").body)
+        app.handle("DELETE", f"/api/v1/Authors/{created['id']}")
+
+        # Assert
+        assert created["id"] in [item["id"] for item in by_book]
+        assert app.handle("GET", f"/api/v1/Authors/{created['id']}").status == 404
+
+    def test_invalid_field_type_rejected(self) -> None:
+        """
+        Test that values not matching the model types are rejected.
+        """
+
+        # Act
+        response = FakeRestApi().handle(
+            "POST", "/api/v1/Books", _body({"id": None, "pageCount": 1})
+        )
+
+        # Assert
+        assert response.status == 400
+
+
+@pytest.mark.unit
+class TestLocalApiServer:
+    """
+    Test suite for LocalApiServer.
+    """
+
+    def test_serves_over_http(self) -> None:
+        """
+        Test that the server answers real HTTP requests with keep-alive.
+        """
+
+        # Arrange
+        with LocalApiServer() as server, requests.Session() as session:
+
+            # Act
+            responses = [
+                session.get(f"{server.base_url}/api/v1/Authors/{author_id}")
+                for author_id in (1, 2, 3)
+            ]
+
+        # Assert
+        assert [response.status_code for response in responses] == [200, 200, 200]
+        assert responses[0].reason == "OK"
+        assert "application/json" in responses[0].headers["Content-Type"]
+
+    @pytest.mark.parametrize("content_length", ["-5", "+5", "5x"])
+    def test_rejects_invalid_content_length(self, content_length: str) -> None:
+        """
+        Test that a Content-Length other than a plain digit string is
+        answered with 400 and the connection is closed.
+        """
+
+        # Arrange
+        request = (
+            "POST /api/v1/Books HTTP/1.1\r\nHost: local\r\n"
+            f"Content-Length: {content_length}\r\n\r\n{{}}"
+        ).encode("ascii")
+
+        with LocalApiServer() as server:
+            with socket.create_connection((server.host, server.port), 5) as client:
+
+                # Act
+                client.sendall(request)
+                reply = client.makefile("rb").read()
+
+        # Assert
+        assert reply.startswith(b"HTTP/1.1 400 ")
+
+    def test_start_raises_when_port_is_taken(self) -> None:
+        """
+        Test that start() reports a failure to listen instead of waiting
+        for the server forever.
+        """
+
+        # Arrange
+        with LocalApiServer() as running:
+            server = LocalApiServer(port=running.port)
+
+            # Act / Assert
+            with pytest.raises(OSError):
+                server.start()
+            server.stop()
+
+
+def _body(data: dict) -> bytes:
+    return json.dumps(data).encode("utf-8")
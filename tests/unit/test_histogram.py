@@ -0,0 +1,75 @@
+"""
+Tests for the latency histogram.
+"""
+
+import json
+import pytest
+from src.utils.histogram import LatencyHistogram
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """
+    Test suite for LatencyHistogram.
+    """
+
+    def test_percentiles_are_within_precision(self) -> None:
+        """
+        Test that percentiles stay within the bucket error bound.
+        """
+
+        # Arrange
+        histogram = LatencyHistogram()
+
+        # Act
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+
+        # Assert
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.016)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.016)
+        assert histogram.percentile(99.9) == pytest.approx(0.999, rel=0.016)
+        assert histogram.max == pytest.approx(1.0)
+        assert histogram.mean == pytest.approx(0.5005)
+
+    def test_merge_equals_recording_into_one(self) -> None:
+        """
+        Test that merged histograms report the same as a single histogram.
+        """
+
+        # Arrange
+        single, first, second = (
+            LatencyHistogram(),
+            LatencyHistogram(),
+            LatencyHistogram(),
+        )
+        for index in range(500):
+            value = (index * 37 % 997) / 10_000
+            single.record(value)
+            (first if index % 2 else second).record(value)
+
+        # Act
+        merged = LatencyHistogram.merged([first, second])
+
+        # Assert
+        assert merged.summary() == single.summary()
+        assert merged.min == single.min
+
+    def test_round_trips_through_json(self) -> None:
+        """
+        Test that serialized histograms deserialize unchanged.
+        """
+
+        # Arrange
+        histogram = LatencyHistogram()
+        histogram.record(0.0042, count=3)
+        histogram.record(1.5)
+
+        # Act
+        restored = LatencyHistogram.from_dict(
+            json.loads(json.dumps(histogram.to_dict()))
+        )
+
+        # Assert
+        assert restored.summary() == histogram.summary()
@@ -0,0 +1,71 @@
+"""
+Tests for parallel-safe record ID allocation.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.data.id_allocator import IdAllocator
+
+
+@pytest.mark.unit
+class TestIdAllocator:
+    """
+    Test suite for IdAllocator.
+    """
+
+    def test_workers_get_disjoint_blocks(self) -> None:
+        """
+        Test that IDs of different workers never overlap.
+        """
+
+        # Arrange
+        first = IdAllocator.for_worker("gw0")
+        second = IdAllocator.for_worker("gw1")
+
+        # Act
+        first_ids = {first.next_id() for _ in range(100)}
+        second_ids = {second.next_id() for _ in range(100)}
+
+        # Assert
+        assert not first_ids & second_ids
+        assert all(record_id in first for record_id in first_ids)
+        assert not any(record_id in first for record_id in second_ids)
+
+    def test_ids_are_unique_across_threads(self) -> None:
+        """
+        Test that concurrent callers never receive the same ID.
+        """
+
+        # Arrange
+        allocator = IdAllocator.for_worker("master")
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(lambda _: allocator.next_id(), range(1000)))
+
+        # Assert
+        assert len(set(ids)) == 1000
+
+    def test_ids_fit_api_integer_range(self) -> None:
+        """
+        Test that blocks beyond the Int32 ID range are rejected.
+        """
+
+        # Act / Assert
+        assert IdAllocator(worker_index=200).stop - 1 < 2**31
+        with pytest.raises(ValueError):
+            IdAllocator(worker_index=300)
+
+    def test_exhausted_block_raises(self) -> None:
+        """
+        Test that an allocator never hands out IDs of the next block.
+        """
+
+        # Arrange
+        allocator = IdAllocator(block_size=2)
+        allocator.next_id()
+        allocator.next_id()
+
+        # Act / Assert
+        with pytest.raises(RuntimeError):
+            allocator.next_id()
@@ -0,0 +1,134 @@
+"""
+Tests for incremental JSON array parsing.
+"""
+
+import json
+from typing import Any, Iterator
+import pytest
+import requests
+from src.clients.books_client import BooksClient
+from src.config.settings import Settings
+from src.server.http_server import LocalApiServer
+from src.utils.byte_accounting import byte_accounting
+from src.utils.json_stream import iter_json_array
+from src.utils.latency_metrics import latency_recorder
+
+DOCUMENT = [
+    {"id": 1, "title": "Pražský ✓", "tags": [1, 2.5e3, None, True]},
+    12345,
+    -0.5,
+    "text",
+    [],
+    {},
+    False,
+]
+
+
+def _chunks(body: bytes, size: int) -> Iterator[bytes]:
+    return (body[index : index + size] for index in range(0, len(body), size))
+
+
+@pytest.mark.unit
+class TestIterJsonArray:
+    """
+    Test suite for iter_json_array.
+    """
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 65536])
+    def test_any_chunking_yields_same_elements(self, chunk_size: int) -> None:
+        """
+        Test that elements split across chunks are parsed correctly.
+        """
+
+        # Arrange
+        body = json.dumps(DOCUMENT, indent=1).encode("utf-8")
+
+        # Act
+        items = list(iter_json_array(_chunks(body, chunk_size)))
+
+        # Assert
+        assert items == DOCUMENT
+
+    def test_elements_are_yielded_before_the_body_ends(self) -> None:
+        """
+        Test that the first element is available before the rest arrives.
+        """
+
+        # Arrange
+        def chunks() -> Iterator[bytes]:
+            yield b'[{"id": 1}, '
+            raise AssertionError("Read past the first element")
+
+        # Act
+        first = next(iter_json_array(chunks()))
+
+        # Assert
+        assert first == {"id": 1}
+
+    @pytest.mark.parametrize(
+        "body", [b"", b"{}", b"[", b"[1,", b"[1 2]", b"[1,]", b"[1] x", b"[tru"]
+    )
+    def test_malformed_body_raises(self, body: bytes) -> None:
+        """
+        Test that malformed arrays are rejected.
+        """
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            list(iter_json_array(_chunks(body, 1)))
+
+    def test_abandoned_client_stream_is_recorded(self) -> None:
+        """
+        Test that a client stream left after its first element still
+        records its latency and the bytes read so far.
+        """
+
+        # Arrange
+        latency_recorder.clear()
+        byte_accounting.clear()
+        key = ("GET", "/api/v1/Books")
+
+        with LocalApiServer() as server:
+            client = BooksClient(settings=Settings(base_url=server.base_url))
+            books = client.iter_all_books()
+
+            # Act
+            first = next(books)
+            books.close()
+
+        # Assert
+        assert first["id"] == 1
+        assert latency_recorder.snapshot()[key].count == 1
+        assert byte_accounting.snapshot()[key].received_decoded > 0
+        latency_recorder.clear()
+        byte_accounting.clear()
+
+    def test_failed_client_stream_is_closed_and_recorded(self) -> None:
+        """
+        Test that a stream with an error status is closed and still
+        records its latency.
+        """
+
+        # Arrange
+        latency_recorder.clear()
+        key = ("GET", "/api/v1/Books/{id}")
+
+        with LocalApiServer() as server:
+            client = BooksClient(settings=Settings(base_url=server.base_url))
+            responses: list[requests.Response] = []
+            get_stream = client.get_stream
+
+            def capture(endpoint: str, params: Any = None) -> requests.Response:
+                responses.append(get_stream(endpoint, params))
+                return responses[-1]
+
+            client.get_stream = capture  # type: ignore[method-assign]
+
+            # Act
+            with pytest.raises(requests.HTTPError):
+                next(client.stream_items("/api/v1/Books/999999"))
+
+        # Assert
+        assert responses[0].raw.closed
+        assert latency_recorder.snapshot()[key].count == 1
+        latency_recorder.clear()
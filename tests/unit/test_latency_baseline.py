@@ -0,0 +1,170 @@
+"""
+Tests for latency baselines and regression detection.
+"""
+
+from pathlib import Path
+import random
+import pytest
+from src.utils.histogram import LatencyHistogram
+from src.utils.latency_baseline import (
+    BaselineConfig,
+    EndpointKey,
+    binomial_tail,
+    compare_latencies,
+    load_latencies,
+    save_history,
+    save_latencies,
+)
+from src.utils.latency_metrics import LatencyRecorder
+
+ENDPOINT: EndpointKey = ("GET", "/api/v1/Books/{id}")
+
+
+def sample_latencies(
+    seed: int, count: int, scale: float = 1.0
+) -> dict[EndpointKey, LatencyHistogram]:
+    """
+    Record log-normal latencies around 20 ms multiplied by `scale`.
+    """
+    rng = random.Random(seed)
+    histogram = LatencyHistogram()
+    for _ in range(count):
+        histogram.record(rng.lognormvariate(-3.9, 0.3) * scale)
+    return {ENDPOINT: histogram}
+
+
+@pytest.mark.unit
+class TestLatencyBaseline:
+    """
+    Test suite for latency baseline comparison.
+    """
+
+    def test_flags_significant_slowdown(self) -> None:
+        """
+        Test that a 2x slowdown under the absolute threshold is a regression.
+        """
+
+        # Arrange
+        baseline = sample_latencies(seed=1, count=500)
+        current = sample_latencies(seed=2, count=500, scale=2.0)
+
+        # Act
+        comparison = compare_latencies(baseline, current, BaselineConfig())[0]
+
+        # Assert
+        assert comparison.regressed
+        assert comparison.ratio == pytest.approx(2.0, rel=0.15)
+        assert comparison.p_value < 1e-6
+
+    def test_same_distribution_does_not_regress(self) -> None:
+        """
+        Test that another run of an unchanged service passes.
+        """
+
+        # Arrange
+        baseline = sample_latencies(seed=1, count=500)
+        current = sample_latencies(seed=3, count=500)
+
+        # Act
+        comparison = compare_latencies(baseline, current, BaselineConfig())[0]
+
+        # Assert
+        assert not comparison.regressed
+        assert comparison.ratio == pytest.approx(1.0, abs=0.15)
+
+    def test_slowdown_within_tolerance_passes(self) -> None:
+        """
+        Test that a significant increase below the tolerance passes.
+        """
+
+        # Arrange
+        baseline = sample_latencies(seed=1, count=5000)
+        current = sample_latencies(seed=2, count=5000, scale=1.1)
+
+        # Act
+        comparison = compare_latencies(
+            baseline, current, BaselineConfig(tolerance=0.2)
+        )[0]
+
+        # Assert
+        assert comparison.p_value < 0.01
+        assert not comparison.regressed
+
+    def test_skips_endpoints_with_few_samples(self) -> None:
+        """
+        Test that endpoints below the sample minimum are not compared.
+        """
+
+        # Arrange
+        baseline = sample_latencies(seed=1, count=500)
+        current = sample_latencies(seed=2, count=10, scale=3.0)
+
+        # Act
+        comparisons = compare_latencies(baseline, current, BaselineConfig())
+
+        # Assert
+        assert not comparisons
+
+    def test_binomial_tail(self) -> None:
+        """
+        Test binomial upper tail against exact values.
+        """
+
+        # Arrange / Act / Assert
+        assert binomial_tail(0, 10, 0.05) == 1.0
+        assert binomial_tail(11, 10, 0.05) == 0.0
+        assert binomial_tail(10, 10, 0.5) == pytest.approx(0.5**10)
+        assert binomial_tail(1, 10, 0.05) == pytest.approx(1 - 0.95**10)
+
+    def test_round_trips_recorder_through_file(self, tmp_path: Path) -> None:
+        """
+        Test that saved recorder histograms load back unchanged.
+        """
+
+        # Arrange
+        recorder = LatencyRecorder()
+        for millis in range(1, 101):
+            recorder.record("GET", "/api/v1/Books/7", millis / 1000)
+        path = tmp_path / "baselines" / "latency_baseline.json"
+
+        # Act
+        save_latencies(recorder.to_dict(), path)
+        loaded = load_latencies(path)
+
+        # Assert
+        assert loaded is not None
+        assert loaded[ENDPOINT].summary() == recorder.snapshot()[ENDPOINT].summary()
+        assert load_latencies(tmp_path / "missing.json") is None
+
+    def test_config_rejects_unknown_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that a misspelled mode fails instead of disabling the check.
+        """
+
+        # Arrange
+        monkeypatch.setenv("LATENCY_BASELINE_MODE", "Compare")
+        assert BaselineConfig.from_env().mode == "compare"
+        monkeypatch.setenv("LATENCY_BASELINE_MODE", "comapre")
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="LATENCY_BASELINE_MODE"):
+            BaselineConfig.from_env()
+
+    def test_history_keeps_latest_runs(self, tmp_path: Path) -> None:
+        """
+        Test that saving a run drops the oldest runs beyond the limit.
+        """
+
+        # Arrange
+        config = BaselineConfig(history_dir=tmp_path, history_limit=2)
+        for run_date in ("20250101_000000", "20250102_000000", "20250103_000000"):
+            (tmp_path / f"{run_date}_latency.json").write_text("{}", encoding="utf-8")
+
+        # Act
+        saved = save_history(LatencyRecorder().to_dict(), config)
+
+        # Assert
+        assert sorted(tmp_path.iterdir()) == [
+            tmp_path / "20250103_000000_latency.json",
+            saved,
+        ]
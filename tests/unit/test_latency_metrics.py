@@ -0,0 +1,71 @@
+"""
+Tests for per-endpoint latency metrics.
+"""
+
+import pytest
+from src.utils.latency_metrics import LatencyRecorder, endpoint_template
+
+
+@pytest.mark.unit
+class TestLatencyRecorder:
+    """
+    Test suite for LatencyRecorder.
+    """
+
+    @pytest.mark.parametrize(
+        "endpoint, expected",
+        [
+            ("/api/v1/Books/12", "/api/v1/Books/{id}"),
+            ("api/v1/Books/-1?x=1", "/api/v1/Books/{id}"),
+            ("/api/v1/Authors/authors/books/7", "/api/v1/Authors/authors/books/{id}"),
+            ("/api/v1/Authors", "/api/v1/Authors"),
+        ],
+    )
+    def test_endpoint_template_collapses_ids(
+        self, endpoint: str, expected: str
+    ) -> None:
+        """
+        Test that record IDs are collapsed into a route template.
+        """
+
+        # Act
+        template = endpoint_template(endpoint)
+
+        # Assert
+        assert template == expected
+
+    def test_records_group_by_method_and_route(self) -> None:
+        """
+        Test that requests to the same route share one histogram.
+        """
+
+        # Arrange
+        recorder = LatencyRecorder()
+
+        # Act
+        recorder.record("get", "/api/v1/Books/1", 0.010)
+        recorder.record("GET", "/api/v1/Books/2", 0.020)
+        recorder.record("DELETE", "/api/v1/Books/2", 0.030)
+
+        # Assert
+        snapshot = recorder.snapshot()
+        assert snapshot[("GET", "/api/v1/Books/{id}")].count == 2
+        assert snapshot[("DELETE", "/api/v1/Books/{id}")].count == 1
+
+    def test_merge_combines_serialized_recorders(self) -> None:
+        """
+        Test that recorders from other processes can be merged.
+        """
+
+        # Arrange
+        worker, controller = LatencyRecorder(), LatencyRecorder()
+        worker.record("GET", "/api/v1/Books", 0.010)
+        controller.record("GET", "/api/v1/Books", 0.030)
+
+        # Act
+        controller.merge(worker.to_dict())
+
+        # Assert
+        histogram = controller.snapshot()[("GET", "/api/v1/Books")]
+        assert histogram.count == 2
+        assert "latency-summary" in controller.format_html()
@@ -0,0 +1,131 @@
+"""
+Tests for the open-loop load engine.
+"""
+
+from concurrent.futures import Future
+import random
+import threading
+import time
+from unittest.mock import Mock
+import pytest
+import requests
+from src.clients.authors_client import AuthorsClient
+from src.clients.books_client import BooksClient
+from src.load import engine as load_engine
+from src.load.engine import LoadEngine, Operation
+from src.load.operations import read_operations
+
+
+def _response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+@pytest.mark.unit
+class TestLoadEngine:
+    """
+    Test suite for LoadEngine.
+    """
+
+    def test_issues_requests_at_target_rate(self) -> None:
+        """
+        Test that the engine offers the configured load and counts errors.
+        """
+
+        # Arrange
+        statuses = iter([200, 500] * 1000)
+        lock = threading.Lock()
+
+        def call() -> requests.Response:
+            with lock:
+                return _response(next(statuses))
+
+        engine = LoadEngine([Operation("GET /x", call)], rate=200, duration=0.5)
+
+        # Act
+        report = engine.run()
+
+        # Assert
+        stats = report.stats["GET /x"]
+        assert stats.requests == 100
+        assert stats.error_rate == pytest.approx(0.5)
+        assert stats.errors == {"500": 50}
+
+    def test_latency_includes_queueing_behind_slow_requests(self) -> None:
+        """
+        Test that latency is measured from the intended start time.
+        """
+
+        # Arrange
+        def slow_call() -> requests.Response:
+            time.sleep(0.05)
+            return _response(200)
+
+        engine = LoadEngine(
+            [Operation("GET /slow", slow_call)], rate=100, duration=0.2, workers=1
+        )
+
+        # Act
+        report = engine.run()
+
+        # Assert
+        stats = report.stats["GET /slow"]
+        assert stats.service_time.percentile(50) < 0.1
+        assert stats.latency.max > 0.5
+
+    def test_completed_requests_are_released(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that the engine only keeps futures of requests still in flight.
+        """
+
+        # Arrange
+        monkeypatch.setattr(load_engine, "PRUNE_MIN_FUTURES", 16)
+        pending = LoadEngine._pending  # pylint: disable=protected-access
+        kept: list[int] = []
+
+        def spy(futures: list[Future[None]]) -> list[Future[None]]:
+            remaining = pending(futures)
+            kept.append(len(remaining))
+            return remaining
+
+        monkeypatch.setattr(LoadEngine, "_pending", staticmethod(spy))
+        engine = LoadEngine(
+            [Operation("GET /x", lambda: _response(200))],
+            rate=2000,
+            duration=0.25,
+            workers=4,
+        )
+
+        # Act
+        report = engine.run()
+
+        # Assert
+        assert report.stats["GET /x"].requests == 500
+        assert len(kept) >= 10
+        assert max(kept) < 100
+
+    def test_operations_draw_ids_from_given_generator(self) -> None:
+        """
+        Test that a seeded generator makes the requested IDs reproducible.
+        """
+
+        # Arrange
+        def requested_ids(seed: int) -> list[int]:
+            books_client = Mock(spec=BooksClient)
+            operations = read_operations(
+                books_client, Mock(spec=AuthorsClient), rng=random.Random(seed)
+            )
+            get_book = next(op for op in operations if op.name == "GET /Books/{id}")
+            for _ in range(20):
+                get_book.call()
+            return [call.args[0] for call in books_client.get_book_by_id.call_args_list]
+
+        # Act
+        first, second, other = requested_ids(7), requested_ids(7), requested_ids(8)
+
+        # Assert
+        assert first == second != other
+        assert all(1 <= book_id <= 200 for book_id in first)
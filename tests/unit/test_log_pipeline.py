@@ -0,0 +1,64 @@
+"""
+Tests for the queue based session log pipeline.
+"""
+
+import logging
+from pathlib import Path
+import pytest
+from src.utils.log_pipeline import LogPipeline, LogPipelineConfig
+
+
+@pytest.mark.unit
+class TestLogPipeline:
+    """
+    Test suite for LogPipeline.
+    """
+
+    def test_records_written_on_stop(self, tmp_path: Path) -> None:
+        """
+        Test that every queued record reaches the log file.
+        """
+
+        # Arrange
+        log_file = tmp_path / "session.log"
+        pipeline = LogPipeline(
+            log_file, logging.Formatter("%(message)s"), LogPipelineConfig()
+        )
+        logger = logging.getLogger("test.pipeline")
+        logger.propagate = False
+        logger.addHandler(pipeline.handler)
+
+        # Act
+        pipeline.start()
+        for index in range(1000):
+            logger.warning("line %s", index)
+        pipeline.stop()
+        logger.removeHandler(pipeline.handler)
+
+        # Assert
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert lines == [f"line {index}" for index in range(1000)]
+
+    def test_rotated_files_compressed(self, tmp_path: Path) -> None:
+        """
+        Test that rotated log files are gzipped.
+        """
+
+        # Arrange
+        log_file = tmp_path / "session.log"
+        config = LogPipelineConfig(max_bytes=1024, backup_count=2, compress=True)
+        pipeline = LogPipeline(log_file, logging.Formatter("%(message)s"), config)
+        logger = logging.getLogger("test.pipeline.rotation")
+        logger.propagate = False
+        logger.addHandler(pipeline.handler)
+
+        # Act
+        pipeline.start()
+        for index in range(500):
+            logger.warning("line %s", index)
+        pipeline.stop()
+        logger.removeHandler(pipeline.handler)
+
+        # Assert
+        assert (tmp_path / "session.log.1.gz").exists()
+        assert not (tmp_path / "session.log.3.gz").exists()
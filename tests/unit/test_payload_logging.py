@@ -0,0 +1,130 @@
+"""
+Tests for bounded, lazily rendered payload logging.
+"""
+
+import logging
+import pytest
+from src.utils import payload_logging
+from src.utils.payload_logging import FailureCaptureHandler, Payload, PayloadLogConfig
+
+
+class FakeResponse:
+    """
+    Minimal stand-in exposing a response body.
+    """
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+
+class RecordingHandler(logging.Handler):
+    """
+    Handler keeping formatted messages in memory.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@pytest.mark.unit
+class TestPayload:
+    """
+    Test suite for Payload rendering.
+    """
+
+    @pytest.fixture(autouse=True)
+    def small_size_cap(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Use a small size cap for every test.
+        """
+        monkeypatch.setattr(payload_logging, "_config", PayloadLogConfig(max_chars=100))
+
+    def test_response_body_truncated(self) -> None:
+        """
+        Test that large response bodies are cut to the size cap.
+        """
+
+        # Act
+        rendered = str(Payload(FakeResponse(b"x" * 10_000)))
+
+        # Assert
+        assert rendered.startswith("x" * 100)
+        assert rendered.endswith("[truncated, 10000 bytes total]")
+
+    def test_small_payload_unchanged(self) -> None:
+        """
+        Test that payloads under the cap render as before.
+        """
+        assert str(Payload({"id": 1})) == "{'id': 1}"
+
+    def test_large_dict_bounded(self) -> None:
+        """
+        Test that nested data is rendered within the cap.
+        """
+
+        # Act
+        rendered = str(Payload({"items": list(range(100_000))}))
+
+        # Assert
+        assert len(rendered) < 200
+
+
+@pytest.mark.unit
+class TestFailureCaptureHandler:
+    """
+    Test suite for FailureCaptureHandler.
+    """
+
+    def test_release_and_discard(self) -> None:
+        """
+        Test that only released records reach the target handler.
+        """
+
+        # Arrange
+        target = RecordingHandler()
+        capture = FailureCaptureHandler(target, capacity=2)
+        logger = logging.getLogger("test.capture")
+        logger.propagate = False
+        logger.addHandler(capture)
+
+        # Act
+        logger.warning("passed %s", 1)
+        capture.discard()
+        for index in range(3):
+            logger.warning("failed %s", index)
+        capture.release()
+        logger.removeHandler(capture)
+
+        # Assert
+        assert target.messages == ["failed 1", "failed 2"]
+
+    def test_buffered_payload_keeps_logged_state(self) -> None:
+        """
+        Test that data mutated after logging is released as it was logged,
+        while response bodies stay unrendered until released.
+        """
+
+        # Arrange
+        target = RecordingHandler()
+        capture = FailureCaptureHandler(target)
+        logger = logging.getLogger("test.capture.frozen")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(capture)
+        data = {"id": 1, "title": "Before"}
+
+        # Act
+        logger.info("data %s", Payload(data))
+        logger.info("body %s", Payload(FakeResponse(b"[]")))
+        data["title"] = "After"
+        buffered = [record.args for record in capture.buffer]
+        capture.release()
+        logger.removeHandler(capture)
+
+        # Assert
+        assert target.messages == ["data {'id': 1, 'title': 'Before'}", "body []"]
+        assert isinstance(buffered[1], tuple) and isinstance(buffered[1][0], Payload)
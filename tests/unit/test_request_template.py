@@ -0,0 +1,110 @@
+"""
+Tests for the request template fast path.
+"""
+
+from typing import Any, Optional
+import pytest
+import requests
+from src.clients.request_template import RequestTemplate
+
+BASE_URL = "http://bookstore.test:8080"
+
+
+@pytest.fixture(name="session")
+def fixture_session() -> requests.Session:
+    """
+    Session configured the way the API clients configure theirs.
+    """
+    session = requests.Session()
+    session.headers.update(
+        {"Content-Type": "application/json", "Accept": "application/json"}
+    )
+    return session
+
+
+@pytest.mark.unit
+class TestRequestTemplate:
+    """
+    Test suite for RequestTemplate.
+    """
+
+    @pytest.mark.parametrize(
+        "method, endpoint, data, params, headers",
+        [
+            ("GET", "/api/v1/Books/1", None, None, None),
+            ("GET", "/api/v1/Books/!@# x", None, None, None),
+            ("GET", "api/v1/Books", None, {"page": 2, "tag": ["a", "b"]}, None),
+            ("POST", "/api/v1/Books", {"id": 1, "title": "Ü"}, None, None),
+            ("PUT", "/api/v1/Books/1", {"id": 1}, None, {"X-Trace": "abc"}),
+            ("DELETE", "/api/v1/Books/1", None, None, {"Accept": None}),
+        ],
+    )
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def test_matches_session_preparation(
+        self,
+        session: requests.Session,
+        method: str,
+        endpoint: str,
+        data: Optional[dict[str, Any]],
+        params: Optional[dict[str, Any]],
+        headers: Optional[dict[str, Any]],
+    ) -> None:
+        """
+        Test that the fast path sends what Session.request would send.
+        """
+
+        # Arrange
+        template = RequestTemplate.for_session(session, BASE_URL)
+        expected = session.prepare_request(
+            requests.Request(
+                method,
+                f"{BASE_URL}/{endpoint.lstrip('/')}",
+                json=data,
+                params=params or {},
+                headers=headers,
+            )
+        )
+
+        # Act
+        prepared = template.prepare(session, method, endpoint, data, params, headers)
+
+        # Assert
+        assert prepared.method == expected.method
+        assert prepared.url == expected.url
+        assert dict(prepared.headers) == dict(expected.headers)
+        assert prepared.body == expected.body
+
+    def test_sends_session_cookies(self, session: requests.Session) -> None:
+        """
+        Test that cookies of the session are sent.
+        """
+
+        # Arrange
+        session.cookies.set("token", "abc")
+        template = RequestTemplate.for_session(session, BASE_URL)
+
+        # Act
+        prepared = template.prepare(session, "GET", "/api/v1/Books")
+
+        # Assert
+        assert prepared.headers["Cookie"] == "token=abc"
+
+    def test_resolves_environment_once(
+        self, session: requests.Session, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that proxies are taken from the environment when the template is built.
+        """
+
+        # Arrange
+        monkeypatch.setenv("HTTP_PROXY", "http://proxy.test:3128")
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        monkeypatch.delenv("no_proxy", raising=False)
+
+        # Act
+        template = RequestTemplate.for_session(session, BASE_URL)
+        monkeypatch.delenv("HTTP_PROXY")
+
+        # Assert
+        assert template.send_kwargs["proxies"]["http"] == "http://proxy.test:3128"
+        assert template.url_prefix == BASE_URL
@@ -0,0 +1,144 @@
+"""
+Tests for the per-request timing breakdown.
+"""
+
+import copy
+import pytest
+import requests
+from src.clients.request_timing import (
+    RequestTiming,
+    TimingAdapter,
+    request_timing,
+)
+from src.server.http_server import LocalApiServer
+from src.utils.validators import validate_timing_phase, validate_ttfb
+
+
+@pytest.fixture(name="timed_session")
+def fixture_timed_session() -> requests.Session:
+    """
+    Session sending requests through the timing adapter.
+    """
+    session = requests.Session()
+    session.mount("http://", TimingAdapter())
+    return session
+
+
+@pytest.mark.unit
+class TestRequestTiming:
+    """
+    Test suite for TimingAdapter and RequestTiming.
+    """
+
+    def test_new_connection_reports_all_phases(
+        self, timed_session: requests.Session
+    ) -> None:
+        """
+        Test that the first request reports connection setup and body phases.
+        """
+
+        # Arrange
+        with LocalApiServer() as server:
+
+            # Act
+            response = timed_session.get(f"{server.base_url}/api/v1/Books")
+            response.json()
+
+        # Assert
+        timing = request_timing(response)
+        assert not timing.reused_connection
+        assert timing.tls is None
+        for phase in ("dns", "connect", "send", "ttfb", "transfer", "decode"):
+            value = timing.phases()[phase]
+            assert value is not None and value >= 0, phase
+        assert timing.total == pytest.approx(
+            sum(value for value in timing.phases().values() if value is not None)
+        )
+
+    def test_reused_connection_skips_setup(
+        self, timed_session: requests.Session
+    ) -> None:
+        """
+        Test that a keep-alive request reports no connection phases.
+        """
+
+        # Arrange
+        with LocalApiServer() as server:
+            timed_session.get(f"{server.base_url}/api/v1/Books/1")
+
+            # Act
+            response = timed_session.get(f"{server.base_url}/api/v1/Books/2")
+
+        # Assert
+        timing = request_timing(response)
+        assert timing.reused_connection
+        assert timing.dns is None
+        assert timing.ttfb is not None
+        assert timing.decode is None
+
+    def test_streamed_body_is_timed_when_read(
+        self, timed_session: requests.Session
+    ) -> None:
+        """
+        Test that transfer of a streamed body is booked once it is read.
+        """
+
+        # Arrange
+        with LocalApiServer() as server:
+            response = timed_session.get(
+                f"{server.base_url}/api/v1/Authors", stream=True
+            )
+            before = request_timing(response).transfer
+
+            # Act
+            response.json()
+
+        # Assert
+        assert before is None
+        assert request_timing(response).transfer is not None
+
+    def test_timing_survives_copy(self, timed_session: requests.Session) -> None:
+        """
+        Test that copied responses, e.g. from the response cache, keep timing.
+        """
+
+        # Arrange
+        with LocalApiServer() as server:
+            response = timed_session.get(f"{server.base_url}/api/v1/Books/1")
+
+        # Act
+        copied = copy.copy(response)
+
+        # Assert
+        assert request_timing(copied) == request_timing(response)
+
+    def test_validators(self, timed_session: requests.Session) -> None:
+        """
+        Test that timing validators pass within and fail beyond the limit.
+        """
+
+        # Arrange
+        with LocalApiServer() as server:
+            response = timed_session.get(f"{server.base_url}/api/v1/Books/1")
+
+        # Act / Assert
+        validate_ttfb(response, 5.0)
+        validate_timing_phase(response, "tls", 0.0)
+        with pytest.raises(AssertionError, match="total"):
+            validate_timing_phase(response, "total", 0.0)
+        with pytest.raises(ValueError):
+            request_timing(requests.Response())
+
+    def test_str_lists_measured_phases(self) -> None:
+        """
+        Test that only measured phases are rendered.
+        """
+
+        # Arrange
+        timing = RequestTiming(send=0.001, ttfb=0.0125)
+
+        # Act
+        text = str(timing)
+
+        # Assert
+        assert text == "send=1.00ms, ttfb=12.50ms"
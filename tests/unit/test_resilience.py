@@ -0,0 +1,262 @@
+"""
+Tests for retries and circuit breaking of API requests.
+"""
+
+import io
+import pytest
+import requests
+from src.clients import resilience
+from src.clients.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilienceConfig,
+    ResilienceMetrics,
+    ResiliencePolicy,
+)
+
+BASE_URL = "http://bookstore.test"
+
+
+def response(status: int, headers: dict[str, str] | None = None) -> requests.Response:
+    """
+    Build a response with a status code.
+    """
+    result = requests.Response()
+    result.status_code = status
+    result.raw = io.BytesIO(b"")
+    result.headers.update(headers or {})
+    return result
+
+
+class FlakySend:
+    """
+    Send function returning or raising queued outcomes, the last one repeatedly.
+    """
+
+    def __init__(self, *outcomes: requests.Response | Exception) -> None:
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def __call__(self) -> requests.Response:
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture(name="metrics", autouse=True)
+def fixture_metrics(monkeypatch: pytest.MonkeyPatch) -> ResilienceMetrics:
+    """
+    Metrics of the test only, kept out of the session-wide counts.
+    """
+    metrics = ResilienceMetrics()
+    monkeypatch.setattr(resilience, "resilience_metrics", metrics)
+    return metrics
+
+
+@pytest.fixture(name="sleeps")
+def fixture_sleeps() -> list[float]:
+    """
+    Delays the policy waited for.
+    """
+    return []
+
+
+@pytest.fixture(name="policy")
+def fixture_policy(sleeps: list[float]) -> ResiliencePolicy:
+    """
+    Policy recording its delays instead of sleeping, with maximal jitter.
+    """
+    return ResiliencePolicy(
+        ResilienceConfig(breaker_threshold=3), sleep=sleeps.append, jitter=lambda: 1.0
+    )
+
+
+@pytest.mark.unit
+class TestResiliencePolicy:
+    """
+    Test suite for ResiliencePolicy.
+    """
+
+    def test_retries_idempotent_request_with_backoff(
+        self, policy: ResiliencePolicy, sleeps: list[float], metrics: ResilienceMetrics
+    ) -> None:
+        """
+        Test that a GET is retried on 503 with growing delays.
+        """
+
+        # Arrange
+        send = FlakySend(response(503), response(503), response(200))
+
+        # Act
+        result = policy.execute("GET", BASE_URL, "/api/v1/Books/1", send)
+
+        # Assert
+        assert result.status_code == 200
+        assert send.calls == 3
+        assert sleeps == [0.1, 0.2]
+        assert metrics.totals()["retry"] == 2
+
+    def test_post_not_resent_after_reaching_server(
+        self, policy: ResiliencePolicy
+    ) -> None:
+        """
+        Test that a POST is neither retried on 503 nor on a read timeout.
+        """
+
+        # Arrange
+        unavailable = FlakySend(response(503))
+        read_timeout = FlakySend(requests.ReadTimeout(), response(200))
+
+        # Act
+        result = policy.execute("POST", BASE_URL, "/api/v1/Books", unavailable)
+        with pytest.raises(requests.ReadTimeout):
+            policy.execute("POST", BASE_URL, "/api/v1/Books", read_timeout)
+
+        # Assert
+        assert result.status_code == 503
+        assert unavailable.calls == read_timeout.calls == 1
+
+    def test_post_retried_when_never_sent(self, policy: ResiliencePolicy) -> None:
+        """
+        Test that a POST is retried when the connection was not established.
+        """
+
+        # Arrange
+        send = FlakySend(requests.ConnectTimeout(), response(201))
+
+        # Act
+        result = policy.execute("POST", BASE_URL, "/api/v1/Books", send)
+
+        # Assert
+        assert result.status_code == 201
+        assert send.calls == 2
+
+    def test_gives_up_after_max_attempts(
+        self, policy: ResiliencePolicy, sleeps: list[float]
+    ) -> None:
+        """
+        Test that the last error is raised once all attempts failed.
+        """
+
+        # Arrange
+        send = FlakySend(requests.ConnectionError("refused"))
+
+        # Act / Assert
+        with pytest.raises(requests.ConnectionError, match="refused"):
+            policy.execute("GET", BASE_URL, "/api/v1/Books", send)
+        assert send.calls == 3
+        assert len(sleeps) == 2
+
+    def test_honours_retry_after(
+        self, policy: ResiliencePolicy, sleeps: list[float]
+    ) -> None:
+        """
+        Test that a numeric Retry-After is waited for, capped at max_backoff.
+        """
+
+        # Arrange
+        send = FlakySend(response(429, {"Retry-After": "60"}), response(200))
+
+        # Act
+        policy.execute("GET", BASE_URL, "/api/v1/Books", send)
+
+        # Assert
+        assert sleeps == [2.0]
+
+    def test_open_circuit_fails_fast(self, policy: ResiliencePolicy) -> None:
+        """
+        Test that requests to a failing host stop being sent.
+        """
+
+        # Arrange
+        send = FlakySend(requests.ConnectTimeout())
+        with pytest.raises(requests.ConnectTimeout):
+            policy.execute("GET", BASE_URL, "/api/v1/Books", send)
+
+        # Act / Assert
+        with pytest.raises(CircuitOpenError):
+            policy.execute("GET", f"{BASE_URL}/other", "/api/v1/Authors", send)
+        assert send.calls == 3
+        assert policy.breaker("http://other.test").state == "closed"
+
+    def test_probe_failing_otherwise_reopens_circuit(
+        self, sleeps: list[float], metrics: ResilienceMetrics
+    ) -> None:
+        """
+        Test that a probe raising an error other than a connection error
+        or timeout does not leave the circuit half-open for good.
+        """
+
+        # Arrange
+        policy = ResiliencePolicy(
+            ResilienceConfig(breaker_threshold=1, breaker_reset=0.0),
+            sleep=sleeps.append,
+        )
+        with pytest.raises(requests.ConnectionError):
+            policy.execute(
+                "POST", BASE_URL, "/api/v1/Books", FlakySend(requests.ConnectionError())
+            )
+        send = FlakySend(requests.exceptions.ChunkedEncodingError(), response(200))
+
+        # Act
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            policy.execute("GET", BASE_URL, "/api/v1/Books", send)
+        probe = policy.execute("GET", BASE_URL, "/api/v1/Books", send)
+
+        # Assert
+        assert probe.status_code == 200
+        assert policy.breaker(BASE_URL).state == "closed"
+        assert metrics.totals()["circuit_open"] == 2
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """
+    Test suite for CircuitBreaker.
+    """
+
+    @pytest.fixture(name="clock")
+    def fixture_clock(self) -> list[float]:
+        """
+        Adjustable time source.
+        """
+        return [0.0]
+
+    @pytest.fixture(name="breaker")
+    def fixture_breaker(self, clock: list[float]) -> CircuitBreaker:
+        """
+        Open breaker: two failures recorded with threshold 2, reset after 10 s.
+        """
+        breaker = CircuitBreaker(2, 10.0, clock=lambda: clock[0])
+        breaker.record_failure()
+        breaker.record_failure()
+        return breaker
+
+    @pytest.mark.parametrize(
+        "record_probe, state",
+        [("record_success", "closed"), ("record_failure", "open")],
+    )
+    def test_single_probe_after_reset(
+        self,
+        breaker: CircuitBreaker,
+        clock: list[float],
+        record_probe: str,
+        state: str,
+    ) -> None:
+        """
+        Test that one probe passes after the reset time and decides the state.
+        """
+
+        # Arrange
+        refused = breaker.allow()
+        clock[0] = 10.0
+
+        # Act
+        probe, concurrent = breaker.allow(), breaker.allow()
+        getattr(breaker, record_probe)()
+
+        # Assert
+        assert (refused, probe, concurrent) == (False, True, False)
+        assert breaker.state == state
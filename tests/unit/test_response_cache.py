@@ -0,0 +1,173 @@
+"""
+Tests for the GET response cache.
+"""
+
+import pytest
+import requests
+from src.clients.books_client import BooksClient
+from src.clients.response_cache import CacheConfig, ResponseCache, resource_path
+from src.config.settings import Settings
+
+
+def _response(status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"[]"  # pylint: disable=protected-access
+    return response
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """
+    Test suite for ResponseCache.
+    """
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """
+        Test that cached responses are served until their TTL passes.
+        """
+
+        # Arrange
+        clock = _Clock()
+        cache = ResponseCache(CacheConfig(enabled=True, ttl=10), clock=clock)
+        key = cache.key("/api/v1/Books")
+        cache.put(key, _response(), cache.generation)
+
+        # Act
+        fresh = cache.get(key)
+        clock.now = 10.0
+        expired = cache.get(key)
+
+        # Assert
+        assert fresh is not None and fresh.json() == []
+        assert expired is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """
+        Test that the cache never holds more than max_entries responses.
+        """
+
+        # Arrange
+        cache = ResponseCache(CacheConfig(enabled=True, max_entries=2))
+        first, second, third = (cache.key(f"/api/v1/Books/{i}") for i in range(3))
+        cache.put(first, _response(), cache.generation)
+        cache.put(second, _response(), cache.generation)
+
+        # Act
+        cache.get(first)
+        cache.put(third, _response(), cache.generation)
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+
+    def test_write_invalidates_collection(self) -> None:
+        """
+        Test that a write drops cached reads of the same resource only.
+        """
+
+        # Arrange
+        cache = ResponseCache(CacheConfig(enabled=True))
+        books, book = cache.key("/api/v1/Books"), cache.key("/api/v1/Books/1")
+        authors = cache.key("/api/v1/Authors/authors/books/1")
+        for key in (books, book, authors):
+            cache.put(key, _response(), cache.generation)
+
+        # Act
+        cache.invalidate("/api/v1/Books/1")
+
+        # Assert
+        assert cache.get(books) is None
+        assert cache.get(book) is None
+        assert cache.get(authors) is not None
+
+    def test_response_older_than_a_write_is_not_cached(self) -> None:
+        """
+        Test that a read racing with a write cannot cache stale data.
+        """
+
+        # Arrange
+        cache = ResponseCache(CacheConfig(enabled=True))
+        key = cache.key("/api/v1/Books")
+        generation = cache.generation
+
+        # Act
+        cache.invalidate("/api/v1/Books")
+        cache.put(key, _response(), generation)
+        cache.put(cache.key("/api/v1/Books/404"), _response(404), cache.generation)
+
+        # Assert
+        assert len(cache) == 0
+
+    def test_failed_write_invalidates_collection(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that a write raising, e.g. on a timeout after the server
+        applied it, still drops cached reads of the resource.
+        """
+
+        # Arrange
+        cache = ResponseCache(CacheConfig(enabled=True))
+        books = cache.key("/api/v1/Books")
+        cache.put(books, _response(), cache.generation)
+        client = BooksClient(
+            settings=Settings(base_url="http://bookstore.invalid"), cache=cache
+        )
+
+        def timeout(*args: object, **kwargs: object) -> requests.Response:
+            raise requests.ReadTimeout()
+
+        monkeypatch.setattr(client, "_make_request", timeout)
+
+        # Act
+        with pytest.raises(requests.ReadTimeout):
+            client.update_book(1, {"id": 1})
+
+        # Assert
+        assert cache.get(books) is None
+        client.pool.close()
+
+    def test_resource_path(self) -> None:
+        """
+        Test that requests map to their collection path.
+        """
+
+        # Assert
+        assert resource_path("api/v1/Books/5") == "/api/v1/books"
+        assert resource_path("/api/v1/Authors/authors/books/5") == "/api/v1/authors"
+
+    def test_client_can_opt_out_of_caching(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that cache_enabled=False leaves a client without a cache, even
+        when caching is enabled in the environment or a cache is passed.
+        """
+
+        # Arrange
+        monkeypatch.setenv("HTTP_CACHE_ENABLED", "true")
+        settings = Settings(base_url="http://bookstore.invalid")
+        shared = ResponseCache(CacheConfig(enabled=True))
+
+        # Act
+        default = BooksClient(settings=settings)
+        shared_client = BooksClient(settings=settings, cache=shared)
+        uncached = BooksClient(settings=settings, cache=shared, cache_enabled=False)
+
+        # Assert
+        assert default.cache is not None
+        assert shared_client.cache is shared
+        assert uncached.cache is None
+        for client in (default, shared_client, uncached):
+            client.pool.close()
@@ -0,0 +1,72 @@
+"""
+Tests for precompiled JSON schema validators.
+"""
+
+import importlib.util
+import pytest
+from jsonschema import ValidationError
+from src.models.authors_models import AuthorModels
+from src.models.books_models import BookModels
+from src.utils.schema_registry import SchemaRegistry
+
+BACKENDS = ["jsonschema"]
+if importlib.util.find_spec("fastjsonschema"):
+    BACKENDS.append("fastjsonschema")
+
+
+@pytest.mark.unit
+class TestSchemaRegistry:
+    """
+    Test suite for SchemaRegistry.
+    """
+
+    def test_schema_compiled_once(self) -> None:
+        """
+        Test that the same schema object reuses its compiled validator.
+        """
+
+        # Arrange
+        registry = SchemaRegistry("jsonschema")
+
+        # Act
+        first = registry.get(AuthorModels.author_response_model)
+        second = registry.get(AuthorModels.author_response_model)
+
+        # Assert
+        assert first is second
+
+    def test_register_models(self) -> None:
+        """
+        Test that every model schema is precompiled.
+        """
+
+        # Arrange
+        registry = SchemaRegistry("jsonschema")
+
+        # Act
+        count = registry.register_models(AuthorModels, BookModels)
+
+        # Assert
+        assert count == 4
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_valid_and_invalid_instances(self, backend: str) -> None:
+        """
+        Test that every backend accepts valid and rejects invalid authors.
+        """
+
+        # Arrange
+        check = SchemaRegistry(backend).get(AuthorModels.author_response_model)
+        author = {"id": 1, "idBook": 1, "firstName": "First", "lastName": "Last"}
+
+        # Act & Assert
+        check(author)
+        with pytest.raises(ValidationError):
+            check({"id": "1", "idBook": 1, "firstName": "First"})
+
+    def test_unsupported_backend(self) -> None:
+        """
+        Test that unknown backends are rejected.
+        """
+        with pytest.raises(ValueError):
+            SchemaRegistry("unknown")
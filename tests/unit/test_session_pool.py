@@ -0,0 +1,134 @@
+"""
+Tests for HTTP session pooling.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import threading
+from unittest.mock import patch
+import pytest
+import requests
+from src.clients.base_client import BaseClient
+from src.clients.session_pool import PoolConfig, SessionPool
+
+
+@pytest.mark.unit
+class TestSessionPool:
+    """
+    Test suite for SessionPool.
+    """
+
+    def test_thread_mode_binds_one_session_per_thread(self) -> None:
+        """
+        Test that every thread reuses its own session.
+        """
+
+        # Arrange
+        pool = SessionPool(PoolConfig(mode="thread"))
+
+        def acquire_twice() -> bool:
+            with pool.acquire() as first:
+                pass
+            with pool.acquire() as second:
+                pass
+            return first is second
+
+        # Act
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: acquire_twice(), range(4)))
+
+        # Assert
+        assert all(results)
+        assert 1 <= pool.size <= 4
+        pool.close()
+
+    def test_thread_mode_releases_sessions_of_finished_threads(self) -> None:
+        """
+        Test that sessions of an executor's threads are closed and dropped
+        once the executor has shut down.
+        """
+
+        # Arrange
+        pool = SessionPool(PoolConfig(mode="thread"))
+        sessions = []
+
+        def acquire() -> None:
+            with pool.acquire() as session:
+                sessions.append(session)
+
+        # Act
+        with patch.object(requests.Session, "close", autospec=True) as close:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                list(executor.map(lambda _: acquire(), range(4)))
+            del executor
+            gc.collect()
+
+        # Assert
+        assert pool.size == 0
+        assert 1 <= len(set(sessions)) <= 2
+        assert {call.args[0] for call in close.call_args_list} == set(sessions)
+        pool.close()
+
+    def test_checkout_mode_is_bounded(self) -> None:
+        """
+        Test that checkout mode never creates more sessions than allowed.
+        """
+
+        # Arrange
+        pool = SessionPool(PoolConfig(mode="checkout", max_sessions=2))
+        barrier = threading.Barrier(2)
+
+        def hold_session() -> None:
+            with pool.acquire():
+                barrier.wait(timeout=5)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(lambda _: hold_session(), range(6)))
+
+        # Assert
+        assert pool.size == 2
+        pool.close()
+
+    def test_lent_session_is_returned_once(self) -> None:
+        """
+        Test that a lent session goes back to the pool once, however often
+        it is released.
+        """
+
+        # Arrange
+        pool = SessionPool(PoolConfig(mode="checkout", max_sessions=2))
+        session, release = pool.lend()
+
+        # Act
+        release()
+        release()
+        first, release_first = pool.lend()
+        second, release_second = pool.lend()
+
+        # Assert
+        assert first is session
+        assert second is not session
+        assert pool.size == 2
+        release_first()
+        release_second()
+        pool.close()
+
+    def test_sessions_are_configured(self) -> None:
+        """
+        Test that pooled sessions carry client headers and pool sizing.
+        """
+
+        # Arrange
+        config = PoolConfig(pool_maxsize=32, keep_alive=False)
+        pool = BaseClient.create_pool(config)
+
+        # Act
+        with pool.acquire() as session:
+            adapter = session.get_adapter("https://example.com")
+
+        # Assert
+        assert session.headers["Accept"] == "application/json"
+        assert session.headers["Connection"] == "close"
+        assert getattr(adapter, "_pool_maxsize") == 32
+        pool.close()
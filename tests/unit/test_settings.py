@@ -0,0 +1,188 @@
+"""
+Tests for process-wide API settings and environment profiles.
+"""
+
+import os
+from pathlib import Path
+from typing import Generator
+import pytest
+from src.clients.response_cache import CacheConfig
+from src.config.settings import (
+    Settings,
+    get_settings,
+    load_environment,
+    reload_settings,
+)
+
+
+@pytest.fixture(name="environ", autouse=True)
+def fixture_environ(monkeypatch: pytest.MonkeyPatch) -> Generator[dict, None, None]:
+    """
+    Isolated copy of the environment without API variables.
+
+    The process-wide settings are reset afterwards, so they are not left
+    built from the isolated environment.
+    """
+    environ = {
+        name: value
+        for name, value in os.environ.items()
+        if not name.startswith(("BOOKS_API_", "AUTHORS_API_", "API_", "TEST_PROFILE"))
+    }
+    monkeypatch.setattr(os, "environ", environ)
+    yield environ
+    get_settings.cache_clear()
+
+
+@pytest.fixture(name="env_dir")
+def fixture_env_dir(tmp_path: Path) -> Path:
+    """
+    Directory with a base .env file and a "staging" profile.
+    """
+    (tmp_path / ".env").write_text(
+        'BOOKS_API_BASE_URL = "http://base.test"\nAPI_VERSION = "v1"\n',
+        encoding="utf-8",
+    )
+    (tmp_path / ".env.staging").write_text(
+        'BOOKS_API_BASE_URL = "http://staging.test"\n', encoding="utf-8"
+    )
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestSettings:
+    """
+    Test suite for Settings and environment profiles.
+    """
+
+    def test_profile_overrides_base_file(self, environ: dict, env_dir: Path) -> None:
+        """
+        Test that profile values win over .env and missing ones come from it.
+        """
+
+        # Act
+        profile = load_environment("staging", env_dir)
+
+        # Assert
+        assert profile == "staging"
+        assert environ["BOOKS_API_BASE_URL"] == "http://staging.test"
+        assert environ["API_VERSION"] == "v1"
+
+    def test_environment_overrides_files(self, environ: dict, env_dir: Path) -> None:
+        """
+        Test that variables set in the environment are kept.
+        """
+
+        # Arrange
+        environ["BOOKS_API_BASE_URL"] = "http://environment.test"
+
+        # Act
+        load_environment("staging", env_dir)
+
+        # Assert
+        assert environ["BOOKS_API_BASE_URL"] == "http://environment.test"
+
+    def test_profile_selected_in_base_file(self, environ: dict, env_dir: Path) -> None:
+        """
+        Test that TEST_PROFILE in .env selects the profile.
+        """
+
+        # Arrange
+        with (env_dir / ".env").open("a", encoding="utf-8") as env_file:
+            env_file.write('TEST_PROFILE = "staging"\n')
+
+        # Act
+        profile = load_environment(directory=env_dir)
+
+        # Assert
+        assert profile == "staging"
+        assert environ["BOOKS_API_BASE_URL"] == "http://staging.test"
+
+    def test_reload_reads_edited_files(self, environ: dict, env_dir: Path) -> None:
+        """
+        Test that loading again picks up edited .env files, while variables
+        set in the environment are kept.
+        """
+
+        # Arrange
+        environ["BOOKS_API_BASE_URL"] = "http://environment.test"
+        (env_dir / ".env.staging").write_text('API_TIMEOUT = "5"\n', encoding="utf-8")
+        load_environment("", env_dir)
+        (env_dir / ".env").write_text('API_VERSION = "v2"\n', encoding="utf-8")
+
+        # Act
+        load_environment("staging", env_dir)
+
+        # Assert
+        assert environ["BOOKS_API_BASE_URL"] == "http://environment.test"
+        assert environ["API_VERSION"] == "v2"
+        assert environ["API_TIMEOUT"] == "5"
+
+        # Act
+        (env_dir / ".env").write_text("", encoding="utf-8")
+        load_environment("", env_dir)
+
+        # Assert
+        assert "API_VERSION" not in environ and "API_TIMEOUT" not in environ
+
+    def test_unknown_profile_rejected(self, env_dir: Path) -> None:
+        """
+        Test that a profile without .env file raises an error.
+        """
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="production"):
+            load_environment("production", env_dir)
+
+    def test_settings_loaded_once(self, environ: dict) -> None:
+        """
+        Test that settings are cached until reloaded.
+        """
+
+        # Arrange
+        environ["BOOKS_API_BASE_URL"] = "http://first.test"
+        environ["API_VERSION"] = "v2"
+        first = reload_settings()
+
+        # Act
+        environ["BOOKS_API_BASE_URL"] = "http://second.test"
+        cached = get_settings()
+        reloaded = reload_settings()
+
+        # Assert
+        assert cached is first
+        assert cached.base_url == "http://first.test"
+        assert cached.books_endpoint == "/api/v2/Books"
+        assert reloaded.base_url == "http://second.test"
+
+    def test_defaults(self) -> None:
+        """
+        Test default endpoint paths.
+        """
+
+        # Act
+        settings = Settings.from_env()
+
+        # Assert
+        assert settings.base_url == ""
+        assert settings.books_endpoint == "/api/v1/Books"
+        assert settings.authors_endpoint == "/api/v1/Authors"
+
+    def test_sections_read_once_per_settings(self, environ: dict) -> None:
+        """
+        Test that component configurations are cached until settings reload.
+        """
+
+        # Arrange
+        environ["HTTP_CACHE_TTL"] = "5"
+        settings = reload_settings()
+
+        # Act
+        first = settings.section(CacheConfig.from_env)
+        environ["HTTP_CACHE_TTL"] = "9"
+        cached = settings.section(CacheConfig.from_env)
+        reloaded = reload_settings().section(CacheConfig.from_env)
+
+        # Assert
+        assert cached is first
+        assert first.ttl == 5
+        assert reloaded.ttl == 9
@@ -0,0 +1,165 @@
+"""
+Tests for the soak runner and its drift detection.
+"""
+
+import itertools
+import random
+import time
+from typing import Sequence
+import pytest
+import requests
+from src.clients.authors_client import AuthorsClient
+from src.clients.books_client import BooksClient
+from src.config.settings import Settings
+from src.load.engine import Operation
+from src.load.soak import (
+    SoakConfig,
+    SoakRunner,
+    WindowSample,
+    crud_flows,
+    detect_drift,
+)
+from src.server.http_server import LocalApiServer
+from src.utils.trend import mann_kendall
+
+
+def _response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    return response
+
+
+def _samples(p99: Sequence[float], rss: Sequence[int]) -> list[WindowSample]:
+    return [
+        WindowSample(
+            index=index,
+            elapsed=index + 1.0,
+            requests=1000,
+            errors=0,
+            p50=0.002,
+            p99=latency,
+            rss=memory,
+            objects=10_000,
+        )
+        for index, (latency, memory) in enumerate(zip(p99, rss))
+    ]
+
+
+@pytest.mark.unit
+class TestSoak:
+    """
+    Test suite for the soak runner, drift detection and Mann-Kendall test.
+    """
+
+    def test_mann_kendall_separates_trend_from_noise(self) -> None:
+        """
+        Test that a steady rise is significant with the right slope and
+        noise and flat series are not.
+        """
+
+        # Arrange
+        rng = random.Random(7)
+        noise = [rng.gauss(10, 1) for _ in range(60)]
+        rising = [10 + 0.05 * index + rng.gauss(0, 1) for index in range(60)]
+
+        # Act
+        noise_trend = mann_kendall(noise)
+        rising_trend = mann_kendall(rising)
+        flat_trend = mann_kendall([5.0] * 10)
+
+        # Assert
+        assert noise_trend.p_value > 0.05
+        assert rising_trend.p_value < 0.001
+        assert rising_trend.slope == pytest.approx(0.05, abs=0.02)
+        assert rising_trend.intercept == pytest.approx(10, abs=1)
+        assert (flat_trend.statistic, flat_trend.p_value) == (0, 0.5)
+        with pytest.raises(ValueError):
+            mann_kendall([1.0])
+
+    def test_detect_drift_needs_significance_and_size(self) -> None:
+        """
+        Test that only a significant trend beyond the tolerance is drift.
+        """
+
+        # Arrange
+        config = SoakConfig(warmup_windows=1)
+        p99 = [0.5] + [0.010 * (1 + 0.05 * index) for index in range(20)]
+        rss = [1] + [100_000_000 + 1000 * index for index in range(20)]
+
+        # Act
+        drift = {
+            result.metric: result for result in detect_drift(_samples(p99, rss), config)
+        }
+        too_short = detect_drift(_samples(p99[:4], rss[:4]), config)
+
+        # Assert
+        assert drift["p99"].drifting
+        assert drift["p99"].change == pytest.approx(0.95)
+        assert drift["rss"].trend.p_value < config.alpha
+        assert not drift["rss"].drifting
+        assert not drift["p50"].drifting and not drift["throughput"].drifting
+        assert not too_short
+
+    def test_runner_samples_windows_and_flags_latency_creep(self) -> None:
+        """
+        Test that the runner cycles flows, samples every window and flags
+        latency that keeps growing.
+        """
+
+        # Arrange
+        started = time.perf_counter()
+        calls = itertools.count()
+
+        def slowing_call() -> requests.Response:
+            time.sleep(0.001 + (time.perf_counter() - started) * 0.02)
+            return _response(500 if next(calls) % 10 == 0 else 200)
+
+        def flow() -> list[Operation]:
+            return [Operation("GET /slow", slowing_call)]
+
+        windows: list[WindowSample] = []
+        runner = SoakRunner(
+            [flow],
+            SoakConfig(
+                duration=1.2, window=0.15, workers=2, warmup_windows=0, alpha=0.05
+            ),
+            on_window=windows.append,
+        )
+
+        # Act
+        report = runner.run()
+
+        # Assert
+        assert [sample.index for sample in report.samples] == list(range(8))
+        assert windows == report.samples
+        assert report.stats["GET /slow"].errors["500"] > 0
+        assert all(sample.rss > 0 and sample.objects > 0 for sample in windows)
+        assert {"p50", "throughput"} <= {drift.metric for drift in report.drifting}
+        assert len(report.to_dict()["windows"]) == 8
+
+    def test_crud_flows_run_against_local_api(self) -> None:
+        """
+        Test that the book and author lifecycles succeed against the local
+        stand-in and leave no records behind.
+        """
+
+        # Arrange
+        with LocalApiServer() as server:
+            settings = Settings(base_url=server.base_url)
+            books_client = BooksClient(settings=settings)
+            authors_client = AuthorsClient(settings=settings)
+            flows = crud_flows(books_client, authors_client)
+            books_before = len(books_client.get_all_books().json())
+
+            # Act
+            responses = [
+                (operation, operation.call())
+                for flow in flows + flows
+                for operation in flow()
+            ]
+            books_after = len(books_client.get_all_books().json())
+
+        # Assert
+        assert len(responses) == 20
+        assert all(response.status_code == 200 for _, response in responses)
+        assert books_after == books_before
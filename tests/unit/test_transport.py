@@ -0,0 +1,221 @@
+"""
+Tests for the HTTP/1.1 and HTTP/2 transports of the API clients.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import socket
+import threading
+from typing import Generator
+import pytest
+import requests
+from src.clients.authors_client import AuthorsClient
+from src.clients.base_client import BaseClient
+from src.clients.books_client import BooksClient
+from src.clients.request_timing import request_timing
+from src.clients import resilience
+from src.clients.resilience import (
+    ResilienceConfig,
+    ResilienceMetrics,
+    ResiliencePolicy,
+)
+from src.clients.session_pool import PoolConfig
+from src.clients.transport import (
+    ConnectionNotEstablished,
+    Http2Transport,
+    SessionTransport,
+    close_http2_transports,
+    create_transport,
+    http2_transport,
+)
+from src.config.settings import Settings
+from src.server.http_server import LocalApiServer
+
+
+@pytest.fixture(name="server")
+def fixture_server() -> Generator[LocalApiServer, None, None]:
+    """
+    Running local API server.
+    """
+    with LocalApiServer() as server:
+        yield server
+
+
+@pytest.fixture(name="http2")
+def fixture_http2(server: LocalApiServer) -> Generator[Http2Transport, None, None]:
+    """
+    HTTP/2 transport to the local server, over a single connection.
+    """
+    transport = Http2Transport(server.base_url, max_connections=1)
+    yield transport
+    transport.close()
+
+
+@pytest.mark.unit
+class TestTransport:
+    """
+    Test suite for transports and their selection.
+    """
+
+    def test_selected_by_settings(self, server: LocalApiServer) -> None:
+        """
+        Test that HTTP_TRANSPORT selects the transport and is validated.
+        """
+
+        # Arrange
+        pool = BaseClient.create_pool()
+
+        # Act
+        default = create_transport(Settings(base_url=server.base_url), pool)
+        http2 = create_transport(
+            Settings(base_url=server.base_url, transport="http2"), pool
+        )
+
+        # Assert
+        assert isinstance(default, SessionTransport)
+        assert isinstance(http2, Http2Transport)
+        assert http2 is create_transport(
+            Settings(base_url=server.base_url, transport="http2"), pool
+        )
+        with pytest.raises(ValueError, match="http3"):
+            create_transport(
+                Settings(base_url=server.base_url, transport="http3"), pool
+            )
+        close_http2_transports()
+        assert http2._loop.is_closed()  # pylint: disable=protected-access
+        assert http2_transport(server.base_url, 2) is not http2
+        close_http2_transports()
+        pool.close()
+
+    def test_checkout_stream_holds_session_until_released(
+        self, server: LocalApiServer
+    ) -> None:
+        """
+        Test that a streamed response keeps its checked out session until it
+        is closed or read to the end.
+        """
+
+        # Arrange
+        pool = BaseClient.create_pool(PoolConfig(mode="checkout", max_sessions=1))
+        client = BooksClient(pool, settings=Settings(base_url=server.base_url))
+        statuses: list[int] = []
+
+        def get_book() -> threading.Thread:
+            thread = threading.Thread(
+                target=lambda: statuses.append(client.get_book_by_id(1).status_code)
+            )
+            thread.start()
+            return thread
+
+        # Act
+        stream = client.get_stream(client.books_endpoint)
+        waiting = get_book()
+        waiting.join(timeout=0.2)
+        blocked = waiting.is_alive()
+        stream.close()
+        waiting.join(timeout=5)
+        books = list(client.iter_all_books())
+        after_exhausted = get_book()
+        after_exhausted.join(timeout=5)
+
+        # Assert
+        assert blocked
+        assert books
+        assert statuses == [200, 200]
+        assert pool.size == 1
+        pool.close()
+
+    def test_http2_multiplexes_concurrent_requests(
+        self, server: LocalApiServer, http2: Http2Transport
+    ) -> None:
+        """
+        Test that concurrent requests share one connection as HTTP/2 streams.
+        """
+
+        # Arrange
+        client = BooksClient(
+            settings=Settings(base_url=server.base_url), transport=http2
+        )
+
+        # Act
+        with ThreadPoolExecutor(16) as executor:
+            responses = list(executor.map(client.get_book_by_id, range(1, 101)))
+
+        # Assert
+        assert [response.json()["id"] for response in responses] == list(range(1, 101))
+        assert server.connections == 1
+        timing = request_timing(responses[-1])
+        assert timing.ttfb is not None and timing.transfer is not None
+        assert "application/json" in responses[-1].headers["content-type"]
+
+    def test_http2_large_bodies_and_errors(
+        self, server: LocalApiServer, http2: Http2Transport
+    ) -> None:
+        """
+        Test that bodies beyond the flow control window pass both ways and
+        error statuses are returned as responses.
+        """
+
+        # Arrange
+        client = BooksClient(
+            settings=Settings(base_url=server.base_url), transport=http2
+        )
+        book = {"id": 900, "title": "Long", "description": "x" * 200_000}
+
+        # Act
+        created = client.create_book(book)
+        fetched = client.get_book_by_id(900)
+        missing = client.get_book_by_id(999_999)
+
+        # Assert
+        assert created.status_code == 200
+        assert fetched.json()["description"] == book["description"]
+        assert missing.status_code == 404
+        with pytest.raises(requests.HTTPError):
+            missing.raise_for_status()
+
+    def test_http2_streams_items(
+        self, server: LocalApiServer, http2: Http2Transport
+    ) -> None:
+        """
+        Test that a streamed HTTP/2 response is parsed while it downloads.
+        """
+
+        # Arrange
+        client = AuthorsClient(
+            settings=Settings(base_url=server.base_url), transport=http2
+        )
+
+        # Act
+        authors = list(client.iter_all_authors())
+
+        # Assert
+        assert authors == client.get_all_authors().json()
+
+    def test_http2_unreachable_host_never_sent(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that a refused connection is reported as never sent, so even a
+        POST is retried.
+        """
+
+        # Arrange
+        metrics = ResilienceMetrics()
+        monkeypatch.setattr(resilience, "resilience_metrics", metrics)
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            base_url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+        transport = Http2Transport(base_url)
+        client = BooksClient(
+            settings=Settings(base_url=base_url),
+            resilience=ResiliencePolicy(
+                ResilienceConfig(max_attempts=2, backoff=0.0), sleep=lambda _: None
+            ),
+            transport=transport,
+        )
+
+        # Act / Assert
+        with pytest.raises(ConnectionNotEstablished):
+            client.create_book({"id": 1})
+        transport.close()
+        assert metrics.totals()["retry"] == 1
@@ -0,0 +1,186 @@
+"""
+Tests for conditional GETs between the API clients and the local server.
+"""
+
+from typing import Generator
+import pytest
+import requests
+from src.clients.books_client import BooksClient
+from src.clients.response_cache import ResponseCache
+from src.clients.transport import Http2Transport
+from src.clients.validator_cache import ValidatorCache, ValidatorConfig
+from src.config.settings import Settings
+from src.server import conditional
+from src.server.app import ApiResponse
+from src.server.http_server import LocalApiServer
+
+
+@pytest.fixture(name="server")
+def fixture_server() -> Generator[LocalApiServer, None, None]:
+    """
+    Running local API server.
+    """
+    with LocalApiServer() as server:
+        yield server
+
+
+def build_response(
+    status: int, headers: dict[str, str], body: bytes
+) -> requests.Response:
+    """
+    Build a response as if received from the service.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    # pylint: disable-next=protected-access
+    response._content = body
+    return response
+
+
+@pytest.mark.unit
+class TestValidatorCache:
+    """
+    Test suite for ValidatorCache and conditional request handling.
+    """
+
+    def test_config_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that conditional requests are configured from environment.
+        """
+
+        # Arrange
+        monkeypatch.setenv("HTTP_CONDITIONAL_ENABLED", "TRUE")
+        monkeypatch.setenv("HTTP_CONDITIONAL_MAX_ENTRIES", "8")
+
+        # Act
+        config = ValidatorConfig.from_env()
+
+        # Assert
+        assert config == ValidatorConfig(enabled=True, max_entries=8)
+
+    def test_client_can_opt_out_of_conditional_requests(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        Test that conditional_enabled=False leaves a client without a
+        validator cache, even when conditional requests are enabled in the
+        environment or a validator cache is passed.
+        """
+
+        # Arrange
+        monkeypatch.setenv("HTTP_CONDITIONAL_ENABLED", "true")
+        settings = Settings(base_url="http://bookstore.invalid")
+        shared = ValidatorCache(ValidatorConfig(enabled=True))
+
+        # Act
+        default = BooksClient(settings=settings)
+        unconditional = BooksClient(
+            settings=settings, validators=shared, conditional_enabled=False
+        )
+
+        # Assert
+        assert default.validators is not None
+        assert unconditional.validators is None
+        for client in (default, unconditional):
+            client.pool.close()
+
+    def test_resolve_serves_stored_response_on_304(self) -> None:
+        """
+        Test that a 304 is replaced by the stored response with refreshed
+        headers, and responses without validators are not stored.
+        """
+
+        # Arrange
+        validators = ValidatorCache(ValidatorConfig(enabled=True, max_entries=1))
+        key = ResponseCache.key("/api/v1/Books/1")
+        stored = build_response(200, {"ETag": 'W/"a"', "Date": "old"}, b'{"id": 1}')
+        validators.resolve(key, stored)
+
+        # Act
+        headers = validators.conditional_headers(key)
+        resolved = validators.resolve(
+            key, build_response(304, {"ETag": 'W/"a"', "Date": "new"}, b"")
+        )
+        validators.resolve(
+            ResponseCache.key("/api/v1/Books/2"), build_response(200, {}, b"{}")
+        )
+
+        # Assert
+        assert headers == {"If-None-Match": 'W/"a"'}
+        assert resolved.status_code == 200
+        assert resolved.json() == {"id": 1}
+        assert resolved.headers["Date"] == "new"
+        assert stored.headers["Date"] == "old"
+        assert validators.stats() == {"hits": 1, "misses": 2, "entries": 1}
+        assert (
+            validators.conditional_headers(ResponseCache.key("/api/v1/Books/2")) is None
+        )
+
+    @pytest.mark.parametrize(
+        "if_none_match, if_modified_since, expected",
+        [
+            ('W/"x", TAG', "", 304),
+            ('"other"', "", 200),
+            ("*", "", 304),
+            ("", "Sun, 06 Nov 1994 08:49:37 GMT", 200),
+            ("", "Fri, 01 Jan 2100 00:00:00 GMT", 304),
+            ('"other"', "Fri, 01 Jan 2100 00:00:00 GMT", 200),
+            ("", "yesterday", 200),
+        ],
+    )
+    def test_server_evaluates_preconditions(
+        self, if_none_match: str, if_modified_since: str, expected: int
+    ) -> None:
+        """
+        Test that the server answers 304 when the validators match, with
+        If-None-Match taking precedence over If-Modified-Since.
+        """
+
+        # Arrange
+        response = ApiResponse(200, b'{"id": 1}', last_modified=1_700_000_000.0)
+        tag = conditional.entity_tag(response.body)
+        if_none_match = if_none_match.replace("TAG", tag)
+
+        # Act
+        result = conditional.evaluate("GET", response, if_none_match, if_modified_since)
+        post = conditional.evaluate("POST", response, tag, "")
+
+        # Assert
+        assert result.status == expected
+        assert result.etag == tag
+        assert result.body == (b"" if expected == 304 else response.body)
+        assert post is response
+
+    @pytest.mark.parametrize("protocol", ["http11", "http2"])
+    def test_client_revalidates_with_server(
+        self, server: LocalApiServer, protocol: str
+    ) -> None:
+        """
+        Test that repeated GETs are answered with 304 over both protocols
+        and writes drop the stored responses.
+        """
+
+        # Arrange
+        transport = Http2Transport(server.base_url) if protocol == "http2" else None
+        validators = ValidatorCache(ValidatorConfig(enabled=True))
+        client = BooksClient(
+            settings=Settings(base_url=server.base_url),
+            transport=transport,
+            validators=validators,
+        )
+        first = client.get_all_books()
+
+        # Act
+        second = client.get_all_books()
+        client.update_book(1, {"id": 1, "title": "Changed"})
+        third = client.get_book_by_id(1)
+
+        # Assert
+        assert first.headers["ETag"].startswith('W/"')
+        assert "Last-Modified" in first.headers
+        assert second.status_code == 200 and second.json() == first.json()
+        assert third.json()["title"] == "Changed"
+        assert (validators.hits, validators.misses, len(validators)) == (1, 2, 1)
+        if transport is not None:
+            transport.close()